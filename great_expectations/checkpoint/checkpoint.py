@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import datetime as dt
+import enum
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Union, cast
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypedDict, Union, cast
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
@@ -37,6 +40,32 @@ if TYPE_CHECKING:
     )
 
 
+class CheckpointConcurrencyMode(str, enum.Enum):
+    """How the validation definitions of a Checkpoint are executed."""
+
+    SERIAL = "serial"
+    THREAD = "thread"
+
+
+class CheckpointConcurrency(BaseModel):
+    """
+    Concurrency settings used when running the validation definitions of a Checkpoint.
+
+    Args:
+        mode: "serial" (default) runs validation definitions one after another; "thread" runs them
+            in a thread pool, which suits I/O-bound backends such as SQL or Spark. Validation
+            definitions on the same Data Source still run one after another.
+        max_workers: The maximum number of Data Sources to validate at the same time.
+            Defaults to the number of Data Sources.
+    """
+
+    mode: CheckpointConcurrencyMode = CheckpointConcurrencyMode.SERIAL
+    max_workers: Optional[int] = Field(default=None, ge=1)
+
+    class Config:
+        extra = Extra.forbid
+
+
 @public_api
 class Checkpoint(BaseModel):
     """
@@ -50,6 +79,7 @@ class Checkpoint(BaseModel):
         validation_definitions: List of validation definitions to be run.
         actions: List of actions to be taken after the validation definitions are run.
         result_format: The format in which to return the results of the validation definitions. Default is ResultFormat.SUMMARY.
+        concurrency: Optional settings to run the validation definitions concurrently. Default is to run them serially.
         id: An optional unique identifier for the checkpoint.
 
     """  # noqa: E501
@@ -58,6 +88,7 @@ class Checkpoint(BaseModel):
     validation_definitions: List[ValidationDefinition]
     actions: List[CheckpointAction] = Field(default_factory=list)
     result_format: Union[ResultFormat, dict] = ResultFormat.SUMMARY
+    concurrency: Optional[CheckpointConcurrency] = None
     id: Union[str, None] = None
 
     class Config:
@@ -90,6 +121,10 @@ class Checkpoint(BaseModel):
                 }
             ],
             "result_format": "SUMMARY",
+            "concurrency": {
+                "mode": "thread",
+                "max_workers": 4
+            },
             "id": "b758816-64c8-46cb-8f7e-03c12cea1d67"
         }
         """  # noqa: E501
@@ -175,14 +210,44 @@ class Checkpoint(BaseModel):
         result_format: ResultFormat | dict,
         run_id: RunIdentifier,
     ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
+        run_kwargs: Dict[str, Any] = {
+            "batch_parameters": batch_parameters,
+            "suite_parameters": expectation_parameters,
+            "result_format": result_format,
+            "run_id": run_id,
+        }
+
+        timed_results: List[Tuple[ExpectationSuiteValidationResult, float]]
+        groups = self._group_validation_definitions_by_data_source()
+        executor = self._get_validation_definition_executor(num_groups=len(groups))
+        if executor is None:
+            timed_results = [
+                _run_validation_definition(validation_definition, run_kwargs)
+                for validation_definition in self.validation_definitions
+            ]
+        else:
+            with executor:
+                futures = [
+                    executor.submit(
+                        _run_validation_definition_group,
+                        [self.validation_definitions[idx] for idx in group],
+                        run_kwargs,
+                    )
+                    for group in groups
+                ]
+                timed_results_by_idx: Dict[int, Tuple[ExpectationSuiteValidationResult, float]] = {}
+                for group, future in zip(groups, futures):
+                    timed_results_by_idx.update(zip(group, future.result()))
+                # Reassembling in definition order keeps result keys and ordering deterministic.
+                timed_results = [
+                    timed_results_by_idx[idx] for idx in range(len(self.validation_definitions))
+                ]
+
         run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
-        for validation_definition in self.validation_definitions:
-            validation_result = validation_definition.run(
-                batch_parameters=batch_parameters,
-                suite_parameters=expectation_parameters,
-                result_format=result_format,
-                run_id=run_id,
-            )
+        for validation_definition, (validation_result, duration) in zip(
+            self.validation_definitions, timed_results
+        ):
+            validation_result.meta["validation_duration_seconds"] = duration
             key = self._build_result_key(
                 validation_definition=validation_definition,
                 run_id=run_id,
@@ -192,6 +257,32 @@ class Checkpoint(BaseModel):
 
         return run_results
 
+    def _group_validation_definitions_by_data_source(self) -> List[List[int]]:
+        """Groups the indices of validation definitions by the Data Source they validate.
+
+        A Data Source caches a single execution engine (active batch, metric cache, connection),
+        so definitions within a group must run one after another.
+        """
+        groups: Dict[Any, List[int]] = {}
+        for idx, validation_definition in enumerate(self.validation_definitions):
+            groups.setdefault(validation_definition.data_source.name, []).append(idx)
+        return list(groups.values())
+
+    def _get_validation_definition_executor(self, num_groups: int) -> Optional[Executor]:
+        """Returns the pool to run groups of validation definitions in, or None to run serially."""  # noqa: E501
+        concurrency = self.concurrency
+        if (
+            concurrency is None
+            or concurrency.mode == CheckpointConcurrencyMode.SERIAL
+            or num_groups < 2  # noqa: PLR2004
+        ):
+            return None
+
+        max_workers = min(concurrency.max_workers or num_groups, num_groups)
+        return ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-checkpoint-validation"
+        )
+
     def _build_result_key(
         self,
         validation_definition: ValidationDefinition,
@@ -320,6 +411,25 @@ class CheckpointResult(BaseModel):
         return json.dumps(self.describe_dict(), indent=4)
 
 
+def _run_validation_definition(
+    validation_definition: ValidationDefinition, run_kwargs: Dict[str, Any]
+) -> Tuple[ExpectationSuiteValidationResult, float]:
+    """Runs a single validation definition and returns its result with the elapsed wall time."""
+    start = time.perf_counter()
+    validation_result = validation_definition.run(**run_kwargs)
+    return validation_result, time.perf_counter() - start
+
+
+def _run_validation_definition_group(
+    validation_definitions: List[ValidationDefinition], run_kwargs: Dict[str, Any]
+) -> List[Tuple[ExpectationSuiteValidationResult, float]]:
+    """Runs validation definitions sharing a Data Source one after another."""
+    return [
+        _run_validation_definition(validation_definition, run_kwargs)
+        for validation_definition in validation_definitions
+    ]
+
+
 # Necessary due to cyclic dependencies between Checkpoint and CheckpointResult
 CheckpointResult.update_forward_refs()
 
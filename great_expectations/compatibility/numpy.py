@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 
 
 def numpy_quantile(
-    a: npt.NDArray, q: float, method: str, axis: int | None = None
+    a: npt.NDArray, q: float | npt.ArrayLike, method: str, axis: int | None = None
 ) -> np.float64 | npt.NDArray:
     """
     As of NumPy 1.21.0, the 'interpolation' arg in quantile() has been renamed to `method`.
@@ -29,6 +29,11 @@ try:
 except ImportError:
     SparkContext = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
 
+try:
+    from pyspark import StorageLevel
+except ImportError:
+    StorageLevel = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
+
 try:
     from pyspark.ml.feature import Bucketizer
 except (ImportError, AttributeError):
@@ -15,7 +15,7 @@ from .expectation_validation_result import (
     expectationValidationResultSchema,
     get_metric_kwargs_id,
 )
-from .id_dict import IDDict
+from .id_dict import FrozenIDDict, IDDict
 from .result_format import ResultFormat
 from .run_identifier import RunIdentifier, RunIdentifierSchema
 from .validation_definition import ValidationDefinition
@@ -28,6 +28,7 @@ __all__ = [
     "ExpectationSuiteValidationResultSchema",
     "ExpectationValidationResult",
     "ExpectationValidationResultSchema",
+    "FrozenIDDict",
     "IDDict",
     "RunIdentifier",
     "RunIdentifierSchema",
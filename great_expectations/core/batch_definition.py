@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Generic, Optional, TypeVar
 
 from great_expectations.compatibility import pydantic
+from great_expectations.compatibility.typing_extensions import override
 
 # if we move this import into the TYPE_CHECKING block, we need to provide the
 # Partitioner class when we update forward refs, so we just import here.
 from great_expectations.core.partitioners import ColumnPartitioner, FileNamePartitioner
+from great_expectations.core.samplers import TableSampler  # noqa: TCH001
 from great_expectations.core.serdes import _EncodedValidationData, _IdentifierBundle
 
 if TYPE_CHECKING:
@@ -29,12 +31,21 @@ class BatchDefinition(pydantic.GenericModel, Generic[PartitionerT]):
     id: Optional[str] = None
     name: str
     partitioner: Optional[PartitionerT] = None
+    sampler: Optional[TableSampler] = None
 
     # private attributes that must be set immediately after instantiation
     # Note that we're using type Any, but the getter setter ensure the right types.
     # If we actually specify DataAsset, pydantic errors out.
     _data_asset: Any = pydantic.PrivateAttr()
 
+    @override
+    def dict(self, **kwargs) -> Dict[str, Any]:  # type: ignore[override]
+        data: Dict[str, Any] = super().dict(**kwargs)
+        # BatchDefinitions without a sampler serialize as they did before samplers were added.
+        if "sampler" in data and data["sampler"] is None:
+            del data["sampler"]
+        return data
+
     @property
     def data_asset(self) -> DataAsset[Any, PartitionerT]:
         return self._data_asset
@@ -47,10 +58,13 @@ class BatchDefinition(pydantic.GenericModel, Generic[PartitionerT]):
         self, batch_parameters: Optional[BatchParameters] = None
     ) -> BatchRequest[PartitionerT]:
         """Build a BatchRequest from the asset and batch parameters."""
-        return self.data_asset.build_batch_request(
+        batch_request = self.data_asset.build_batch_request(
             options=batch_parameters,
             partitioner=self.partitioner,
         )
+        if self.sampler is not None:
+            batch_request.sampler = self.sampler
+        return batch_request
 
     def get_batch(self, batch_parameters: Optional[BatchParameters] = None) -> Batch:
         """
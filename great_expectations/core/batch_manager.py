@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+import threading
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple
 
 from great_expectations.core.batch import (
     Batch,
@@ -21,6 +22,86 @@ logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
 
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class DomainRecordsCache:
+    """Least-recently-used cache of row selections for Domain records, bounded by a memory budget.
+
+    Execution engines store lightweight row selectors (e.g., boolean masks or positional index arrays)
+    here, rather than copies of filtered data, so that repeated requests for the same Domain of a Batch
+    do not have to re-evaluate row conditions.  Keys are tuples whose first element is the Batch ID.
+    """  # noqa: E501
+
+    def __init__(self, max_bytes: int = DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES) -> None:
+        """
+        Args:
+            max_bytes: Approximate upper bound on the total size of cached row selectors; 0 disables caching.
+        """  # noqa: E501
+        self._entries: OrderedDict[Tuple[Hashable, ...], Tuple[Any, int]] = OrderedDict()
+        self._num_bytes: int = 0
+        self._max_bytes: int = max_bytes
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def num_bytes(self) -> int:
+        """Approximate total size of cached row selectors."""
+        return self._num_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._evict(num_bytes_needed=0)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Tuple[Hashable, ...], value: Any, num_bytes: int) -> None:
+        with self._lock:
+            self._pop(key)
+            if num_bytes > self._max_bytes:
+                return
+
+            self._evict(num_bytes_needed=num_bytes)
+            self._entries[key] = (value, num_bytes)
+            self._num_bytes += num_bytes
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        """Removes all cached row selectors that belong to the specified Batch."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == batch_id]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+    def _pop(self, key: Tuple[Hashable, ...]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._num_bytes -= entry[1]
+
+    def _evict(self, num_bytes_needed: int) -> None:
+        while self._entries and self._num_bytes + num_bytes_needed > self._max_bytes:
+            _, (_, num_bytes) = self._entries.popitem(last=False)
+            self._num_bytes -= num_bytes
+
+
 class BatchManager:
     def __init__(
         self,
@@ -39,6 +120,7 @@ class BatchManager:
 
         self._batch_cache: Dict[str, AnyBatch] = OrderedDict()
         self._batch_data_cache: Dict[str, BatchDataUnion] = {}
+        self._domain_records_cache = DomainRecordsCache()
 
         if batch_list:
             self.load_batch_list(batch_list=batch_list)
@@ -48,6 +130,11 @@ class BatchManager:
         """Dictionary of loaded BatchData objects."""
         return self._batch_data_cache
 
+    @property
+    def domain_records_cache(self) -> DomainRecordsCache:
+        """Cache of row selections for Domain records of loaded BatchData objects."""
+        return self._domain_records_cache
+
     @property
     def loaded_batch_ids(self) -> List[str]:
         """IDs of loaded BatchData objects."""
@@ -137,9 +224,10 @@ class BatchManager:
         return self.active_batch.batch_definition
 
     def reset_batch_cache(self) -> None:
-        """Clears Batch cache"""
+        """Clears Batch cache (including cached Domain records)"""
         self._batch_cache = OrderedDict()
         self._active_batch_id = None
+        self._domain_records_cache.clear()
 
     def load_batch_list(self, batch_list: Sequence[AnyBatch]) -> None:
         batch: AnyBatch
@@ -165,5 +253,6 @@ class BatchManager:
         """
         Updates the data for the specified Batch in the cache
         """
+        self._domain_records_cache.invalidate_batch(batch_id=batch_id)
         self._batch_data_cache[batch_id] = batch_data
         self._active_batch_data_id = batch_id
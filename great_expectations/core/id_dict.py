@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sys
 from typing import Any, Set, TypeVar, Union
 
 from great_expectations.compatibility.typing_extensions import override
@@ -11,9 +12,26 @@ T = TypeVar("T")
 
 
 class IDDict(dict):
+    """Dictionary, whose contents determine its ID (and hash).
+
+    The default ID (i.e., "to_id()" with no arguments) is computed once and cached; mutating the dictionary through
+    any of its methods invalidates the cached ID.  Values must not be mutated in place once the ID has been obtained.
+    """  # noqa: E501
+
     _id_ignore_keys: Set[str] = set()
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            cached_id = self.__dict__.get("_cached_id")
+            if cached_id is None:
+                cached_id = self._compute_id()
+                object.__setattr__(self, "_cached_id", cached_id)
+
+            return cached_id
+
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys=None, id_ignore_keys=None):
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
@@ -23,10 +41,15 @@ class IDDict(dict):
             return tuple()
         elif len(id_keys) == 1:
             key = list(id_keys)[0]
-            return f"{key}={self[key]!s}"
+            return sys.intern(f"{key}={self[key]!s}")
 
         _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
-        return hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
+        return sys.intern(
+            hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
+        )
+
+    def _invalidate_id(self) -> None:
+        self.__dict__.pop("_cached_id", None)
 
     @override
     def __hash__(self) -> int:  # type: ignore[override]
@@ -34,6 +57,70 @@ class IDDict(dict):
         _result_hash: int = hash(self.to_id())
         return _result_hash
 
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._invalidate_id()
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._invalidate_id()
+        super().__delitem__(key)
+
+    @override
+    def __ior__(self, other):  # type: ignore[override,misc]
+        self._invalidate_id()
+        return super().__ior__(other)
+
+    @override
+    def clear(self) -> None:
+        self._invalidate_id()
+        super().clear()
+
+    @override
+    def pop(self, *args):  # type: ignore[override]
+        self._invalidate_id()
+        return super().pop(*args)
+
+    @override
+    def popitem(self):
+        self._invalidate_id()
+        return super().popitem()
+
+    @override
+    def setdefault(self, key, default=None):
+        self._invalidate_id()
+        return super().setdefault(key, default)
+
+    @override
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        self._invalidate_id()
+        super().update(*args, **kwargs)
+
+
+class FrozenIDDict(IDDict):
+    """Immutable "IDDict", whose ID is computed at most once.
+
+    Suitable for keys that are looked up repeatedly (e.g., Domain kwargs grouping bundled metric computations).
+    """  # noqa: E501
+
+    def _raise_immutable(self, *args, **kwargs):
+        raise TypeError(f'"{type(self).__name__}" object is immutable.')  # noqa: TRY003
+
+    __setitem__ = _raise_immutable  # type: ignore[assignment]
+    __delitem__ = _raise_immutable  # type: ignore[assignment]
+    __ior__ = _raise_immutable  # type: ignore[assignment]
+    clear = _raise_immutable  # type: ignore[assignment]
+    pop = _raise_immutable  # type: ignore[assignment]
+    popitem = _raise_immutable  # type: ignore[assignment]
+    setdefault = _raise_immutable  # type: ignore[assignment]
+    update = _raise_immutable  # type: ignore[assignment]
+
+    @override
+    def __reduce__(self):
+        # Default "dict" reconstruction (used by "copy" and "pickle") assigns items one at a time.
+        return type(self), (dict(self),)
+
 
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict],
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from great_expectations.compatibility import pydantic
+
+
+class TableSampler(pydantic.BaseModel):
+    """Samples a fraction of a SQL table with the dialect-native "TABLESAMPLE" clause.
+
+    Dialects without "TABLESAMPLE" support (or without support for the requested method) sample
+    rows at random instead.
+    """
+
+    fraction: float = pydantic.Field(..., gt=0.0, le=1.0)
+    method: Literal["system", "bernoulli"] = "system"
+    seed: Optional[int] = None
+    method_name: Literal["sample_using_tablesample"] = "sample_using_tablesample"
+
+    def sampling_method_kwargs(self) -> dict:
+        return {"p": self.fraction, "method": self.method, "seed": self.seed}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import threading
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 import great_expectations.exceptions as gx_exceptions
@@ -39,6 +40,9 @@ if TYPE_CHECKING:
     from great_expectations.datasource.fluent.batch_request import BatchParameters
     from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
 
+# Checkpoints may run validation definitions in threads, and store backends aren't thread-safe.
+_STORE_WRITE_LOCK = threading.Lock()
+
 
 class ValidationDefinition(BaseModel):
     """
@@ -200,7 +204,8 @@ class ValidationDefinition(BaseModel):
         run_id: RunIdentifier | None = None,
     ) -> ExpectationSuiteValidationResult:
         if not self.id:
-            self._add_to_store()
+            with _STORE_WRITE_LOCK:
+                self._add_to_store()
 
         validator = Validator(
             batch_definition=self.batch_definition,
@@ -222,11 +227,12 @@ class ValidationDefinition(BaseModel):
             validator=validator, run_id=run_id
         )
 
-        ref = self._validation_results_store.store_validation_results(
-            suite_validation_result=results,
-            suite_validation_result_identifier=validation_result_id,
-            expectation_suite_identifier=expectation_suite_identifier,
-        )
+        with _STORE_WRITE_LOCK:
+            ref = self._validation_results_store.store_validation_results(
+                suite_validation_result=results,
+                suite_validation_result_identifier=validation_result_id,
+                expectation_suite_identifier=expectation_suite_identifier,
+            )
 
         if isinstance(ref, GXCloudResourceRef):
             results.result_url = self._validation_results_store.parse_result_url_from_gx_cloud_ref(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
@@ -23,7 +24,11 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -31,6 +36,9 @@ from great_expectations.util import (
 
 logger = logging.getLogger(__name__)
 
+# File (in the site root), in which incremental builds record what pages were rendered from.
+RENDER_MANIFEST_FILEPATH = "render_manifest.json"
+
 
 class HtmlSiteStore:
     """
@@ -231,6 +239,25 @@ class HtmlSiteStore:
             "static_assets": static_assets_obj,
         }
 
+        if not is_gx_cloud_store:
+            render_manifest_obj = instantiate_class_from_config(
+                config=store_backend,
+                runtime_environment=runtime_environment,
+                config_defaults={
+                    "module_name": module_name,
+                    "filepath_template": RENDER_MANIFEST_FILEPATH,
+                    "suppress_store_backend_id": True,
+                },
+            )
+            if not render_manifest_obj:
+                raise ClassInstantiationError(
+                    module_name=module_name,
+                    package_name=None,
+                    class_name=store_backend["class_name"],
+                )
+
+            self.store_backends["render_manifest"] = render_manifest_obj
+
         # NOTE: Instead of using the filesystem as the source of record for keys,
         # this class tracks keys separately in an internal set.
         # This means that keys are stored for a specific session, but can't be fetched after the original  # noqa: E501
@@ -356,6 +383,31 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_render_manifest(self) -> dict:
+        """Returns the render manifest of the site (empty, if the site has none, or it cannot be read)."""  # noqa: E501
+        if "render_manifest" not in self.store_backends:
+            return {}
+
+        try:
+            return json.loads(self.store_backends["render_manifest"].get(()))
+        except InvalidKeyError:
+            return {}
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Render manifest of the site could not be read; ignoring it: {e!r}")
+            return {}
+
+    def set_render_manifest(self, manifest: dict) -> None:
+        """Writes the render manifest of the site; like the index page, it uses a zero-length tuple as a key."""  # noqa: E501
+        if "render_manifest" not in self.store_backends:
+            return
+
+        self.store_backends["render_manifest"].set(
+            (),
+            json.dumps(manifest, sort_keys=True),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
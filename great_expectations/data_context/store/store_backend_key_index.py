@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import contextlib
+import datetime
+import sqlite3
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Separator of key elements in the index (keys of tuple store backends are file or object paths, which cannot contain it).  # noqa: E501
+KEY_ELEMENT_SEPARATOR = "\x1f"
+
+# Seconds to wait for other processes (e.g., concurrent Checkpoint runs) writing to the index.
+KEY_INDEX_TIMEOUT_SECONDS = 30.0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS keys (key TEXT PRIMARY KEY, modified_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS keys_modified_at ON keys (modified_at)",
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+
+class StoreBackendKeyIndex:
+    """SQLite file indexing keys of a tuple store backend (with modification times of their objects).
+
+    Store backends keep the index in sync as they set, move, and remove keys, so that keys can be listed (optionally,
+    by prefix or by modification time) without walking the directory or paginating through the bucket.  The index is
+    built from a full listing of the store backend the first time it is used (and whenever "location" of the store
+    backend changes); objects that were added or removed by other means (e.g., copied into the directory) are only
+    reflected after it is rebuilt (see "TupleFilesystemStoreBackend.rebuild_key_index").
+
+    Args:
+        path: Path of the SQLite file (created, if it does not exist).
+        location: Location of the indexed store backend (e.g., its base directory); an index built for another
+            location is rebuilt before it is used.
+    """  # noqa: E501
+
+    def __init__(self, path: str, location: str) -> None:
+        self._path = path
+        self._location = location
+        self._schema_created = False
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def is_built(self) -> bool:
+        with self._connect() as connection:
+            row = connection.execute("SELECT value FROM meta WHERE name = 'location'").fetchone()
+
+        return row is not None and row[0] == self._location
+
+    def add(self, key: Tuple[str, ...], modified_at: Optional[float] = None) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO keys (key, modified_at) VALUES (?, ?)",
+                (_encode_key(key), time.time() if modified_at is None else modified_at),
+            )
+
+    def remove(self, key: Tuple[str, ...]) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM keys WHERE key = ?", (_encode_key(key),))
+
+    def move(
+        self,
+        source_key: Tuple[str, ...],
+        dest_key: Tuple[str, ...],
+        modified_at: Optional[float] = None,
+    ) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM keys WHERE key = ?", (_encode_key(source_key),))
+            connection.execute(
+                "INSERT OR REPLACE INTO keys (key, modified_at) VALUES (?, ?)",
+                (_encode_key(dest_key), time.time() if modified_at is None else modified_at),
+            )
+
+    def list_keys(
+        self,
+        prefix: Tuple[str, ...] = (),
+        modified_after: Optional[datetime.datetime] = None,
+        modified_before: Optional[datetime.datetime] = None,
+    ) -> List[Tuple[str, ...]]:
+        """Returns indexed keys (in sorted order), which start with elements of "prefix".
+
+        If "modified_after" and/or "modified_before" are specified, only keys whose objects were last modified in this
+        (half-open) time range are returned.
+        """  # noqa: E501
+        conditions: List[str] = []
+        parameters: List[object] = []
+        if prefix:
+            encoded_prefix: str = _encode_key(prefix)
+            # Keys starting with "prefix" sort after "<prefix><separator>" and before the next character.
+            conditions.append("(key = ? OR (key >= ? AND key < ?))")
+            parameters.extend(
+                [
+                    encoded_prefix,
+                    encoded_prefix + KEY_ELEMENT_SEPARATOR,
+                    encoded_prefix + chr(ord(KEY_ELEMENT_SEPARATOR) + 1),
+                ]
+            )
+
+        if modified_after is not None:
+            conditions.append("modified_at >= ?")
+            parameters.append(modified_after.timestamp())
+
+        if modified_before is not None:
+            conditions.append("modified_at < ?")
+            parameters.append(modified_before.timestamp())
+
+        query = "SELECT key FROM keys"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+
+        with self._connect() as connection:
+            rows = connection.execute(f"{query} ORDER BY key", parameters).fetchall()
+
+        return [_decode_key(row[0]) for row in rows]
+
+    def rebuild(self, keys_with_modification_times: Iterable[Tuple[Tuple[str, ...], float]]) -> int:
+        """Replaces all indexed keys (in one transaction) and returns the number of keys indexed."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM keys")
+            num_keys: int = connection.executemany(
+                "INSERT OR REPLACE INTO keys (key, modified_at) VALUES (?, ?)",
+                (
+                    (_encode_key(key), modified_at)
+                    for key, modified_at in keys_with_modification_times
+                ),
+            ).rowcount
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('location', ?)",
+                (self._location,),
+            )
+
+        return num_keys
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yields connection to the index; statements executed through it are committed as one transaction."""  # noqa: E501
+        connection = sqlite3.connect(self._path, timeout=KEY_INDEX_TIMEOUT_SECONDS)
+        try:
+            with connection:
+                if not self._schema_created:
+                    for statement in _SCHEMA:
+                        connection.execute(statement)
+
+                    self._schema_created = True
+
+                yield connection
+        finally:
+            connection.close()
+
+
+def _encode_key(key: Tuple[str, ...]) -> str:
+    return KEY_ELEMENT_SEPARATOR.join(key)
+
+
+def _decode_key(encoded_key: str) -> Tuple[str, ...]:
+    return tuple(encoded_key.split(KEY_ELEMENT_SEPARATOR)) if encoded_key else ()
@@ -1,6 +1,7 @@
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
 from __future__ import annotations
 
+import datetime
 import functools
 import logging
 import os
@@ -8,12 +9,15 @@ import pathlib
 import random
 import re
 import shutil
-from abc import ABCMeta
-from typing import Any, List, Tuple
+from abc import ABCMeta, abstractmethod
+from typing import Any, Iterable, List, Optional, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.store.store_backend_key_index import (
+    StoreBackendKeyIndex,
+)
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
 
@@ -214,12 +218,75 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         return self._config  # type: ignore[attr-defined]
 
 
-class TupleFilesystemStoreBackend(TupleStoreBackend):
+class _KeyIndexedTupleStoreBackend(TupleStoreBackend):
+    """Tuple store backend, which can keep an index of its keys (see "StoreBackendKeyIndex")."""
+
+    # Index of keys of store backends configured with "key_index_path".
+    _key_index: Optional[StoreBackendKeyIndex] = None
+
+    def rebuild_key_index(self) -> int:
+        """Rebuilds the key index from a full listing of the store backend (e.g., after objects were added or removed
+        by other means than this store backend) and returns the number of keys indexed.
+        """  # noqa: E501
+        if self._key_index is None:
+            raise StoreBackendError(  # noqa: TRY003
+                f"{self.__class__.__name__} has no key index; configure it with key_index_path."
+            )
+
+        num_keys: int = self._key_index.rebuild(self._scan_keys_with_modification_times())
+        logger.info(f"Indexed {num_keys} keys of {self.__class__.__name__}.")
+        return num_keys
+
+    def list_keys_modified_between(
+        self,
+        modified_after: Optional[datetime.datetime] = None,
+        modified_before: Optional[datetime.datetime] = None,
+        prefix: Tuple = (),
+    ) -> List[Tuple]:
+        """Lists keys (starting with elements of "prefix"), whose objects were last modified in the given time range.
+
+        Modification times are looked up in the key index, if the store backend has one; otherwise, every object is
+        listed with its modification time.
+        """  # noqa: E501
+        key_index: Optional[StoreBackendKeyIndex] = self._get_built_key_index()
+        if key_index is not None:
+            return key_index.list_keys(
+                prefix=prefix, modified_after=modified_after, modified_before=modified_before
+            )
+
+        after: Optional[float] = modified_after.timestamp() if modified_after else None
+        before: Optional[float] = modified_before.timestamp() if modified_before else None
+        return [
+            key
+            for key, modified_at in self._scan_keys_with_modification_times()
+            if key[: len(prefix)] == tuple(prefix)
+            and (after is None or modified_at >= after)
+            and (before is None or modified_at < before)
+        ]
+
+    def _get_built_key_index(self) -> Optional[StoreBackendKeyIndex]:
+        """Returns the key index (building it first, if it was not built for this store backend), if any."""  # noqa: E501
+        if self._key_index is not None and not self._key_index.is_built:
+            self.rebuild_key_index()
+
+        return self._key_index
+
+    @abstractmethod
+    def _scan_keys_with_modification_times(self) -> Iterable[Tuple[Tuple, float]]:
+        """Lists every key of the store backend with modification time (POSIX timestamp) of its object."""  # noqa: E501
+        raise NotImplementedError
+
+
+class TupleFilesystemStoreBackend(_KeyIndexedTupleStoreBackend):
     """Uses a local filepath as a store.
 
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    If key_index_path is provided (absolute, or relative to root_directory), keys are listed from a SQLite index at
+    that path (see "StoreBackendKeyIndex") instead of by walking base_directory (which must not contain the index);
+    call "rebuild_key_index" after files are added to or removed from base_directory by other means.
     """  # noqa: E501
 
     def __init__(  # noqa: PLR0913
@@ -236,6 +303,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        key_index_path=None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -269,6 +337,18 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             str(os.path.dirname(self.full_base_directory)),  # noqa: PTH120
             exist_ok=True,
         )
+        if key_index_path:
+            full_key_index_path = key_index_path
+            if not os.path.isabs(key_index_path) and root_directory:  # noqa: PTH117
+                full_key_index_path = os.path.join(root_directory, key_index_path)  # noqa: PTH118
+            os.makedirs(  # noqa: PTH103
+                os.path.dirname(os.path.abspath(full_key_index_path)),  # noqa: PTH100, PTH120
+                exist_ok=True,
+            )
+            self._key_index = StoreBackendKeyIndex(
+                path=full_key_index_path, location=self.full_base_directory
+            )
+
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -288,6 +368,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "key_index_path": key_index_path,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -326,6 +407,10 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
+
+        if self._key_index is not None and not self.is_ignored_key(key):
+            self._key_index.add(key, modified_at=os.path.getmtime(filepath))  # noqa: PTH204
+
         return filepath
 
     def _move(self, source_key, dest_key, **kwargs):
@@ -341,12 +426,32 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if os.path.exists(source_path):  # noqa: PTH110
             os.makedirs(dest_dir, exist_ok=True)  # noqa: PTH103
             shutil.move(source_path, dest_path)
+            if self._key_index is not None:
+                self._key_index.move(
+                    source_key, dest_key, modified_at=os.path.getmtime(dest_path)  # noqa: PTH204
+                )
             return dest_key
 
         return False
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        key_index: Optional[StoreBackendKeyIndex] = self._get_built_key_index()
+        if key_index is not None:
+            return key_index.list_keys(prefix=prefix)
+
+        return [key for key, _ in self._list_keys_with_filepaths(prefix=prefix)]
+
+    @override
+    def _scan_keys_with_modification_times(self) -> Iterable[Tuple[Tuple, float]]:
+        for key, filepath in self._list_keys_with_filepaths():
+            try:
+                yield key, os.path.getmtime(filepath)  # noqa: PTH204
+            except FileNotFoundError:
+                # Removed since it was listed.
+                continue
+
+    def _list_keys_with_filepaths(self, prefix: Tuple = ()) -> List[Tuple[Tuple, str]]:
         key_list = []
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118
@@ -372,7 +477,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     continue
                 key = self._convert_filepath_to_key(filepath)
                 if key and not self.is_ignored_key(key):
-                    key_list.append(key)
+                    key_list.append((key, os.path.join(root, file_)))  # noqa: PTH118
 
         return key_list
 
@@ -400,6 +505,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             self.full_base_directory, self._convert_key_to_filepath(key)
         )
 
+        if self._key_index is not None:
+            self._key_index.remove(key)
+
         if os.path.exists(filepath):  # noqa: PTH110
             d_path = os.path.dirname(filepath)  # noqa: PTH120
             os.remove(filepath)  # noqa: PTH107
@@ -441,13 +549,17 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         return self._config
 
 
-class TupleS3StoreBackend(TupleStoreBackend):
+class TupleS3StoreBackend(_KeyIndexedTupleStoreBackend):
     """
     Uses an S3 bucket as a store.
 
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    If key_index_path (a local path) is provided, keys are listed from a SQLite index at that path (see
+    "StoreBackendKeyIndex") instead of by paginating through all objects under prefix; call "rebuild_key_index" after
+    objects are added to or removed from the bucket by other means (e.g., by other machines, with their own indexes).
     """  # noqa: E501
 
     def __init__(  # noqa: PLR0913
@@ -467,6 +579,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        key_index_path=None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -496,6 +609,15 @@ class TupleS3StoreBackend(TupleStoreBackend):
             s3_put_options = {}
         self.s3_put_options = s3_put_options
         self.endpoint_url = endpoint_url
+        if key_index_path:
+            os.makedirs(  # noqa: PTH103
+                os.path.dirname(os.path.abspath(key_index_path)),  # noqa: PTH100, PTH120
+                exist_ok=True,
+            )
+            self._key_index = StoreBackendKeyIndex(
+                path=key_index_path, location=f"s3://{bucket}/{prefix}"
+            )
+
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -518,6 +640,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "key_index_path": key_index_path,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -597,6 +720,13 @@ class TupleS3StoreBackend(TupleStoreBackend):
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.") from e  # noqa: TRY003
 
+        if self._key_index is not None:
+            # Index the time S3 recorded for the object, as "rebuild_key_index" does.
+            last_modified = s3.meta.client.head_object(Bucket=self.bucket, Key=s3_object_key)[
+                "LastModified"
+            ]
+            self._key_index.add(key, modified_at=last_modified.timestamp())
+
         return s3_object_key
 
     @override
@@ -614,9 +744,24 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         s3.Object(self.bucket, source_filepath).delete()
 
+        if self._key_index is not None:
+            self._key_index.move(source_key, dest_key)
+
     @override
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:  # noqa: C901 - too complex
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
+    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        key_index: Optional[StoreBackendKeyIndex] = self._get_built_key_index()
+        if key_index is not None:
+            return key_index.list_keys(prefix=prefix)
+
+        # Note that without key index, the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
+        return [key for key, _ in self._list_keys_with_s3_objects()]
+
+    @override
+    def _scan_keys_with_modification_times(self) -> Iterable[Tuple[Tuple, float]]:
+        for key, s3_object_info in self._list_keys_with_s3_objects():
+            yield key, s3_object_info.last_modified.timestamp()
+
+    def _list_keys_with_s3_objects(self) -> List[Tuple[Tuple, Any]]:  # noqa: C901 - too complex
         s3r = self._create_resource()
         bucket = s3r.Bucket(self.bucket)
         key_list = []
@@ -644,7 +789,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
             if key:
-                key_list.append(key)
+                key_list.append((key, s3_object_info))
         return key_list
 
     def get_url_for_key(self, key, protocol=None):
@@ -693,6 +838,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         # Check if the object exists
         if self.has_key(key):
+            if self._key_index is not None:
+                self._key_index.remove(key)
             # This implementation deletes the object if non-versioned or adds a delete marker if versioned  # noqa: E501
             s3.Object(self.bucket, s3_object_key).delete()
             return True
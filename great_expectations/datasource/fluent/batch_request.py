@@ -22,6 +22,7 @@ from great_expectations.compatibility.pydantic import (
 # default_ref_template
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_definition import PartitionerT
+from great_expectations.core.samplers import TableSampler  # noqa: TCH001
 
 # moving this import into TYPE_CHECKING requires forward refs to be updated.
 from great_expectations.datasource.fluent.data_connector.batch_filter import (
@@ -59,6 +60,7 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
             calling DataAsset.get_batch_parameters_keys(...).
         batch_slice: A python slice that can be used to filter the sorted batches by index.
             e.g. `batch_slice = "[-5:]"` will request only the last 5 batches after the options filter is applied.
+        sampler: A Sampler used to sample data of each Batch (supported by SQL table Data Assets).
 
     Returns:
         BatchRequest
@@ -83,6 +85,7 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
         ),
     )
     partitioner: Optional[PartitionerT] = None
+    sampler: Optional[TableSampler] = None
     _batch_slice_input: Optional[BatchSlice] = pydantic.PrivateAttr(
         default=None,
     )
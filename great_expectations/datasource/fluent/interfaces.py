@@ -80,6 +80,7 @@ if TYPE_CHECKING:
     )
     from great_expectations.core.config_provider import _ConfigurationProvider
     from great_expectations.core.id_dict import BatchSpec
+    from great_expectations.core.samplers import TableSampler
     from great_expectations.data_context import (
         AbstractDataContext as GXDataContext,
     )
@@ -295,6 +296,9 @@ class DataAsset(GenericBaseModel, Generic[DatasourceT, PartitionerT]):
     batch_metadata: BatchMetadata = pydantic.Field(default_factory=dict)
     batch_definitions: List[BatchDefinition] = Field(default_factory=list)
 
+    # Whether BatchDefinitions of this DataAsset can be sampled (see "add_batch_definition").
+    _supports_sampler: ClassVar[bool] = False
+
     # non-field private attributes
     _save_batch_definition: Callable[[BatchDefinition], None] = pydantic.PrivateAttr()
     _datasource: DatasourceT = pydantic.PrivateAttr()
@@ -366,6 +370,7 @@ class DataAsset(GenericBaseModel, Generic[DatasourceT, PartitionerT]):
         self,
         name: str,
         partitioner: Optional[PartitionerT] = None,
+        sampler: Optional[TableSampler] = None,
     ) -> BatchDefinition[PartitionerT]:
         """Add a BatchDefinition to this DataAsset.
         BatchDefinition names must be unique within a DataAsset.
@@ -375,10 +380,19 @@ class DataAsset(GenericBaseModel, Generic[DatasourceT, PartitionerT]):
         Args:
             name (str): Name of the new batch definition.
             partitioner: Optional Partitioner to partition this BatchDefinition
+            sampler: Optional Sampler to sample this BatchDefinition (supported by SQL table assets)
 
         Returns:
             BatchDefinition: The new batch definition.
+
+        Raises:
+            ValueError: If a sampler is passed, but this DataAsset cannot sample its Batches.
         """
+        if sampler is not None and not self._supports_sampler:
+            raise ValueError(  # noqa: TRY003
+                f"{self.__class__.__name__} does not support sampling; only SQL table assets can be sampled."  # noqa: E501
+            )
+
         batch_definition_names = {bc.name for bc in self.batch_definitions}
         if name in batch_definition_names:
             raise ValueError(  # noqa: TRY003
@@ -388,7 +402,9 @@ class DataAsset(GenericBaseModel, Generic[DatasourceT, PartitionerT]):
         # Let mypy know that self.datasource is a Datasource (it is currently bound to MetaDatasource)  # noqa: E501
         assert isinstance(self.datasource, Datasource)
 
-        batch_definition = BatchDefinition[PartitionerT](name=name, partitioner=partitioner)
+        batch_definition = BatchDefinition[PartitionerT](
+            name=name, partitioner=partitioner, sampler=sampler
+        )
         batch_definition.set_data_asset(self)
         self.batch_definitions.append(batch_definition)
         self.update_batch_definition_field_set()
@@ -79,7 +79,9 @@ class InvalidAsset(DataAsset):
         )
 
     @override
-    def add_batch_definition(self, name: str, partitioner: Any | None = None) -> NoReturn:
+    def add_batch_definition(
+        self, name: str, partitioner: Any | None = None, sampler: Any | None = None
+    ) -> NoReturn:
         self._raise_type_error()
 
     @override
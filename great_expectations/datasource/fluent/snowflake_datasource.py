@@ -736,7 +736,10 @@ class SnowflakeDatasource(SQLDatasource):
             self.name,
             connection_string=connection_string,
             engine=self.get_engine(),
-            create_temp_table=self.create_temp_table,
+            # Query-based Batches may be materialized on demand, if "create_temp_table" is not set.
+            create_temp_table=self.create_temp_table
+            if "create_temp_table" in self.__fields_set__
+            else None,
             data_context=self._data_context,
         )
         self._execution_engine = gx_exec_engine
@@ -82,6 +82,7 @@ if TYPE_CHECKING:
 
     from great_expectations.compatibility import sqlalchemy
     from great_expectations.core.batch_definition import BatchDefinition
+    from great_expectations.core.samplers import TableSampler
     from great_expectations.datasource.fluent import BatchParameters
     from great_expectations.datasource.fluent.interfaces import (
         BatchMetadata,
@@ -617,6 +618,11 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
                         request.options
                     )
                 )
+            if batch_request.sampler:
+                batch_spec_kwargs["sampling_method"] = batch_request.sampler.method_name
+                batch_spec_kwargs["sampling_kwargs"] = (
+                    batch_request.sampler.sampling_method_kwargs()
+                )
             # Creating the batch_spec is our hook into the execution engine.
             batch_spec = self._create_batch_spec(batch_spec_kwargs)
             execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
@@ -694,26 +700,38 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
         )
 
     @public_api
-    def add_batch_definition_whole_table(self, name: str) -> BatchDefinition:
+    def add_batch_definition_whole_table(
+        self, name: str, sampler: Optional[TableSampler] = None
+    ) -> BatchDefinition:
         return self.add_batch_definition(
             name=name,
             partitioner=None,
+            sampler=sampler,
         )
 
     @public_api
     def add_batch_definition_yearly(
-        self, name: str, column: str, sort_ascending: bool = True
+        self,
+        name: str,
+        column: str,
+        sort_ascending: bool = True,
+        sampler: Optional[TableSampler] = None,
     ) -> BatchDefinition:
         return self.add_batch_definition(
             name=name,
             partitioner=ColumnPartitionerYearly(
                 method_name="partition_on_year", column_name=column, sort_ascending=sort_ascending
             ),
+            sampler=sampler,
         )
 
     @public_api
     def add_batch_definition_monthly(
-        self, name: str, column: str, sort_ascending: bool = True
+        self,
+        name: str,
+        column: str,
+        sort_ascending: bool = True,
+        sampler: Optional[TableSampler] = None,
     ) -> BatchDefinition:
         return self.add_batch_definition(
             name=name,
@@ -722,11 +740,16 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
                 column_name=column,
                 sort_ascending=sort_ascending,
             ),
+            sampler=sampler,
         )
 
     @public_api
     def add_batch_definition_daily(
-        self, name: str, column: str, sort_ascending: bool = True
+        self,
+        name: str,
+        column: str,
+        sort_ascending: bool = True,
+        sampler: Optional[TableSampler] = None,
     ) -> BatchDefinition:
         return self.add_batch_definition(
             name=name,
@@ -735,6 +758,7 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
                 column_name=column,
                 sort_ascending=sort_ascending,
             ),
+            sampler=sampler,
         )
 
     @override
@@ -831,6 +855,8 @@ class QueryAsset(_SQLAsset):
 
 @public_api
 class TableAsset(_SQLAsset):
+    _supports_sampler: ClassVar[bool] = True
+
     # Instance fields
     type: Literal["table"] = "table"
     # TODO: quoted_name or str
@@ -1081,6 +1107,9 @@ class SQLDatasource(Datasource):
             # but we want to include them here
             exclude_unset=False,
         )
+        # Query-based Batches may be materialized on demand, if "create_temp_table" is not set.
+        if "create_temp_table" not in self.__fields_set__:
+            current_execution_engine_kwargs["create_temp_table"] = None
         if (
             current_execution_engine_kwargs != self._cached_execution_engine_kwargs
             or not self._execution_engine
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import logging
+import sqlite3
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
 from typing import (
@@ -21,6 +22,10 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.persistent_metric_cache import (
+    PersistentMetricCache,
+    is_persistable_metric_name,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -47,6 +52,7 @@ if TYPE_CHECKING:
         BatchSpec,
     )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
+    from great_expectations.validator.metrics_calculator import _MetricKey
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
@@ -131,6 +137,8 @@ class ExecutionEngine(ABC):
     Args:
         name: (str) name of this ExecutionEngine
         caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        persistent_metric_cache: PersistentMetricCache object (or dictionary of its constructor arguments); if set, \
+        then resolved metrics are also stored on disk, keyed by Batch fingerprint, and reused across validation runs.
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
@@ -138,13 +146,14 @@ class ExecutionEngine(ABC):
 
     recognized_batch_spec_defaults: Set[str] = set()
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         name: Optional[str] = None,
         caching: bool = True,
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -158,6 +167,12 @@ class ExecutionEngine(ABC):
         else:
             self._metric_cache = NoOpDict()
 
+        if isinstance(persistent_metric_cache, dict):
+            persistent_metric_cache = PersistentMetricCache(**persistent_metric_cache)
+
+        self._persistent_metric_cache: Optional[PersistentMetricCache] = persistent_metric_cache
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -190,6 +205,9 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "persistent_metric_cache": persistent_metric_cache.to_config()
+            if persistent_metric_cache
+            else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -214,6 +232,11 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        """Getter for on-disk cache of resolved metrics (None, unless configured)"""
+        return self._persistent_metric_cache
+
     def _load_batch_data_from_dict(self, batch_data_dict: Dict[str, BatchDataType]) -> None:
         """
         Loads all data in batch_data_dict using cache_batch_data
@@ -224,8 +247,142 @@ class ExecutionEngine(ABC):
             self.load_batch_data(batch_id=batch_id, batch_data=batch_data)  # type: ignore[arg-type]
 
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        self._batch_fingerprints.pop(batch_id, None)
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def get_batch_fingerprint(self, batch_id: Optional[str] = None) -> Optional[str]:
+        """Returns a fingerprint identifying contents of loaded Batch of data (or None, if unknown).
+
+        Metric values computed from a Batch, whose fingerprint is unknown, are never persisted, since there is no way to
+        tell whether or not they remain valid for subsequent validation runs.
+
+        Args:
+            batch_id: ID of loaded Batch (default is ID of active Batch)
+
+        Returns:
+            Fingerprint string (unique to type of ExecutionEngine and to data contents) or None
+        """  # noqa: E501
+        if batch_id is None:
+            batch_id = self._batch_manager.active_batch_data_id
+
+        if batch_id is None or batch_id not in self._batch_manager.batch_data_cache:
+            return None
+
+        if batch_id not in self._batch_fingerprints:
+            batch_fingerprint: Optional[str] = self._compute_batch_fingerprint(batch_id=batch_id)
+            self._batch_fingerprints[batch_id] = (
+                None
+                if batch_fingerprint is None
+                else f"{self.__class__.__name__}:{batch_fingerprint}"
+            )
+
+        return self._batch_fingerprints[batch_id]
+
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Obtains fingerprint of Batch contents from its BatchMarkers; subclasses may compute it from data."""  # noqa: E501
+        batch = self._batch_manager.batch_cache.get(batch_id)
+        batch_markers: Optional[BatchMarkers] = getattr(batch, "batch_markers", None)
+        if not batch_markers:
+            return None
+
+        return batch_markers.get("batch_fingerprint") or batch_markers.get(
+            "pandas_data_fingerprint"
+        )
+
+    def get_persisted_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[_MetricKey, MetricValue]:
+        """Looks up values of "metric_configurations" in persistent metric cache (if one is configured).
+
+        Args:
+            metric_configurations: "MetricConfiguration" objects, whose values may have been computed previously
+
+        Returns:
+            Dictionary of previously computed metric values (keyed by ID of corresponding "MetricConfiguration")
+        """  # noqa: E501
+        if self._persistent_metric_cache is None:
+            return {}
+
+        persisted_metrics: Dict[_MetricKey, MetricValue] = {}
+
+        batch_fingerprint: str
+        metric_ids: Set[_MetricKey]
+        for (
+            batch_fingerprint,
+            metric_ids,
+        ) in self._get_persistable_metric_ids_by_batch_fingerprint(
+            metric_configurations=metric_configurations
+        ).items():
+            try:
+                persisted_metrics.update(
+                    self._persistent_metric_cache.get(
+                        batch_fingerprint=batch_fingerprint, metric_ids=metric_ids
+                    )
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Unable to read from persistent metric cache: {e!r}")
+
+        return persisted_metrics
+
+    def prepare_batch_data_for_metrics(  # noqa: B027 # empty-method-without-abstract-decorator
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Optionally prepares loaded Batch data, before "metric_configurations" are resolved against it.
+
+        Args:
+            metric_configurations: "MetricConfiguration" objects, which are about to be resolved
+        """  # noqa: E501
+        pass
+
+    def _persist_resolved_metrics(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        resolved_metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        if self._persistent_metric_cache is None:
+            return
+
+        batch_fingerprint: str
+        metric_ids: Set[_MetricKey]
+        for (
+            batch_fingerprint,
+            metric_ids,
+        ) in self._get_persistable_metric_ids_by_batch_fingerprint(
+            metric_configurations=metric_configurations
+        ).items():
+            try:
+                self._persistent_metric_cache.put(
+                    batch_fingerprint=batch_fingerprint,
+                    metrics={
+                        metric_id: resolved_metrics[metric_id]
+                        for metric_id in metric_ids
+                        if metric_id in resolved_metrics
+                    },
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Unable to write to persistent metric cache: {e!r}")
+
+    def _get_persistable_metric_ids_by_batch_fingerprint(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[str, Set[_MetricKey]]:
+        metric_ids_by_batch_fingerprint: Dict[str, Set[_MetricKey]] = {}
+
+        metric_configuration: MetricConfiguration
+        batch_fingerprint: Optional[str]
+        for metric_configuration in metric_configurations:
+            if not is_persistable_metric_name(metric_name=metric_configuration.metric_name):
+                continue
+
+            batch_fingerprint = self.get_batch_fingerprint(
+                batch_id=metric_configuration.metric_domain_kwargs.get("batch_id")
+            )
+            if batch_fingerprint is not None:
+                metric_ids_by_batch_fingerprint.setdefault(batch_fingerprint, set()).add(
+                    metric_configuration.id
+                )
+
+        return metric_ids_by_batch_fingerprint
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -546,6 +703,9 @@ class ExecutionEngine(ABC):
                 self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle_configurations)
             )
             resolved_metrics.update(resolved_metric_bundle)
+        except gx_exceptions.MetricResolutionError:
+            # Engine already attributed the failure to the specific "MetricConfiguration" objects involved.  # noqa: E501
+            raise
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
@@ -558,6 +718,15 @@ class ExecutionEngine(ABC):
         if self._caching:
             self._metric_cache.update(resolved_metrics)
 
+        self._persist_resolved_metrics(
+            metric_configurations=[
+                metric_computation_configuration.metric_configuration
+                for metric_computation_configuration in metric_fn_direct_configurations
+                + metric_fn_bundle_configurations
+            ],
+            resolved_metrics=resolved_metrics,
+        )
+
         return resolved_metrics
 
     def _partition_domain_kwargs(
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import functools
+import itertools
+import logging
+from collections import ChainMap
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+import numpy as np
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.batch import BatchData
+from great_expectations.core.metric_function_types import (
+    SummarizationMetricNameSuffixes,
+)
+from great_expectations.execution_engine.persistent_metric_cache import (
+    is_persistable_metric_name,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.pandas_execution_engine import (
+        PandasExecutionEngine,
+    )
+    from great_expectations.execution_engine.pandas_quantile_sketch import QuantileSketch
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+    from great_expectations.validator.metrics_calculator import _MetricKey
+
+logger = logging.getLogger(__name__)
+
+
+class PandasChunkedBatchData(BatchData):
+    """BatchData, whose records are read from source one DataFrame chunk at a time, instead of all at once.
+
+    Only metrics, whose per-chunk values can be combined into the value for the whole Batch (see
+    "get_chunk_results_combiner()"), are computed over chunked Batch data; other metrics require records of the whole
+    Batch in memory and are not supported.
+
+    Args:
+        execution_engine: PandasExecutionEngine, which loaded this BatchData
+        chunk_reader: callable returning an iterator over consecutive DataFrame chunks of Batch (called once per pass)
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader: Callable[[], Iterable[pd.DataFrame]],
+    ) -> None:
+        super().__init__(execution_engine=execution_engine)
+        self._chunk_reader = chunk_reader
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        return iter(self._chunk_reader())
+
+
+class _ChunkDeferredMetricValue:
+    """Placeholder value of partial function metrics over chunked Batch data (evaluated separately for each chunk)."""  # noqa: E501
+
+    def __repr__(self) -> str:
+        return "<deferred to chunks>"
+
+
+CHUNK_DEFERRED_METRIC_VALUE = _ChunkDeferredMetricValue()
+
+ChunkResultsCombiner = Callable[[List[Any], "MetricConfiguration"], Any]
+
+
+def _combine_sum(results: List[Any], metric_configuration: MetricConfiguration) -> Any:
+    return sum(results[1:], results[0])
+
+
+def _combine_first(results: List[Any], metric_configuration: MetricConfiguration) -> Any:
+    return results[0]
+
+
+def _combine_min(results: List[Any], metric_configuration: MetricConfiguration) -> Any:
+    values: List[Any] = [result for result in results if not pd.isna(result)]
+    return min(values) if values else np.nan
+
+
+def _combine_max(results: List[Any], metric_configuration: MetricConfiguration) -> Any:
+    values: List[Any] = [result for result in results if not pd.isna(result)]
+    return max(values) if values else np.nan
+
+
+def _combine_set_union(results: List[Any], metric_configuration: MetricConfiguration) -> Any:
+    return set().union(*results)
+
+
+def _combine_quantile_sketches(
+    results: List[QuantileSketch], metric_configuration: MetricConfiguration
+) -> QuantileSketch:
+    return functools.reduce(lambda merged, sketch: merged.merge(sketch), results)
+
+
+def _combine_value_counts(
+    results: List[pd.Series], metric_configuration: MetricConfiguration
+) -> pd.Series:
+    counts: pd.Series = pd.concat(results).groupby(level=0, sort=False).sum()
+    # Mirrors "sort" semantics of "column.value_counts" metric for Pandas.
+    if (metric_configuration.metric_value_kwargs.get("sort") or "value") == "value":
+        try:
+            counts = counts.sort_index()
+        except TypeError:
+            counts.index = counts.index.astype(str)
+            counts = counts.sort_index()
+    else:
+        counts = counts.sort_values(ascending=False, kind="stable")
+
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
+
+
+def _combine_unexpected_list(
+    results: List[list], metric_configuration: MetricConfiguration
+) -> list:
+    result_format: dict = metric_configuration.metric_value_kwargs["result_format"]
+    unexpected_list: list = list(itertools.chain.from_iterable(results))
+    if result_format["result_format"] == "COMPLETE":
+        return unexpected_list
+
+    return unexpected_list[: result_format["partial_unexpected_count"]]
+
+
+def _combine_unexpected_rows(
+    results: List[pd.DataFrame], metric_configuration: MetricConfiguration
+) -> pd.DataFrame:
+    result_format: dict = metric_configuration.metric_value_kwargs["result_format"]
+    unexpected_rows: pd.DataFrame = pd.concat(results)
+    if result_format["result_format"] == "COMPLETE":
+        return unexpected_rows
+
+    return unexpected_rows.iloc[: result_format["partial_unexpected_count"]]
+
+
+def _combine_table_head(
+    results: List[pd.DataFrame], metric_configuration: MetricConfiguration
+) -> pd.DataFrame:
+    metric_value_kwargs = metric_configuration.metric_value_kwargs
+    head: pd.DataFrame = pd.concat(results)
+    if metric_value_kwargs.get("fetch_all"):
+        return head
+
+    n_rows: Optional[int] = metric_value_kwargs.get("n_rows")
+    if n_rows is None:
+        from great_expectations.expectations.metrics.table_metrics.table_head import TableHead
+
+        n_rows = TableHead.default_kwarg_values["n_rows"]
+
+    if n_rows < 0:
+        raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+            'Negative "n_rows" of "table.head" metric is not supported for chunked Batch data.'
+        )
+
+    return head.head(n=n_rows)
+
+
+_CHUNK_RESULTS_COMBINERS_BY_METRIC_NAME: Dict[str, ChunkResultsCombiner] = {
+    "table.row_count": _combine_sum,
+    "table.columns": _combine_first,
+    "table.column_types": _combine_first,
+    "table.head": _combine_table_head,
+    "column.min": _combine_min,
+    "column.max": _combine_max,
+    "column.sum": _combine_sum,
+    "column.value_counts": _combine_value_counts,
+    "column.distinct_values": _combine_set_union,
+    "column.quantile_sketch": _combine_quantile_sketches,
+}
+
+_CHUNK_RESULTS_COMBINERS_BY_METRIC_NAME_SUFFIX: Dict[str, ChunkResultsCombiner] = {
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value: _combine_sum,
+    SummarizationMetricNameSuffixes.FILTERED_ROW_COUNT.value: _combine_sum,
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value: _combine_unexpected_list,
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value: _combine_unexpected_list,
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value: _combine_unexpected_rows,
+}
+
+
+def get_chunk_results_combiner(metric_name: str) -> Optional[ChunkResultsCombiner]:
+    """Returns function combining per-chunk values of metric into its value for whole Batch (None if unsupported)."""  # noqa: E501
+    combiner: Optional[ChunkResultsCombiner] = _CHUNK_RESULTS_COMBINERS_BY_METRIC_NAME.get(
+        metric_name
+    )
+    if combiner is None:
+        combiner = _CHUNK_RESULTS_COMBINERS_BY_METRIC_NAME_SUFFIX.get(metric_name.rsplit(".")[-1])
+
+    return combiner
+
+
+def is_chunk_deferred_metric_name(metric_name: str) -> bool:
+    """Partial function metrics (maps, conditions, aggregate functions) are evaluated separately for each chunk."""  # noqa: E501
+    return not is_persistable_metric_name(metric_name=metric_name)
+
+
+def resolve_chunked_metrics(
+    execution_engine: PandasExecutionEngine,
+    batch_data: PandasChunkedBatchData,
+    metrics_to_resolve: List[MetricConfiguration],
+    metrics: Dict[_MetricKey, MetricValue],
+    runtime_configuration: Optional[dict] = None,
+) -> Dict[_MetricKey, MetricValue]:
+    """Resolves combinable "metrics_to_resolve" over chunked Batch data in a single pass over its chunks.
+
+    Every chunk is loaded into a separate in-memory PandasExecutionEngine, which evaluates deferred partial function
+    dependencies of "metrics_to_resolve" and then "metrics_to_resolve" themselves; other dependencies (e.g.,
+    "table.columns") retain their values for the whole Batch.  Per-chunk values are combined as chunks are consumed,
+    so that memory use is bounded by the size of a chunk.
+    """  # noqa: E501
+    waves: List[List[MetricConfiguration]] = _get_chunk_resolution_waves(
+        metrics_to_resolve=metrics_to_resolve, metrics=metrics
+    )
+
+    batch_id: Optional[str] = metrics_to_resolve[0].metric_domain_kwargs.get("batch_id")
+    if batch_id is None:
+        batch_id = execution_engine.batch_manager.active_batch_data_id
+
+    chunk_execution_engine = execution_engine.__class__(caching=False)
+
+    metric_configurations_by_id: Dict[_MetricKey, MetricConfiguration] = {
+        metric_configuration.id: metric_configuration for metric_configuration in metrics_to_resolve
+    }
+    resolved_metrics: Dict[_MetricKey, MetricValue] = {}
+    num_chunks: int = 0
+    try:
+        chunk: pd.DataFrame
+        for chunk in batch_data.iter_chunks():
+            chunk_execution_engine.load_batch_data(batch_id=batch_id, batch_data=chunk)  # type: ignore[arg-type]
+            chunk_metrics: Dict[_MetricKey, MetricValue] = {}
+            all_metrics = ChainMap(chunk_metrics, metrics)
+            wave: List[MetricConfiguration]
+            for wave in waves:
+                chunk_metrics.update(
+                    chunk_execution_engine.resolve_metrics(
+                        metrics_to_resolve=wave,
+                        metrics=all_metrics,  # type: ignore[arg-type]
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+
+            metric_id: _MetricKey
+            metric_configuration: MetricConfiguration
+            for metric_id, metric_configuration in metric_configurations_by_id.items():
+                if metric_id in resolved_metrics:
+                    combiner = get_chunk_results_combiner(metric_configuration.metric_name)
+                    resolved_metrics[metric_id] = combiner(  # type: ignore[misc] # only combinable metrics are resolved
+                        [resolved_metrics[metric_id], chunk_metrics[metric_id]],
+                        metric_configuration,
+                    )
+                else:
+                    resolved_metrics[metric_id] = chunk_metrics[metric_id]
+
+            num_chunks += 1
+    except Exception as e:
+        raise gx_exceptions.MetricResolutionError(
+            message=str(e),
+            failed_metrics=metrics_to_resolve,
+        ) from e
+
+    logger.debug(
+        f"PandasExecutionEngine resolved {len(metrics_to_resolve)} metrics over {num_chunks} chunks of Batch {batch_id}."  # noqa: E501
+    )
+    if len(resolved_metrics) < len(metric_configurations_by_id):
+        raise gx_exceptions.MetricResolutionError(
+            message=f"Batch {batch_id} has no data chunks to compute metrics from.",
+            failed_metrics=metrics_to_resolve,
+        )
+
+    return resolved_metrics
+
+
+def _get_chunk_resolution_waves(  # noqa: C901
+    metrics_to_resolve: List[MetricConfiguration],
+    metrics: Dict[_MetricKey, MetricValue],
+) -> List[List[MetricConfiguration]]:
+    """Orders deferred (transitive) dependencies of "metrics_to_resolve", followed by "metrics_to_resolve", into waves, whose members depend only on members of preceding waves."""  # noqa: E501
+    wave_index_by_id: Dict[_MetricKey, int] = {}
+    deferred_metrics: Dict[_MetricKey, MetricConfiguration] = {}
+
+    def _get_wave_index(metric_configuration: MetricConfiguration) -> int:
+        if metric_configuration.id not in wave_index_by_id:
+            wave_index_by_id[metric_configuration.id] = 1 + max(
+                (
+                    _get_wave_index(dependency)
+                    for dependency in metric_configuration.metric_dependencies.values()
+                    if metrics.get(dependency.id) is CHUNK_DEFERRED_METRIC_VALUE
+                ),
+                default=-1,
+            )
+
+        return wave_index_by_id[metric_configuration.id]
+
+    def _collect_deferred_dependencies(metric_configuration: MetricConfiguration) -> None:
+        dependency: MetricConfiguration
+        for dependency in metric_configuration.metric_dependencies.values():
+            if (
+                metrics.get(dependency.id) is CHUNK_DEFERRED_METRIC_VALUE
+                and dependency.id not in deferred_metrics
+            ):
+                deferred_metrics[dependency.id] = dependency
+                _collect_deferred_dependencies(dependency)
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metrics_to_resolve:
+        _collect_deferred_dependencies(metric_configuration)
+
+    waves: List[List[MetricConfiguration]] = []
+    for metric_configuration in deferred_metrics.values():
+        wave_index: int = _get_wave_index(metric_configuration)
+        while len(waves) <= wave_index:
+            waves.append([])
+
+        waves[wave_index].append(metric_configuration)
+
+    waves.append(list(metrics_to_resolve))
+    return waves
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import enum
+import logging
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Number of elements processed at a time by the fused kernel; chosen so that a block of float64
+# values (and temporaries derived from it) stays in CPU cache while every aggregate is applied.
+FUSED_AGGREGATE_BLOCK_SIZE = 1 << 16
+
+
+class PandasColumnAggregate(str, enum.Enum):
+    """Column aggregates that "PandasExecutionEngine" can compute together in a single pass over a column.
+
+    Pandas "column_aggregate_partial" metric implementations return one of these members (or, for aggregates that
+    cannot be fused, a callable accepting the "pd.Series" of column values); "PandasExecutionEngine" bundles all of
+    them that share a compute Domain and column.
+    """  # noqa: E501
+
+    MIN = "min"
+    MAX = "max"
+    SUM = "sum"
+    MEAN = "mean"
+    STANDARD_DEVIATION = "standard_deviation"
+
+
+_PANDAS_AGGREGATE_FNS: Dict[PandasColumnAggregate, Callable[[pd.Series], Any]] = {
+    PandasColumnAggregate.MIN: lambda column: column.min(),
+    PandasColumnAggregate.MAX: lambda column: column.max(),
+    PandasColumnAggregate.SUM: lambda column: column.sum(),
+    PandasColumnAggregate.MEAN: lambda column: column.mean(),
+    PandasColumnAggregate.STANDARD_DEVIATION: lambda column: column.std(),
+}
+
+_DECIMAL_SENSITIVE_AGGREGATES: Set[PandasColumnAggregate] = {
+    PandasColumnAggregate.SUM,
+    PandasColumnAggregate.MEAN,
+    PandasColumnAggregate.STANDARD_DEVIATION,
+}
+
+
+def compute_column_aggregates(
+    column: pd.Series, aggregates: Set[PandasColumnAggregate]
+) -> Dict[PandasColumnAggregate, Any]:
+    """Computes requested aggregates of "column", making a single pass over numeric NumPy-backed columns.
+
+    Columns of any other type (e.g., strings, datetimes, "decimal.Decimal" objects, or pandas extension types) are
+    aggregated one at a time using the corresponding "pd.Series" methods, exactly as the individual metrics would.
+    """  # noqa: E501
+    if is_fusable_column(column=column):
+        return _compute_fused_aggregates(values=column.to_numpy(), aggregates=aggregates)
+
+    results: Dict[PandasColumnAggregate, Any] = {}
+    decimal_safe_column: Optional[pd.Series] = None
+    for aggregate in aggregates:
+        if aggregate in _DECIMAL_SENSITIVE_AGGREGATES:
+            if decimal_safe_column is None:
+                decimal_safe_column = convert_pandas_series_decimal_to_float_dtype(data=column)
+
+            results[aggregate] = _PANDAS_AGGREGATE_FNS[aggregate](decimal_safe_column)
+        else:
+            results[aggregate] = _PANDAS_AGGREGATE_FNS[aggregate](column)
+
+    return results
+
+
+def is_fusable_column(column: pd.Series) -> bool:
+    # Pandas reduces lower-precision floating point columns in their own precision (unlike the fused
+    # kernel, which accumulates in float64), so only float64 columns are fused.
+    return isinstance(column.dtype, np.dtype) and (
+        column.dtype.kind in "iu" or column.dtype == np.float64
+    )
+
+
+def _compute_fused_aggregates(  # noqa: C901
+    values: np.ndarray, aggregates: Set[PandasColumnAggregate]
+) -> Dict[PandasColumnAggregate, Any]:
+    """Computes "aggregates" over "values" block by block, applying all of them while each block is in cache.
+
+    Per-block arithmetic mirrors "pandas.core.nanops" (missing values are zero-filled and excluded from counts), so
+    results equal those of the corresponding "pd.Series" methods for single-block columns; partial results of larger
+    columns are combined exactly (counts, integer sums, extrema) or with Chan's parallel variance algorithm.
+    """  # noqa: E501
+    is_float: bool = values.dtype.kind == "f"
+    sum_dtype = np.float64 if is_float else (np.uint64 if values.dtype.kind == "u" else np.int64)
+    need_extrema: bool = bool(aggregates & {PandasColumnAggregate.MIN, PandasColumnAggregate.MAX})
+    need_std: bool = PandasColumnAggregate.STANDARD_DEVIATION in aggregates
+
+    count = 0
+    total = sum_dtype(0)
+    float_block_sums: List[float] = []
+    block_moments: List[Tuple[int, float, float]] = []
+    minimum: Any = None
+    maximum: Any = None
+
+    block: np.ndarray
+    for start in range(0, len(values), FUSED_AGGREGATE_BLOCK_SIZE):
+        block = values[start : start + FUSED_AGGREGATE_BLOCK_SIZE]
+
+        valid_mask: Optional[np.ndarray] = None
+        valid_values: np.ndarray = block
+        filled: np.ndarray = block
+        block_count: int = len(block)
+        if is_float:
+            valid_mask = ~np.isnan(block)
+            block_count = int(np.count_nonzero(valid_mask))
+            if block_count < len(block):
+                valid_values = block[valid_mask]
+                filled = np.where(valid_mask, block, 0)
+
+        count += block_count
+        total += filled.sum(dtype=sum_dtype)
+        float_block_sums.append(filled.sum(dtype=np.float64))
+
+        if need_extrema and block_count > 0:
+            block_min = valid_values.min()
+            block_max = valid_values.max()
+            minimum = block_min if minimum is None else min(minimum, block_min)
+            maximum = block_max if maximum is None else max(maximum, block_max)
+
+        if need_std and block_count > 0:
+            float_filled: np.ndarray = filled if is_float else filled.astype(np.float64)
+            block_mean = float_filled.sum(dtype=np.float64) / block_count
+            squared_deviations = (block_mean - float_filled) ** 2
+            if valid_mask is not None and block_count < len(block):
+                np.putmask(squared_deviations, ~valid_mask, 0)
+
+            block_moments.append(
+                (block_count, block_mean, squared_deviations.sum(dtype=np.float64))
+            )
+
+    results: Dict[PandasColumnAggregate, Any] = {}
+    if PandasColumnAggregate.MIN in aggregates:
+        results[PandasColumnAggregate.MIN] = np.nan if minimum is None else minimum
+
+    if PandasColumnAggregate.MAX in aggregates:
+        results[PandasColumnAggregate.MAX] = np.nan if maximum is None else maximum
+
+    if PandasColumnAggregate.SUM in aggregates:
+        results[PandasColumnAggregate.SUM] = total
+
+    if PandasColumnAggregate.MEAN in aggregates:
+        results[PandasColumnAggregate.MEAN] = (
+            np.float64(np.sum(float_block_sums, dtype=np.float64) / count) if count else np.nan
+        )
+
+    if need_std:
+        results[PandasColumnAggregate.STANDARD_DEVIATION] = _combine_standard_deviation(
+            block_moments=block_moments, count=count
+        )
+
+    return results
+
+
+def _combine_standard_deviation(block_moments: List[Tuple[int, float, float]], count: int) -> Any:
+    """Sample (ddof=1) standard deviation from per-block (count, mean, sum of squared deviations) moments."""  # noqa: E501
+    ddof = 1
+    if count == 0:
+        return np.nan
+
+    if count <= ddof:
+        return np.float64(np.nan)
+
+    if len(block_moments) == 1:
+        squared_deviations_sum = block_moments[0][2]
+    else:
+        mean = math.fsum(block_count * block_mean for block_count, block_mean, _ in block_moments)
+        mean /= count
+        squared_deviations_sum = math.fsum(
+            block_m2 + block_count * (block_mean - mean) ** 2
+            for block_count, block_mean, block_m2 in block_moments
+        )
+
+    return np.sqrt(np.float64(squared_deviations_sum) / (count - ddof))
@@ -4,6 +4,7 @@ import datetime
 import hashlib
 import logging
 import pickle
+from collections import defaultdict
 from functools import partial
 from io import BytesIO
 from typing import (
@@ -12,6 +13,8 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -19,15 +22,17 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility import aws, azure, google, pyarrow
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.batch_manager import DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
     BatchSpec,
@@ -39,6 +44,7 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import FrozenIDDict
 from great_expectations.core.metric_domain_types import (
     MetricDomainTypes,  # noqa: TCH001
 )
@@ -48,6 +54,20 @@ from great_expectations.execution_engine.execution_engine import (
     PartitionDomainKwargs,  # noqa: TCH001
 )
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_chunked_batch_data import (
+    CHUNK_DEFERRED_METRIC_VALUE,
+    PandasChunkedBatchData,
+    get_chunk_results_combiner,
+    is_chunk_deferred_metric_name,
+    resolve_chunked_metrics,
+)
+from great_expectations.execution_engine.pandas_column_aggregates import (
+    PandasColumnAggregate,
+    compute_column_aggregates,
+)
+from great_expectations.execution_engine.pandas_fused_map_condition_metrics import (
+    resolve_fused_map_condition_metrics,
+)
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
@@ -58,11 +78,21 @@ from great_expectations.execution_engine.partition_and_sample.pandas_data_sample
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from great_expectations.core.batch import BatchData
+    from great_expectations.execution_engine.execution_engine import (
+        MetricComputationConfiguration,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
 logger = logging.getLogger(__name__)
 
 
 HASH_THRESHOLD = 1e9
 
+# Reader methods, which are able to read files one chunk (of "chunksize" rows) at a time.
+CHUNKED_READER_METHODS = {"read_csv", "read_table", "read_fwf", "read_parquet"}
+
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
 
@@ -73,7 +103,13 @@ class PandasExecutionEngine(ExecutionEngine):
 
     Args:
         *args: Positional arguments for configuring PandasExecutionEngine
-        **kwargs: Keyword arguments for configuring PandasExecutionEngine
+        **kwargs: Keyword arguments for configuring PandasExecutionEngine (e.g., "domain_records_cache_max_bytes"
+            bounds the memory used to memoize row selections of filtered Domains; 0 disables memoization; and
+            "persistent_metric_cache" enables reuse of metrics across validation runs of unchanged data; and
+            "chunksize" makes file-based Batches be read and validated that many rows at a time, so that files larger
+            than memory can be validated using metrics, whose per-chunk values can be combined; and
+            "fuse_map_condition_metrics" (True by default) derives unexpected counts, values, index lists, and rows of
+            all column map conditions of a Domain from one bit-packed mask matrix, gathering only the rows needed)
 
     For example:
     ```python
@@ -113,6 +149,15 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        domain_records_cache_max_bytes: int = kwargs.pop(
+            "domain_records_cache_max_bytes", DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+        )
+        chunksize: Optional[int] = kwargs.pop("chunksize", None)
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer.")  # noqa: TRY003
+
+        self._chunksize = chunksize
+        self._fuse_map_condition_metrics: bool = kwargs.pop("fuse_map_condition_metrics", True)
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -122,18 +167,28 @@ class PandasExecutionEngine(ExecutionEngine):
 
         super().__init__(*args, **kwargs)
 
+        self.batch_manager.domain_records_cache.max_bytes = domain_records_cache_max_bytes
+
         self._config.update(
             {
                 "discard_subset_failing_expectations": self.discard_subset_failing_expectations,
                 "boto3_options": boto3_options,
                 "azure_options": azure_options,
                 "gcs_options": gcs_options,
+                "domain_records_cache_max_bytes": domain_records_cache_max_bytes,
+                "chunksize": chunksize,
+                "fuse_map_condition_metrics": self._fuse_map_condition_metrics,
             }
         )
 
         self._data_partitioner = PandasDataPartitioner()
         self._data_sampler = PandasDataSampler()
 
+    @property
+    def chunksize(self) -> Optional[int]:
+        """Number of rows per chunk, in which file-based Batches are read (None if they are read into memory whole)."""  # noqa: E501
+        return self._chunksize
+
     def _instantiate_azure_client(self) -> None:
         self._azure = None
         if azure.BlobServiceClient:  # type: ignore[truthy-function] # False if NotImported
@@ -189,21 +244,34 @@ class PandasExecutionEngine(ExecutionEngine):
     def load_batch_data(
         self,
         batch_id: str,
-        batch_data: Union[PandasBatchData, pd.DataFrame],  # type: ignore[override]
+        batch_data: Union[PandasBatchData, PandasChunkedBatchData, pd.DataFrame],  # type: ignore[override]
     ) -> None:
         if isinstance(batch_data, pd.DataFrame):
             batch_data = PandasBatchData(self, batch_data)
-        elif not isinstance(batch_data, PandasBatchData):
+        elif not isinstance(batch_data, (PandasBatchData, PandasChunkedBatchData)):
             raise gx_exceptions.GreatExpectationsError(  # noqa: TRY003
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"  # noqa: E501
             )
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        batch_fingerprint: Optional[str] = super()._compute_batch_fingerprint(batch_id=batch_id)
+        if batch_fingerprint is not None:
+            return batch_fingerprint
+
+        batch_data = self.batch_manager.batch_data_cache[batch_id]
+        if not isinstance(batch_data, PandasBatchData):
+            # Fingerprinting chunked Batch data would take an extra pass over the whole file.
+            return None
+
+        return hash_pandas_dataframe(batch_data.dataframe)
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec | PandasBatchSpecProtocol
-    ) -> Tuple[PandasBatchData, BatchMarkers]:  # batch_data
+    ) -> Tuple[Union[PandasBatchData, PandasChunkedBatchData], BatchMarkers]:  # batch_data
         # We need to build a batch_markers to be used in the dataframe
         batch_markers = BatchMarkers(
             {
@@ -320,6 +388,13 @@ Bucket: {error}"""  # noqa: E501
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
+            if self._chunksize is not None:
+                chunked_batch_data: Optional[PandasChunkedBatchData] = self._get_chunked_batch_data(
+                    batch_spec=batch_spec
+                )
+                if chunked_batch_data is not None:
+                    return chunked_batch_data, batch_markers
+
             reader_fn = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
 
@@ -359,6 +434,55 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
 
         return typed_batch_data, batch_markers
 
+    def _get_chunked_batch_data(
+        self, batch_spec: PathBatchSpec
+    ) -> Optional[PandasChunkedBatchData]:
+        """Returns BatchData reading file at "batch_spec" path "chunksize" rows at a time (None if unsupported).
+
+        Partitioning and sampling directives, as well as reader methods unable to read files in chunks, require the
+        whole file in memory; in that case, the file is read whole, as if "chunksize" were not configured.
+        """  # noqa: E501
+        path: str = batch_spec.path
+        reader_method: Optional[str] = batch_spec.reader_method
+        reader_options: dict = dict(batch_spec.reader_options or {})
+        if reader_method is None:
+            path_guess: dict = self.guess_reader_method_from_path(path)
+            reader_method = path_guess["reader_method"]
+            reader_options = {**(path_guess.get("reader_options") or {}), **reader_options}
+
+        chunksize = cast(int, self._chunksize)
+        chunk_reader: Optional[Callable[[], Iterable[pd.DataFrame]]] = None
+        if batch_spec.get("partitioner_method") or batch_spec.get("sampling_method"):
+            pass
+        elif reader_method in ("read_csv", "read_table", "read_fwf"):
+            reader_options.pop("iterator", None)
+            chunk_reader = partial(
+                _read_text_file_chunks,
+                reader_fn=getattr(pd, reader_method),
+                path=path,
+                chunksize=chunksize,
+                reader_options=reader_options,
+            )
+        elif (
+            reader_method == "read_parquet"
+            and pyarrow.parquet  # type: ignore[truthy-function] # False if NotImported
+            and set(reader_options) <= {"columns"}
+        ):
+            chunk_reader = partial(
+                _read_parquet_file_chunks,
+                path=path,
+                chunksize=chunksize,
+                columns=reader_options.get("columns"),
+            )
+
+        if chunk_reader is None:
+            logger.warning(
+                f'PandasExecutionEngine is unable to read "{path}" in chunks (using reader method "{reader_method}"); reading it into memory whole.'  # noqa: E501
+            )
+            return None
+
+        return PandasChunkedBatchData(execution_engine=self, chunk_reader=chunk_reader)
+
     def _apply_partitioning_and_sampling_methods(
         self,
         batch_spec: BatchSpec | PandasBatchSpecProtocol,
@@ -478,17 +602,178 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
             )
 
     @override
-    def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], Any]:
-        """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
-        return {}  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).  # noqa: E501
+    def resolve_metrics(  # noqa: C901
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics of chunked Batches (see "chunksize") chunk by chunk, and all other metrics as usual.
+
+        Partial function metrics (maps, conditions, and aggregate functions) of chunked Batches are deferred, and are
+        evaluated for every chunk along with metrics depending on them, whose per-chunk values are then combined.
+        Unexpected count, values, index list, and rows of column map conditions of in-memory Batches are derived from
+        one mask matrix per Domain (see "fuse_map_condition_metrics").
+        """  # noqa: E501
+        if metrics is None:
+            metrics = {}
+
+        metrics_to_resolve = list(metrics_to_resolve)
+        chunked_metrics_to_resolve: Dict[int, List[MetricConfiguration]] = defaultdict(list)
+        chunked_batch_data_by_id: Dict[int, PandasChunkedBatchData] = {}
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        in_memory_metrics_to_resolve: List[MetricConfiguration] = []
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            batch_data: Optional[BatchData] = self._get_metric_batch_data(
+                metric_configuration=metric_configuration
+            )
+            if not isinstance(batch_data, PandasChunkedBatchData):
+                in_memory_metrics_to_resolve.append(metric_configuration)
+            elif is_chunk_deferred_metric_name(metric_name=metric_configuration.metric_name):
+                resolved_metrics[metric_configuration.id] = CHUNK_DEFERRED_METRIC_VALUE
+            elif get_chunk_results_combiner(metric_name=metric_configuration.metric_name):
+                chunked_metrics_to_resolve[id(batch_data)].append(metric_configuration)
+                chunked_batch_data_by_id[id(batch_data)] = batch_data
+            elif any(
+                metrics.get(dependency.id) is CHUNK_DEFERRED_METRIC_VALUE
+                for dependency in metric_configuration.metric_dependencies.values()
+            ):
+                raise gx_exceptions.MetricResolutionError(
+                    message=f'Metric "{metric_configuration.metric_name}" is not supported for chunked Batch data.',  # noqa: E501
+                    failed_metrics=(metric_configuration,),
+                )
+            else:
+                in_memory_metrics_to_resolve.append(metric_configuration)
+
+        for batch_data_id, batch_metrics_to_resolve in chunked_metrics_to_resolve.items():
+            resolved_metrics.update(
+                resolve_chunked_metrics(
+                    execution_engine=self,
+                    batch_data=chunked_batch_data_by_id[batch_data_id],
+                    metrics_to_resolve=batch_metrics_to_resolve,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if self._fuse_map_condition_metrics and in_memory_metrics_to_resolve:
+            fused_metrics = resolve_fused_map_condition_metrics(
+                execution_engine=self,
+                metrics_to_resolve=in_memory_metrics_to_resolve,
+                metrics=metrics,
+            )
+            resolved_metrics.update(fused_metrics)
+            in_memory_metrics_to_resolve = [
+                metric_configuration
+                for metric_configuration in in_memory_metrics_to_resolve
+                if metric_configuration.id not in fused_metrics
+            ]
+
+        # Placeholders of chunk-deferred metrics only stand in for them during this resolution.
+        computed_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+            metric_id: metric_value
+            for metric_id, metric_value in resolved_metrics.items()
+            if metric_value is not CHUNK_DEFERRED_METRIC_VALUE
+        }
+        if self._caching:
+            self._metric_cache.update(computed_metrics)
+
+        self._persist_resolved_metrics(
+            metric_configurations=[
+                metric_configuration
+                for metric_configuration in metrics_to_resolve
+                if metric_configuration.id in computed_metrics
+            ],
+            resolved_metrics=computed_metrics,
+        )
+
+        if in_memory_metrics_to_resolve:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=in_memory_metrics_to_resolve,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def _get_metric_batch_data(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[BatchData]:
+        batch_id: Optional[str] = metric_configuration.metric_domain_kwargs.get("batch_id")
+        if batch_id is None:
+            return self.batch_manager.active_batch_data
+
+        return self.batch_manager.batch_data_cache.get(batch_id)
+
+    @override
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """For every compute Domain, obtains its records once and resolves all bundled column aggregates of each column.
+
+        "PandasColumnAggregate" aggregates of the same column are computed together, in a single pass over the column
+        values; other aggregate callables are applied to the column one at a time.
+
+        Args:
+            metric_fn_bundle: an iterable of "MetricComputationConfiguration" objects, whose "metric_fn" is either a
+            "PandasColumnAggregate" or a callable that accepts a "pd.Series" and returns the metric value.
+
+        Returns:
+            A dictionary of "MetricConfiguration" IDs and their corresponding now-queried (fully resolved) values.
+        """  # noqa: E501
+        bundles_by_domain: Dict[FrozenIDDict, Dict[str, List[MetricComputationConfiguration]]] = (
+            defaultdict(lambda: defaultdict(list))
+        )
+
+        metric_computation_configuration: MetricComputationConfiguration
+        for metric_computation_configuration in metric_fn_bundle:
+            domain_id = FrozenIDDict(metric_computation_configuration.compute_domain_kwargs)
+            column_name = metric_computation_configuration.accessor_domain_kwargs["column"]
+            bundles_by_domain[domain_id][column_name].append(metric_computation_configuration)
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        for domain_id, bundles_by_column in bundles_by_domain.items():
+            data: pd.DataFrame = self.get_domain_records(domain_kwargs=dict(domain_id))
+            for column_name, metric_computation_configurations in bundles_by_column.items():
+                column: pd.Series = data[column_name]
+                fused_aggregates = {
+                    metric_computation_configuration.metric_fn
+                    for metric_computation_configuration in metric_computation_configurations
+                    if isinstance(metric_computation_configuration.metric_fn, PandasColumnAggregate)
+                }
+                fused_results = compute_column_aggregates(
+                    column=column, aggregates=fused_aggregates
+                )
+                for metric_computation_configuration in metric_computation_configurations:
+                    metric_fn = metric_computation_configuration.metric_fn
+                    resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
+                        fused_results[metric_fn]
+                        if isinstance(metric_fn, PandasColumnAggregate)
+                        else metric_fn(column)  # type: ignore[misc] # F not callable
+                    )
+
+            logger.debug(
+                f"PandasExecutionEngine computed {sum(len(c) for c in bundles_by_column.values())} metrics on domain_id {domain_id}"  # noqa: E501
+            )
+
+        return resolved_metrics
 
     @override
-    def get_domain_records(  # noqa: C901, PLR0912
+    def get_domain_records(  # noqa: C901, PLR0912, PLR0915
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
         """Uses the given Domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to obtain and/or query a Batch of data.
 
+        Row selections computed for a given Batch and set of directives are memoized (as boolean masks or positional
+        indices, not as copies of data) in the "DomainRecordsCache" of the "BatchManager", so that repeated requests
+        for the same Domain do not re-evaluate "row_condition" and "ignore_row_if" directives.
+
         Args:
             domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
 
@@ -502,9 +787,20 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
             )
 
         batch_id = domain_kwargs.get("batch_id")
+        if isinstance(
+            self.batch_manager.batch_data_cache.get(
+                batch_id or self.batch_manager.active_batch_data_id
+            ),
+            PandasChunkedBatchData,
+        ):
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                'Records of chunked Batch data cannot be accessed all at once; only metrics, whose per-chunk values can be combined, are supported when "chunksize" is configured.'  # noqa: E501
+            )
+
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
+                batch_id = self.batch_manager.active_batch_data_id
                 data = cast(PandasBatchData, self.batch_manager.active_batch_data).dataframe
             else:
                 raise gx_exceptions.ValidationError(  # noqa: TRY003
@@ -520,76 +816,108 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
-        # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
+        condition_parser = domain_kwargs.get("condition_parser", None)
         if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-
             # Ensuring proper condition parser has been provided
             if condition_parser not in ["python", "pandas"]:
                 raise ValueError(  # noqa: TRY003
                     "condition_parser is required when setting a row_condition,"
                     " and must be 'python' or 'pandas'"
                 )
-            else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
+        else:
+            row_condition = None
+            condition_parser = None
 
+        ignore_row_if: Optional[str] = None
+        columns: Tuple[str, ...] = tuple()
+        drop_missing_how: Optional[str] = None
         if "column" in domain_kwargs:
-            return data
-
-        if (
+            pass
+        elif (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
         ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
             ignore_row_if = domain_kwargs["ignore_row_if"]
+            columns = (domain_kwargs["column_A"], domain_kwargs["column_B"])
             if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
-                )
+                drop_missing_how = "all"
             elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
-
-            return data
-
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
-
+                drop_missing_how = "any"
+            elif ignore_row_if != "neither":
+                raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+        elif "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             ignore_row_if = domain_kwargs["ignore_row_if"]
+            columns = tuple(domain_kwargs["column_list"])
             if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
+                drop_missing_how = "all"
             elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+                drop_missing_how = "any"
+            elif ignore_row_if != "never":
+                raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
 
+        if row_condition is None and drop_missing_how is None:
             return data
 
-        return data
+        cache_key = (batch_id, row_condition, condition_parser, ignore_row_if, columns)
+        domain_records_cache = self.batch_manager.domain_records_cache
+        row_selector = domain_records_cache.get(cache_key)
+        if row_selector is None:
+            row_selector = self._get_domain_records_row_selector(
+                data=data,
+                row_condition=row_condition,
+                condition_parser=condition_parser,
+                columns=columns,
+                drop_missing_how=drop_missing_how,
+            )
+            if row_selector is None:
+                # Row condition could not be evaluated into a boolean mask; fall back to querying.
+                data = data.query(row_condition, parser=condition_parser)
+                if drop_missing_how is not None:
+                    data = data.dropna(axis=0, how=drop_missing_how, subset=list(columns))
+
+                return data
+
+            domain_records_cache.put(cache_key, row_selector, num_bytes=row_selector.nbytes)
+
+        return data.iloc[row_selector]
+
+    @staticmethod
+    def _get_domain_records_row_selector(
+        data: pd.DataFrame,
+        row_condition: Optional[str],
+        condition_parser: Optional[str],
+        columns: Tuple[str, ...],
+        drop_missing_how: Optional[str],
+    ) -> Optional[np.ndarray]:
+        """Computes the rows of "data" that satisfy the "row_condition" and "ignore_row_if" directives.
+
+        Returns the more compact of a boolean mask and an array of positional indices, or None if "row_condition" does
+        not evaluate to a boolean mask (in which case "DataFrame.query" semantics cannot be reproduced positionally).
+        """  # noqa: E501
+        mask = np.ones(len(data), dtype=bool)
+        if row_condition is not None:
+            condition = data.eval(row_condition, parser=condition_parser)
+            if not (
+                isinstance(condition, pd.Series)
+                and condition.dtype == bool
+                and condition.index.equals(data.index)
+            ):
+                return None
+
+            mask &= condition.to_numpy()
+
+        if drop_missing_how == "all":
+            mask &= data[list(columns)].notna().any(axis=1).to_numpy()
+        elif drop_missing_how == "any":
+            mask &= data[list(columns)].notna().all(axis=1).to_numpy()
+
+        positions = np.flatnonzero(mask)
+        if positions.nbytes < mask.nbytes:
+            return positions
+
+        return mask
 
     @override
     def get_compute_domain(
@@ -634,6 +962,28 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
         return data, partition_domain_kwargs.compute, partition_domain_kwargs.accessor
 
 
+def _read_text_file_chunks(
+    reader_fn: DataFrameFactoryFn, path: str, chunksize: int, reader_options: dict
+) -> Iterator[pd.DataFrame]:
+    # Pandas continues the default index of every chunk where the previous chunk ended.
+    with reader_fn(path, **{**reader_options, "chunksize": chunksize}) as reader:
+        yield from reader
+
+
+def _read_parquet_file_chunks(
+    path: str, chunksize: int, columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    num_rows = 0
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    for record_batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        chunk: pd.DataFrame = pyarrow.pyarrow.Table.from_batches([record_batch]).to_pandas()
+        if isinstance(chunk.index, pd.RangeIndex) and chunk.index.start == 0:
+            chunk.index = pd.RangeIndex(num_rows, num_rows + len(chunk))
+
+        num_rows += len(chunk)
+        yield chunk
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.id_dict import FrozenIDDict
+from great_expectations.core.metric_function_types import SummarizationMetricNameSuffixes
+from great_expectations.expectations.registry import get_metric_provider
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.pandas_execution_engine import (
+        PandasExecutionEngine,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+UNEXPECTED_COUNT = SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value
+UNEXPECTED_VALUES = SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value
+UNEXPECTED_INDEX_LIST = SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value
+UNEXPECTED_ROWS = SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value
+
+# Number of set bits of every byte value.
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1).sum(
+    axis=1, dtype=np.uint8
+)
+
+
+class UnexpectedRowsMaskMatrix:
+    """Bit-packed matrix of unexpected rows (one row of bits per map condition, one bit per row of the Domain).
+
+    Every condition occupies one bit per row of the Domain (rather than one byte of a boolean Series), so that masks of
+    all map conditions of a Domain can be held together at a fraction of the memory of their Series.
+    """  # noqa: E501
+
+    def __init__(self, num_rows: int, num_conditions: int) -> None:
+        self._num_rows = num_rows
+        self._bits = np.zeros((num_conditions, (num_rows + 7) // 8), dtype=np.uint8)
+
+    def set_mask(self, condition_index: int, mask: np.ndarray) -> None:
+        self._bits[condition_index] = np.packbits(mask)
+
+    def unexpected_counts(self) -> np.ndarray:
+        """Returns number of unexpected rows of every condition (computed in one reduction over the matrix)."""  # noqa: E501
+        return _POPCOUNT[self._bits].sum(axis=1, dtype=np.int64)
+
+    def unexpected_positions(self, condition_index: int, limit: Optional[int] = None) -> np.ndarray:
+        """Returns positions (in the Domain) of the first "limit" (or all) unexpected rows of a condition."""  # noqa: E501
+        positions = np.flatnonzero(np.unpackbits(self._bits[condition_index], count=self._num_rows))
+        if limit is None:
+            return positions
+
+        return positions[:limit]
+
+
+def resolve_fused_map_condition_metrics(
+    execution_engine: PandasExecutionEngine,
+    metrics_to_resolve: Sequence[MetricConfiguration],
+    metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    """Resolves unexpected count, values, index list, and rows of all column map conditions of a Domain together.
+
+    Each of these metrics otherwise filters the Domain DataFrame with the boolean Series of its condition.  Instead,
+    conditions of every compute Domain are packed into one "UnexpectedRowsMaskMatrix"; unexpected counts are obtained
+    from it in a single reduction, and only the unexpected rows needed by "result_format" are gathered (by position)
+    from the Domain.  Metrics that are not resolved here (e.g., whose Domain cannot be fused) are left for their own
+    metric implementations.
+
+    Returns:
+        Dictionary of resolved metric values (in the format of the per-metric implementations).
+    """  # noqa: E501
+    from great_expectations.expectations.metrics.map_metric_provider.column_map_condition_auxilliary_methods import (  # noqa: E501
+        _pandas_column_map_condition_values,
+    )
+    from great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods import (  # noqa: E501
+        _pandas_map_condition_index,
+        _pandas_map_condition_rows,
+        _pandas_map_condition_unexpected_count,
+    )
+
+    fusible_metric_fns = {
+        _pandas_map_condition_unexpected_count: UNEXPECTED_COUNT,
+        _pandas_column_map_condition_values: UNEXPECTED_VALUES,
+        _pandas_map_condition_index: UNEXPECTED_INDEX_LIST,
+        _pandas_map_condition_rows: UNEXPECTED_ROWS,
+    }
+
+    metrics_by_domain: Dict[FrozenIDDict, List[Tuple[str, MetricConfiguration]]] = defaultdict(list)
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metrics_to_resolve:
+        condition_metric: Optional[MetricConfiguration] = (
+            metric_configuration.metric_dependencies.get("unexpected_condition")
+        )
+        if condition_metric is None or condition_metric.id not in metrics:
+            continue
+
+        _metric_class, metric_fn = get_metric_provider(
+            metric_name=metric_configuration.metric_name, execution_engine=execution_engine
+        )
+        kind: Optional[str] = fusible_metric_fns.get(metric_fn)
+        if kind is None:
+            continue
+
+        _condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[condition_metric.id]
+        if "column" not in accessor_domain_kwargs:
+            continue
+
+        metrics_by_domain[FrozenIDDict(compute_domain_kwargs)].append((kind, metric_configuration))
+
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    domain_id: FrozenIDDict
+    domain_metrics: List[Tuple[str, MetricConfiguration]]
+    for domain_id, domain_metrics in metrics_by_domain.items():
+        try:
+            resolved_metrics.update(
+                _resolve_fused_domain(
+                    execution_engine=execution_engine,
+                    compute_domain_kwargs=dict(domain_id),
+                    domain_metrics=domain_metrics,
+                    metrics=metrics,
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                f"Map condition metrics of domain_id {domain_id} could not be fused; resolving them separately: {e!r}"  # noqa: E501
+            )
+            continue
+
+    return resolved_metrics
+
+
+def _resolve_fused_domain(  # noqa: C901 - too complex
+    execution_engine: PandasExecutionEngine,
+    compute_domain_kwargs: dict,
+    domain_metrics: List[Tuple[str, MetricConfiguration]],
+    metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    from great_expectations.expectations.metrics.util import (
+        compute_unexpected_pandas_indices,
+        get_dbms_compatible_metric_domain_kwargs,
+    )
+
+    df: pd.DataFrame = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+
+    condition_indices: Dict[Tuple[str, str, str], int] = {}
+    column_names: Dict[Tuple[str, str, str], str] = {}
+    for _kind, metric_configuration in domain_metrics:
+        condition_id = metric_configuration.metric_dependencies["unexpected_condition"].id
+        if condition_id in condition_indices:
+            continue
+
+        condition_indices[condition_id] = len(condition_indices)
+        dependencies = execution_engine._get_computed_metric_evaluation_dependencies_by_metric_name(
+            metric_to_resolve=metric_configuration, metrics=metrics
+        )
+        column_names[condition_id] = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metrics[condition_id][2],
+            batch_columns_list=dependencies["table.columns"],
+        )["column"]
+
+    matrix = UnexpectedRowsMaskMatrix(num_rows=len(df), num_conditions=len(condition_indices))
+    for condition_id, condition_index in condition_indices.items():
+        matrix.set_mask(
+            condition_index=condition_index,
+            mask=_get_domain_mask(
+                df=df, column_name=column_names[condition_id], condition=metrics[condition_id][0]
+            ),
+        )
+
+    unexpected_counts: Optional[np.ndarray] = None
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    for kind, metric_configuration in domain_metrics:
+        condition_id = metric_configuration.metric_dependencies["unexpected_condition"].id
+        condition_index = condition_indices[condition_id]
+        if kind == UNEXPECTED_COUNT:
+            if unexpected_counts is None:
+                unexpected_counts = matrix.unexpected_counts()
+
+            resolved_metrics[metric_configuration.id] = int(unexpected_counts[condition_index])
+            continue
+
+        result_format: dict = metric_configuration.metric_value_kwargs["result_format"]
+        partial_unexpected_count: Optional[int] = (
+            None
+            if result_format["result_format"] == "COMPLETE"
+            else result_format.get("partial_unexpected_count")
+        )
+        if kind == UNEXPECTED_VALUES:
+            positions = matrix.unexpected_positions(
+                condition_index=condition_index, limit=partial_unexpected_count
+            )
+            resolved_metrics[metric_configuration.id] = list(
+                df[column_names[condition_id]].iloc[positions]
+            )
+        elif kind == UNEXPECTED_ROWS:
+            positions = matrix.unexpected_positions(
+                condition_index=condition_index, limit=partial_unexpected_count
+            )
+            resolved_metrics[metric_configuration.id] = df.iloc[positions]
+        else:
+            # Excluded unexpected values list all unexpected rows in one entry.
+            positions = matrix.unexpected_positions(
+                condition_index=condition_index,
+                limit=None
+                if result_format.get("exclude_unexpected_values")
+                else partial_unexpected_count,
+            )
+            unexpected_index_list = compute_unexpected_pandas_indices(
+                domain_records_df=df.iloc[positions],
+                result_format=result_format,
+                execution_engine=execution_engine,
+                metrics=execution_engine._get_computed_metric_evaluation_dependencies_by_metric_name(
+                    metric_to_resolve=metric_configuration, metrics=metrics
+                ),
+                expectation_domain_column_list=[column_names[condition_id]],
+            )
+            resolved_metrics[metric_configuration.id] = unexpected_index_list[
+                :partial_unexpected_count
+            ]
+
+    logger.debug(
+        f"PandasExecutionEngine resolved {len(domain_metrics)} metrics of {len(condition_indices)} map conditions from one mask matrix."  # noqa: E501
+    )
+
+    return resolved_metrics
+
+
+def _get_domain_mask(df: pd.DataFrame, column_name: str, condition: Any) -> np.ndarray:
+    """Returns unexpected rows of a map condition as a boolean mask over all rows of the Domain.
+
+    Conditions of metrics filtering out null values ("filter_column_isnull") only cover non-null rows of the column.
+    """  # noqa: E501
+    if not isinstance(condition, pd.Series):
+        raise TypeError(f"Map condition is not a Series ({type(condition)}).")  # noqa: TRY003
+
+    values: np.ndarray = condition.to_numpy(dtype=bool, na_value=False)
+    if condition.index.equals(df.index):
+        return values
+
+    notnull: pd.Series = df[column_name].notnull()
+    if not condition.index.equals(df.index[notnull.to_numpy()]):
+        raise ValueError("Map condition is not aligned with rows of its Domain.")  # noqa: TRY003
+
+    mask = np.zeros(len(df), dtype=bool)
+    mask[notnull.to_numpy()] = values
+    return mask
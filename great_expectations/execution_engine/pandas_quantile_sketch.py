@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+from typing import Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Relative (rank) error of quantiles estimated when "allow_relative_error" is True.
+DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR = 0.01
+
+# Ratio of capacities of adjacent compactor levels (as recommended by Karnin, Lang, and Liberty).
+_CAPACITY_DECAY = 2.0 / 3.0
+_MIN_LEVEL_CAPACITY = 2
+
+# Empirical constant relating the capacity of the top compactor level to normalized rank error.
+_RANK_ERROR_CAPACITY_FACTOR = 4.0
+
+# Values are added to the bottom compactor level (and compacted) in blocks of at most this size.
+_UPDATE_BLOCK_SIZE = 16384
+
+
+def get_quantile_sketch_relative_error(
+    allow_relative_error: Union[bool, float, str, None],
+) -> Optional[float]:
+    """Returns rank error, with which "allow_relative_error" requests quantiles to be estimated by sketch (None, if exact quantiles are requested).
+
+    Falsy values and pandas interpolation method names (e.g., "linear") request exact quantiles; True requests the
+    default error; and numbers between 0 and 1 request that error.
+    """  # noqa: E501
+    if not allow_relative_error or isinstance(allow_relative_error, str):
+        return None
+
+    if allow_relative_error is True:
+        return DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+
+    if not (0.0 < allow_relative_error < 1.0):
+        raise ValueError(  # noqa: TRY003
+            f"If specified as a number, allow_relative_error must be between 0 and 1 (not {allow_relative_error})."  # noqa: E501
+        )
+
+    return float(allow_relative_error)
+
+
+class QuantileSketch:
+    """Mergeable, fixed-memory summary of numeric values, which estimates their quantiles in a single pass.
+
+    Implements the KLL sketch (Karnin, Lang, and Liberty, "Optimal Quantile Approximation in Streams", 2016): values
+    enter the bottom compactor level; whenever a level exceeds its capacity, it is sorted, and every other value (with
+    a pseudo-random offset) is promoted to the next level, where each value stands for twice as many original values.
+    Estimated quantiles are values, whose ranks are within "relative_error" * (number of values) of the exact ranks
+    (with high probability), while memory use grows only logarithmically with the number of values.  Sketches of
+    disjoint parts of data (e.g., chunks of a file, or Batches) merge into a sketch of their union.
+
+    Args:
+        relative_error: normalized rank error of estimated quantiles (e.g., 0.01 for one percent).
+        seed: seed of pseudo-random compaction offsets (same data and seed yield the same sketch).
+    """  # noqa: E501
+
+    def __init__(
+        self, relative_error: float = DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR, seed: int = 0
+    ):
+        if not (0.0 < relative_error < 1.0):
+            raise ValueError("relative_error must be between 0 and 1.")  # noqa: TRY003
+
+        self._relative_error = relative_error
+        self._k = max(_MIN_LEVEL_CAPACITY, math.ceil(_RANK_ERROR_CAPACITY_FACTOR / relative_error))
+        self._rng = np.random.default_rng(seed)
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._count = 0
+        self._min: Any = None
+        self._max: Any = None
+
+    @property
+    def relative_error(self) -> float:
+        return self._relative_error
+
+    @property
+    def count(self) -> int:
+        """Number of (non-missing) values summarized by sketch."""
+        return self._count
+
+    @property
+    def num_retained(self) -> int:
+        """Number of values retained by sketch (bounds its memory use)."""
+        return sum(len(level) for level in self._levels)
+
+    def update(self, values: Union[np.ndarray, Sequence[Any]]) -> None:
+        """Adds (numeric) "values" to sketch, ignoring missing (NaN) values."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self._count += len(values)
+        values_min = values.min()
+        values_max = values.max()
+        self._min = values_min if self._min is None else min(self._min, values_min)
+        self._max = values_max if self._max is None else max(self._max, values_max)
+
+        # Levels are compacted once per block, staying within their capacity plus one block.
+        block_start: int
+        for block_start in range(0, len(values), _UPDATE_BLOCK_SIZE):
+            self._levels[0] = np.concatenate(
+                (self._levels[0], values[block_start : block_start + _UPDATE_BLOCK_SIZE])
+            )
+            self._compress()
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Adds all values summarized by "other" sketch to this sketch (which is returned, for convenience)."""  # noqa: E501
+        if other._count == 0:
+            return self
+
+        self._count += other._count
+        self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = other._max if self._max is None else max(self._max, other._max)
+
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+
+        height: int
+        level: np.ndarray
+        for height, level in enumerate(other._levels):
+            self._levels[height] = np.concatenate((self._levels[height], level))
+
+        self._compress()
+        return self
+
+    def get_quantiles(self, quantiles: Sequence[float]) -> List[Optional[float]]:
+        """Returns estimated values at "quantiles" (None for each quantile, if sketch summarizes no values).
+
+        Like "PERCENTILE_DISC", the estimate of quantile "q" is the smallest retained value, whose estimated rank is
+        at least "q" times the number of values; minimum and maximum values are exact.
+        """  # noqa: E501
+        if self._count == 0:
+            return [None for _ in quantiles]
+
+        values: np.ndarray = np.concatenate(self._levels)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(len(level), 2**height, dtype=np.int64)
+                for height, level in enumerate(self._levels)
+            ]
+        )
+        order: np.ndarray = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+
+        results: List[Optional[float]] = []
+        quantile: float
+        for quantile in quantiles:
+            if quantile <= 0.0:
+                results.append(float(self._min))
+            elif quantile >= 1.0:
+                results.append(float(self._max))
+            else:
+                index = int(
+                    np.searchsorted(
+                        cumulative_weights, quantile * cumulative_weights[-1], side="left"
+                    )
+                )
+                results.append(float(values[min(index, len(values) - 1)]))
+
+        return results
+
+    def _get_level_capacity(self, height: int) -> int:
+        depth: int = len(self._levels) - height - 1
+        return max(_MIN_LEVEL_CAPACITY, math.ceil(self._k * _CAPACITY_DECAY**depth))
+
+    def _compress(self) -> None:
+        height = 0
+        while height < len(self._levels):
+            level: np.ndarray = self._levels[height]
+            if len(level) > self._get_level_capacity(height):
+                if height + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+
+                level = np.sort(level)
+                # An odd value out stays at its level, preserving total weight of retained values.
+                num_compacted: int = len(level) - len(level) % 2
+                offset = int(self._rng.integers(2))
+                self._levels[height + 1] = np.concatenate(
+                    (self._levels[height + 1], level[offset:num_compacted:2])
+                )
+                self._levels[height] = level[num_compacted:]
+
+            height += 1
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(relative_error={self._relative_error!r}, count={self._count!r}, num_retained={self.num_retained!r})"  # noqa: E501
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import functools
+import re
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Number of distinct compiled patterns (including combined "_list" patterns) kept for reuse across Expectations.
+REGEX_CACHE_SIZE = 1024
+
+MATCH_ON_ANY = "any"
+MATCH_ON_ALL = "all"
+
+_DEFAULT_REGEX_FLAGS: int = re.compile("").flags
+
+
+@functools.lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_regex(regex: str) -> re.Pattern:
+    """Returns compiled "regex" (compiled once per distinct pattern, unlike the size-bounded cache of the "re" module)."""  # noqa: E501
+    return re.compile(regex)
+
+
+@functools.lru_cache(maxsize=REGEX_CACHE_SIZE)
+def combine_regex_list(regex_list: Sequence[str], match_on: str) -> Optional[str]:
+    """Returns a single pattern, which a value matches (anywhere) if any / all patterns of "regex_list" match it.
+
+    Patterns that cannot be combined without changing their meaning (those carrying inline flags, which would apply to
+    all others, and those following the first pattern that define capturing groups, whose numbered backreferences
+    would shift) yield None, in which case every pattern is evaluated separately.
+
+    Args:
+        regex_list: tuple of patterns (hashable, so that combined patterns are cached).
+        match_on: "any" (alternation) or "all" (a lookahead per pattern, anchored at the start of the value).
+
+    Returns:
+        Combined pattern, or None, if patterns of "regex_list" cannot be combined.
+    """  # noqa: E501
+    compiled_patterns: List[re.Pattern] = [compile_regex(regex) for regex in regex_list]
+    if any(pattern.flags != _DEFAULT_REGEX_FLAGS for pattern in compiled_patterns):
+        return None
+
+    if any(pattern.groups for pattern in compiled_patterns[1:]):
+        return None
+
+    if match_on == MATCH_ON_ANY:
+        combined_regex = "|".join(f"(?:{regex})" for regex in regex_list)
+    else:
+        combined_regex = r"\A" + "".join(rf"(?=[\s\S]*?(?:{regex}))" for regex in regex_list)
+
+    try:
+        compile_regex(combined_regex)
+    except re.error:
+        return None
+
+    return combined_regex
+
+
+def series_matches_regex(column: pd.Series, regex: str) -> pd.Series:
+    """Returns boolean Series, which is True where string representation of value of "column" contains match of "regex".
+
+    Equivalent to "column.astype(str).str.contains(regex)", except that the pattern is compiled once and string columns
+    are not converted.  Values of every dtype (including Arrow-backed strings) are matched by Python regex, so that
+    patterns mean what they mean in "re" (Arrow's RE2 engine differs, e.g., on "$", character classes, and lookarounds).
+    """  # noqa: E501
+    return pd.Series(
+        _search_values(values=_get_string_values(column=column), pattern=compile_regex(regex)),
+        index=column.index,
+    )
+
+
+def series_matches_regex_list(
+    column: pd.Series, regex_list: Sequence[str], match_on: str = MATCH_ON_ANY
+) -> pd.Series:
+    """Returns boolean Series, which is True where any / all patterns of "regex_list" match value of "column".
+
+    Patterns are combined into one (see "combine_regex_list"), so that values are converted and scanned once, rather
+    than once per pattern.
+    """  # noqa: E501
+    if match_on not in (MATCH_ON_ANY, MATCH_ON_ALL):
+        raise ValueError("match_on must be either 'any' or 'all'")  # noqa: TRY003
+
+    if len(regex_list) == 0:
+        raise ValueError("At least one regex must be supplied in the regex_list.")  # noqa: TRY003
+
+    regex_list = tuple(regex_list)
+
+    values: np.ndarray = _get_string_values(column=column)
+    combined_regex: Optional[str] = combine_regex_list(regex_list, match_on)
+    if combined_regex is not None:
+        matches = _search_values(values=values, pattern=compile_regex(combined_regex))
+    else:
+        reduce = np.logical_or if match_on == MATCH_ON_ANY else np.logical_and
+        matches = reduce.reduce(
+            [_search_values(values=values, pattern=compile_regex(regex)) for regex in regex_list]
+        )
+
+    return pd.Series(matches, index=column.index)
+
+
+def _search_values(values: np.ndarray, pattern: re.Pattern) -> np.ndarray:
+    search = pattern.search
+    return np.fromiter(
+        (search(value) is not None for value in values), dtype=bool, count=len(values)
+    )
+
+
+def _get_string_values(column: pd.Series) -> np.ndarray:
+    """Returns values of "column" as object array of strings (as "column.astype(str)" would convert them)."""  # noqa: E501
+    if column.dtype == object and pd.api.types.infer_dtype(column, skipna=False) == "string":
+        return column.to_numpy()
+
+    return column.astype(str).to_numpy(dtype=object)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, FrozenSet, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Value sets with fewer values are passed to "Series.isin()" as they are (preparing them would not pay off: for 1M-row
+# columns, prepared value sets break even with "Series.isin()" at about 100K values, and halve its time at 1M values).
+PREPARED_VALUE_SET_MIN_SIZE = 100_000
+
+# Number of distinct prepared value sets kept for reuse across Expectations.
+PREPARED_VALUE_SET_CACHE_SIZE = 32
+
+# Kinds of NumPy dtypes, for which membership is looked up in the (cached) hash table of a prepared value set.
+_HASH_INDEX_DTYPE_KINDS = ("i", "u", "f")
+
+
+class PreparedValueSet:
+    """Value set converted once into a deduplicated array (as "Series.isin()" would convert it for every call).
+
+    For numeric columns of the same dtype, membership is looked up in the hash table of a "pd.Index" of the values,
+    which pandas builds once and keeps with the Index; other columns are matched by "Series.isin()" against the array.
+    """  # noqa: E501
+
+    def __init__(self, value_set: Sequence[Any]) -> None:
+        self._values: np.ndarray = pd.unique(_to_array(value_set))
+        self._index: Optional[pd.Index] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def isin(self, column: pd.Series) -> pd.Series:
+        """Returns boolean Series, which is True where value of "column" is in value set (as "column.isin()" does)."""  # noqa: E501
+        if column.dtype == self._values.dtype and column.dtype.kind in _HASH_INDEX_DTYPE_KINDS:
+            if self._index is None:
+                self._index = pd.Index(self._values, dtype=self._values.dtype)
+
+            return pd.Series(
+                self._index.get_indexer(column) >= 0, index=column.index, name=column.name
+            )
+
+        return column.isin(self._values)
+
+
+def series_isin_value_set(column: pd.Series, value_set: Sequence[Any]) -> pd.Series:
+    """Returns boolean Series, which is True where value of "column" is in "value_set".
+
+    Equivalent to "column.isin(value_set)"; large value sets are prepared once (see "PreparedValueSet") and shared by
+    all Expectations using the same values (e.g., the same suite parameter).
+    """  # noqa: E501
+    if len(value_set) < PREPARED_VALUE_SET_MIN_SIZE:
+        return column.isin(value_set)
+
+    try:
+        # Keying the cache hashes every value (~40 ms for 1M ints), which value sets of Expectations need, since they
+        # reach metrics as copies; lookups save their conversion, deduplication, and hash table build instead.
+        prepared_value_set: PreparedValueSet = _get_prepared_value_set(
+            tuple(value_set), frozenset(map(type, value_set))
+        )
+    except TypeError:
+        # Unhashable values cannot key the cache.
+        return column.isin(value_set)
+
+    return prepared_value_set.isin(column)
+
+
+@functools.lru_cache(maxsize=PREPARED_VALUE_SET_CACHE_SIZE)
+def _get_prepared_value_set(
+    values: Tuple[Any, ...], value_types: FrozenSet[type]
+) -> PreparedValueSet:
+    # Types are part of the key, since equal values of different types (e.g., 1, 1.0, and True) convert differently.
+    return PreparedValueSet(value_set=values)
+
+
+def _to_array(value_set: Sequence[Any]) -> np.ndarray:
+    """Converts "value_set" into array the way "Series.isin()" converts list-likes (mixed values stay objects)."""  # noqa: E501
+    inferred_type: str = pd.api.types.infer_dtype(value_set, skipna=False)
+    if inferred_type in ("mixed", "string", "mixed-integer"):
+        values = np.empty(len(value_set), dtype=object)
+        values[:] = list(value_set)
+        return values
+
+    return np.asarray(value_set)
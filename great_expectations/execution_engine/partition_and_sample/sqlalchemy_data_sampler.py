@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.sqlalchemy import (
@@ -16,6 +17,25 @@ if TYPE_CHECKING:
     from great_expectations.compatibility import sqlalchemy
     from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 
+logger = logging.getLogger(__name__)
+
+# Templates of "TABLESAMPLE" arguments by dialect and sampling method (block-level "system" or
+# row-level "bernoulli"), and the template of the seed clause (None, if seeds are not supported).
+_SYSTEM_AND_BERNOULLI_METHODS: Dict[str, str] = {
+    "system": "SYSTEM ({percent})",
+    "bernoulli": "BERNOULLI ({percent})",
+}
+TABLESAMPLE_CLAUSES: Dict[GXSqlDialect, Tuple[Dict[str, str], Optional[str]]] = {
+    GXSqlDialect.POSTGRESQL: (_SYSTEM_AND_BERNOULLI_METHODS, "REPEATABLE ({seed})"),
+    GXSqlDialect.SNOWFLAKE: (_SYSTEM_AND_BERNOULLI_METHODS, "SEED ({seed})"),
+    GXSqlDialect.BIGQUERY: ({"system": "SYSTEM ({percent} PERCENT)"}, None),
+    GXSqlDialect.DATABRICKS: (
+        {"system": "({percent} PERCENT)", "bernoulli": "({percent} PERCENT)"},
+        "REPEATABLE ({seed})",
+    ),
+    GXSqlDialect.TRINO: (_SYSTEM_AND_BERNOULLI_METHODS, None),
+}
+
 
 class SqlAlchemyDataSampler(DataSampler):
     """Sampling methods for data stores with SQL interfaces."""
@@ -168,6 +188,74 @@ class SqlAlchemyDataSampler(DataSampler):
             .limit(sample_size)
         )
 
+    def sample_using_tablesample(
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        batch_spec: BatchSpec,
+        where_clause: Optional[sqlalchemy.Selectable] = None,
+    ) -> sqlalchemy.Selectable:
+        """Sample a fraction of table using the dialect-native "TABLESAMPLE" clause, which the database evaluates without scanning the whole table.
+
+        Note: where_clause is applied to the sampled rows.  Dialects that do not support "TABLESAMPLE"
+        (or the requested sampling method) fall back to sample_using_random.
+
+        Args:
+            execution_engine: Engine used to connect to the database.
+            batch_spec: should contain keys `table_name` and `sampling_kwargs` with key `p` (fraction of
+                rows to sample), and optionally `method` ("system" for blocks of rows, which is the default,
+                or "bernoulli" for individual rows) and `seed` (used where dialect supports repeatable samples).
+            where_clause: Optional clause used in WHERE clause. Typically generated by a partitioner.
+
+        Returns:
+            Sqlalchemy selectable.
+
+        Raises:
+            SamplerError
+        """  # noqa: E501
+        self.verify_batch_spec_sampling_kwargs_exists(batch_spec)
+        self.verify_batch_spec_sampling_kwargs_key_exists("p", batch_spec)
+        p: float = self.get_sampling_kwargs_value_or_default(batch_spec, "p")
+        method: str = self.get_sampling_kwargs_value_or_default(
+            batch_spec=batch_spec, sampling_kwargs_key="method", default_value="system"
+        )
+        seed: Optional[int] = self.get_sampling_kwargs_value_or_default(batch_spec, "seed")
+        if not (0.0 < p <= 1.0):
+            raise gx_exceptions.SamplerError(  # noqa: TRY003
+                f"The sampling_kwargs 'p' parameter must be a fraction between 0 and 1 (not {p})."
+            )
+        if method not in ("system", "bernoulli"):
+            raise gx_exceptions.SamplerError(  # noqa: TRY003
+                f"The sampling_kwargs 'method' parameter must be 'system' or 'bernoulli' (not '{method}')."  # noqa: E501
+            )
+
+        dialect_name: GXSqlDialect = execution_engine.dialect_name
+        method_templates, seed_template = TABLESAMPLE_CLAUSES.get(dialect_name, ({}, None))
+        if method not in method_templates:
+            logger.info(
+                f'Dialect "{dialect_name}" does not support "TABLESAMPLE" with "{method}" method; using sample_using_random instead.'  # noqa: E501
+            )
+            return self.sample_using_random(
+                execution_engine=execution_engine,
+                batch_spec=batch_spec,
+                where_clause=where_clause,
+            )
+
+        tablesample_clause: str = "TABLESAMPLE " + method_templates[method].format(
+            percent=float(p) * 100
+        )
+        if seed is not None:
+            if seed_template is None:
+                logger.info(f'Dialect "{dialect_name}" does not support seeds of "TABLESAMPLE".')
+            else:
+                tablesample_clause += " " + seed_template.format(seed=int(seed))
+
+        table: str = execution_engine.dialect.identifier_preparer.format_table(
+            sa.table(batch_spec["table_name"], schema=batch_spec.get("schema_name", None))
+        )
+        return (
+            sa.select("*").select_from(sa.text(f"{table} {tablesample_clause}")).where(where_clause)
+        )
+
     def sample_using_mod(
         self,
         batch_spec: BatchSpec,
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import logging
+import pathlib
+import pickle
+import sqlite3
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, Union
+
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metrics_calculator import _MetricKey
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERSISTENT_METRIC_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# SQLite versions prior to 3.32 limit the number of host parameters in a statement to 999.
+_MAX_SQL_VARIABLES = 900
+
+_PARTIAL_FUNCTION_METRIC_NAME_SUFFIXES: Tuple[str, ...] = tuple(
+    f".{suffix.value}" for suffix in MetricPartialFunctionTypeSuffixes
+)
+
+_CREATE_TABLE_STATEMENT = """
+CREATE TABLE IF NOT EXISTS metric_values (
+    batch_fingerprint TEXT NOT NULL,
+    metric_id TEXT NOT NULL,
+    value BLOB NOT NULL,
+    num_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (batch_fingerprint, metric_id)
+)
+"""
+
+
+def is_persistable_metric_name(metric_name: str) -> bool:
+    """Partial function metrics (e.g., "column.max.aggregate_fn") evaluate to engine-specific callables or expressions, which are meaningful only within the engine that produced them; hence, they are never persisted."""  # noqa: E501
+    return not metric_name.endswith(_PARTIAL_FUNCTION_METRIC_NAME_SUFFIXES)
+
+
+class PersistentMetricCache:
+    """On-disk (SQLite) store of resolved metric values, which outlives ExecutionEngine instances and processes.
+
+    Values are keyed by the fingerprint of the Batch of data they were computed from and by the ID of their
+    "MetricConfiguration"; hence, re-validating unchanged data reuses previously computed metric values.  Entries
+    older than "ttl_seconds" are ignored (and purged), and least-recently-used entries are evicted once the total
+    size of stored values exceeds "max_bytes".
+
+    Args:
+        path: location of SQLite database file (created, along with its parent directories, if absent).
+        ttl_seconds: age (in seconds), after which stored metric values expire (default is no expiration).
+        max_bytes: upper bound on total size of pickled metric values kept in the cache.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        ttl_seconds: Optional[float] = None,
+        max_bytes: int = DEFAULT_PERSISTENT_METRIC_CACHE_MAX_BYTES,
+    ) -> None:
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be a positive number.")  # noqa: TRY003
+
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")  # noqa: TRY003
+
+        self._path = pathlib.Path(path)
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(_CREATE_TABLE_STATEMENT)
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def to_config(self) -> dict:
+        return {
+            "path": str(self._path),
+            "ttl_seconds": self._ttl_seconds,
+            "max_bytes": self._max_bytes,
+        }
+
+    def get(
+        self, batch_fingerprint: str, metric_ids: Iterable[_MetricKey]
+    ) -> Dict[_MetricKey, MetricValue]:
+        """Returns unexpired stored values among those of "metric_ids" computed from Batch with "batch_fingerprint"."""  # noqa: E501
+        metric_ids_by_key: Dict[str, _MetricKey] = {
+            _to_key(metric_id=metric_id): metric_id for metric_id in metric_ids
+        }
+        if not metric_ids_by_key:
+            return {}
+
+        now: float = time.time()
+        found: Dict[_MetricKey, MetricValue] = {}
+        with closing(self._connect()) as connection, connection:
+            self._purge_expired(connection=connection, now=now)
+
+            keys = list(metric_ids_by_key)
+            key: str
+            value: bytes
+            for chunk_start in range(0, len(keys), _MAX_SQL_VARIABLES):
+                chunk = keys[chunk_start : chunk_start + _MAX_SQL_VARIABLES]
+                rows = connection.execute(
+                    f"""SELECT metric_id, value FROM metric_values
+WHERE batch_fingerprint = ? AND metric_id IN ({", ".join("?" * len(chunk))})""",
+                    (batch_fingerprint, *chunk),
+                ).fetchall()
+                for key, value in rows:
+                    try:
+                        found[metric_ids_by_key[key]] = pickle.loads(value)
+                    except Exception as e:
+                        logger.debug(f"Ignoring unreadable cached value of metric {key}: {e!r}")
+
+                connection.executemany(
+                    """UPDATE metric_values SET accessed_at = ?
+WHERE batch_fingerprint = ? AND metric_id = ?""",
+                    [(now, batch_fingerprint, key) for key, _ in rows],
+                )
+
+        return found
+
+    def put(self, batch_fingerprint: str, metrics: Dict[_MetricKey, MetricValue]) -> None:
+        """Stores picklable "metrics" computed from Batch with "batch_fingerprint", evicting old entries if needed."""  # noqa: E501
+        now: float = time.time()
+        rows: list = []
+        metric_id: _MetricKey
+        for metric_id, metric_value in metrics.items():
+            if not is_persistable_metric_name(metric_name=metric_id[0]):
+                continue
+
+            try:
+                value: bytes = pickle.dumps(metric_value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.debug(
+                    f"Not caching value of metric {metric_id}, which cannot be pickled: {e!r}"
+                )
+                continue
+
+            if len(value) > self._max_bytes:
+                continue
+
+            rows.append(
+                (batch_fingerprint, _to_key(metric_id=metric_id), value, len(value), now, now)
+            )
+
+        if not rows:
+            return
+
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                """INSERT OR REPLACE INTO metric_values
+(batch_fingerprint, metric_id, value, num_bytes, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)""",  # noqa: E501
+                rows,
+            )
+            self._evict(connection=connection)
+
+    def clear(self) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM metric_values")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A new connection per operation keeps the cache usable from multiple threads and processes.
+        return sqlite3.connect(str(self._path), timeout=30.0)
+
+    def _purge_expired(self, connection: sqlite3.Connection, now: float) -> None:
+        if self._ttl_seconds is not None:
+            connection.execute(
+                "DELETE FROM metric_values WHERE created_at < ?", (now - self._ttl_seconds,)
+            )
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (num_bytes,) = connection.execute(
+            "SELECT COALESCE(SUM(num_bytes), 0) FROM metric_values"
+        ).fetchone()
+        if num_bytes <= self._max_bytes:
+            return
+
+        rows = connection.execute(
+            """SELECT batch_fingerprint, metric_id, num_bytes FROM metric_values
+ORDER BY accessed_at, created_at"""
+        ).fetchall()
+        evicted: list = []
+        for batch_fingerprint, key, entry_num_bytes in rows:
+            if num_bytes <= self._max_bytes:
+                break
+
+            evicted.append((batch_fingerprint, key))
+            num_bytes -= entry_num_bytes
+
+        connection.executemany(
+            "DELETE FROM metric_values WHERE batch_fingerprint = ? AND metric_id = ?", evicted
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={str(self._path)!r}, ttl_seconds={self._ttl_seconds!r}, max_bytes={self._max_bytes!r})"  # noqa: E501
+
+
+def _to_key(metric_id: _MetricKey) -> str:
+    # Components of metric IDs are strings, except for an empty tuple standing for absent kwargs.
+    return repr(metric_id)
@@ -14,6 +14,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -36,7 +37,7 @@ from great_expectations.core.batch_spec import (
     PathBatchSpec,
     RuntimeDataBatchSpec,
 )
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
 from great_expectations.core.metric_domain_types import (
     MetricDomainTypes,  # noqa: TCH001
 )
@@ -76,6 +77,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Storage level of row-condition-filtered Domain DataFrames that several pending metrics read.
+DEFAULT_DOMAIN_RECORDS_STORAGE_LEVEL = "MEMORY_AND_DISK"
+
 
 def apply_dateutil_parse(column):
     assert len(column.columns) == 1, "Expected DataFrame with 1 column"
@@ -107,6 +111,9 @@ class SparkDFExecutionEngine(ExecutionEngine):
         spark: A PySpark Session used to set the SparkDFExecutionEngine being configured. Will override
           spark_config if provided.
         force_reuse_spark_context: If True then utilize existing SparkSession if it exists and is active
+        domain_records_storage_level: Name of "pyspark.StorageLevel" (e.g., "MEMORY_AND_DISK"), at which Domain
+          DataFrames filtered by a row_condition are persisted, if more than one pending metric reads them; None
+          disables persisting filtered Domains.
         **kwargs: Keyword arguments for configuring SparkDFExecutionEngine
 
     For example:
@@ -204,9 +211,16 @@ class SparkDFExecutionEngine(ExecutionEngine):
         spark_config: Optional[dict] = None,
         spark: Optional[pyspark.SparkSession] = None,
         force_reuse_spark_context: Optional[bool] = None,
+        domain_records_storage_level: Optional[str] = DEFAULT_DOMAIN_RECORDS_STORAGE_LEVEL,
         **kwargs,
     ) -> None:
         self._persist = persist
+        self._domain_records_storage_level = domain_records_storage_level
+        # Row-condition-filtered Domain DataFrames, keyed by (batch_id, row_condition, condition_parser).
+        self._domain_records_to_persist: Set[Tuple[str, str, Optional[str]]] = set()
+        self._persisted_domain_records: Dict[
+            Tuple[str, str, Optional[str]], pyspark.DataFrame
+        ] = {}
 
         spark_config = spark_config or {}
         self.spark: pyspark.SparkSession
@@ -234,6 +248,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self._config.update(
             {
                 "persist": self._persist,
+                "domain_records_storage_level": domain_records_storage_level,
                 "spark_config": spark_config,
                 "azure_options": azure_options,
             }
@@ -408,8 +423,62 @@ class SparkDFExecutionEngine(ExecutionEngine):
         if self._persist:
             batch_data.dataframe.persist()
 
+        self._unpersist_domain_records(
+            domain_records_keys=[key for key in self._persisted_domain_records if key[0] == batch_id]
+        )
+
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def prepare_batch_data_for_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Marks Domains filtered by a row_condition, which more than one pending metric reads, to be persisted.
+
+        Every metric reading such a Domain otherwise re-evaluates the row_condition against the Batch DataFrame.  The
+        filtered DataFrame is persisted (at "domain_records_storage_level") when it is first requested; filtered Domains
+        that are no longer pending are unpersisted.
+        """  # noqa: E501
+        if not self._domain_records_storage_level:
+            return
+
+        active_batch_id: Optional[str] = self.batch_manager.active_batch_data_id
+        num_metrics_by_key: Dict[Tuple[str, str, Optional[str]], int] = {}
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            metric_domain_kwargs = metric_configuration.metric_domain_kwargs
+            row_condition = metric_domain_kwargs.get("row_condition")
+            if not row_condition or not isinstance(row_condition, str):
+                continue
+
+            key = (
+                metric_domain_kwargs.get("batch_id") or active_batch_id,
+                row_condition,
+                metric_domain_kwargs.get("condition_parser"),
+            )
+            num_metrics_by_key[key] = num_metrics_by_key.get(key, 0) + 1
+
+        self._domain_records_to_persist = {
+            key for key, num_metrics in num_metrics_by_key.items() if num_metrics > 1
+        }
+        self._unpersist_domain_records(
+            domain_records_keys=[
+                key
+                for key in self._persisted_domain_records
+                if key not in self._domain_records_to_persist
+            ]
+        )
+
+    def _get_domain_records_storage_level(self) -> pyspark.StorageLevel:
+        return getattr(pyspark.StorageLevel, cast(str, self._domain_records_storage_level))
+
+    def _unpersist_domain_records(
+        self, domain_records_keys: Iterable[Tuple[str, str, Optional[str]]]
+    ) -> None:
+        for key in domain_records_keys:
+            self._persisted_domain_records.pop(key).unpersist()
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec
@@ -647,6 +716,7 @@ illegal.  Please check your config."""  # noqa: E501
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data:
+                batch_id = self.batch_manager.active_batch_data_id
                 data = cast(SparkDFBatchData, self.batch_manager.active_batch_data).dataframe
             else:
                 raise ValidationError(  # noqa: TRY003
@@ -664,15 +734,26 @@ illegal.  Please check your config."""  # noqa: E501
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
+            domain_records_key = (batch_id, row_condition, condition_parser)
+            persisted_data: Optional[pyspark.DataFrame] = self._persisted_domain_records.get(
+                domain_records_key
+            )
+            if persisted_data is not None:
+                data = persisted_data
             else:
-                raise GreatExpectationsError(  # noqa: TRY003
-                    f"unrecognized condition_parser {condition_parser!s} for Spark execution engine"
-                )
+                if condition_parser == "spark":
+                    data = data.filter(row_condition)
+                elif condition_parser == "great_expectations__experimental__":
+                    parsed_condition = parse_condition_to_spark(row_condition)
+                    data = data.filter(parsed_condition)
+                else:
+                    raise GreatExpectationsError(  # noqa: TRY003
+                        f"unrecognized condition_parser {condition_parser!s} for Spark execution engine"  # noqa: E501
+                    )
+
+                if domain_records_key in self._domain_records_to_persist:
+                    data = data.persist(self._get_domain_records_storage_level())
+                    self._persisted_domain_records[domain_records_key] = data
 
         # Filtering by filter_conditions
         filter_conditions: List[RowCondition] = domain_kwargs.get("filter_conditions", [])
@@ -680,10 +761,28 @@ illegal.  Please check your config."""  # noqa: E501
             filter_condition = self._combine_row_conditions(filter_conditions)
             data = data.filter(filter_condition.condition)
 
+        # Filtering by ignore_row_if directive
+        ignore_condition: Optional[pyspark.Column] = self.get_ignore_row_if_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if ignore_condition is not None:
+            data = data.filter(~ignore_condition)
+
+        return data
+
+    def get_ignore_row_if_condition(self, domain_kwargs: dict) -> Optional[pyspark.Column]:
+        """Returns condition, which is True for rows that the "ignore_row_if" directive of a column pair or multicolumn
+        Domain excludes (None, if no rows are excluded).
+
+        Args:
+            domain_kwargs (dict) - Domain kwargs, including accessor keys ("column_A" and "column_B", or "column_list")
+
+        Returns:
+            Spark Column expression, or None
+        """  # noqa: E501
         if "column" in domain_kwargs:
-            return data
+            return None
 
-        # Filtering by ignore_row_if directive
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
@@ -696,35 +795,27 @@ illegal.  Please check your config."""  # noqa: E501
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "both_values_are_missing":
-                ignore_condition = F.col(column_A_name).isNull() & F.col(column_B_name).isNull()
-                data = data.filter(~ignore_condition)
+                return F.col(column_A_name).isNull() & F.col(column_B_name).isNull()
             elif ignore_row_if == "either_value_is_missing":
-                ignore_condition = F.col(column_A_name).isNull() | F.col(column_B_name).isNull()
-                data = data.filter(~ignore_condition)
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+                return F.col(column_A_name).isNull() | F.col(column_B_name).isNull()
+            elif ignore_row_if != "neither":
+                raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
 
-            return data
+            return None
 
         if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             column_list = domain_kwargs["column_list"]
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "all_values_are_missing":
                 conditions = [F.col(column_name).isNull() for column_name in column_list]
-                ignore_condition = reduce(lambda a, b: a & b, conditions)
-                data = data.filter(~ignore_condition)
+                return reduce(lambda a, b: a & b, conditions)
             elif ignore_row_if == "any_value_is_missing":
                 conditions = [F.col(column_name).isNull() for column_name in column_list]
-                ignore_condition = reduce(lambda a, b: a | b, conditions)
-                data = data.filter(~ignore_condition)
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+                return reduce(lambda a, b: a | b, conditions)
+            elif ignore_row_if != "never":
+                raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
 
-            return data
-
-        return data
+        return None
 
     @staticmethod
     def _combine_row_conditions(row_conditions: List[RowCondition]) -> RowCondition:
@@ -874,7 +965,7 @@ illegal.  Please check your config."""  # noqa: E501
             metric_fn: Any = bundled_metric_configuration.metric_fn
             compute_domain_kwargs: dict = bundled_metric_configuration.compute_domain_kwargs or {}
             if not isinstance(compute_domain_kwargs, IDDict):
-                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+                compute_domain_kwargs = FrozenIDDict(compute_domain_kwargs)
 
             domain_id = compute_domain_kwargs.to_id()
             if domain_id not in aggregates:
@@ -887,7 +978,7 @@ illegal.  Please check your config."""  # noqa: E501
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
-        for aggregate in aggregates.values():
+        for domain_id, aggregate in aggregates.items():
             domain_kwargs: dict = aggregate["domain_kwargs"]
             df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
 
@@ -896,7 +987,7 @@ illegal.  Please check your config."""  # noqa: E501
             res = df.agg(*aggregate["column_aggregates"]).collect()
 
             logger.debug(
-                f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"  # noqa: E501
+                f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {domain_id}"
             )
 
             assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
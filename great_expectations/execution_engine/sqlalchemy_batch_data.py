@@ -49,7 +49,7 @@ class SqlAlchemyBatchData(BatchData):
         query: str = ...,
         # Option 3
         selectable: None = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Optional[bool] = ...,
         temp_table_schema_name: Optional[str] = ...,
         use_quoted_name: bool = ...,
         source_schema_name: None = ...,
@@ -84,7 +84,7 @@ class SqlAlchemyBatchData(BatchData):
         query: Optional[str] = None,
         # Option 3
         selectable: Optional[Selectable] = None,
-        create_temp_table: bool = True,
+        create_temp_table: Optional[bool] = True,
         temp_table_schema_name: Optional[str] = None,
         use_quoted_name: bool = False,
         source_schema_name: Optional[str] = None,
@@ -105,10 +105,10 @@ class SqlAlchemyBatchData(BatchData):
                     A query string representing a domain, which will be used to create a temporary table
                 selectable (Sqlalchemy Selectable or None): \
                     A SqlAlchemy selectable representing a domain, which will be used to create a temporary table
-                create_temp_table (bool): \
+                create_temp_table (bool or None): \
                     When building the batch data object from a query, this flag determines whether a temporary table should
                     be created against which to validate data from the query. If False, a subselect statement will be used
-                    in each validation.
+                    in each validation. If None (not set), a subselect statement is used until "materialize()" is called.
                 temp_table_schema_name (str or None): \
                     The name of the schema in which a temporary table should be created. If None, the default schema will be
                     used if a temporary table is requested.
@@ -140,6 +140,10 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        self._temp_table_schema_name = temp_table_schema_name
+        # Query that is re-run as a subquery by every metric computation, until it is materialized.
+        self._deferred_query: Optional[str] = None
+        self._materialized_table_name: Optional[str] = None
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError("Exactly one of table_name, query, or selectable must be specified")  # noqa: TRY003
@@ -165,12 +169,15 @@ class SqlAlchemyBatchData(BatchData):
                 schema_name=schema_name,
             )
         elif query:
+            # Only queries loaded with "create_temp_table" unset may be materialized later.
+            if create_temp_table is None:
+                self._deferred_query = query
             self._selectable = self._generate_selectable_from_query(  # type: ignore[call-overload] # https://github.com/python/mypy/issues/14764
-                query, dialect, create_temp_table, temp_table_schema_name
+                query, dialect, bool(create_temp_table), temp_table_schema_name
             )
         else:
             self._selectable = self._generate_selectable_from_selectable(
-                selectable, dialect, create_temp_table, temp_table_schema_name
+                selectable, dialect, bool(create_temp_table), temp_table_schema_name
             )
 
     @property
@@ -198,6 +205,59 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def deferred_query(self) -> Optional[str]:
+        """Query, which is re-run as a subquery by every metric computation (None, if data is in a table)."""  # noqa: E501
+        return self._deferred_query
+
+    def materialize(self) -> None:
+        """Stores results of the deferred query in a temporary table, which subsequent metrics are computed from.
+
+        The temporary table is removed by "drop_materialized_table()".
+        """  # noqa: E501
+        if self._deferred_query is None:
+            return
+
+        selectable: sqlalchemy.Table = self._generate_selectable_from_query(
+            query=self._deferred_query,
+            dialect=self._dialect,
+            create_temp_table=True,
+            temp_table_schema_name=self._temp_table_schema_name,
+        )
+        self._selectable = selectable
+        self._materialized_table_name = selectable.name
+        self._deferred_query = None
+
+    def drop_materialized_table(self) -> None:
+        """Drops temporary table created by "materialize()" (if any); failure to drop it is only logged."""  # noqa: E501
+        temp_table_name: Optional[str] = self._materialized_table_name
+        if temp_table_name is None:
+            return
+
+        if self._dialect == GXSqlDialect.DATABRICKS:
+            stmt = f"DROP VIEW `{temp_table_name}`"
+        elif self._dialect == GXSqlDialect.DREMIO:
+            stmt = f"DROP VDS {temp_table_name}"
+        elif self._dialect in (GXSqlDialect.BIGQUERY, GXSqlDialect.HIVE):
+            stmt = f"DROP TABLE `{temp_table_name}`"
+        elif self._dialect in (
+            GXSqlDialect.MSSQL,
+            GXSqlDialect.MYSQL,
+            GXSqlDialect.ORACLE,
+            GXSqlDialect.SNOWFLAKE,
+            GXSqlDialect.VERTICA,
+        ):
+            stmt = f"DROP TABLE {temp_table_name}"
+        else:
+            stmt = f'DROP TABLE "{temp_table_name}"'
+
+        try:
+            self.execution_engine.execute_query_in_transaction(sa.text(stmt))
+        except Exception as e:
+            logger.warning(f"Unable to drop temporary table {temp_table_name}: {e!r}")
+
+        self._materialized_table_name = None
+
     def _create_temporary_table(  # noqa: C901, PLR0912
         self,
         dialect: GXSqlDialect,
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import ast
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core import FrozenIDDict
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyExecutionEngine,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+QUANTILE_VALUES_METRIC_NAME = "column.quantile_values"
+
+# Dialects, on which every quantile of a column is selected by
+# "percentile_disc(q) WITHIN GROUP (ORDER BY column)".
+WITHIN_GROUP_DIALECTS = {
+    GXSqlDialect.POSTGRESQL,
+    GXSqlDialect.SNOWFLAKE,
+}
+
+# Dialects, whose "percentile_disc()" is an analytic function (every row carries the quantiles).
+OVER_DIALECTS = {
+    GXSqlDialect.BIGQUERY,
+    GXSqlDialect.MSSQL,
+}
+
+# Dialects, on which quantiles of a column are selected as one array by
+# "approx_percentile(column, ARRAY[...])".
+APPROX_PERCENTILE_DIALECTS = {
+    GXSqlDialect.AWSATHENA,
+    GXSqlDialect.TRINO,
+}
+
+BATCHED_QUANTILES_DIALECTS = WITHIN_GROUP_DIALECTS | OVER_DIALECTS | APPROX_PERCENTILE_DIALECTS
+
+
+def resolve_batched_column_quantile_values(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metrics_to_resolve: Sequence[MetricConfiguration],
+) -> Dict[Tuple[str, str, str], List[Any]]:
+    """Resolves "column.quantile_values" metrics sharing compute Domain in one query per Domain.
+
+    Quantiles of all columns (and of all requested "quantiles" lists) of a compute Domain are selected by a single
+    statement, which scans the Domain once, instead of one statement per metric.  Metrics that are not resolved here
+    (e.g., on dialects without aggregate quantile functions, or whose batched query fails) are left for the per-column
+    "column.quantile_values" metric implementation.
+
+    Returns:
+        Dictionary of resolved "column.quantile_values" metric values (in the format of the per-column implementation).
+    """  # noqa: E501
+    if execution_engine.dialect_name not in BATCHED_QUANTILES_DIALECTS:
+        return {}
+
+    metrics_by_domain: Dict[FrozenIDDict, List[MetricConfiguration]] = defaultdict(list)
+    selectables_by_domain: Dict[FrozenIDDict, Any] = {}
+    columns_by_metric_id: Dict[Tuple[str, str, str], str] = {}
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metrics_to_resolve:
+        if metric_configuration.metric_name != QUANTILE_VALUES_METRIC_NAME:
+            continue
+
+        (
+            selectable,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            domain_kwargs=metric_configuration.metric_domain_kwargs,
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        domain = FrozenIDDict(compute_domain_kwargs)
+        metrics_by_domain[domain].append(metric_configuration)
+        selectables_by_domain.setdefault(domain, selectable)
+        columns_by_metric_id[metric_configuration.id] = accessor_domain_kwargs["column"]
+
+    resolved_metrics: Dict[Tuple[str, str, str], List[Any]] = {}
+    for domain, domain_metrics in metrics_by_domain.items():
+        if len(domain_metrics) < 2:  # noqa: PLR2004
+            continue
+
+        columns: List[str] = [
+            columns_by_metric_id[metric_configuration.id] for metric_configuration in domain_metrics
+        ]
+        quantiles_lists: List[List[float]] = [
+            list(metric_configuration.metric_value_kwargs["quantiles"])
+            for metric_configuration in domain_metrics
+        ]
+        try:
+            quantile_values_lists: List[List[Any]] = _get_batched_column_quantile_values(
+                execution_engine=execution_engine,
+                selectable=selectables_by_domain[domain],
+                columns=columns,
+                quantiles_lists=quantiles_lists,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batched quantiles of columns {columns} could not be computed; computing quantiles of each column separately: {e!r}"  # noqa: E501
+            )
+            continue
+
+        for metric_configuration, quantile_values in zip(domain_metrics, quantile_values_lists):
+            resolved_metrics[metric_configuration.id] = quantile_values
+
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed quantiles of {len(set(columns))} columns in a single query."  # noqa: E501
+        )
+
+    return resolved_metrics
+
+
+def _get_batched_column_quantile_values(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    columns: List[str],
+    quantiles_lists: List[List[float]],
+) -> List[List[Any]]:
+    """Returns quantile values of every column (at quantiles of the respective list), all selected by one query."""  # noqa: E501
+    query: sqlalchemy.Select = execution_engine._build_metric_bundle_query(
+        selectable=selectable,
+        select=_build_quantile_selects(
+            dialect_name=execution_engine.dialect_name,
+            columns=columns,
+            quantiles_lists=quantiles_lists,
+        ),
+    )
+    row: sqlalchemy.Row = execution_engine.execute_query(query).fetchone()  # type: ignore[assignment]
+
+    if execution_engine.dialect_name in APPROX_PERCENTILE_DIALECTS:
+        if execution_engine.dialect_name == GXSqlDialect.AWSATHENA:
+            # Athena returns arrays as strings (e.g., "[1, 2]").
+            return [ast.literal_eval(quantile_values) for quantile_values in row]
+
+        return [list(quantile_values) for quantile_values in row]
+
+    quantile_values_lists: List[List[Any]] = []
+    offset: int = 0
+    quantiles: List[float]
+    for quantiles in quantiles_lists:
+        quantile_values_lists.append(list(row[offset : offset + len(quantiles)]))
+        offset += len(quantiles)
+
+    return quantile_values_lists
+
+
+def _build_quantile_selects(
+    dialect_name: str, columns: List[str], quantiles_lists: List[List[float]]
+) -> List[Any]:
+    """Builds expressions of "quantiles_lists[idx]" quantiles of "columns[idx]" (as the per-column metric does).
+
+    Dialects in "APPROX_PERCENTILE_DIALECTS" select one array per column; others select one value per quantile.
+    """  # noqa: E501
+    selects: List[Any] = []
+    idx: int
+    column_name: str
+    quantiles: List[float]
+    for idx, (column_name, quantiles) in enumerate(zip(columns, quantiles_lists)):
+        column = sa.column(column_name)
+        if dialect_name in APPROX_PERCENTILE_DIALECTS:
+            selects.append(
+                sa.literal_column(f"approx_percentile({column}, ARRAY{quantiles})").label(
+                    f"q_{idx}"
+                )
+            )
+            continue
+
+        if dialect_name == GXSqlDialect.SNOWFLAKE:
+            # Snowflake rejects some quantiles, unless rounded (see "ColumnQuantileValues").
+            quantiles = [round(quantile, 10) for quantile in quantiles]  # noqa: PLW2901
+
+        quantile_idx: int
+        quantile: float
+        for quantile_idx, quantile in enumerate(quantiles):
+            quantile_select: Any
+            if dialect_name == GXSqlDialect.BIGQUERY:
+                quantile_select = sa.func.percentile_disc(column, quantile).over()
+            elif dialect_name == GXSqlDialect.MSSQL:
+                quantile_select = (
+                    sa.func.percentile_disc(quantile).within_group(column.asc()).over()
+                )
+            else:
+                quantile_select = sa.func.percentile_disc(quantile).within_group(column.asc())
+
+            selects.append(quantile_select.label(f"q_{idx}_{quantile_idx}"))
+
+    return selects
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+
+import pandas as pd
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core import FrozenIDDict
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyExecutionEngine,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+VALUE_COUNTS_METRIC_NAME = "column.value_counts"
+
+# Columns with more distinct values (in a sample of rows) than this are queried one at a time.
+DEFAULT_BATCHED_VALUE_COUNTS_MAX_CARDINALITY = 1000
+
+# Number of rows, from which cardinality of candidate columns is estimated.
+BATCHED_VALUE_COUNTS_CARDINALITY_SAMPLE_SIZE = 10000
+
+# Dialects that group by several independent sets of columns in one scan ("GROUP BY GROUPING SETS").
+GROUPING_SETS_DIALECTS = {
+    GXSqlDialect.BIGQUERY,
+    GXSqlDialect.DATABRICKS,
+    GXSqlDialect.MSSQL,
+    GXSqlDialect.ORACLE,
+    GXSqlDialect.POSTGRESQL,
+    GXSqlDialect.REDSHIFT,
+    GXSqlDialect.SNOWFLAKE,
+    GXSqlDialect.TRINO,
+    GXSqlDialect.VERTICA,
+}
+
+
+def resolve_batched_column_value_counts(  # noqa: C901 - too complex
+    execution_engine: SqlAlchemyExecutionEngine,
+    metrics_to_resolve: Sequence[MetricConfiguration],
+    max_cardinality: int,
+) -> Dict[Tuple[str, str, str], pd.Series]:
+    """Resolves "column.value_counts" metrics of low-cardinality columns sharing compute Domain in one query each.
+
+    Metrics are grouped by compute Domain and "sort" directive; within every group of two or more columns, columns
+    whose estimated cardinality does not exceed "max_cardinality" are counted together.  Metrics that are not resolved
+    here (e.g., of high-cardinality columns, with "collate" directive, or whose batched query fails) are left for the
+    per-column "column.value_counts" metric implementation.
+
+    Returns:
+        Dictionary of resolved "column.value_counts" metric values (in the format of the per-column implementation).
+    """  # noqa: E501
+    metrics_by_group: Dict[Tuple[FrozenIDDict, str], List[MetricConfiguration]] = defaultdict(list)
+    selectables_by_group: Dict[Tuple[FrozenIDDict, str], Any] = {}
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metrics_to_resolve:
+        if metric_configuration.metric_name != VALUE_COUNTS_METRIC_NAME:
+            continue
+
+        metric_value_kwargs = metric_configuration.metric_value_kwargs
+        sort: str = metric_value_kwargs.get("sort") or "value"
+        if metric_value_kwargs.get("collate") is not None or sort not in ("value", "count", "none"):
+            continue
+
+        selectable, compute_domain_kwargs, _ = execution_engine.get_compute_domain(
+            domain_kwargs=metric_configuration.metric_domain_kwargs,
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        group = (FrozenIDDict(compute_domain_kwargs), sort)
+        metrics_by_group[group].append(metric_configuration)
+        selectables_by_group.setdefault(group, selectable)
+
+    resolved_metrics: Dict[Tuple[str, str, str], pd.Series] = {}
+    for group, group_metrics in metrics_by_group.items():
+        columns: List[str] = list(
+            dict.fromkeys(
+                metric_configuration.metric_domain_kwargs["column"]
+                for metric_configuration in group_metrics
+            )
+        )
+        if len(columns) < 2:  # noqa: PLR2004
+            continue
+
+        try:
+            selectable = selectables_by_group[group]
+            cardinalities: Dict[str, int] = _estimate_column_cardinalities(
+                execution_engine=execution_engine, selectable=selectable, columns=columns
+            )
+            columns = [column for column in columns if cardinalities[column] <= max_cardinality]
+            if len(columns) < 2:  # noqa: PLR2004
+                continue
+
+            value_counts_by_column: Dict[str, pd.Series] = _get_batched_column_value_counts(
+                execution_engine=execution_engine,
+                selectable=selectable,
+                columns=columns,
+                sort=group[1],
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batched value counts of columns {columns} could not be computed; counting values of each column separately: {e!r}"  # noqa: E501
+            )
+            continue
+
+        for metric_configuration in group_metrics:
+            column: str = metric_configuration.metric_domain_kwargs["column"]
+            if column in value_counts_by_column:
+                resolved_metrics[metric_configuration.id] = value_counts_by_column[column]
+
+        logger.debug(
+            f"SqlAlchemyExecutionEngine counted values of {len(columns)} columns in a single query."
+        )
+
+    return resolved_metrics
+
+
+def _estimate_column_cardinalities(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    columns: List[str],
+) -> Dict[str, int]:
+    sample: sqlalchemy.Subquery = (
+        execution_engine._build_metric_bundle_query(
+            selectable=selectable, select=[sa.column(column) for column in columns]
+        )
+        .limit(BATCHED_VALUE_COUNTS_CARDINALITY_SAMPLE_SIZE)
+        .subquery()
+    )
+    query: sqlalchemy.Select = sa.select(
+        *[sa.func.count(sa.distinct(sample.c[column])) for column in columns]
+    )
+    row: sqlalchemy.Row = execution_engine.execute_query(query).fetchone()  # type: ignore[assignment]
+    return dict(zip(columns, row))
+
+
+def _get_batched_column_value_counts(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    columns: List[str],
+    sort: str,
+) -> Dict[str, pd.Series]:
+    rows: List[Tuple[int, Any, int]]
+    if execution_engine.dialect_name in GROUPING_SETS_DIALECTS:
+        rows = _execute_grouping_sets_query(
+            execution_engine=execution_engine, selectable=selectable, columns=columns, sort=sort
+        )
+    else:
+        rows = _execute_union_all_query(
+            execution_engine=execution_engine, selectable=selectable, columns=columns, sort=sort
+        )
+
+    values_by_column_index: Dict[int, List[Any]] = defaultdict(list)
+    counts_by_column_index: Dict[int, List[int]] = defaultdict(list)
+    column_index: int
+    for column_index, value, count in rows:
+        # Rows are ordered by column (and then as "sort" directs), like per-column query results.
+        values_by_column_index[column_index].append(value)
+        counts_by_column_index[column_index].append(count)
+
+    return {
+        column: pd.Series(
+            data=counts_by_column_index[column_index],
+            index=pd.Index(data=values_by_column_index[column_index], name="value"),
+            name="count",
+        )
+        for column_index, column in enumerate(columns)
+    }
+
+
+def _execute_grouping_sets_query(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    columns: List[str],
+    sort: str,
+) -> List[Tuple[int, Any, int]]:
+    """Counts values of all "columns" in one scan, grouping rows by each column separately.
+
+    "GROUPING(column)" is 0 only in rows of the grouping set of that column; rows of NULL values are
+    dropped.
+    """
+    sa_columns = [sa.column(column) for column in columns]
+    groupings = [sa.func.grouping(sa_column) for sa_column in sa_columns]
+    count = sa.func.count().label("count")
+    query: sqlalchemy.Select = execution_engine._build_metric_bundle_query(
+        selectable=selectable,
+        select=[
+            *sa_columns,
+            *[grouping.label(f"grouping_{idx}") for idx, grouping in enumerate(groupings)],
+            count,
+        ],
+    ).group_by(sa.func.grouping_sets(*[sa.tuple_(sa_column) for sa_column in sa_columns]))
+    if sort == "value":
+        query = query.order_by(*groupings, *sa_columns)
+    elif sort == "count":
+        query = query.order_by(*groupings, count.desc())
+    else:
+        query = query.order_by(*groupings)
+
+    rows: List[Tuple[int, Any, int]] = []
+    num_columns: int = len(columns)
+    row: sqlalchemy.Row
+    for row in execution_engine.execute_query(query).fetchall():
+        column_index: int = list(row[num_columns : 2 * num_columns]).index(0)
+        value: Any = row[column_index]
+        if value is not None:
+            rows.append((column_index, value, row[-1]))
+
+    return rows
+
+
+def _execute_union_all_query(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    columns: List[str],
+    sort: str,
+) -> List[Tuple[int, Any, int]]:
+    """Counts values of all "columns" in one round trip, using "UNION ALL" of per-column "GROUP BY" subqueries.
+
+    Values of every column occupy their own result column (others are NULL), so that columns of different types
+    are never combined in one result column.
+    """  # noqa: E501
+    value_labels: List[str] = [f"value_{idx}" for idx in range(len(columns))]
+    subqueries: List[sqlalchemy.Select] = []
+    column_index: int
+    column: str
+    for column_index, column in enumerate(columns):
+        sa_column = sa.column(column)
+        subqueries.append(
+            execution_engine._build_metric_bundle_query(
+                selectable=selectable,
+                select=[
+                    sa.literal(column_index).label("column_index"),
+                    *[
+                        (sa_column if idx == column_index else sa.null()).label(label)
+                        for idx, label in enumerate(value_labels)
+                    ],
+                    sa.func.count(sa_column).label("count"),
+                ],
+            )
+            .where(sa_column.is_not(None))
+            .group_by(sa_column)
+        )
+
+    value_counts: sqlalchemy.Subquery = sa.union_all(*subqueries).subquery("value_counts")
+    query: sqlalchemy.Select = sa.select(value_counts)
+    if sort == "value":
+        query = query.order_by(
+            value_counts.c.column_index, *[value_counts.c[label] for label in value_labels]
+        )
+    elif sort == "count":
+        query = query.order_by(value_counts.c.column_index, value_counts.c["count"].desc())
+    else:
+        query = query.order_by(value_counts.c.column_index)
+
+    rows: List[Tuple[int, Any, int]] = []
+    row: sqlalchemy.Row
+    for row in execution_engine.execute_query(query).fetchall():
+        column_index = row[0]
+        rows.append((column_index, row[1 + column_index], row[-1]))
+
+    return rows
@@ -10,6 +10,7 @@ import random
 import re
 import string
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import (
@@ -21,6 +22,8 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Union,
     cast,
@@ -43,6 +46,10 @@ from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricFunctionTypes,
+    MetricPartialFunctionTypes,
+)
 from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,
     PartitionDomainKwargs,
@@ -59,7 +66,7 @@ from great_expectations.validator.computed_metric import MetricValue  # noqa: TC
 del get_versions  # isort:skip
 
 
-from great_expectations.core import IDDict
+from great_expectations.core import FrozenIDDict, IDDict
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
@@ -77,7 +84,22 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.sqlalchemy_batched_quantiles import (
+    resolve_batched_column_quantile_values,
+)
+from great_expectations.execution_engine.sqlalchemy_batched_value_counts import (
+    DEFAULT_BATCHED_VALUE_COUNTS_MAX_CARDINALITY,
+    resolve_batched_column_value_counts,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_fused_map_condition_metrics import (
+    resolve_fused_map_condition_metrics,
+)
+from great_expectations.execution_engine.sqlalchemy_value_set_tables import (
+    DEFAULT_VALUE_SET_TABLE_MIN_SIZE,
+    SqlAlchemyValueSetTables,
+)
+from great_expectations.expectations.registry import get_metric_function_type
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -142,6 +164,10 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
+
 
 def _get_dialect_type_module(dialect):  # noqa: C901
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -206,6 +232,19 @@ _PERSISTED_CONNECTION_DIALECTS = (
     GXSqlDialect.BIGQUERY,
 )
 
+# Backends, on which temporary tables are not supported (GX would create permanent tables instead).
+_TEMP_TABLE_UNSUPPORTED_DIALECTS = (
+    GXSqlDialect.TRINO,
+    GXSqlDialect.AWSATHENA,  # WKS 202201 - AWS Athena currently doesn't support temp_tables.
+    GXSqlDialect.CLICKHOUSE,
+)
+
+# Query-based Batches, against which at least this many queries are pending, are materialized into temporary tables.  # noqa: E501
+DEFAULT_MATERIALIZE_QUERY_MIN_DOMAIN_QUERIES = 3
+
+# Domain keys, which do not change the compute Domain of aggregate metrics (they are bundled in one query).  # noqa: E501
+_ACCESSOR_DOMAIN_KEYS = ("column", "column_A", "column_B", "column_list")
+
 
 def _dialect_requires_persisted_connection(
     connection_string: str | None = None,
@@ -273,6 +312,25 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        max_query_concurrency (int): If greater than 1, independent per-Domain metric queries issued by \
+            "resolve_metric_bundle()" are sent concurrently, using at most this many pooled connections.  Dialects \
+            that require a single persisted connection (e.g., sqlite, mssql) always execute queries serially.
+        persistent_metric_cache (PersistentMetricCache or dict): On-disk cache of resolved metrics; it is used only \
+            for Batches, whose BatchMarkers carry a "batch_fingerprint" that identifies contents of the data.
+        batched_value_counts_max_cardinality (int): "column.value_counts" metrics of columns sharing a compute \
+            Domain, whose estimated number of distinct values does not exceed this threshold, are computed together \
+            in a single query ("GROUPING SETS" or "UNION ALL"); None or 0 disables batching of value counts.
+        materialize_query_min_domain_queries (int): Query-based Batches, for which "create_temp_table" was not set \
+            (is None), are materialized into a temporary table (once, and dropped by "close()"), if validating them \
+            would otherwise run the query as a subquery of at least this many metric queries; None or 0 disables \
+            materialization.  An explicit "create_temp_table=False" is always respected.
+        fuse_map_condition_queries (bool): If True (default), unexpected count, unexpected values, and unexpected \
+            index list of a column map condition, which would each scan the Domain, are computed in a single query.
+        value_set_table_min_size (int): Value sets of "column_values.in_set" conditions with at least this many \
+            integer or string values are loaded into temporary tables (once per value set, and dropped by "close()") \
+            and tested by semi-join rather than "IN" list; None or 0 disables value set tables.
+        batch_column_quantile_queries (bool): If True (default), "column.quantile_values" metrics of columns sharing \
+            a compute Domain are computed in a single query on dialects with aggregate quantile functions.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -291,17 +349,43 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string: Optional[str] = None,
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
-        create_temp_table: bool = True,
+        create_temp_table: Optional[bool] = True,
+        max_query_concurrency: Optional[int] = None,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
+        batched_value_counts_max_cardinality: Optional[
+            int
+        ] = DEFAULT_BATCHED_VALUE_COUNTS_MAX_CARDINALITY,
+        materialize_query_min_domain_queries: Optional[
+            int
+        ] = DEFAULT_MATERIALIZE_QUERY_MIN_DOMAIN_QUERIES,
+        fuse_map_condition_queries: bool = True,
+        value_set_table_min_size: Optional[int] = DEFAULT_VALUE_SET_TABLE_MIN_SIZE,
+        batch_column_quantile_queries: bool = True,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            persistent_metric_cache=persistent_metric_cache,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._max_query_concurrency = max_query_concurrency
+        self._batched_value_counts_max_cardinality = batched_value_counts_max_cardinality
+        self._materialize_query_min_domain_queries = materialize_query_min_domain_queries
+        self._materialized_batch_data: List[SqlAlchemyBatchData] = []
+        self._fuse_map_condition_queries = fuse_map_condition_queries
+        self._value_set_tables: Optional[SqlAlchemyValueSetTables] = (
+            SqlAlchemyValueSetTables(execution_engine=self, min_size=value_set_table_min_size)
+            if value_set_table_min_size
+            else None
+        )
+        self._batch_column_quantile_queries = batch_column_quantile_queries
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by  # noqa: E501
@@ -331,15 +415,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 url=url,
             )
 
-        # these are two backends where temp_table_creation is not supported we set the default value to False.  # noqa: E501
-        if (
-            self.dialect_name
-            in [
-                GXSqlDialect.TRINO,
-                GXSqlDialect.AWSATHENA,  # WKS 202201 - AWS Athena currently doesn't support temp_tables.  # noqa: E501
-                GXSqlDialect.CLICKHOUSE,
-            ]
-        ):
+        # these are backends where temp_table_creation is not supported we set the default value to False.  # noqa: E501
+        if self.dialect_name in _TEMP_TABLE_UNSUPPORTED_DIALECTS:
             self._create_temp_table = False
 
         # Get the dialect **for purposes of identifying types**
@@ -425,6 +502,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "max_query_concurrency": max_query_concurrency,
+            "batched_value_counts_max_cardinality": batched_value_counts_max_cardinality,
+            "materialize_query_min_domain_queries": materialize_query_min_domain_queries,
+            "fuse_map_condition_queries": fuse_map_condition_queries,
+            "value_set_table_min_size": value_set_table_min_size,
+            "batch_column_quantile_queries": batch_column_quantile_queries,
+            "persistent_metric_cache": self.persistent_metric_cache.to_config()
+            if self.persistent_metric_cache
+            else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -942,6 +1028,89 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return PartitionDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
+    @override
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves "column.value_counts" metrics of low-cardinality columns in batches (see
+        "batched_value_counts_max_cardinality"), unexpected count, values, and index list of column map conditions
+        in one query each (see "fuse_map_condition_queries"), quantiles of columns sharing compute Domain in one
+        query per Domain (see "batch_column_quantile_queries"), and all other metrics as usual.
+        """  # noqa: E501
+        metrics_to_resolve = list(metrics_to_resolve)
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if self._batched_value_counts_max_cardinality:
+            resolved_metrics.update(
+                resolve_batched_column_value_counts(
+                    execution_engine=self,
+                    metrics_to_resolve=metrics_to_resolve,
+                    max_cardinality=self._batched_value_counts_max_cardinality,
+                )
+            )
+
+        if self._fuse_map_condition_queries:
+            resolved_metrics.update(
+                resolve_fused_map_condition_metrics(
+                    execution_engine=self,
+                    metrics_to_resolve=[
+                        metric_configuration
+                        for metric_configuration in metrics_to_resolve
+                        if metric_configuration.id not in resolved_metrics
+                    ],
+                    metrics=metrics or {},
+                )
+            )
+
+        if self._batch_column_quantile_queries:
+            resolved_metrics.update(
+                resolve_batched_column_quantile_values(
+                    execution_engine=self,
+                    metrics_to_resolve=[
+                        metric_configuration
+                        for metric_configuration in metrics_to_resolve
+                        if metric_configuration.id not in resolved_metrics
+                    ],
+                )
+            )
+
+        if not resolved_metrics:
+            return super().resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        if self._caching:
+            self._metric_cache.update(resolved_metrics)
+
+        self._persist_resolved_metrics(
+            metric_configurations=[
+                metric_configuration
+                for metric_configuration in metrics_to_resolve
+                if metric_configuration.id in resolved_metrics
+            ],
+            resolved_metrics=resolved_metrics,
+        )
+
+        remaining_metrics_to_resolve: List[MetricConfiguration] = [
+            metric_configuration
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id not in resolved_metrics
+        ]
+        if remaining_metrics_to_resolve:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=remaining_metrics_to_resolve,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
     @override
     def resolve_metric_bundle(  # noqa: C901 - too complex
         self,
@@ -951,6 +1120,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         bundles of the metrics into one large query dictionary so that they are all executed simultaneously. Will fail
         if bundling the metrics together is not possible.
 
+        The "metric_fn" of a bundled metric is either one aggregate expression, or a list of aggregate expressions (e.g.,
+        one per histogram bin), in which case the metric value is the list of their results.
+
             Args:
                 metric_fn_bundle (Iterable[MetricComputationConfiguration]): \
                     "MetricComputationConfiguration" contains MetricProvider's MetricConfiguration (its unique identifier),
@@ -979,79 +1151,286 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             metric_fn: Any = bundled_metric_configuration.metric_fn
             compute_domain_kwargs: dict = bundled_metric_configuration.compute_domain_kwargs or {}
             if not isinstance(compute_domain_kwargs, IDDict):
-                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+                compute_domain_kwargs = FrozenIDDict(compute_domain_kwargs)
 
             domain_id = compute_domain_kwargs.to_id()
             if domain_id not in queries:
                 queries[domain_id] = {
                     "select": [],
                     "metric_ids": [],
+                    "metric_value_slices": [],
+                    "metric_configurations": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
-            if self.engine.dialect.name == "clickhouse":
-                queries[domain_id]["select"].append(
-                    metric_fn.label(
-                        metric_to_resolve.metric_name.join(
-                            random.choices(string.ascii_lowercase, k=4)
+            metric_aggregates: List[Any] = (
+                list(metric_fn) if isinstance(metric_fn, (list, tuple)) else [metric_fn]
+            )
+            start: int = len(queries[domain_id]["select"])
+            metric_aggregate: Any
+            for metric_aggregate in metric_aggregates:
+                if self.engine.dialect.name == "clickhouse":
+                    queries[domain_id]["select"].append(
+                        metric_aggregate.label(
+                            metric_to_resolve.metric_name.join(
+                                random.choices(string.ascii_lowercase, k=4)
+                            )
                         )
                     )
-                )
-            else:
-                queries[domain_id]["select"].append(metric_fn.label(metric_to_resolve.metric_name))
+                else:
+                    queries[domain_id]["select"].append(
+                        metric_aggregate.label(metric_to_resolve.metric_name)
+                    )
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
+            # Results of a single aggregate expression are taken as they are (rather than as a list).
+            queries[domain_id]["metric_value_slices"].append(
+                slice(start, start + len(metric_aggregates))
+                if isinstance(metric_fn, (list, tuple))
+                else start
+            )
+            queries[domain_id]["metric_configurations"].append(metric_to_resolve)
+
+        sa_query_objects: Dict[Tuple[str, str, str], sqlalchemy.Select] = {}
+        for domain_id, query in queries.items():
+            assert len(query["metric_value_slices"]) == len(query["metric_ids"])
+            sa_query_objects[domain_id] = self._build_metric_bundle_query(
+                selectable=self.get_domain_records(domain_kwargs=query["domain_kwargs"]),
+                select=query["select"],
+            )
+
+        results_by_domain_id: Dict[Tuple[str, str, str], List[sqlalchemy.Row]]
+        if self._should_execute_metric_bundle_queries_concurrently(num_queries=len(queries)):
+            results_by_domain_id = self._execute_metric_bundle_queries_concurrently(
+                queries=queries, sa_query_objects=sa_query_objects
+            )
+        else:
+            results_by_domain_id = {
+                domain_id: self._execute_metric_bundle_query(
+                    sa_query_object=sa_query_objects[domain_id], domain_id=domain_id
+                )
+                for domain_id in queries
+            }
+
+        for domain_id, query in queries.items():
+            res = results_by_domain_id[domain_id]
+
+            assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
+            assert len(query["select"]) == len(res[0]), "unexpected number of metrics returned"
+
+            metric_value_slice: Union[int, slice]
+            metric_id: Tuple[str, str, str]
+            for metric_value_slice, metric_id in zip(
+                query["metric_value_slices"], query["metric_ids"]
+            ):
+                # Converting SQL query execution results into JSON-serializable format produces simple data types,  # noqa: E501
+                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
+                resolved_metrics[metric_id] = convert_to_json_serializable(
+                    data=res[0][metric_value_slice]
+                )
+
+        return resolved_metrics
+
+    @staticmethod
+    def _build_metric_bundle_query(
+        selectable: sqlalchemy.Selectable, select: List[Any]
+    ) -> sqlalchemy.Select:
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
+            return sa.select(*select).select_from(selectable.columns().subquery())
+
+        if (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+            sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)
+        ):
+            return sa.select(*select).select_from(selectable.subquery())
 
-        for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
+        return sa.select(*select).select_from(selectable)
 
-            assert len(query["select"]) == len(query["metric_ids"])
+    def _execute_metric_bundle_query(
+        self, sa_query_object: sqlalchemy.Select, domain_id: Tuple[str, str, str]
+    ) -> List[sqlalchemy.Row]:
+        try:
+            logger.debug(f"Attempting query {sa_query_object!s}")
+            # Rows are fetched before the connection is released, since pooled connections may be closed on return.  # noqa: E501
+            with self.get_connection() as connection:
+                res: List[sqlalchemy.Row] = connection.execute(sa_query_object).fetchall()
+
+            logger.debug(
+                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {domain_id}"
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)  # noqa: TRY400
+            raise ExecutionEngineError(message=exception_message)
+
+        return res
+
+    @override
+    def prepare_batch_data_for_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Materializes query-based Batches, which pending metrics would otherwise re-query many times.
+
+        Every pending metric bundle (one per compute Domain) and every other metric that issues its own query runs
+        the query of a Batch, loaded with "create_temp_table" unset, as a subquery.  Once there are at least
+        "materialize_query_min_domain_queries" such queries, running the query once into a temporary table is cheaper.
+        Backends without temporary tables, and concurrent metric queries (whose pooled connections do not share
+        temporary tables) are left alone; if the temporary table cannot be created, the subquery continues to be used.
+        """  # noqa: E501
+        if not self._materialize_query_min_domain_queries or (
+            self.dialect_name in _TEMP_TABLE_UNSUPPORTED_DIALECTS
+        ):
+            return
+
+        batch_data_cache = self.batch_manager.batch_data_cache
+        if not any(
+            isinstance(batch_data, SqlAlchemyBatchData) and batch_data.deferred_query is not None
+            for batch_data in batch_data_cache.values()
+        ):
+            return
+
+        num_domain_queries = self._estimate_domain_queries_by_batch_id(
+            metric_configurations=metric_configurations
+        )
+
+        batch_id: str
+        num_queries: int
+        for batch_id, num_queries in num_domain_queries.items():
+            batch_data = batch_data_cache.get(batch_id)
+            if (
+                not isinstance(batch_data, SqlAlchemyBatchData)
+                or batch_data.deferred_query is None
+                or num_queries < self._materialize_query_min_domain_queries
+                or self._should_execute_metric_bundle_queries_concurrently(num_queries=num_queries)
+            ):
+                continue
 
             try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
-                    sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable.subquery())
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable)
+                batch_data.materialize()
+            except Exception as e:
+                logger.warning(
+                    f"Query of Batch {batch_id} could not be materialized into a temporary table; it will be run as a subquery: {e!r}"  # noqa: E501
+                )
+                continue
+
+            self._materialized_batch_data.append(batch_data)
+            logger.debug(
+                f"SqlAlchemyExecutionEngine materialized query of Batch {batch_id} ahead of {num_queries} metric queries."  # noqa: E501
+            )
 
-                logger.debug(f"Attempting query {sa_query_object!s}")
-                res = self.execute_query(sa_query_object).fetchall()
+    def _estimate_domain_queries_by_batch_id(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[str, int]:
+        """Counts queries issued by resolving "metric_configurations" (distinct aggregate compute Domains and other
+        "value" metrics) for each Batch.
+        """  # noqa: E501
+        active_batch_id: Optional[str] = self.batch_manager.active_batch_data_id
+        aggregate_domains: Dict[str, Set[Tuple[str, str, str]]] = {}
+        num_value_queries: Dict[str, int] = {}
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            try:
+                metric_fn_type = get_metric_function_type(
+                    metric_name=metric_configuration.metric_name, execution_engine=self
                 )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += (
-                    f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            except gx_exceptions.MetricProviderError:
+                continue
+
+            metric_domain_kwargs = metric_configuration.metric_domain_kwargs
+            batch_id: Optional[str] = metric_domain_kwargs.get("batch_id") or active_batch_id
+            if batch_id is None:
+                continue
+
+            if metric_fn_type == MetricPartialFunctionTypes.AGGREGATE_FN:
+                compute_domain_kwargs = IDDict(
+                    {
+                        key: value
+                        for key, value in metric_domain_kwargs.items()
+                        if key not in _ACCESSOR_DOMAIN_KEYS
+                    }
                 )
-                logger.error(exception_message)  # noqa: TRY400
-                raise ExecutionEngineError(message=exception_message)
+                aggregate_domains.setdefault(batch_id, set()).add(compute_domain_kwargs.to_id())
+            elif metric_fn_type == MetricFunctionTypes.VALUE:
+                num_value_queries[batch_id] = num_value_queries.get(batch_id, 0) + 1
 
-            assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
-            assert len(query["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
+        return {
+            batch_id: len(aggregate_domains.get(batch_id, ())) + num_value_queries.get(batch_id, 0)
+            for batch_id in aggregate_domains.keys() | num_value_queries.keys()
+        }
 
-            idx: int
-            metric_id: Tuple[str, str, str]
-            for idx, metric_id in enumerate(query["metric_ids"]):
-                # Converting SQL query execution results into JSON-serializable format produces simple data types,  # noqa: E501
-                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
-                resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
+    def get_value_set_selectable(
+        self, value_set: Sequence[Any], column_type: Optional[Any] = None
+    ) -> Optional[sqlalchemy.Select]:
+        """Returns query of temporary table holding "value_set", against which membership of values of column of
+        "column_type" can be tested by semi-join (None, if "value_set" is to be rendered as "IN" list of literals).
+        """  # noqa: E501
+        if self._value_set_tables is None:
+            return None
 
-        return resolved_metrics
+        return self._value_set_tables.get_value_set_selectable(
+            value_set=value_set, column_type=column_type
+        )
+
+    def _should_execute_metric_bundle_queries_concurrently(self, num_queries: int) -> bool:
+        """Concurrency is opt-in and requires an Engine (with its own connection pool) that is not restricted to a single persisted connection."""  # noqa: E501
+        return (
+            self._max_query_concurrency is not None
+            and self._max_query_concurrency > 1
+            and num_queries > 1
+            and isinstance(self.engine, sqlalchemy.Engine)
+            and self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS
+        )
+
+    def _execute_metric_bundle_queries_concurrently(
+        self,
+        queries: Dict[Tuple[str, str, str], dict],
+        sa_query_objects: Dict[Tuple[str, str, str], sqlalchemy.Select],
+    ) -> Dict[Tuple[str, str, str], List[sqlalchemy.Row]]:
+        """Executes independent per-Domain queries through a bounded pool of worker threads.
+
+        Every query runs to completion, even if others fail, so that only "MetricConfiguration" objects belonging to
+        failed Domains are reported in the raised "MetricResolutionError" (and counted towards their retry limits).
+        """  # noqa: E501
+        max_workers: int = min(cast(int, self._max_query_concurrency), len(queries))
+        results_by_domain_id: Dict[Tuple[str, str, str], List[sqlalchemy.Row]] = {}
+        errors_by_domain_id: Dict[Tuple[str, str, str], Exception] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-sql-metric-bundle"
+        ) as executor:
+            futures = {
+                domain_id: executor.submit(
+                    self._execute_metric_bundle_query,
+                    sa_query_object=sa_query_objects[domain_id],
+                    domain_id=domain_id,
+                )
+                for domain_id in queries
+            }
+            for domain_id, future in futures.items():
+                try:
+                    results_by_domain_id[domain_id] = future.result()
+                except Exception as e:
+                    errors_by_domain_id[domain_id] = e
+
+        if errors_by_domain_id:
+            raise gx_exceptions.MetricResolutionError(
+                message="; ".join(str(e) for e in errors_by_domain_id.values()),
+                failed_metrics=[
+                    metric_configuration
+                    for domain_id in errors_by_domain_id
+                    for metric_configuration in queries[domain_id]["metric_configurations"]
+                ],
+            )
+
+        return results_by_domain_id
 
     def close(self) -> None:
         """
@@ -1071,6 +1450,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """  # noqa: E501
+        for batch_data in self._materialized_batch_data:
+            batch_data.drop_materialized_table()
+        self._materialized_batch_data = []
+
+        if self._value_set_tables:
+            self._value_set_tables.drop_all()
+
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1168,6 +1554,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 "sample_using_limit",
                 "_sample_using_random",
                 "sample_using_random",
+                "_sample_using_tablesample",
+                "sample_using_tablesample",
             ]:
                 sampler_fn = self._data_sampler.get_sampler_method(sampling_method)
                 return sampler_fn(
@@ -1236,7 +1624,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         source_schema_name: str = batch_spec.get("schema_name", None)
         source_table_name: str = batch_spec.get("table_name", None)
 
-        create_temp_table: bool = batch_spec.get("create_temp_table", self._create_temp_table)
+        create_temp_table: Optional[bool] = batch_spec.get(
+            "create_temp_table", self._create_temp_table
+        )
         # this is where partitioner components are added to the selectable
         selectable: sqlalchemy.Selectable = self._build_selectable_from_batch_spec(
             batch_spec=batch_spec
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.metric_function_types import SummarizationMetricNameSuffixes
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.util import get_sqlalchemy_selectable
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyExecutionEngine,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+UNEXPECTED_COUNT = SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value
+UNEXPECTED_VALUES = SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value
+UNEXPECTED_INDEX_LIST = SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value
+
+# BigQuery upper bound on query parameters (applies to "COMPLETE" lists of unexpected values).
+BIGQUERY_MAX_UNEXPECTED_VALUES = 10000
+
+
+def resolve_fused_map_condition_metrics(  # noqa: C901 - too complex
+    execution_engine: SqlAlchemyExecutionEngine,
+    metrics_to_resolve: Sequence[MetricConfiguration],
+    metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    """Resolves unexpected count, unexpected values, and unexpected index list of a column map condition in one query.
+
+    Each of these metrics otherwise scans the Domain separately.  Whenever at least two of them, sharing the same
+    "unexpected_condition" (and "result_format"), are ready to be resolved together, one query selects the first
+    unexpected rows (index columns and the Domain column) along with "COUNT(*) OVER ()" (total number of unexpected
+    rows, computed before "LIMIT" is applied).  Unexpected counts that are bundled with other aggregates are left alone
+    (they cost no scan of their own).  Metrics that are not resolved here (e.g., whose fused query fails) are left for
+    their own metric implementations.
+
+    Returns:
+        Dictionary of resolved metric values (in the format of the per-metric implementations).
+    """  # noqa: E501
+    from great_expectations.expectations.metrics.map_metric_provider.column_map_condition_auxilliary_methods import (  # noqa: E501
+        _sqlalchemy_column_map_condition_values,
+    )
+    from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (  # noqa: E501
+        _is_sqlalchemy_metric_selectable,
+    )
+    from great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods import (  # noqa: E501
+        _sqlalchemy_map_condition_index,
+        _sqlalchemy_map_condition_unexpected_count_value,
+    )
+
+    fusible_metric_fns = {
+        _sqlalchemy_map_condition_unexpected_count_value: UNEXPECTED_COUNT,
+        _sqlalchemy_column_map_condition_values: UNEXPECTED_VALUES,
+        _sqlalchemy_map_condition_index: UNEXPECTED_INDEX_LIST,
+    }
+
+    metrics_by_condition: Dict[Tuple[str, str, str], Dict[str, MetricConfiguration]] = defaultdict(
+        dict
+    )
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metrics_to_resolve:
+        condition_metric: Optional[MetricConfiguration] = (
+            metric_configuration.metric_dependencies.get("unexpected_condition")
+        )
+        if condition_metric is None:
+            continue
+
+        metric_class, metric_fn = get_metric_provider(
+            metric_name=metric_configuration.metric_name, execution_engine=execution_engine
+        )
+        kind: Optional[str] = fusible_metric_fns.get(metric_fn)
+        if kind is None or _is_sqlalchemy_metric_selectable(map_metric_provider=metric_class):
+            continue
+
+        if kind == UNEXPECTED_COUNT and execution_engine.dialect_name == GXSqlDialect.MSSQL:
+            # Unexpected count is computed through a temporary table on MSSQL.
+            continue
+
+        metrics_by_condition[condition_metric.id][kind] = metric_configuration
+
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    condition_id: Tuple[str, str, str]
+    group: Dict[str, MetricConfiguration]
+    for condition_id, group in metrics_by_condition.items():
+        if len(group) < 2:  # noqa: PLR2004
+            continue
+
+        result_formats: List[dict] = [
+            group[kind].metric_value_kwargs["result_format"]
+            for kind in (UNEXPECTED_VALUES, UNEXPECTED_INDEX_LIST)
+            if kind in group
+        ]
+        if any(result_format != result_formats[0] for result_format in result_formats):
+            continue
+
+        try:
+            resolved_metrics.update(
+                _resolve_fused_group(
+                    execution_engine=execution_engine,
+                    group=group,
+                    metrics=metrics,
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                f"Fused query for {sorted(group)} of {condition_id[0]} could not be executed; resolving them separately: {e!r}"  # noqa: E501
+            )
+            continue
+
+        logger.debug(
+            f"SqlAlchemyExecutionEngine resolved {len(group)} metrics of {condition_id[0]} in a single query."  # noqa: E501
+        )
+
+    return resolved_metrics
+
+
+def _resolve_fused_group(  # noqa: C901 - too complex
+    execution_engine: SqlAlchemyExecutionEngine,
+    group: Dict[str, MetricConfiguration],
+    metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    from great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods import (  # noqa: E501
+        _get_sqlalchemy_customized_unexpected_index_list,
+    )
+    from great_expectations.expectations.metrics.util import (
+        get_dbms_compatible_metric_domain_kwargs,
+    )
+
+    # Groups contain at least two metrics, so unexpected values or unexpected index list is always among them.  # noqa: E501
+    row_metric: MetricConfiguration = group.get(UNEXPECTED_VALUES) or group[UNEXPECTED_INDEX_LIST]
+    dependencies = execution_engine._get_computed_metric_evaluation_dependencies_by_metric_name(
+        metric_to_resolve=row_metric, metrics=metrics
+    )
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = dependencies[
+        "unexpected_condition"
+    ]
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(  # noqa: TRY003
+            'No "column" found in provided metric_domain_kwargs, but it is required for a column map metric.'  # noqa: E501
+        )
+
+    table_columns: List[str] = dependencies.get("table.columns") or []
+    result_format: dict = row_metric.metric_value_kwargs["result_format"]
+    unexpected_index_column_names: List[str] = []
+
+    fuse_index_list: bool = (
+        UNEXPECTED_INDEX_LIST in group and "unexpected_index_column_names" in result_format
+    )
+    if fuse_index_list:
+        unexpected_index_column_names = result_format["unexpected_index_column_names"]
+        if any(column_name not in table_columns for column_name in unexpected_index_column_names):
+            # Leave reporting of invalid index columns to the unexpected index list metric itself.
+            raise ValueError(  # noqa: TRY003
+                f"Unexpected index columns {unexpected_index_column_names} are not all in table."
+            )
+
+    column_name: str = accessor_domain_kwargs["column"]
+    compatible_column_name: str = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=table_columns,
+    )["column"]
+
+    selected_columns: list = [sa.column(name) for name in unexpected_index_column_names]
+    selected_columns.append(sa.column(compatible_column_name).label("unexpected_values"))
+    if UNEXPECTED_COUNT in group:
+        selected_columns.append(sa.func.count().over().label("unexpected_count"))
+
+    selectable = execution_engine.get_domain_records(
+        domain_kwargs=dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+    )
+    query: sqlalchemy.Select = (
+        sa.select(*selected_columns)
+        .select_from(get_sqlalchemy_selectable(selectable))
+        .where(unexpected_condition)
+    )
+
+    partial_unexpected_count: Optional[int] = result_format.get("partial_unexpected_count")
+    if UNEXPECTED_VALUES in group and result_format["result_format"] == "COMPLETE":
+        if execution_engine.dialect_name == GXSqlDialect.BIGQUERY:
+            query = query.limit(BIGQUERY_MAX_UNEXPECTED_VALUES)
+    elif partial_unexpected_count is not None:
+        query = query.limit(partial_unexpected_count)
+
+    rows: List[sqlalchemy.Row] = execution_engine.execute_query(query).fetchall()
+
+    num_index_columns: int = len(unexpected_index_column_names)
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    if UNEXPECTED_COUNT in group:
+        resolved_metrics[group[UNEXPECTED_COUNT].id] = int(rows[0][-1]) if rows else 0
+
+    if UNEXPECTED_VALUES in group:
+        resolved_metrics[group[UNEXPECTED_VALUES].id] = [row[num_index_columns] for row in rows]
+
+    if UNEXPECTED_INDEX_LIST in group:
+        if fuse_index_list:
+            resolved_metrics[group[UNEXPECTED_INDEX_LIST].id] = (
+                _get_sqlalchemy_customized_unexpected_index_list(
+                    exclude_unexpected_values=result_format.get("exclude_unexpected_values", False),
+                    unexpected_index_column_names=unexpected_index_column_names,
+                    query_result=rows[:partial_unexpected_count],
+                    domain_column_name_list=[column_name],
+                )
+            )
+        else:
+            resolved_metrics[group[UNEXPECTED_INDEX_LIST].id] = None
+
+    return resolved_metrics
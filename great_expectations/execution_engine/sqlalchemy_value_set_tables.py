@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.not_imported import is_version_greater_or_equal
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.util import generate_temporary_table_name
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyExecutionEngine,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Value sets with at least this many values are loaded into temporary tables (rather than rendered as "IN" lists).
+DEFAULT_VALUE_SET_TABLE_MIN_SIZE = 10000
+
+# Dialects, on which temporary tables are created by "CREATE TEMPORARY TABLE" (and live as long as the connection).
+# MySQL is not among them: it cannot refer to a temporary table more than once in the same query.
+VALUE_SET_TABLE_DIALECTS = (
+    GXSqlDialect.POSTGRESQL,
+    GXSqlDialect.REDSHIFT,
+    GXSqlDialect.SNOWFLAKE,
+    GXSqlDialect.SQLITE,
+)
+
+VALUE_SET_TABLE_COLUMN_NAME = "value"
+
+
+class SqlAlchemyValueSetTables:
+    """Temporary tables holding large value sets, which "column_values.in_set" conditions test membership in.
+
+    A value set rendered as "IN (...)" list of literals is sent (and planned) with every query that references it;
+    some dialects reject very long lists.  Instead, every distinct value set is inserted once into a temporary table,
+    and conditions are expressed as semi-joins against it.  Tables are shared by all Expectations using the same value
+    set (e.g., the same suite parameter), and dropped by "drop_all()".
+
+    Args:
+        execution_engine: SqlAlchemyExecutionEngine, on whose connection temporary tables are created.
+        min_size: value sets with fewer values are left to be rendered as "IN" lists.
+    """  # noqa: E501
+
+    def __init__(self, execution_engine: SqlAlchemyExecutionEngine, min_size: int) -> None:
+        self._execution_engine = execution_engine
+        self._min_size = min_size
+        # Value sets, whose table could not be created, are cached as None (they are not retried).
+        self._tables: Dict[Tuple[str, Tuple[Any, ...]], Optional[sqlalchemy.Table]] = {}
+
+    def get_value_set_selectable(
+        self, value_set: Sequence[Any], column_type: Optional[Any]
+    ) -> Optional[sqlalchemy.Select]:
+        """Returns "SELECT value FROM <temporary table>" with values of "value_set", compared with column of "column_type".
+
+        Returns:
+            Selectable, or None, if "value_set" is to be rendered as "IN" list (it is small, its values would have to
+            be converted to "column_type", or the temporary table could not be created).
+        """  # noqa: E501
+        if (
+            len(value_set) < self._min_size
+            or column_type is None
+            or self._execution_engine.dialect_name not in VALUE_SET_TABLE_DIALECTS
+            or self._execution_engine._should_execute_metric_bundle_queries_concurrently(
+                num_queries=2
+            )
+        ):
+            return None
+
+        value_set_type: Optional[Any] = _get_value_set_type(
+            value_set=value_set, column_type=column_type
+        )
+        if value_set_type is None:
+            return None
+
+        key: Tuple[str, Tuple[Any, ...]] = (type(value_set_type).__name__, tuple(value_set))
+        if key not in self._tables:
+            self._tables[key] = self._create_value_set_table(
+                values=list(dict.fromkeys(value_set)), value_set_type=value_set_type
+            )
+
+        table: Optional[sqlalchemy.Table] = self._tables[key]
+        if table is None:
+            return None
+
+        return sa.select(table.c[VALUE_SET_TABLE_COLUMN_NAME])
+
+    def drop_all(self) -> None:
+        """Drops all temporary tables created so far; failure to drop a table is only logged."""
+        table: Optional[sqlalchemy.Table]
+        for table in self._tables.values():
+            if table is None:
+                continue
+
+            try:
+                self._execute_in_transaction(lambda connection: table.drop(bind=connection))  # noqa: B023
+            except Exception as e:
+                logger.warning(f"Unable to drop temporary value set table {table.name}: {e!r}")
+
+        self._tables = {}
+
+    def _create_value_set_table(
+        self, values: List[Any], value_set_type: Any
+    ) -> Optional[sqlalchemy.Table]:
+        table = sa.Table(
+            generate_temporary_table_name(),
+            sa.MetaData(),
+            sa.Column(VALUE_SET_TABLE_COLUMN_NAME, value_set_type),
+            prefixes=["TEMPORARY"],
+        )
+
+        def create_and_insert(connection: sqlalchemy.Connection) -> None:
+            table.create(bind=connection)
+            connection.execute(
+                table.insert(), [{VALUE_SET_TABLE_COLUMN_NAME: value} for value in values]
+            )
+
+        try:
+            self._execute_in_transaction(create_and_insert)
+        except Exception as e:
+            logger.warning(
+                f"Value set of {len(values)} values could not be loaded into a temporary table; it will be rendered as IN list: {e!r}"  # noqa: E501
+            )
+            return None
+
+        logger.debug(
+            f"SqlAlchemyExecutionEngine loaded value set of {len(values)} values into temporary table {table.name}."  # noqa: E501
+        )
+        return table
+
+    def _execute_in_transaction(self, fn) -> None:
+        with self._execution_engine.get_connection() as connection:
+            if (
+                is_version_greater_or_equal(sqlalchemy.sqlalchemy.__version__, "2.0.0")
+                and not connection.closed
+            ):
+                try:
+                    fn(connection)
+                except Exception:
+                    connection.rollback()
+                    raise
+                connection.commit()
+            else:
+                with connection.begin():
+                    fn(connection)
+
+
+def _get_value_set_type(value_set: Sequence[Any], column_type: Optional[Any]) -> Optional[Any]:
+    """Returns type of temporary table column, which holds "value_set" without converting any of its values.
+
+    Only integer values (compared with integer columns) and string values (compared with string columns) qualify;
+    inserting other values (e.g., floats into "NUMERIC(5, 0)") could round or reinterpret them, so that they would
+    match rows that the "IN" list would not.
+    """  # noqa: E501
+    if isinstance(column_type, sa.Integer) and all(type(value) is int for value in value_set):
+        return sa.BigInteger()
+
+    if isinstance(column_type, sa.String) and all(type(value) is str for value in value_set):
+        # Values are stored in full (columns of limited length would truncate or reject them).
+        return sa.Text()
+
+    return None
@@ -66,7 +66,9 @@ QUANTILE_RANGES_DESCRIPTION = (
 )
 ALLOW_RELATIVE_ERROR_DESCRIPTION = (
     "Whether to allow relative error in quantile "
-    "communications on backends that support or require it."
+    "communications on backends that support or require it. "
+    "On Pandas, True or a number between 0 and 1 (the allowed rank error) "
+    "estimates quantiles in bounded memory, using a mergeable quantile sketch."
 )
 SUPPORTED_DATA_SOURCES = ["Pandas", "Spark", "SQLite", "PostgreSQL", "MySQL", "MSSQL", "Redshift"]
 DATA_QUALITY_ISSUES = ["Numerical data"]
@@ -90,7 +92,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             {COLUMN_DESCRIPTION}
         quantile_ranges (dictionary with keys 'quantiles' and 'value_ranges'): \
             {QUANTILE_RANGES_DESCRIPTION} The length of the 'quantiles' list and the 'value_ranges' list must be equal.
-        allow_relative_error (boolean or string): \
+        allow_relative_error (boolean, float, or string): \
             {ALLOW_RELATIVE_ERROR_DESCRIPTION}
 
     Other Parameters:
@@ -235,7 +237,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
     """  # noqa: E501
 
     quantile_ranges: QuantileRange = pydantic.Field(description=QUANTILE_RANGES_DESCRIPTION)
-    allow_relative_error: Union[bool, str] = pydantic.Field(
+    allow_relative_error: Union[bool, float, str] = pydantic.Field(
         False,
         description=ALLOW_RELATIVE_ERROR_DESCRIPTION,
     )
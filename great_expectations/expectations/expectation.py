@@ -1123,8 +1123,10 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
             return None
 
     def _get_domain_kwargs(self) -> Dict[str, Optional[str]]:
+        # "configuration" is built anew on every access, so it is built once here, not per key.
+        configuration_kwargs: dict = self.configuration.kwargs
         domain_kwargs: Dict[str, Optional[str]] = {
-            key: self.configuration.kwargs.get(key, self._get_default_value(key))
+            key: configuration_kwargs.get(key, self._get_default_value(key))
             for key in self.domain_keys
         }
         missing_kwargs: Union[set, Set[str]] = set(self.domain_keys) - set(domain_kwargs.keys())
@@ -1134,8 +1136,9 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
 
     def _get_success_kwargs(self) -> Dict[str, Any]:
         domain_kwargs: Dict[str, Optional[str]] = self._get_domain_kwargs()
+        configuration_kwargs: dict = self.configuration.kwargs
         success_kwargs: Dict[str, Any] = {
-            key: self.configuration.kwargs.get(key, self._get_default_value(key))
+            key: configuration_kwargs.get(key, self._get_default_value(key))
             for key in self.success_keys
         }
         success_kwargs.update(domain_kwargs)
@@ -1145,7 +1148,8 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
         self,
         runtime_configuration: Optional[dict] = None,
     ) -> dict:
-        configuration = deepcopy(self.configuration)
+        # "configuration" is a fresh copy, which is safe to update in place.
+        configuration = self.configuration
 
         if runtime_configuration:
             configuration.kwargs.update(runtime_configuration)
@@ -1522,11 +1526,13 @@ class BatchExpectation(Expectation, ABC):
             runtime_configuration=runtime_configuration,
         )
 
+        configuration = self.configuration
+
         metric_name: str
         for metric_name in self.metric_dependencies:
             metric_kwargs = get_metric_kwargs(
                 metric_name=metric_name,
-                configuration=self.configuration,
+                configuration=configuration,
                 runtime_configuration=runtime_configuration,
             )
             validation_dependencies.set_metric_configuration(
@@ -1881,9 +1887,11 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs: dict
 
+        configuration = self.configuration
+
         metric_kwargs = get_metric_kwargs(
             metric_name=f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1897,7 +1905,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1911,7 +1919,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name="table.row_count",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1935,7 +1943,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1950,7 +1958,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
         if include_unexpected_rows:
             metric_kwargs = get_metric_kwargs(
                 metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
-                configuration=self.configuration,
+                configuration=configuration,
                 runtime_configuration=runtime_configuration,
             )
             validation_dependencies.set_metric_configuration(
@@ -1967,7 +1975,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1980,7 +1988,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
         )
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -9,6 +9,7 @@ from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.pandas_column_aggregates import PandasColumnAggregate
 from great_expectations.execution_engine.sparkdf_execution_engine import (
     SparkDFExecutionEngine,
 )
@@ -31,6 +32,8 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.compatibility import sqlalchemy
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
@@ -111,6 +114,10 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):  # noqa:
     A metric function that is decorated as a column_aggregate_partial will be called with the engine-specific column
     type and any value_kwargs associated with the Metric for which the provider function is being declared.
 
+    For PandasExecutionEngine, the metric function is not given a column; it returns either a PandasColumnAggregate
+    member (all of which are computed together in a single pass over the column) or a callable that accepts the column
+    as a pd.Series and returns the metric value.
+
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
         partial_fn_type: The metric function type
@@ -243,10 +250,72 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):  # noqa:
 
         return wrapper
 
+    elif issubclass(engine, PandasExecutionEngine):
+
+        def wrapper(metric_fn: Callable):
+            @metric_partial(
+                engine=PandasExecutionEngine,
+                partial_fn_type=partial_fn_type,
+                domain_type=domain_type,
+            )
+            @wraps(metric_fn)
+            def inner_func(  # noqa: PLR0913
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                # Data is not accessed here; "PandasExecutionEngine.resolve_metric_bundle()" obtains
+                # records of each compute Domain once and computes all bundled aggregates together.
+                column_name: str = metric_domain_kwargs["column"]
+                compute_domain_kwargs = {
+                    k: v for k, v in metric_domain_kwargs.items() if k != "column"
+                }
+                accessor_domain_kwargs = {"column": column_name}
+
+                metric_aggregate: Union[PandasColumnAggregate, Callable[[pd.Series], Any]] = (
+                    metric_fn(
+                        cls,
+                        **metric_value_kwargs,
+                        _column_name=column_name,
+                        _metrics=metrics,
+                    )
+                )
+                if filter_column_isnull and not isinstance(metric_aggregate, PandasColumnAggregate):
+                    # Fusable aggregates skip missing values by definition.
+                    metric_aggregate = _filter_column_isnull(metric_aggregate)
+
+                return metric_aggregate, compute_domain_kwargs, accessor_domain_kwargs
+
+            return inner_func
+
+        return wrapper
+
     else:
         raise ValueError("Unsupported engine for column_aggregate_partial")  # noqa: TRY003, TRY004
 
 
+def _filter_column_isnull(
+    metric_aggregate: Callable[[pd.Series], Any],
+) -> Callable[[pd.Series], Any]:
+    @wraps(metric_aggregate)
+    def inner_func(column: pd.Series) -> Any:
+        return metric_aggregate(column[column.notnull()])
+
+    return inner_func
+
+
 class ColumnAggregateMetricProvider(TableMetricProvider):
     """Base class for all Column Aggregate Metrics,
     which define metrics to be calculated in aggregate from a given column.
@@ -20,9 +20,9 @@ from great_expectations.execution_engine import (
 )
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
+    column_aggregate_partial,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -54,27 +54,17 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         hist, _bin_edges = np.histogram(column_nonnull_elements, bins, density=False)
         return list(hist)
 
-    @metric_value(engine=SqlAlchemyExecutionEngine)
-    def _sqlalchemy(
-        cls,
-        execution_engine: SqlAlchemyExecutionEngine,
-        metric_domain_kwargs: dict,
-        metric_value_kwargs: dict,
-        metrics: Dict[str, Any],
-        runtime_configuration: dict,
-    ):
-        """return a list of counts corresponding to bins
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, bins, **kwargs):
+        """return a list of aggregates counting values in each of bins
+
+        Aggregates are computed by the bundled query of the compute Domain (together with other aggregate metrics),
+        which yields the list of counts corresponding to bins.
 
         Args:
-            column: the name of the column for which to get the histogram
+            column: the column for which to get the histogram
             bins: tuple of bin edges for which to get histogram values; *must* be tuple to support caching
         """  # noqa: E501
-        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
-            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
-        )
-        column = accessor_domain_kwargs["column"]
-        bins = metric_value_kwargs["bins"]
-
         if isinstance(bins, np.ndarray):
             bins = bins.tolist()
         else:
@@ -101,31 +91,15 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         ):
             # Single-valued column data are modeled using "impulse" (or "sample") distributions (on open interval).  # noqa: E501
             case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        (
-                            sa.and_(
-                                float(bins[0] - np.finfo(float).eps) < sa.column(column),
-                                sa.column(column) < float(bins[0] + np.finfo(float).eps),
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("bin_0")
-            )
-            query = (
-                sa.select(*case_conditions)
-                .where(
-                    sa.column(column) != None,  # noqa: E711
+                _count_nonnull_values(
+                    column=column,
+                    condition=sa.and_(
+                        float(bins[0] - np.finfo(float).eps) < column,
+                        column < float(bins[0] + np.finfo(float).eps),
+                    ),
                 )
-                .select_from(selectable)
-            )
-
-            # Run the data through convert_to_json_serializable to ensure we do not have Decimal types  # noqa: E501
-            return convert_to_json_serializable(
-                list(execution_engine.execute_query(query).fetchone())
             )
+            return case_conditions
 
         idx = 0
 
@@ -137,9 +111,7 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
             == get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=True)
         ):
             case_conditions.append(
-                sa.func.sum(sa.case((sa.column(column) < bins[idx + 1], 1), else_=0)).label(
-                    f"bin_{idx!s}"
-                )
+                _count_nonnull_values(column=column, condition=column < bins[idx + 1])
             )
             idx += 1
 
@@ -151,18 +123,13 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
             negative_boundary = float(bins[idx])
             positive_boundary = float(bins[idx + 1])
             case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        (
-                            sa.and_(
-                                negative_boundary <= sa.column(column),
-                                sa.column(column) < positive_boundary,
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label(f"bin_{idx!s}")
+                _count_nonnull_values(
+                    column=column,
+                    condition=sa.and_(
+                        negative_boundary <= column,
+                        column < positive_boundary,
+                    ),
+                )
             )
 
         if (
@@ -174,38 +141,22 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         ):
             negative_boundary = float(bins[-2])
             case_conditions.append(
-                sa.func.sum(sa.case((negative_boundary <= sa.column(column), 1), else_=0)).label(
-                    f"bin_{len(bins) - 1!s}"
-                )
+                _count_nonnull_values(column=column, condition=negative_boundary <= column)
             )
         else:
             negative_boundary = float(bins[-2])
             positive_boundary = float(bins[-1])
             case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        (
-                            sa.and_(
-                                negative_boundary <= sa.column(column),
-                                sa.column(column) <= positive_boundary,
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label(f"bin_{len(bins) - 1!s}")
-            )
-
-        query = (
-            sa.select(*case_conditions)
-            .where(
-                sa.column(column) != None,  # noqa: E711
+                _count_nonnull_values(
+                    column=column,
+                    condition=sa.and_(
+                        negative_boundary <= column,
+                        column <= positive_boundary,
+                    ),
+                )
             )
-            .select_from(selectable)
-        )
 
-        # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
-        return convert_to_json_serializable(list(execution_engine.execute_query(query).fetchone()))
+        return case_conditions
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(  # noqa: C901
@@ -279,3 +230,17 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _count_nonnull_values(column, condition):
+    """Counts non-null values of "column" satisfying "condition" (null, if "column" has no non-null values).
+
+    Rows of null values are not filtered out (other aggregates of the bundled query need them); instead, they are
+    excluded from the sum, so that counts (including null counts of all-null columns) are as if they had been.
+    """  # noqa: E501
+    return sa.func.sum(
+        sa.case(
+            (condition, 1),
+            (column != None, 0),  # noqa: E711
+        )
+    )
@@ -8,12 +8,11 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_column_aggregates import PandasColumnAggregate
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
-from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 
 
 class ColumnMean(ColumnAggregateMetricProvider):
@@ -21,11 +20,10 @@ class ColumnMean(ColumnAggregateMetricProvider):
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    @column_aggregate_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, **kwargs):
         """Pandas Mean Implementation"""
-        convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
-        return column.mean()
+        return PandasColumnAggregate.MEAN
 
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, **kwargs):
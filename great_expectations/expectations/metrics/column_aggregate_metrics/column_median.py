@@ -13,16 +13,25 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_quantile_sketch import (
+    get_quantile_sketch_relative_error,
+)
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
-    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_sketch import (  # noqa: E501
+    get_quantile_sketch_metric_configuration,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import (
+    get_dbms_compatible_metric_domain_kwargs,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     import pandas as pd
 
+    from great_expectations.execution_engine.pandas_quantile_sketch import QuantileSketch
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
@@ -33,9 +42,32 @@ class ColumnMedian(ColumnAggregateMetricProvider):
 
     metric_name = "column.median"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
-        """Pandas Median Implementation"""
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        """Pandas Median Implementation
+
+        If "allow_relative_error" is True or a number between 0 and 1, median is estimated (with that rank error) from
+        the "column.quantile_sketch" metric.
+        """  # noqa: E501
+        quantile_sketch: Optional[QuantileSketch] = metrics.get("column.quantile_sketch")
+        if quantile_sketch is not None:
+            return quantile_sketch.get_quantiles([0.5])[0]
+
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column: pd.Series = df[accessor_domain_kwargs["column"]]
         column_null_elements_cond: pd.Series = column.isnull()
         column_nonnull_elements: pd.Series = column[~column_null_elements_cond]
         return column_nonnull_elements.median()
@@ -143,6 +175,16 @@ class ColumnMedian(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
+        if isinstance(execution_engine, PandasExecutionEngine) and (
+            get_quantile_sketch_relative_error(
+                metric.metric_value_kwargs.get("allow_relative_error")
+            )
+            is not None
+        ):
+            dependencies["column.quantile_sketch"] = get_quantile_sketch_metric_configuration(
+                metric=metric
+            )
+
         if isinstance(execution_engine, SqlAlchemyExecutionEngine):
             dependencies["column_values.nonnull.count"] = MetricConfiguration(
                 metric_name="column_values.nonnull.count",
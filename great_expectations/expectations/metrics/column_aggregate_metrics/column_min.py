@@ -7,10 +7,10 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_column_aggregates import PandasColumnAggregate
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
 
 
@@ -18,9 +18,9 @@ class ColumnMin(ColumnAggregateMetricProvider):
     metric_name = "column.min"
     value_keys = ()
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
-        return column.min()
+    @column_aggregate_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, **kwargs):
+        return PandasColumnAggregate.MIN
 
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, **kwargs):
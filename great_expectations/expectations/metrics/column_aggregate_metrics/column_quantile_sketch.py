@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.pandas_quantile_sketch import (
+    QuantileSketch,
+    get_quantile_sketch_relative_error,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_partial,
+)
+from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+class ColumnQuantileSketch(ColumnAggregateMetricProvider):
+    """Mergeable quantile sketch of numeric column values (underlies approximate "column.quantile_values" and "column.median" metrics for Pandas)."""  # noqa: E501
+
+    metric_name = "column.quantile_sketch"
+    value_keys = ("allow_relative_error",)
+
+    @column_aggregate_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, allow_relative_error, **kwargs):
+        relative_error = get_quantile_sketch_relative_error(allow_relative_error)
+        if relative_error is None:
+            raise ValueError(  # noqa: TRY003
+                f'Metric "{cls.metric_name}" requires allow_relative_error to be True or a number between 0 and 1.'  # noqa: E501
+            )
+
+        def build_sketch(column: pd.Series) -> QuantileSketch:
+            if column.dtype == object:
+                # Only object columns can hold "decimal.Decimal" values (found by visiting each).
+                column = convert_pandas_series_decimal_to_float_dtype(data=column)
+
+            try:
+                if not (pd.api.types.is_numeric_dtype(column) or column.dtype == object):
+                    raise TypeError(column.dtype)  # noqa: TRY301
+
+                values = column.to_numpy(dtype="float64", na_value=float("nan"))
+            except (TypeError, ValueError) as e:
+                raise TypeError(  # noqa: TRY003
+                    f"Approximate quantiles require numeric column values ({e}); set allow_relative_error to False to compute exact quantiles."  # noqa: E501
+                ) from e
+
+            sketch = QuantileSketch(relative_error=relative_error)
+            sketch.update(values)
+            return sketch
+
+        return build_sketch
+
+
+def get_quantile_sketch_metric_configuration(
+    metric: MetricConfiguration,
+) -> MetricConfiguration:
+    """Returns configuration of "column.quantile_sketch" metric, from which "metric" estimates quantiles."""  # noqa: E501
+    return MetricConfiguration(
+        metric_name=ColumnQuantileSketch.metric_name,
+        metric_domain_kwargs=metric.metric_domain_kwargs,
+        metric_value_kwargs={
+            "allow_relative_error": metric.metric_value_kwargs["allow_relative_error"]
+        },
+    )
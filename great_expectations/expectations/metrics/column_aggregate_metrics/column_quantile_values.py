@@ -3,9 +3,10 @@ from __future__ import annotations
 import ast
 import itertools
 import logging
+import sqlite3
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
@@ -13,42 +14,87 @@ from great_expectations.compatibility import sqlalchemy, trino
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_quantile_sketch import (
+    get_quantile_sketch_relative_error,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
-    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_sketch import (  # noqa: E501
+    get_quantile_sketch_metric_configuration,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.util import (
+    attempt_allowing_relative_error,
+    get_dbms_compatible_metric_domain_kwargs,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.pandas_quantile_sketch import QuantileSketch
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
+# Window functions (e.g., "ROW_NUMBER()") are available as of SQLite 3.25.
+SQLITE_WINDOW_FUNCTIONS_MIN_VERSION = (3, 25)
+
 
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
     value_keys = ("quantiles", "allow_relative_error")
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
-        """Quantile Function"""
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        """Quantile Function
+
+        If "allow_relative_error" is True or a number between 0 and 1, quantiles are estimated (with that rank error)
+        from the "column.quantile_sketch" metric; otherwise, it names the "interpolation" method of exact quantiles.
+        """  # noqa: E501
+        quantiles = metric_value_kwargs["quantiles"]
+        quantile_sketch: QuantileSketch | None = metrics.get("column.quantile_sketch")
+        if quantile_sketch is not None:
+            return quantile_sketch.get_quantiles(quantiles)
+
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
+        allow_relative_error = metric_value_kwargs.get("allow_relative_error")
         if not allow_relative_error:
             allow_relative_error = "nearest"
 
         if allow_relative_error not in interpolation_options:
             raise ValueError(  # noqa: TRY003
-                f"If specified for pandas, allow_relative_error must be one an allowed value for the 'interpolation'"  # noqa: E501
+                f"If specified for pandas, allow_relative_error must be True, a number between 0 and 1, or one an allowed value for the 'interpolation'"  # noqa: E501
                 f"parameter of .quantile() (one of {interpolation_options})"
             )
 
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = df[accessor_domain_kwargs["column"]]
         return column.quantile(quantiles, interpolation=allow_relative_error).tolist()
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -182,6 +228,34 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
 
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if isinstance(execution_engine, PandasExecutionEngine) and (
+            get_quantile_sketch_relative_error(
+                metric.metric_value_kwargs.get("allow_relative_error")
+            )
+            is not None
+        ):
+            dependencies["column.quantile_sketch"] = get_quantile_sketch_metric_configuration(
+                metric=metric
+            )
+
+        return dependencies
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
@@ -323,12 +397,44 @@ def _get_column_quantiles_sqlite(
     table_row_count,
 ) -> list:
     """
-    The present implementation is somewhat inefficient, because it requires as many calls to
-    "execution_engine.execute_query()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    Rows of the column are sorted once (and numbered by the "ROW_NUMBER()" window function), and the rows at offsets of
+    all "quantiles" are selected by a single query.  SQLite versions without window functions (before 3.25) do not
+    accept this query; for them, every quantile is selected by its own "ORDER BY ... OFFSET" query.
     """  # noqa: E501
-    offsets: list[int] = [quantile * table_row_count - 1 for quantile in quantiles]
+    # Offsets are truncated (and negative offsets are taken as zero), as "OFFSET" clauses of SQLite would treat them.
+    offsets: list[int] = [max(int(quantile * table_row_count - 1), 0) for quantile in quantiles]
+    if sqlite3.sqlite_version_info < SQLITE_WINDOW_FUNCTIONS_MIN_VERSION:
+        return _get_column_quantiles_sqlite_by_offset(
+            column=column,
+            offsets=offsets,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    numbered_rows: sqlalchemy.CTE = (
+        sa.select(
+            column.label("value"),
+            sa.func.row_number().over(order_by=column.asc()).label("row_number"),
+        )
+        .select_from(selectable)
+        .cte("numbered_rows")
+    )
+    quantiles_query: sqlalchemy.Select = sa.select(
+        numbered_rows.c.row_number, numbered_rows.c.value
+    ).where(numbered_rows.c.row_number.in_(sorted({offset + 1 for offset in offsets})))
+
+    values_by_row_number: dict[int, Any] = dict(
+        execution_engine.execute_query(quantiles_query).fetchall()
+    )
+    return [values_by_row_number.get(offset + 1) for offset in offsets]
+
+
+def _get_column_quantiles_sqlite_by_offset(
+    column,
+    offsets: list[int],
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> list:
     quantile_queries: list[sqlalchemy.Select] = [
         sa.select(column).order_by(column.asc()).offset(offset).limit(1).select_from(selectable)
         for offset in offsets
@@ -15,13 +15,12 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_column_aggregates import PandasColumnAggregate
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
-from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -37,11 +36,10 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
 
     metric_name = "column.standard_deviation"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    @column_aggregate_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, **kwargs):
         """Pandas Standard Deviation implementation"""
-        convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
-        return column.std()
+        return PandasColumnAggregate.STANDARD_DEVIATION
 
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, _dialect, _metrics, **kwargs):
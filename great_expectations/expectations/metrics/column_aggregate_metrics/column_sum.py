@@ -7,21 +7,19 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_column_aggregates import PandasColumnAggregate
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
-from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 
 
 class ColumnSum(ColumnAggregateMetricProvider):
     metric_name = "column.sum"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
-        convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
-        return column.sum()
+    @column_aggregate_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, **kwargs):
+        return PandasColumnAggregate.SUM
 
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, **kwargs):
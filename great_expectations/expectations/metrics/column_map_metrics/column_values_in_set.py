@@ -10,6 +10,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_value_set import series_isin_value_set
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
@@ -36,7 +37,7 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
             # Vacuously true
             return np.ones(len(column), dtype=np.bool_)
 
-        return column.isin(value_set)
+        return series_isin_value_set(column=column, value_set=value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, value_set, **kwargs):
@@ -51,6 +52,17 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
         if len(value_set) == 0:
             return False
 
+        column_type = None
+        if (
+            "_metrics" in kwargs
+            and "table.column_types" in kwargs["_metrics"]
+            and isinstance(kwargs["_metrics"]["table.column_types"], Sequence)
+        ):
+            for column_info in kwargs["_metrics"]["table.column_types"]:
+                if "name" in column_info and column_info["name"] == column.name:
+                    column_type = column_info.get("type")
+                    break
+
         # This "if" block is a workaround for:
         # https://github.com/googleapis/python-bigquery-sqlalchemy/issues/489#issuecomment-1253731826
         # `in_` doesn't work for boolean columns in bigquery so we unroll expressions like
@@ -60,18 +72,19 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
             and "_dialect" in kwargs
             and hasattr(kwargs["_dialect"], "__name__")
             and kwargs["_dialect"].__name__ == "sqlalchemy_bigquery"
-            and "_metrics" in kwargs
-            and "table.column_types" in kwargs["_metrics"]
-            and isinstance(kwargs["_metrics"]["table.column_types"], Sequence)
+            and isinstance(column_type, sa.Boolean)
         ):
-            for column_info in kwargs["_metrics"]["table.column_types"]:
-                if (
-                    "name" in column_info
-                    and column_info["name"] == column.name
-                    and "type" in column_info
-                    and isinstance(column_info["type"], sa.Boolean)
-                ):
-                    return sa.or_(*[column == value for value in value_set])
+            return sa.or_(*[column == value for value in value_set])
+
+        # Large value sets are tested by semi-join against a temporary table (shared by all conditions using them).  # noqa: E501
+        execution_engine = kwargs.get("_execution_engine")
+        if execution_engine is not None:
+            value_set_selectable = execution_engine.get_value_set_selectable(
+                value_set=value_set, column_type=column_type
+            )
+            if value_set_selectable is not None:
+                return column.in_(value_set_selectable)
+
         return column.in_(value_set)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import logging
 
-import pandas as pd
-
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_regex import series_matches_regex_list
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
@@ -29,19 +28,7 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, match_on, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        if match_on == "any":
-            result = regex_match_df.any(axis="columns")
-        elif match_on == "all":
-            result = regex_match_df.all(axis="columns")
-        else:
-            raise ValueError("match_on must be either 'any' or 'all'")  # noqa: TRY003
-
-        return result
+        return series_matches_regex_list(column=column, regex_list=regex_list, match_on=match_on)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex_list, match_on, _dialect, **kwargs):
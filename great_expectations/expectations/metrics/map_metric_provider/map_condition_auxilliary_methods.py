@@ -586,6 +586,14 @@ def _spark_map_condition_unexpected_count_aggregate_fn(
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
         "unexpected_condition"
     ]
+    # Column pair and multicolumn conditions are aggregated over the compute Domain, which retains rows that the
+    # "ignore_row_if" directive excludes; such rows are not counted.
+    ignore_condition = execution_engine.get_ignore_row_if_condition(
+        domain_kwargs=dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+    )
+    if ignore_condition is not None:
+        unexpected_condition = ~ignore_condition & unexpected_condition
+
     return (
         F.sum(F.when(unexpected_condition, 1).otherwise(0)),
         compute_domain_kwargs,
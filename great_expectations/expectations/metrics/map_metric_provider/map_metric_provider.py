@@ -424,35 +424,25 @@ class MapMetricProvider(MetricProvider):
                     )
                     if metric_fn_type == MetricPartialFunctionTypes.MAP_CONDITION_FN:
                         # Documentation in "MetricProvider._register_metric_functions()" explains registration protocol.  # noqa: E501
-                        if domain_type == MetricDomainTypes.COLUMN:
-                            register_metric(
-                                metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-                                metric_domain_keys=metric_domain_keys,
-                                metric_value_keys=metric_value_keys,
-                                execution_engine=engine,
-                                metric_class=cls,
-                                metric_provider=_spark_map_condition_unexpected_count_aggregate_fn,
-                                metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
-                            )
-                            register_metric(
-                                metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
-                                metric_domain_keys=metric_domain_keys,
-                                metric_value_keys=metric_value_keys,
-                                execution_engine=engine,
-                                metric_class=cls,
-                                metric_provider=None,
-                                metric_fn_type=MetricFunctionTypes.VALUE,
-                            )
-                        else:
-                            register_metric(
-                                metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
-                                metric_domain_keys=metric_domain_keys,
-                                metric_value_keys=metric_value_keys,
-                                execution_engine=engine,
-                                metric_class=cls,
-                                metric_provider=_spark_map_condition_unexpected_count_value,
-                                metric_fn_type=MetricFunctionTypes.VALUE,
-                            )
+                        # Unexpected counts of all Domain types are bundled into the aggregate query of their compute Domain.  # noqa: E501
+                        register_metric(
+                            metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                            metric_domain_keys=metric_domain_keys,
+                            metric_value_keys=metric_value_keys,
+                            execution_engine=engine,
+                            metric_class=cls,
+                            metric_provider=_spark_map_condition_unexpected_count_aggregate_fn,
+                            metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+                        )
+                        register_metric(
+                            metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+                            metric_domain_keys=metric_domain_keys,
+                            metric_value_keys=metric_value_keys,
+                            execution_engine=engine,
+                            metric_class=cls,
+                            metric_provider=None,
+                            metric_fn_type=MetricFunctionTypes.VALUE,
+                        )
                     elif metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN:
                         register_metric(
                             metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
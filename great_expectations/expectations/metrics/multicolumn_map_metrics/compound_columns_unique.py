@@ -7,6 +7,7 @@ from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypes,
     MetricPartialFunctionTypeSuffixes,
 )
 from great_expectations.execution_engine import (
@@ -184,7 +185,11 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
 
         return row_wise_cond
 
-    @multicolumn_condition_partial(engine=SparkDFExecutionEngine)
+    # Window functions cannot go into bundled aggregates; unexpected rows are counted separately.
+    @multicolumn_condition_partial(
+        engine=SparkDFExecutionEngine,
+        partial_fn_type=MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
+    )
     def _spark(cls, column_list, **kwargs):
         column_names = column_list.columns
         row_wise_cond = (
@@ -324,7 +324,7 @@ def get_metric_function_type(
 ) -> Optional[Union[MetricPartialFunctionTypes, MetricFunctionTypes]]:
     try:
         metric_definition = _registered_metrics[metric_name]
-        provider_fn, _provider_class = metric_definition["providers"][
+        _provider_class, provider_fn = metric_definition["providers"][
             type(execution_engine).__name__
         ]
         return getattr(provider_fn, "metric_fn_type", None)
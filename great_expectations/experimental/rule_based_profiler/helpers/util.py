@@ -96,6 +96,9 @@ RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
 
 NP_RANDOM_GENERATOR: Final = np.random.default_rng()
 
+# Bootstrap resamples are drawn and reduced in blocks holding at most this many values (bounds memory use).  # noqa: E501
+BOOTSTRAP_RESAMPLES_BLOCK_MAX_NUM_VALUES: Final = 2**20
+
 
 def get_validator(  # noqa: PLR0913
     purpose: str,
@@ -798,20 +801,23 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
         method=quantile_statistic_interpolation_method,
     )
 
-    bootstraps: np.ndarray
+    random_state: np.random.Generator
     if random_seed:
-        random_state: np.random.Generator = np.random.Generator(np.random.PCG64(random_seed))
-        bootstraps = random_state.choice(metric_values, size=(n_resamples, metric_values.size))
+        random_state = np.random.Generator(np.random.PCG64(random_seed))
     else:
-        bootstraps = NP_RANDOM_GENERATOR.choice(
-            metric_values, size=(n_resamples, metric_values.size)
-        )
+        random_state = NP_RANDOM_GENERATOR
+
+    bootstrap_quantiles: np.ndarray = _compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        quantile_pcts=[lower_quantile_pct, upper_quantile_pct],
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        random_state=random_state,
+    )
 
     lower_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
         _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=lower_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            bootstrap_quantiles=bootstrap_quantiles[0],
             quantile_bias_correction=quantile_bias_correction,
             quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
             sample_quantile=sample_lower_quantile,
@@ -819,9 +825,7 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     )
     upper_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
         _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=upper_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            bootstrap_quantiles=bootstrap_quantiles[1],
             quantile_bias_correction=quantile_bias_correction,
             quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
             sample_quantile=sample_upper_quantile,
@@ -884,20 +888,52 @@ def build_numeric_range_estimation_result(
     )
 
 
-def _determine_quantile_bias_corrected_point_estimate(  # noqa: PLR0913
-    bootstraps: np.ndarray,
-    quantile_pct: float,
+def _compute_bootstrap_quantiles(
+    metric_values: np.ndarray,
+    quantile_pcts: List[float],
+    n_resamples: int,
     quantile_statistic_interpolation_method: str,
+    random_state: np.random.Generator,
+) -> np.ndarray:
+    """
+    Computes "quantile_pcts" quantiles of each of "n_resamples" bootstrap resamples of "metric_values".
+
+    Resamples are drawn and reduced in blocks of at most "BOOTSTRAP_RESAMPLES_BLOCK_MAX_NUM_VALUES" values, rather than
+    materializing all of them at once; "random_state" yields the same stream of draws however they are partitioned, so
+    the result is identical to that of a single "(n_resamples, metric_values.size)" draw.
+
+    Returns:
+        "np.ndarray" of shape "(len(quantile_pcts), n_resamples)" (one row of resample quantiles per quantile).
+    """  # noqa: E501
+    block_num_resamples: int = max(
+        1, BOOTSTRAP_RESAMPLES_BLOCK_MAX_NUM_VALUES // max(1, metric_values.size)
+    )
+
+    blocks: List[np.ndarray] = []
+    block_start: int
+    for block_start in range(0, n_resamples, block_num_resamples):
+        bootstraps: np.ndarray = random_state.choice(
+            metric_values,
+            size=(min(block_num_resamples, n_resamples - block_start), metric_values.size),
+        )
+        blocks.append(
+            numpy.numpy_quantile(
+                bootstraps,
+                q=quantile_pcts,
+                axis=1,
+                method=quantile_statistic_interpolation_method,
+            )
+        )
+
+    return np.concatenate(blocks, axis=1)
+
+
+def _determine_quantile_bias_corrected_point_estimate(
+    bootstrap_quantiles: np.ndarray,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
     sample_quantile: np.ndarray,
 ) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy.numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
-        method=quantile_statistic_interpolation_method,
-    )
     bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
     bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
     bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
@@ -16,6 +16,7 @@ from great_expectations.experimental.rule_based_profiler.helpers.util import (
 )
 from great_expectations.experimental.rule_based_profiler.parameter_builder import (
     MetricSingleBatchParameterBuilder,
+    ParameterBuilder,
 )
 from great_expectations.experimental.rule_based_profiler.parameter_container import (
     DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
@@ -32,6 +33,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class HistogramSingleBatchParameterBuilder(MetricSingleBatchParameterBuilder):
@@ -112,6 +114,21 @@ class HistogramSingleBatchParameterBuilder(MetricSingleBatchParameterBuilder):
             data_context=data_context,
         )
 
+    @override
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        # "column.histogram" arguments depend on "column.partition" bins, so only the latter can be planned.  # noqa: E501
+        return ParameterBuilder.get_metric_configurations(
+            self,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
     @override
     def _build_parameters(
         self,
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import numpy as np
 
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.domain import Domain  # noqa: TCH001
 from great_expectations.experimental.rule_based_profiler.config import (
     ParameterBuilderConfig,  # noqa: TCH001
@@ -28,6 +29,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class MetricMultiBatchParameterBuilder(ParameterBuilder):
@@ -129,6 +131,42 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
     def reduce_scalar_metric(self) -> Union[str, bool]:
         return self._reduce_scalar_metric
 
+    @override
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        metric_configurations: List[MetricConfiguration] = super().get_metric_configurations(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not self.metric_name:
+            return metric_configurations
+
+        # Obtain single_batch_mode from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
+        single_batch_mode: bool = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.single_batch_mode,
+            expected_return_type=bool,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        metrics_to_resolve: List[MetricConfiguration]
+        *_, metrics_to_resolve = self._build_metric_configurations(
+            metric_name=self.metric_name,
+            metric_domain_kwargs=self.metric_domain_kwargs,
+            metric_value_kwargs=self.metric_value_kwargs,
+            limit=1 if single_batch_mode else None,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        return metric_configurations + metrics_to_resolve
+
     def _build_parameters(
         self,
         domain: Domain,
@@ -20,6 +20,7 @@ from typing import (
 import numpy as np
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.domain import Domain  # noqa: TCH001
 from great_expectations.experimental.rule_based_profiler.config import (
     ParameterBuilderConfig,  # noqa: TCH001
@@ -55,6 +56,7 @@ from great_expectations.experimental.rule_based_profiler.metric_computation_resu
 )
 from great_expectations.experimental.rule_based_profiler.parameter_builder import (
     MetricMultiBatchParameterBuilder,
+    ParameterBuilder,
 )
 from great_expectations.experimental.rule_based_profiler.parameter_container import (
     FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY,
@@ -75,6 +77,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 logger = logging.getLogger(__name__)
@@ -304,6 +307,28 @@ detected.
     def round_decimals(self) -> Optional[Union[str, int]]:
         return self._round_decimals
 
+    @override
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        if self.metric_multi_batch_parameter_builder_name:
+            # Metric values are computed by referenced "MetricMultiBatchParameterBuilder", not by this one.  # noqa: E501
+            return ParameterBuilder.get_metric_configurations(
+                self,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+
+        return super().get_metric_configurations(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
     def _build_parameters(
         self,
         domain: Domain,
@@ -68,6 +68,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.validator.metrics_calculator import MetricsCalculator
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,7 @@ class ParameterBuilder(ABC, Builder):
 
     exclude_field_names: ClassVar[Set[str]] = Builder.exclude_field_names | {
         "suite_parameter_builders",
+        "resolved_metrics",
     }
 
     def __init__(
@@ -125,6 +127,8 @@ class ParameterBuilder(ABC, Builder):
             data_context=self._data_context,
         )
 
+        self._resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
     def build_parameters(  # noqa: PLR0913
         self,
         domain: Domain,
@@ -282,6 +286,22 @@ class ParameterBuilder(ABC, Builder):
     ) -> Optional[List[ParameterBuilderConfig]]:
         return self._suite_parameter_builder_configs
 
+    @property
+    def resolved_metrics(self) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Metric values resolved ahead of time (keyed by ID of "MetricConfiguration" returned from
+        "get_metric_configurations()"), which "get_metrics()" uses instead of computing them again.
+        """
+        return self._resolved_metrics
+
+    @resolved_metrics.setter
+    def resolved_metrics(self, value: Dict[Tuple[str, str, str], MetricValue]) -> None:
+        self._resolved_metrics = value
+
+        suite_parameter_builder: ParameterBuilder
+        for suite_parameter_builder in self.suite_parameter_builders or []:
+            suite_parameter_builder.resolved_metrics = value
+
     @property
     def raw_fully_qualified_parameter_name(self) -> str:
         """
@@ -367,119 +387,66 @@ class ParameterBuilder(ABC, Builder):
 specified (empty "metric_name" value detected)."""  # noqa: E501
             )
 
-        batch_ids: Optional[List[str]] = self.get_batch_ids(
-            limit=limit,
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
-        if not batch_ids:
-            raise gx_exceptions.ProfilerExecutionError(
-                message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of Batch identifiers."  # noqa: E501
-            )
-
-        """
-        Compute metrics, corresponding to multiple "MetricConfiguration" directives, together, rather than individually.
-
-        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
-        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
-
-        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
-        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
-        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
-        """  # noqa: E501
-
-        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
-
-        domain_kwargs: dict = build_metric_domain_kwargs(
-            batch_id=None,
+        batch_ids: List[str]
+        domain_kwargs: dict
+        metrics_to_resolve: List[MetricConfiguration]
+        (
+            batch_ids,
+            domain_kwargs,
+            metric_value_kwargs,
+            metrics_to_resolve,
+        ) = self._build_metric_configurations(
+            metric_name=metric_name,
             metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            limit=limit,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        batch_id: str
+        # Step-4: Resolve all metrics in one operation simultaneously (except those resolved ahead of time).  # noqa: E501
 
-        metric_domain_kwargs = [
-            copy.deepcopy(
-                build_metric_domain_kwargs(
-                    batch_id=batch_id,
-                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
-                    domain=domain,
-                    variables=variables,
-                    parameters=parameters,
-                )
-            )
-            for batch_id in batch_ids
+        metric_configuration: MetricConfiguration
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+            metric_configuration.id: self._resolved_metrics[metric_configuration.id]
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id in self._resolved_metrics
+        }
+        unresolved_metrics: List[MetricConfiguration] = [
+            metric_configuration
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id not in resolved_metrics
         ]
 
-        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).  # noqa: E501
-
-        if not isinstance(metric_value_kwargs, list):
-            metric_value_kwargs = [metric_value_kwargs]
-
-        value_kwargs_cursor: dict
-        metric_value_kwargs = [
-            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
-            get_parameter_value_and_validate_return_type(
+        if unresolved_metrics:
+            # The Validator object used for metric calculation purposes.
+            validator: Validator = self.get_validator(
                 domain=domain,
-                parameter_reference=value_kwargs_cursor,
-                expected_return_type=None,
                 variables=variables,
                 parameters=parameters,
             )
-            for value_kwargs_cursor in metric_value_kwargs
-        ]
-
-        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.  # noqa: E501
 
-        domain_kwargs_cursor: dict
-        kwargs_combinations: List[List[dict]] = [
-            [domain_kwargs_cursor, value_kwargs_cursor]
-            for value_kwargs_cursor in metric_value_kwargs
-            for domain_kwargs_cursor in metric_domain_kwargs
-        ]
-
-        metrics_to_resolve: List[MetricConfiguration]
-
-        kwargs_pair_cursor: List[dict, dict]
-        metrics_to_resolve = [
-            MetricConfiguration(
-                metric_name=metric_name,
-                metric_domain_kwargs=kwargs_pair_cursor[0],
-                metric_value_kwargs=kwargs_pair_cursor[1],
+            metrics_calculator: MetricsCalculator = validator.metrics_calculator
+            graph: ValidationGraph = metrics_calculator.build_metric_dependency_graph(
+                metric_configurations=unresolved_metrics,
+                runtime_configuration=runtime_configuration,
             )
-            for kwargs_pair_cursor in kwargs_combinations
-        ]
 
-        # Step-4: Resolve all metrics in one operation simultaneously.
-
-        # The Validator object used for metric calculation purposes.
-        validator: Validator = self.get_validator(
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
-
-        graph: ValidationGraph = validator.metrics_calculator.build_metric_dependency_graph(
-            metric_configurations=metrics_to_resolve,
-            runtime_configuration=runtime_configuration,
-        )
-
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
-        aborted_metrics_info: Dict[
-            Tuple[str, str, str],
-            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ]
-        (
-            resolved_metrics,
-            _aborted_metrics_info,
-        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
-            graph=graph,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=0,
-        )
+            computed_metrics: Dict[Tuple[str, str, str], MetricValue]
+            _aborted_metrics_info: Dict[
+                Tuple[str, str, str],
+                Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+            ]
+            (
+                computed_metrics,
+                _aborted_metrics_info,
+            ) = metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+                graph=graph,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
+            )
+            resolved_metrics.update(computed_metrics)
 
         # Step-5: Map resolved metrics to their attributes for identification and recovery by receiver.  # noqa: E501
 
@@ -487,7 +454,6 @@ specified (empty "metric_name" value detected)."""  # noqa: E501
 
         resolved_metric_value: MetricValue
         attributed_resolved_metrics: AttributedResolvedMetrics
-        metric_configuration: MetricConfiguration
         for metric_configuration in metrics_to_resolve:
             attributed_resolved_metrics = attributed_resolved_metrics_map.get(
                 metric_configuration.metric_value_kwargs_id
@@ -568,6 +534,143 @@ specified (empty "metric_name" value detected)."""  # noqa: E501
             details=details,
         )
 
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" objects, which this "ParameterBuilder" object (and its "suite_parameter_builders")
+        will resolve for "domain", so that "Rule" can resolve those of all "Domain" objects together ahead of time.
+
+        This implementation plans only "suite_parameter_builders"; "ParameterBuilder" classes, whose metrics are known
+        before their "_build_parameters()" method executes, extend it.  Configurations, which depend on parameters not
+        yet computed, cannot be planned (an exception is raised); these are resolved by "get_metrics()" as usual.
+        """  # noqa: E501
+        metric_configurations: List[MetricConfiguration] = []
+
+        suite_parameter_builder: ParameterBuilder
+        for suite_parameter_builder in self.suite_parameter_builders or []:
+            suite_parameter_builder.set_batch_list_if_null_batch_request(
+                batch_list=self.batch_list,
+                batch_request=self.batch_request,
+            )
+            metric_configurations.extend(
+                suite_parameter_builder.get_metric_configurations(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+
+        return metric_configurations
+
+    def _build_metric_configurations(  # noqa: PLR0913
+        self,
+        metric_name: str,
+        metric_domain_kwargs: Optional[Union[Union[str, dict], List[Union[str, dict]]]] = None,
+        metric_value_kwargs: Optional[Union[Union[str, dict], List[Union[str, dict]]]] = None,
+        limit: Optional[int] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[List[str], dict, List[dict], List[MetricConfiguration]]:
+        """
+        Builds "MetricConfiguration" directives for all combinations of Batch identifiers and "metric_value_kwargs".
+
+        Returns:
+            Tuple of Batch identifiers, resolved "metric_domain_kwargs" (without "batch_id"), resolved list of
+            "metric_value_kwargs", and "MetricConfiguration" objects for all of their combinations.
+        """  # noqa: E501
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
+            limit=limit,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not batch_ids:
+            raise gx_exceptions.ProfilerExecutionError(
+                message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of Batch identifiers."  # noqa: E501
+            )
+
+        """
+        Metrics, corresponding to multiple "MetricConfiguration" directives, are computed together, rather than individually.
+
+        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
+        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
+
+        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
+        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
+        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
+        """  # noqa: E501
+
+        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+
+        domain_kwargs: dict = build_metric_domain_kwargs(
+            batch_id=None,
+            metric_domain_kwargs=metric_domain_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_id: str
+
+        metric_domain_kwargs = [
+            copy.deepcopy(
+                build_metric_domain_kwargs(
+                    batch_id=batch_id,
+                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+            for batch_id in batch_ids
+        ]
+
+        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).  # noqa: E501
+
+        if not isinstance(metric_value_kwargs, list):
+            metric_value_kwargs = [metric_value_kwargs]
+
+        value_kwargs_cursor: dict
+        metric_value_kwargs = [
+            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
+            get_parameter_value_and_validate_return_type(
+                domain=domain,
+                parameter_reference=value_kwargs_cursor,
+                expected_return_type=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            for value_kwargs_cursor in metric_value_kwargs
+        ]
+
+        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.  # noqa: E501
+
+        domain_kwargs_cursor: dict
+        kwargs_combinations: List[List[dict]] = [
+            [domain_kwargs_cursor, value_kwargs_cursor]
+            for value_kwargs_cursor in metric_value_kwargs
+            for domain_kwargs_cursor in metric_domain_kwargs
+        ]
+
+        metrics_to_resolve: List[MetricConfiguration]
+
+        kwargs_pair_cursor: List[dict, dict]
+        metrics_to_resolve = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=kwargs_pair_cursor[0],
+                metric_value_kwargs=kwargs_pair_cursor[1],
+            )
+            for kwargs_pair_cursor in kwargs_combinations
+        ]
+
+        return batch_ids, domain_kwargs, metric_value_kwargs, metrics_to_resolve
+
     @staticmethod
     def _sanitize_metric_computation(  # noqa: PLR0913
         parameter_builder: ParameterBuilder,
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import copy
 import json
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.util import (
@@ -45,6 +46,11 @@ if TYPE_CHECKING:
     from great_expectations.experimental.rule_based_profiler.parameter_builder import (
         ParameterBuilder,
     )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+    from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
 
 
 class Rule(SerializableDictDot):
@@ -141,47 +147,63 @@ class Rule(SerializableDictDot):
 
         rule_state.reset_parameter_containers()
 
-        pbar_method: Callable = determine_progress_bar_method_by_environment()
-
-        domain: Domain
-        for domain in pbar_method(
-            domains,
-            desc="Profiling Dataset:",
-            position=1,
-            leave=False,
-            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
-        ):
-            rule_state.initialize_parameter_container_for_domain(domain=domain)
-
-            parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
-            parameter_builder: ParameterBuilder
-            for parameter_builder in parameter_builders:
-                parameter_builder.build_parameters(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    parameter_computation_impl=None,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                )
+        parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
 
-            expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
-                self.expectation_configuration_builders or []
-            )
+        # Metrics, requested by all "ParameterBuilder" objects for all "Domain" objects, are resolved together.  # noqa: E501
+        self._resolve_planned_metrics(
+            domains=domains,
+            variables=variables,
+            parameters=rule_state.parameters,
+            batch_list=batch_list,
+            batch_request=batch_request,
+            runtime_configuration=runtime_configuration,
+        )
 
-            expectation_configuration_builder: ExpectationConfigurationBuilder
+        pbar_method: Callable = determine_progress_bar_method_by_environment()
 
-            for expectation_configuration_builder in expectation_configuration_builders:
-                expectation_configuration_builder.resolve_validation_dependencies(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
+        try:
+            domain: Domain
+            for domain in pbar_method(
+                domains,
+                desc="Profiling Dataset:",
+                position=1,
+                leave=False,
+                bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+            ):
+                rule_state.initialize_parameter_container_for_domain(domain=domain)
+
+                parameter_builder: ParameterBuilder
+                for parameter_builder in parameter_builders:
+                    parameter_builder.build_parameters(
+                        domain=domain,
+                        variables=variables,
+                        parameters=rule_state.parameters,
+                        parameter_computation_impl=None,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                        runtime_configuration=runtime_configuration,
+                    )
+
+                expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
+                    self.expectation_configuration_builders or []
                 )
 
+                expectation_configuration_builder: ExpectationConfigurationBuilder
+
+                for expectation_configuration_builder in expectation_configuration_builders:
+                    expectation_configuration_builder.resolve_validation_dependencies(
+                        domain=domain,
+                        variables=variables,
+                        parameters=rule_state.parameters,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                        runtime_configuration=runtime_configuration,
+                    )
+        finally:
+            # Planned metric values must not outlive this run (data of Batch objects may change).
+            for parameter_builder in parameter_builders:
+                parameter_builder.resolved_metrics = {}
+
         return rule_state
 
     @property
@@ -317,6 +339,89 @@ class Rule(SerializableDictDot):
             for expectation_configuration_builder in expectation_configuration_builders
         }
 
+    def _resolve_planned_metrics(  # noqa: C901, PLR0913
+        self,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer],
+        parameters: Dict[str, ParameterContainer],
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """
+        Collects "MetricConfiguration" objects, requested by "ParameterBuilder" objects across all "Domain" objects and
+        Batches, and resolves them in one "ValidationGraph" (so that execution engines can bundle their computation);
+        resolved values are handed to "ParameterBuilder" objects, which then compute only metrics not planned here.
+        """  # noqa: E501
+        parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+        if not (domains and parameter_builders):
+            return
+
+        planned_metrics: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+
+        parameter_builder: ParameterBuilder
+        domain: Domain
+        metric_configuration: MetricConfiguration
+        for parameter_builder in parameter_builders:
+            parameter_builder.set_batch_list_if_null_batch_request(
+                batch_list=batch_list,
+                batch_request=batch_request,
+            )
+            for domain in domains:
+                try:
+                    for metric_configuration in parameter_builder.get_metric_configurations(
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                    ):
+                        planned_metrics.setdefault(metric_configuration.id, metric_configuration)
+                except Exception as e:
+                    # Metrics depending on parameters that are not yet computed are resolved later, when needed.  # noqa: E501
+                    logger.debug(
+                        f'Unable to plan metrics of "{parameter_builder.name}" for Domain "{domain.id}": {e!r}'  # noqa: E501
+                    )
+
+        if not planned_metrics:
+            return
+
+        try:
+            validator: Optional[Validator] = parameter_builders[0].get_validator(
+                variables=variables,
+            )
+            if validator is None:
+                return
+
+            # Metric IDs change once "ValidationGraph" sets default "metric_value_kwargs"; planned IDs are retained.  # noqa: E501
+            loaded_batch_ids: List[str] = validator.loaded_batch_ids
+            planned_metrics = {
+                metric_id: metric_configuration
+                for metric_id, metric_configuration in planned_metrics.items()
+                if metric_configuration.metric_domain_kwargs.get("batch_id") in loaded_batch_ids
+            }
+            resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+            resolved_metrics, _ = validator.metrics_calculator.compute_metrics(
+                metric_configurations=list(planned_metrics.values()),
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
+            )
+        except Exception as e:
+            logger.warning(
+                f'Unable to resolve metrics planned for Rule "{self.name}"; computing them for each Domain separately: {e!r}'  # noqa: E501
+            )
+            return
+
+        resolved_planned_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+            metric_id: resolved_metrics[metric_configuration.id]
+            for metric_id, metric_configuration in planned_metrics.items()
+            if metric_configuration.id in resolved_metrics
+        }
+        logger.debug(
+            f'Rule "{self.name}" resolved {len(resolved_planned_metrics)} planned metrics for {len(domains)} Domains together.'  # noqa: E501
+        )
+
+        for parameter_builder in parameter_builders:
+            parameter_builder.resolved_metrics = resolved_planned_metrics
+
     # noinspection PyUnusedLocal
     @measure_execution_time(
         execution_time_holder_object_reference_name="rule_state",
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import pathlib
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.util import nested_update
@@ -24,6 +28,7 @@ from great_expectations.data_context.types.resource_identifiers import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.render.util import resource_key_passes_run_name_filter
+from great_expectations.util import convert_to_json_serializable
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,9 @@ FALSEY_YAML_STRINGS = [
     "NONE",
 ]
 
+# Version of the layout of render manifests (see "SiteBuilder"); other versions are ignored.
+RENDER_MANIFEST_VERSION = 1
+
 
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
@@ -112,7 +120,26 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
-    """
+
+    Large sites can be built incrementally and rendered in parallel::
+
+        local_site:
+            class_name: SiteBuilder
+            incremental_build: true
+            render_concurrency: 8
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
+
+    With "incremental_build", the site keeps a render manifest ("render_manifest.json" in the site root), which records
+    the content hash of every rendered expectation suite and validation result (and what the index page shows of it).
+    A build then renders only resources that are new or changed since they were last rendered (pages of renderers,
+    views, custom styles and views, or versions of Great Expectations other than those recorded are re-rendered), and
+    the index page is built from the manifest instead of re-reading every validation result.  "clean_site" removes the
+    manifest with the pages, so that the next build renders everything again.
+
+    With "render_concurrency" greater than 1, pages of every section are rendered by that many threads.
+    """  # noqa: E501
 
     def __init__(  # noqa: C901, PLR0912, PLR0913
         self,
@@ -126,12 +153,16 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        incremental_build: bool = False,
+        render_concurrency: Optional[int] = None,
         **kwargs,
     ) -> None:
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental_build = incremental_build
+        self.render_concurrency = render_concurrency
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -230,6 +261,7 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "render_concurrency": self.render_concurrency,
                 },
                 config_defaults={
                     "name": site_section_name,
@@ -299,9 +331,21 @@ class SiteBuilder:
         :return:
         """
 
+        # GX Cloud supports JSON Site Data Docs (without render manifest)
+        render_manifest: Optional[dict] = None
+        if self.incremental_build and not self.cloud_mode:
+            render_manifest = self.target_store.get_render_manifest()
+            if render_manifest.get("version") != RENDER_MANIFEST_VERSION:
+                render_manifest = {"version": RENDER_MANIFEST_VERSION, "sections": {}}
+
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
-            site_section_builder.build(resource_identifiers=resource_identifiers)
+            if render_manifest is None:
+                site_section_builder.build(resource_identifiers=resource_identifiers)
+            else:
+                site_section_builder.build(
+                    resource_identifiers=resource_identifiers, render_manifest=render_manifest
+                )
 
         # GX Cloud supports JSON Site Data Docs
         # Skip static assets, indexing
@@ -310,7 +354,14 @@ class SiteBuilder:
 
         self.target_store.copy_static_assets()
 
-        _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        if render_manifest is None:
+            _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        else:
+            _, index_links_dict = self.site_index_builder.build(
+                build_index=build_index, render_manifest=render_manifest
+            )
+            self.target_store.set_render_manifest(render_manifest)
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -351,6 +402,7 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        render_concurrency=None,
         **kwargs,
     ) -> None:
         self.name = name
@@ -361,6 +413,9 @@ class DefaultSiteSectionBuilder:
         self.validation_results_limit = validation_results_limit
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
+        self.render_concurrency = render_concurrency
+        self.custom_styles_directory = custom_styles_directory
+        self.custom_views_directory = custom_views_directory
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -369,6 +424,7 @@ class DefaultSiteSectionBuilder:
             raise exceptions.InvalidConfigError(  # noqa: TRY003
                 "SiteSectionBuilder requires a renderer configuration " "with a class_name key."
             )
+        self.renderer_config = renderer
         module_name = renderer.get("module_name") or "great_expectations.render.renderer"
         self.renderer_class = instantiate_class_from_config(
             config=renderer,
@@ -388,6 +444,7 @@ class DefaultSiteSectionBuilder:
                 "module_name": module_name,
                 "class_name": "DefaultJinjaPageView",
             }
+        self.view_config = view
         module_name = view.get("module_name") or module_name
         self.view_class = instantiate_class_from_config(
             config=view,
@@ -404,13 +461,21 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: C901, PLR0912
+    def build(
+        self, resource_identifiers=None, render_manifest: Optional[dict] = None
+    ) -> None:
+        """
+        :param resource_identifiers: if specified, pages are built only for the resources in this list
+        :param render_manifest: render manifest of the site (see "SiteBuilder"); if specified, pages are built only for
+        resources that are new or changed since they were last rendered, and the manifest is updated in place
+        """  # noqa: E501
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -423,68 +488,192 @@ class DefaultSiteSectionBuilder:
             if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
                 if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+
+            resource_keys.append(resource_key)
+
+        section_manifest: Optional[dict] = None
+        if render_manifest is not None:
+            section_manifest = self._get_section_render_manifest(
+                render_manifest=render_manifest, source_store_keys=source_store_keys
+            )
+
+        if self.render_concurrency and self.render_concurrency > 1 and len(resource_keys) > 1:
+            # Rendering is mostly Python code (serialized by the GIL); threads overlap it with
+            # reading resources from the source store and writing pages to the target store.
+            with ThreadPoolExecutor(
+                max_workers=min(self.render_concurrency, len(resource_keys)),
+                thread_name_prefix="gx-data-docs-render",
+            ) as executor:
+                for _ in executor.map(
+                    lambda resource_key: self._build_resource(
+                        resource_key=resource_key, section_manifest=section_manifest
+                    ),
+                    resource_keys,
+                ):
+                    pass
+        else:
+            for resource_key in resource_keys:
+                self._build_resource(resource_key=resource_key, section_manifest=section_manifest)
+
+    def _get_section_render_manifest(self, render_manifest: dict, source_store_keys: list) -> dict:
+        """Returns (creating or resetting, as needed) the part of "render_manifest" that belongs to this section.
+
+        Entries of resources no longer in the source store, or whose pages are no longer in the site, are dropped; all
+        entries are dropped, if pages of the section would now be rendered differently (e.g., by another renderer).
+        """  # noqa: E501
+        sections: dict = render_manifest.setdefault("sections", {})
+        fingerprint: str = self._get_render_fingerprint()
+        section_manifest: Optional[dict] = sections.get(self.name)
+        if not section_manifest or section_manifest.get("fingerprint") != fingerprint:
+            section_manifest = {"fingerprint": fingerprint, "resources": {}}
+            sections[self.name] = section_manifest
+
+        rendered_keys = set()
+        for key_class in {type(resource_key) for resource_key in source_store_keys}:
+            if key_class in self.target_store.store_backends:
+                rendered_keys.update(
+                    _render_manifest_key(key_tuple)
+                    for key_tuple in self.target_store.store_backends[key_class].list_keys()
                 )
+
+        source_keys = {
+            _render_manifest_key(resource_key.to_tuple()) for resource_key in source_store_keys
+        }
+        section_manifest["resources"] = {
+            manifest_key: entry
+            for manifest_key, entry in section_manifest.get("resources", {}).items()
+            if manifest_key in source_keys and manifest_key in rendered_keys
+        }
+        return section_manifest
+
+    def _get_render_fingerprint(self) -> str:
+        """Returns hash of everything, other than the resource itself, that determines how its page is rendered."""  # noqa: E501
+        fingerprint = hashlib.sha256()
+        for value in (
+            ge_version,
+            _get_qualified_class_name(self.renderer_class),
+            _get_qualified_class_name(self.view_class),
+            # Renderers and views are configured by their kwargs (e.g., "column_section_renderer").
+            json.dumps(self.renderer_config, sort_keys=True, default=str),
+            json.dumps(self.view_config, sort_keys=True, default=str),
+            str(self.data_context_id),
+            str(self.show_how_to_buttons),
+        ):
+            fingerprint.update(f"{value}\0".encode())
+
+        for directory in (self.custom_styles_directory, self.custom_views_directory):
+            if not directory:
                 continue
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.name
-                logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = resource_key.expectation_suite_identifier.name
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+            for root, _, files in sorted(os.walk(directory)):
+                for file_ in sorted(files):
+                    file_path = os.path.join(root, file_)  # noqa: PTH118
+                    fingerprint.update(
+                        f"{file_path}:{os.path.getmtime(file_path)}\0".encode()  # noqa: PTH204
                     )
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
+        return fingerprint.hexdigest()
 
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
+    def _build_resource(  # noqa: C901, PLR0912
+        self, resource_key, section_manifest: Optional[dict] = None
+    ) -> None:
+        content_hash: Optional[str] = None
+        try:
+            if section_manifest is None:
+                resource = self.source_store.get(resource_key)
+            else:
+                serialized_resource = self.source_store.store_backend.get(
+                    self.source_store.key_to_tuple(resource_key)
+                )
+                content_hash = _get_content_hash(serialized_resource)
+                entry: Optional[dict] = section_manifest["resources"].get(
+                    _render_manifest_key(resource_key.to_tuple())
+                )
+                if entry and entry.get("content_hash") == content_hash:
+                    logger.debug(f"        Skipping unchanged resource {resource_key!s}")
+                    return
+
+                resource = (
+                    self.source_store.deserialize(serialized_resource)
+                    if serialized_resource
+                    else None
+                )
+
+            if isinstance(resource_key, ExpectationSuiteIdentifier):
+                resource = ExpectationSuite(**resource)
+        except exceptions.InvalidKeyError:
+            logger.warning(f"Object with Key: {resource_key!s} could not be retrieved. Skipping...")
+            return
+
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.name
+            logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = resource_key.expectation_suite_identifier.name
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                )
+
+        try:
+            rendered_content = self.renderer_class.render(resource)
+
+            if self.cloud_mode:
+                self.target_store.set(
+                    GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+            else:
+                viewable_content = self.view_class.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+                # Verify type
+                self.target_store.set(
+                    SiteSectionIdentifier(
+                        site_section_name=self.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
+
+            if section_manifest is not None:
+                section_manifest["resources"][_render_manifest_key(resource_key.to_tuple())] = (
+                    self._get_render_manifest_entry(resource=resource, content_hash=content_hash)
+                )
+        except Exception as e:
+            exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
-                """  # noqa: E501
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400
+            """  # noqa: E501
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)  # noqa: TRY400
+
+    def _get_render_manifest_entry(self, resource, content_hash: Optional[str]) -> dict:
+        """Returns render manifest entry of a rendered resource (with what the index page shows of it)."""  # noqa: E501
+        entry: Dict[str, Any] = {"content_hash": content_hash}
+        if not isinstance(resource, ExpectationSuite):
+            entry["validation_success"] = resource.success
+            entry["batch_kwargs"] = convert_to_json_serializable(
+                resource.meta.get("batch_kwargs", {})
+            )
+            entry["batch_spec"] = convert_to_json_serializable(resource.meta.get("batch_spec", {}))
+
+        return entry
 
 
 class DefaultSiteIndexBuilder:
@@ -702,12 +891,17 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        render_manifest: Optional[dict] = None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param render_manifest: render manifest of the site (see "SiteBuilder"); if specified, validation results
+        recorded in it are not read again from their store
         :return: tuple(index_page_url, index_links_dict)
         """  # noqa: E501
 
@@ -728,10 +922,10 @@ class DefaultSiteIndexBuilder:
             self._build_validation_and_profiling_result_site_keys(skip_and_clean_missing)
         )
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, render_manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, render_manifest
         )
 
         viewable_content = ""
@@ -829,10 +1023,40 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
         return validation_and_profiling_result_site_keys
 
+    def _get_validation_result_index_info(
+        self,
+        validation_result_key: ValidationResultIdentifier,
+        section_name: str,
+        render_manifest: Optional[dict] = None,
+    ) -> Tuple[Optional[bool], dict, dict]:
+        """Returns success, batch_kwargs, and batch_spec of a validation result (from "render_manifest", if recorded)."""  # noqa: E501
+        if render_manifest is not None:
+            entry: Optional[dict] = (
+                render_manifest.get("sections", {})
+                .get(section_name, {})
+                .get("resources", {})
+                .get(_render_manifest_key(validation_result_key.to_tuple()))
+            )
+            if entry and "batch_kwargs" in entry:
+                return entry["validation_success"], entry["batch_kwargs"], entry["batch_spec"]
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
+            run_id=validation_result_key.run_id,
+            validation_results_store_name=self.source_stores.get(section_name),
+        )
+        return (
+            validation.success,
+            validation.meta.get("batch_kwargs", {}),
+            validation.meta.get("batch_spec", {}),
+        )
+
     def _add_profiling_to_index_links(
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        render_manifest: Optional[dict] = None,
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -848,16 +1072,12 @@ diagnose and repair the underlying issue.  Detailed information follows:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("profiling"),
+                    _, batch_kwargs, batch_spec = self._get_validation_result_index_info(
+                        validation_result_key=profiling_result_key,
+                        section_name="profiling",
+                        render_manifest=render_manifest,
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
@@ -879,6 +1099,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        render_manifest: Optional[dict] = None,
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -903,17 +1124,16 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("validations"),
+                    (
+                        validation_success,
+                        batch_kwargs,
+                        batch_spec,
+                    ) = self._get_validation_result_index_info(
+                        validation_result_key=validation_result_key,
+                        section_name="validations",
+                        render_manifest=render_manifest,
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
@@ -937,3 +1157,25 @@ class CallToActionButton:
     def __init__(self, title, link) -> None:
         self.title = title
         self.link = link
+
+
+def _render_manifest_key(key_tuple: Tuple[str, ...]) -> str:
+    return "/".join(str(element) for element in key_tuple)
+
+
+def _get_qualified_class_name(obj: Any) -> str:
+    return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
+
+def _get_content_hash(serialized_resource: Any) -> str:
+    """Returns hash of resource, as serialized by its store (e.g., JSON string of validation result)."""
+    if isinstance(serialized_resource, bytes):
+        content = serialized_resource
+    elif isinstance(serialized_resource, str):
+        content = serialized_resource.encode("utf-8")
+    else:
+        content = json.dumps(
+            convert_to_json_serializable(serialized_resource), sort_keys=True
+        ).encode("utf-8")
+
+    return hashlib.sha256(content).hexdigest()
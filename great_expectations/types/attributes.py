@@ -15,6 +15,10 @@ class Attributes(SerializableDotDict, IDDict):
     This class generalizes dictionary in order to hold generic attributes with unique ID.
     """
 
+    # Dot-notation assignment must go through "IDDict" so that the cached ID is invalidated.
+    __setattr__ = IDDict.__setitem__  # type: ignore[assignment]
+    __delattr__ = IDDict.__delitem__  # type: ignore[assignment]
+
     def to_dict(self) -> dict:
         return dict(self)
 
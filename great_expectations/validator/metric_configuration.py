@@ -50,6 +50,8 @@ class MetricConfiguration:
 
         self._metric_dependencies: IDDict = IDDict({})
 
+        self._id: Optional[Tuple[str, str, str]] = None
+
     def __repr__(self):
         return json.dumps(self.to_json_dict(), indent=2)
 
@@ -151,11 +153,21 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
-        return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
-        )
+        # Component IDs are cached (and interned) by "IDDict"; tuple is rebuilt only if they change.
+        metric_domain_kwargs_id: str = self.metric_domain_kwargs_id
+        metric_value_kwargs_id: str = self.metric_value_kwargs_id
+        if (
+            self._id is None
+            or self._id[1] is not metric_domain_kwargs_id
+            or self._id[2] is not metric_value_kwargs_id
+        ):
+            self._id = (
+                self.metric_name,
+                metric_domain_kwargs_id,
+                metric_value_kwargs_id,
+            )
+
+        return self._id
 
     def to_json_dict(self) -> dict:
         """Returns a JSON-serializable dict representation of this MetricConfiguration.
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import traceback
+from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -17,6 +19,9 @@ from tqdm.auto import tqdm
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.execution_engine.persistent_metric_cache import (
+    is_persistable_metric_name,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -24,6 +29,7 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 if TYPE_CHECKING:
     from great_expectations.core import IDDict
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.expectations.expectation import Expectation
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
@@ -74,6 +80,143 @@ class MetricEdge:
         return f"<{self._left.__repr__()}|{self._right.__repr__()}>"
 
 
+class _MetricResolutionScheduler:
+    """Incremental topological scheduler over "MetricEdge" objects of "ValidationGraph".
+
+    Each unresolved "MetricConfiguration" keeps a count of its unresolved dependencies, and each dependency keeps a
+    list of its dependents (reverse adjacency).  Marking metrics as resolved only visits edges incident to them, so
+    updating the set of ready metrics no longer requires rescanning every edge of the graph.
+
+    Partial function metrics (which are never persisted), whose dependents have all been resolved in advance (e.g.,
+    obtained from persistent metric cache), are not scheduled, since nothing remains that needs their values.
+    """  # noqa: E501
+
+    def __init__(  # noqa: C901
+        self,
+        edges: Iterable[MetricEdge],
+        resolved_metric_ids: Iterable[_MetricKey] = (),
+    ) -> None:
+        resolved: Set[_MetricKey] = set(resolved_metric_ids)
+        has_dependents: Set[_MetricKey] = set()
+
+        self._pending: Dict[_MetricKey, MetricConfiguration] = {}
+        self._dependents: Dict[_MetricKey, List[_MetricKey]] = defaultdict(list)
+        self._num_unmet_dependencies: Dict[_MetricKey, int] = {}
+
+        dependency_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+
+        edge: MetricEdge
+        for edge in edges:
+            left_id: _MetricKey = edge.left.id
+            if edge.right is not None:
+                has_dependents.add(edge.right.id)
+
+            if left_id in resolved:
+                continue
+
+            if left_id not in self._pending:
+                self._pending[left_id] = edge.left
+                dependency_ids[left_id] = set()
+
+            if edge.right is None:
+                continue
+
+            right_id: _MetricKey = edge.right.id
+            if right_id not in resolved and right_id not in dependency_ids[left_id]:
+                dependency_ids[left_id].add(right_id)
+                self._dependents[right_id].append(left_id)
+
+        if resolved:
+            self._skip_unneeded_partial_metrics(
+                has_dependents=has_dependents, dependency_ids=dependency_ids
+            )
+
+        self._ready: Dict[_MetricKey, MetricConfiguration] = {}
+
+        metric_id: _MetricKey
+        for metric_id, metric_configuration in self._pending.items():
+            self._num_unmet_dependencies[metric_id] = len(dependency_ids[metric_id])
+            if self._num_unmet_dependencies[metric_id] == 0:
+                self._ready[metric_id] = metric_configuration
+
+    def _skip_unneeded_partial_metrics(
+        self,
+        has_dependents: Set[_MetricKey],
+        dependency_ids: Dict[_MetricKey, Set[_MetricKey]],
+    ) -> None:
+        metric_id: _MetricKey
+        unneeded_metric_ids: List[_MetricKey] = [
+            metric_id
+            for metric_id in self._pending
+            if self._is_unneeded_partial_metric(metric_id=metric_id, has_dependents=has_dependents)
+        ]
+        while unneeded_metric_ids:
+            metric_id = unneeded_metric_ids.pop()
+            self._pending.pop(metric_id)
+            self._dependents.pop(metric_id, None)
+            dependency_id: _MetricKey
+            for dependency_id in dependency_ids.pop(metric_id):
+                self._dependents[dependency_id].remove(metric_id)
+                if self._is_unneeded_partial_metric(
+                    metric_id=dependency_id, has_dependents=has_dependents
+                ):
+                    unneeded_metric_ids.append(dependency_id)
+
+    def _is_unneeded_partial_metric(
+        self, metric_id: _MetricKey, has_dependents: Set[_MetricKey]
+    ) -> bool:
+        return (
+            metric_id in self._pending
+            and metric_id in has_dependents
+            and not self._dependents.get(metric_id)
+            and not is_persistable_metric_name(metric_name=self._pending[metric_id].metric_name)
+        )
+
+    @property
+    def ready_metrics(self) -> List[MetricConfiguration]:
+        """Unresolved "MetricConfiguration" objects, whose dependencies have all been resolved."""
+        return list(self._ready.values())
+
+    @property
+    def num_needed_metrics(self) -> int:
+        """Number of unresolved "MetricConfiguration" objects that still have unresolved dependencies."""  # noqa: E501
+        return len(self._pending) - len(self._ready)
+
+    def mark_resolved(self, metric_ids: Iterable[_MetricKey]) -> None:
+        """Removes resolved metrics from the schedule and promotes dependents whose last dependency was resolved."""  # noqa: E501
+        metric_ids = set(metric_ids)
+        # Resolution may update "MetricConfiguration" in place (e.g., its column name), changing its ID.
+        metric_ids.update(
+            [
+                scheduled_metric_id
+                for scheduled_metric_id, metric_configuration in self._ready.items()
+                if metric_configuration.id in metric_ids
+            ]
+        )
+
+        metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for metric_id in metric_ids:
+            if self._pending.pop(metric_id, None) is None:
+                continue
+
+            self._ready.pop(metric_id, None)
+            for dependent_id in self._dependents.pop(metric_id, []):
+                self._num_unmet_dependencies[dependent_id] -= 1
+                if self._num_unmet_dependencies[dependent_id] == 0:
+                    self._ready[dependent_id] = self._pending[dependent_id]
+
+    def waves(self) -> List[List[MetricConfiguration]]:
+        """Consumes the schedule, assuming every metric resolves, and returns successive sets of ready metrics."""  # noqa: E501
+        waves: List[List[MetricConfiguration]] = []
+        while self._ready:
+            wave: List[MetricConfiguration] = self.ready_metrics
+            waves.append(wave)
+            self.mark_resolved(metric_id for metric_id in list(self._ready))
+
+        return waves
+
+
 class ValidationGraph:
     def __init__(
         self,
@@ -104,6 +247,15 @@ class ValidationGraph:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as set of two-tuples)."""  # noqa: E501
         return {edge.id for edge in self._edges}
 
+    @property
+    def waves(self) -> List[List[MetricConfiguration]]:
+        """Returns "MetricConfiguration" objects in the order of resolution, grouped into waves.
+
+        Every "MetricConfiguration" object in a wave depends only on "MetricConfiguration" objects in earlier waves;
+        hence, each wave is submitted to "ExecutionEngine.resolve_metrics()" as one set (assuming no failures).
+        """  # noqa: E501
+        return _MetricResolutionScheduler(edges=self._edges).waves()
+
     def add(self, edge: MetricEdge) -> None:
         """Adds supplied "MetricEdge" object to this "ValidationGraph" object (if not already present)."""  # noqa: E501
         if edge.id not in self._edge_ids:
@@ -232,8 +384,25 @@ class ValidationGraph:
         failed_metric_info: _AbortedMetricsInfoDict = {}
         aborted_metrics_info: _AbortedMetricsInfoDict = {}
 
-        ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        # Metrics computed by previous validation runs over unchanged data need not be resolved again.  # noqa: E501
+        if getattr(self._execution_engine, "persistent_metric_cache", None) is not None:
+            metrics.update(
+                self._execution_engine.get_persisted_metrics(
+                    metric_configurations=self._get_unresolved_metric_configurations(
+                        metrics=metrics
+                    )
+                )
+            )
+
+        # Knowing every pending metric up front lets ExecutionEngine decide how to access Batch data (e.g., materialize it).  # noqa: E501
+        self._execution_engine.prepare_batch_data_for_metrics(
+            metric_configurations=self._get_unresolved_metric_configurations(metrics=metrics)
+        )
+
+        scheduler = self._build_metric_resolution_scheduler(metrics=metrics)
+
+        ready_metrics: List[MetricConfiguration]
+        resolved_metrics: Dict[_MetricKey, MetricValue]
 
         exception_info: ExceptionInfo
 
@@ -241,7 +410,7 @@ class ValidationGraph:
 
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = scheduler.ready_metrics
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -251,14 +420,14 @@ class ValidationGraph:
             if progress_bar is None:
                 # noinspection PyProtectedMember,SpellCheckingInspection
                 progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
+                    total=len(ready_metrics) + scheduler.num_needed_metrics,
                     desc="Calculating Metrics",
                     disable=disable,
                 )
             progress_bar.update(0)
             progress_bar.refresh()
 
-            computable_metrics = set()
+            computable_metrics: List[MetricConfiguration] = []
 
             for metric in ready_metrics:
                 if (
@@ -268,17 +437,17 @@ class ValidationGraph:
                 ):
                     aborted_metrics_info[metric.id] = failed_metric_info[metric.id]
                 else:
-                    computable_metrics.add(metric)
+                    computable_metrics.append(metric)
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.  # noqa: E501
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        runtime_configuration=runtime_configuration,
-                    )
+                resolved_metrics = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    runtime_configuration=runtime_configuration,
                 )
+                metrics.update(resolved_metrics)
+                scheduler.mark_resolved(metric_ids=resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -312,7 +481,7 @@ class ValidationGraph:
                 else:
                     raise e  # noqa: TRY201
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
+            if (len(ready_metrics) + scheduler.num_needed_metrics == 0) or (
                 len(ready_metrics) == len(aborted_metrics_info)
             ):
                 done = True
@@ -321,6 +490,27 @@ class ValidationGraph:
 
         return aborted_metrics_info
 
+    def _get_unresolved_metric_configurations(
+        self,
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> List[MetricConfiguration]:
+        metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+
+        edge: MetricEdge
+        metric_configuration: Optional[MetricConfiguration]
+        for edge in self.edges:
+            for metric_configuration in (edge.left, edge.right):
+                if metric_configuration is not None and metric_configuration.id not in metrics:
+                    metric_configurations[metric_configuration.id] = metric_configuration
+
+        return list(metric_configurations.values())
+
+    def _build_metric_resolution_scheduler(
+        self,
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> _MetricResolutionScheduler:
+        return _MetricResolutionScheduler(edges=self.edges, resolved_metric_ids=metrics.keys())
+
     def _parse(
         self,
         metrics: Dict[_MetricKey, MetricValue],
@@ -370,6 +560,7 @@ class ExpectationValidationGraph:
         self,
         configuration: ExpectationConfiguration,
         graph: ValidationGraph,
+        expectation: Optional[Expectation] = None,
     ) -> None:
         if configuration is None:
             raise ValueError(  # noqa: TRY003
@@ -383,11 +574,17 @@ class ExpectationValidationGraph:
 
         self._configuration = configuration
         self._graph = graph
+        self._expectation = expectation
 
     @property
     def configuration(self) -> ExpectationConfiguration:
         return self._configuration
 
+    @property
+    def expectation(self) -> Optional[Expectation]:
+        """ "Expectation" object built from "configuration" (if supplied), for reuse when evaluating results."""  # noqa: E501
+        return self._expectation
+
     @property
     def graph(self) -> ValidationGraph:
         return self._graph
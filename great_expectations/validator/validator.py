@@ -84,6 +84,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context import AbstractDataContext
     from great_expectations.datasource.fluent.interfaces import Batch as FluentBatch
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.expectations.expectation import Expectation
     from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -561,7 +562,7 @@ class Validator:
         keys = dir(self)
         return [expectation for expectation in keys if expectation.startswith("expect_")]
 
-    def graph_validate(
+    def graph_validate(  # noqa: C901 - too complex
         self,
         configurations: List[ExpectationConfiguration],
         runtime_configuration: Optional[dict] = None,
@@ -639,13 +640,24 @@ class Validator:
             else:
                 raise err  # noqa: TRY201
 
+        # "Expectation" objects, built while generating sub-graphs, are reused to evaluate results.
+        expectations_by_configuration_id: Dict[int, Expectation] = {
+            id(expectation_validation_graph.configuration): expectation_validation_graph.expectation
+            for expectation_validation_graph in expectation_validation_graphs
+            if expectation_validation_graph.expectation is not None
+        }
+
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
         for configuration in processed_configurations:
             try:
-                runtime_configuration_default = copy.deepcopy(runtime_configuration)
+                # "metrics_validate()" only sets top-level keys, so a shallow copy isolates expectations.  # noqa: E501
+                runtime_configuration_default = dict(runtime_configuration)
+
+                expectation = expectations_by_configuration_id.get(id(configuration))
+                if expectation is None:
+                    expectation = configuration.to_domain_obj()
 
-                expectation = configuration.to_domain_obj()
                 result = expectation.metrics_validate(
                     metrics=resolved_metrics,
                     execution_engine=self._execution_engine,
@@ -694,7 +706,12 @@ class Validator:
             except AssertionError as e:
                 raise InvalidExpectationConfigurationError(str(e))
 
-            evaluated_config = copy.deepcopy(configuration)
+            # Copy of "configuration" cheaper than "copy.deepcopy()": its (possibly nested) "kwargs"
+            # and "meta" are deep-copied, while the remaining attributes are shared with it, as they
+            # are only ever reassigned (never updated in place) on the evaluated configuration.
+            evaluated_config = copy.copy(configuration)
+            evaluated_config.kwargs = copy.deepcopy(configuration.kwargs)
+            evaluated_config.meta = copy.deepcopy(configuration.meta)
 
             if self.active_batch_id:
                 evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
@@ -714,6 +731,7 @@ class Validator:
                         metric_configurations=validation_dependencies.get_metric_configurations(),
                         runtime_configuration=runtime_configuration,
                     ),
+                    expectation=expectation,
                 )
                 expectation_validation_graphs.append(expectation_validation_graph)
                 processed_configurations.append(evaluated_config)
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import json
 import pathlib
+import sqlite3
+import time
 import uuid
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
 from unittest import mock
 
 import pytest
@@ -21,6 +23,7 @@ from great_expectations.checkpoint.actions import (
 from great_expectations.checkpoint.checkpoint import (
     Checkpoint,
     CheckpointAction,
+    CheckpointConcurrency,
     CheckpointResult,
 )
 from great_expectations.compatibility.pydantic import ValidationError
@@ -208,6 +211,7 @@ class TestCheckpointSerialization:
             ],
             "actions": expected_actions,
             "result_format": ResultFormat.SUMMARY,
+            "concurrency": None,
             "id": cp.id,
         }
 
@@ -294,6 +298,7 @@ class TestCheckpointSerialization:
                 },
             ],
             "result_format": ResultFormat.SUMMARY,
+            "concurrency": None,
             "id": None,
         }
 
@@ -566,6 +571,202 @@ class TestCheckpointResult:
             run_id=mock.ANY,
         )
 
+    @pytest.fixture
+    def slow_validation_definitions(
+        self, mocker: MockerFixture
+    ) -> Iterator[List[ValidationDefinition]]:
+        num_validation_definitions = 4
+        validation_definitions: List[ValidationDefinition] = []
+        for idx in range(num_validation_definitions):
+            suite = mocker.Mock(spec=ExpectationSuite)
+            suite.name = f"{self.suite_name}_{idx}"
+            validation_definitions.append(
+                ValidationDefinition(
+                    name=f"{self.validation_definition_name}_{idx}",
+                    data=mocker.Mock(spec=BatchDefinition),
+                    suite=suite,
+                )
+            )
+
+        def _run(
+            validation_definition: ValidationDefinition, **kwargs
+        ) -> ExpectationSuiteValidationResult:
+            # Earlier validation definitions finish last to shake out any ordering issues.
+            idx = validation_definitions.index(validation_definition)
+            time.sleep(0.05 * (num_validation_definitions - idx))
+            return ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name=validation_definition.suite.name,
+                batch_id=f"{self.datasource_name}-{self.asset_name}",
+            )
+
+        with mock.patch.object(ValidationDefinition, "run", autospec=True, side_effect=_run):
+            yield validation_definitions
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "concurrency",
+        [
+            pytest.param(None, id="default"),
+            pytest.param(CheckpointConcurrency(mode="serial"), id="serial"),
+            pytest.param(CheckpointConcurrency(mode="thread"), id="thread"),
+            pytest.param(CheckpointConcurrency(mode="thread", max_workers=2), id="thread_2"),
+        ],
+    )
+    def test_checkpoint_run_with_concurrency_preserves_result_order(
+        self,
+        slow_validation_definitions: List[ValidationDefinition],
+        concurrency: CheckpointConcurrency | None,
+        mocker: MockerFixture,
+    ):
+        action = mocker.Mock(spec=UpdateDataDocsAction, type="update_data_docs")
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=slow_validation_definitions,
+            actions=[action],
+            concurrency=concurrency,
+        )
+        run_id = RunIdentifier(run_name="my_run")
+
+        result = checkpoint.run(run_id=run_id)
+
+        assert list(result.run_results.keys()) == [
+            checkpoint._build_result_key(
+                validation_definition=validation_definition,
+                run_id=run_id,
+                batch_identifier=f"{self.datasource_name}-{self.asset_name}",
+            )
+            for validation_definition in slow_validation_definitions
+        ]
+        assert [r.suite_name for r in result.run_results.values()] == [
+            vd.suite.name for vd in slow_validation_definitions
+        ]
+        for validation_result in result.run_results.values():
+            assert validation_result.meta["validation_duration_seconds"] > 0
+        action._copy_and_set_values().run.assert_called_once_with(
+            checkpoint_result=result, action_context=mock.ANY
+        )
+
+    @pytest.mark.unit
+    def test_checkpoint_run_with_thread_concurrency_runs_in_parallel(
+        self, slow_validation_definitions: List[ValidationDefinition]
+    ):
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=slow_validation_definitions,
+            concurrency=CheckpointConcurrency(mode="thread"),
+        )
+
+        start = time.perf_counter()
+        result = checkpoint.run()
+        elapsed = time.perf_counter() - start
+
+        # Serially this takes the sum of all durations (0.5s); concurrently only the longest.
+        longest = max(r.meta["validation_duration_seconds"] for r in result.run_results.values())
+        total = sum(r.meta["validation_duration_seconds"] for r in result.run_results.values())
+        assert elapsed < total
+        assert longest <= elapsed
+
+    @pytest.mark.sqlite
+    def test_checkpoint_run_with_thread_concurrency_validates_each_batch(
+        self, tmp_path: pathlib.Path, mocker: MockerFixture
+    ):
+        db_path = tmp_path / "concurrency.db"
+        row_counts = {"small": 3, "medium": 5, "large": 8}
+        with sqlite3.connect(db_path) as connection:
+            for table_name, row_count in row_counts.items():
+                connection.execute(f"CREATE TABLE {table_name} (value INTEGER)")
+                connection.executemany(
+                    f"INSERT INTO {table_name} VALUES (?)", [(i,) for i in range(row_count)]
+                )
+
+        context = gx.get_context(mode="ephemeral")
+        connection_string = f"sqlite:///{db_path}"
+        # Two assets share the first Data Source (and its execution engine); the second Data
+        # Source lets the checkpoint actually use its thread pool.
+        shared_ds = context.data_sources.add_sqlite(
+            "shared_ds", connection_string=connection_string
+        )
+        other_ds = context.data_sources.add_sqlite("other_ds", connection_string=connection_string)
+        assets = [
+            shared_ds.add_table_asset("small", table_name="small"),
+            shared_ds.add_table_asset("medium", table_name="medium"),
+            other_ds.add_table_asset("large", table_name="large"),
+        ]
+
+        validation_definitions = []
+        for asset in assets:
+            row_count = row_counts[asset.name]
+            suite = context.suites.add(
+                ExpectationSuite(
+                    name=f"{asset.name}_suite",
+                    expectations=[
+                        gxe.ExpectTableRowCountToEqual(value=row_count),
+                        gxe.ExpectColumnMaxToBeBetween(
+                            column="value", min_value=row_count - 1, max_value=row_count - 1
+                        ),
+                    ],
+                )
+            )
+            validation_definitions.append(
+                context.validation_definitions.add(
+                    ValidationDefinition(
+                        name=f"{asset.name}_validation",
+                        data=asset.add_batch_definition_whole_table(f"{asset.name}_batch"),
+                        suite=suite,
+                    )
+                )
+            )
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=validation_definitions,
+            concurrency=CheckpointConcurrency(mode="thread"),
+        )
+
+        run = ValidationDefinition.run
+        run_intervals: Dict[str, Tuple[float, float]] = {}
+
+        def _timed_run(
+            validation_definition: ValidationDefinition, **kwargs
+        ) -> ExpectationSuiteValidationResult:
+            start = time.perf_counter()
+            validation_result = run(validation_definition, **kwargs)
+            time.sleep(0.05)  # Widens the window in which runs could overlap
+            run_intervals[validation_definition.asset.name] = (start, time.perf_counter())
+            return validation_result
+
+        mocker.patch.object(ValidationDefinition, "run", autospec=True, side_effect=_timed_run)
+
+        result = checkpoint.run()
+
+        # Runs on the shared Data Source must not overlap; the other Data Source runs alongside.
+        (_, first_end), (second_start, _) = sorted(
+            [run_intervals["small"], run_intervals["medium"]]
+        )
+        assert first_end <= second_start
+        assert result.success is True
+        run_results = list(result.run_results.values())
+        assert len(run_results) == len(assets)
+        for asset, validation_result in zip(assets, run_results):
+            assert validation_result.batch_id == f"{asset.datasource.name}-{asset.name}"
+            assert [r.result["observed_value"] for r in validation_result.results] == [
+                row_counts[asset.name],
+                row_counts[asset.name] - 1,
+            ]
+
+    @pytest.mark.unit
+    def test_checkpoint_concurrency_rejects_invalid_max_workers(self):
+        with pytest.raises(ValidationError):
+            CheckpointConcurrency(mode="thread", max_workers=0)
+
+    @pytest.mark.unit
+    def test_checkpoint_concurrency_rejects_process_mode(self):
+        # Validation definitions reference their Data Context and Data Assets, so they can't be
+        # pickled into worker processes.
+        with pytest.raises(ValidationError):
+            CheckpointConcurrency(mode="process")
+
     @pytest.mark.unit
     def test_result_init_no_run_results_raises_error(self, mocker: MockerFixture):
         with pytest.raises(ValueError) as e:
@@ -759,6 +960,11 @@ class TestCheckpointResult:
         # The meta attribute of each run result should contain the requisite IDs
         run_results = tuple(result.run_results.values())
         meta = run_results[0].meta
-        assert sorted(meta.keys()) == ["checkpoint_id", "run_id", "validation_id"]
+        assert sorted(meta.keys()) == [
+            "checkpoint_id",
+            "run_id",
+            "validation_duration_seconds",
+            "validation_id",
+        ]
         assert meta["checkpoint_id"] == checkpoint.id
         assert meta["validation_id"] == checkpoint.validation_definitions[0].id
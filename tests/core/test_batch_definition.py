@@ -8,6 +8,7 @@ import pytest
 
 from great_expectations.core.batch_definition import BatchDefinition
 from great_expectations.core.partitioners import FileNamePartitionerYearly
+from great_expectations.core.samplers import TableSampler
 from great_expectations.core.serdes import _EncodedValidationData, _IdentifierBundle
 from great_expectations.datasource.fluent.batch_request import BatchParameters
 from great_expectations.datasource.fluent.interfaces import Batch, DataAsset
@@ -146,3 +147,33 @@ def test_identifier_bundle():
         asset=_IdentifierBundle(name="my_asset", id=None),
         batch_definition=_IdentifierBundle(name="my_batch_definition", id=None),
     )
+
+
+@pytest.mark.unit
+def test_dict_excludes_unset_sampler():
+    assert BatchDefinition(name="my_batch_definition").dict() == {
+        "id": None,
+        "name": "my_batch_definition",
+        "partitioner": None,
+    }
+    assert BatchDefinition(
+        name="my_batch_definition", sampler=TableSampler(fraction=0.5)
+    ).dict()["sampler"] == {
+        "fraction": 0.5,
+        "method": "system",
+        "seed": None,
+        "method_name": "sample_using_tablesample",
+    }
+
+
+@pytest.mark.unit
+def test_add_batch_definition_with_sampler_raises_for_asset_without_sampling():
+    ds = PandasDatasource(
+        name="pandas_datasource",
+    )
+    asset = ds.add_csv_asset("my_asset", "data.csv")
+
+    with pytest.raises(ValueError, match="does not support sampling"):
+        asset.add_batch_definition("my_batch_definition", sampler=TableSampler(fraction=0.5))
+
+    assert asset.batch_definitions == []
@@ -1,3 +1,5 @@
+import copy
+
 import pandas as pd
 import pytest
 
@@ -10,7 +12,10 @@ from great_expectations.core.batch import (
     LegacyBatchDefinition,
 )
 from great_expectations.core.batch_spec import RuntimeDataBatchSpec
-from great_expectations.core.id_dict import deep_convert_properties_iterable_to_id_dict
+from great_expectations.core.id_dict import (
+    FrozenIDDict,
+    deep_convert_properties_iterable_to_id_dict,
+)
 from great_expectations.exceptions import InvalidBatchSpecError
 from great_expectations.util import convert_to_json_serializable
 
@@ -94,6 +99,51 @@ def test_iddict_is_hashable():
         assert False, "IDDict.__hash__() failed."
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("c", 3), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("a"), id="delitem"),
+        pytest.param(lambda d: d.update({"a": 0}), id="update"),
+        pytest.param(lambda d: d.setdefault("c", 3), id="setdefault"),
+        pytest.param(lambda d: d.pop("a"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+    ],
+)
+def test_iddict_id_is_cached_and_invalidated_on_mutation(mutate):
+    id_dict = IDDict({"a": 1, "b": 2})
+    original_id = id_dict.to_id()
+    assert id_dict.to_id() is original_id
+
+    mutate(id_dict)
+
+    assert id_dict.to_id() == IDDict(dict(id_dict)).to_id()
+    assert id_dict.to_id() != original_id
+    assert hash(id_dict) == hash(IDDict(dict(id_dict)))
+
+
+@pytest.mark.unit
+def test_frozen_iddict():
+    frozen = FrozenIDDict({"a": 1, "b": [1, 2]})
+
+    assert frozen.to_id() == IDDict({"a": 1, "b": [1, 2]}).to_id()
+    assert {frozen: "value"}[IDDict({"a": 1, "b": [1, 2]})] == "value"
+
+    with pytest.raises(TypeError):
+        frozen["c"] = 3
+    with pytest.raises(TypeError):
+        frozen.update({"a": 2})
+    with pytest.raises(TypeError):
+        frozen.pop("a")
+
+    frozen_copy = copy.deepcopy(frozen)
+    assert isinstance(frozen_copy, FrozenIDDict)
+    assert frozen_copy == frozen
+    assert frozen_copy["b"] is not frozen["b"]
+
+
 @pytest.mark.unit
 def test_batch_definition_id():
     # noinspection PyUnusedLocal,PyPep8Naming
@@ -456,6 +456,53 @@ def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     assert set(my_store.list_keys()) == {(".ge_store_backend_id",), ("AAA",)}
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_with_key_index(tmp_path_factory, mocker: MockerFixture):
+    project_path = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_with_key_index"))
+    TupleFilesystemStoreBackend(root_directory=project_path, base_directory="keys").set(
+        ("a", "1"), "a1"
+    )
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="keys",
+        key_index_path="key_index.sqlite",
+    )
+    assert my_store.config["key_index_path"] == "key_index.sqlite"
+    my_store.set(("a", "2"), "a2")
+    my_store.set(("b", "1"), "b1")
+
+    # Keys set before the index was configured are indexed when keys are first listed.
+    assert my_store.list_keys() == [(".ge_store_backend_id",), ("a", "1"), ("a", "2"), ("b", "1")]
+    walk_spy = mocker.spy(os, "walk")
+    assert my_store.list_keys(prefix=("a",)) == [("a", "1"), ("a", "2")]
+    assert walk_spy.call_count == 0
+
+    my_store.move(("b", "1"), ("c", "1"))
+    assert my_store.remove_key(("a", "2"))
+    assert my_store.list_keys() == [(".ge_store_backend_id",), ("a", "1"), ("c", "1")]
+    assert my_store.list_keys_modified_between(prefix=("c",)) == [("c", "1")]
+    assert (
+        my_store.list_keys_modified_between(
+            modified_after=datetime.datetime.now() + datetime.timedelta(days=1)
+        )
+        == []
+    )
+
+    # Files added by other means are listed only after the index is rebuilt.
+    os.makedirs(os.path.join(project_path, "keys", "d"))  # noqa: PTH103, PTH118
+    with open(os.path.join(project_path, "keys", "d", "1"), "w") as f:  # noqa: PTH118
+        f.write("d1")
+    assert ("d", "1") not in my_store.list_keys()
+    assert my_store.rebuild_key_index() == 4  # noqa: PLR2004
+    assert ("d", "1") in my_store.list_keys()
+
+    with pytest.raises(StoreBackendError):
+        TupleFilesystemStoreBackend(
+            root_directory=project_path, base_directory="keys"
+        ).rebuild_key_index()
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_TupleS3StoreBackend_with_prefix(aws_credentials):
@@ -593,6 +640,53 @@ def test_TupleS3StoreBackend_get_all(aws_credentials):
     assert sorted(result) == [val_a, val_b]
 
 
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_with_key_index(aws_credentials, tmp_path):
+    bucket = "leakybucket"
+    prefix = "my_prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix=prefix,
+        key_index_path=str(tmp_path / "key_index.sqlite"),
+    )
+    my_store.set(("AAA",), "aaa")
+    my_store.set(("BBB",), "bbb")
+    assert my_store.list_keys() == [(".ge_store_backend_id",), ("AAA",), ("BBB",)]
+
+    # Keys are indexed with LastModified of their objects (as when the index is rebuilt).
+    last_modified = boto3.client("s3").head_object(Bucket=bucket, Key=f"{prefix}/my_file_AAA")[
+        "LastModified"
+    ]
+    assert ("AAA",) in my_store.list_keys_modified_between(
+        modified_after=last_modified,
+        modified_before=last_modified + datetime.timedelta(microseconds=1),
+    )
+
+    assert my_store.remove_key(("BBB",))
+    assert my_store.list_keys() == [(".ge_store_backend_id",), ("AAA",)]
+
+    # Objects put by other means are listed only after the index is rebuilt.
+    boto3.client("s3").put_object(Bucket=bucket, Key=f"{prefix}/my_file_CCC", Body=b"ccc")
+    assert my_store.list_keys() == [(".ge_store_backend_id",), ("AAA",)]
+    assert my_store.rebuild_key_index() == 3  # noqa: PLR2004
+    assert my_store.list_keys() == [(".ge_store_backend_id",), ("AAA",), ("CCC",)]
+    assert my_store.get(("CCC",)) == "ccc"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("store_backend_class", [TupleGCSStoreBackend, TupleAzureBlobStoreBackend])
+def test_store_backends_without_key_index_support(store_backend_class):
+    assert not hasattr(store_backend_class, "rebuild_key_index")
+    assert not hasattr(store_backend_class, "list_keys_modified_between")
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_tuple_s3_store_backend_slash_conditions(aws_credentials):  # noqa: PLR0915
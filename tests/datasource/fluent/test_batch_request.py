@@ -122,6 +122,7 @@ def test_batch_request_config_serialization_round_trips(
         '"sort_ascending": true, '
         '"method_name": "partition_on_year"'
         "}, "
+        '"sampler": null, '
         f'"batch_slice": {batch_slice_json}'
         "}"
     )
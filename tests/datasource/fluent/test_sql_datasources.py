@@ -190,6 +190,8 @@ class TestConfigPasstrough:
                 exclude_unset=False,
                 exclude={"kwargs", *ds_kwargs.keys(), *ds._get_exec_engine_excludes()},
             ),
+            # unset "create_temp_table" is passed as None (query Batches are materialized on demand)
+            "create_temp_table": None,
             **{k: v for k, v in ds_kwargs.items() if k not in ["kwargs"]},
             **ds_kwargs.get("kwargs", {}),
             # config substitution should have been performed
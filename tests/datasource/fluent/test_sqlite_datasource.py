@@ -4,12 +4,15 @@ import pathlib
 from contextlib import _GeneratorContextManager, contextmanager
 from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
 
+import pandas as pd
 import pytest
 
 from great_expectations.compatibility.pydantic import ValidationError
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core.partitioners import (
     PartitionerConvertedDatetime,
 )
+from great_expectations.core.samplers import TableSampler
 from great_expectations.datasource.fluent import SqliteDatasource
 from tests.datasource.fluent.conftest import sqlachemy_execution_engine_mock_cls
 
@@ -180,3 +183,43 @@ def test_create_temp_table(empty_data_context, create_sqlite_source):
         asset = source.add_query_asset(name="query_asset", query="SELECT * from table")
         _ = asset.get_batch_list_from_batch_request(asset.build_batch_request())
         assert source._execution_engine._create_temp_table is False
+
+
+@pytest.mark.sqlite
+def test_table_asset_batch_definition_with_sampler(empty_data_context, tmp_path: pathlib.Path):
+    database_path = tmp_path / "sampled.db"
+    engine = sa.create_engine(f"sqlite:///{database_path}")
+    pd.DataFrame({"a": range(100)}).to_sql("my_table", engine, index=False)
+    engine.dispose()
+
+    datasource = empty_data_context.data_sources.add_sqlite(
+        name="sqlite_datasource", connection_string=f"sqlite:///{database_path}"
+    )
+    asset = datasource.add_table_asset(name="my_asset", table_name="my_table")
+    sampler = TableSampler(fraction=0.2, seed=42)
+    batch_definition = asset.add_batch_definition_whole_table(name="sampled", sampler=sampler)
+    assert asset.get_batch_definition("sampled").sampler == sampler
+
+    batch = batch_definition.get_batch()
+
+    assert batch.batch_spec["sampling_method"] == "sample_using_tablesample"
+    assert batch.batch_spec["sampling_kwargs"] == {"p": 0.2, "method": "system", "seed": 42}
+    # SQLite has no "TABLESAMPLE" clause, so rows are sampled at random instead.
+    assert len(batch.head(n_rows=100).data) == 20
+
+
+@pytest.mark.sqlite
+def test_query_asset_batch_definition_with_sampler_raises(empty_data_context):
+    datasource = empty_data_context.data_sources.add_sqlite(
+        name="sqlite_datasource", connection_string="sqlite://"
+    )
+    asset = datasource.add_query_asset(name="my_asset", query="SELECT 1 AS a")
+
+    with pytest.raises(ValueError, match="does not support sampling"):
+        asset.add_batch_definition(name="sampled", sampler=TableSampler(fraction=0.2))
+
+
+@pytest.mark.unit
+def test_table_sampler_fraction_must_be_between_0_and_1():
+    with pytest.raises(ValidationError):
+        TableSampler(fraction=0.0)
@@ -8,6 +8,7 @@ import pandas as pd
 import pytest
 from dateutil.parser import parse
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
     add_dataframe_to_db,
 )
@@ -55,6 +56,7 @@ pytestmark = [
             "sample_using_mod",
             "sample_using_a_list",
             "sample_using_md5",
+            "sample_using_tablesample",
         ]
     ],
 )
@@ -378,6 +380,111 @@ def test_sample_using_random(sqlite_view_engine, test_df):
     assert rows_0 != rows_1
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect_name,sampling_kwargs,expected_from_clause",
+    [
+        pytest.param(
+            GXSqlDialect.POSTGRESQL,
+            {"p": 0.1, "seed": 42},
+            "test_schema_name.test_table TABLESAMPLE SYSTEM (10.0) REPEATABLE (42)",
+            id="postgresql",
+        ),
+        pytest.param(
+            GXSqlDialect.SNOWFLAKE,
+            {"p": 0.25, "method": "bernoulli", "seed": 42},
+            "test_schema_name.test_table TABLESAMPLE BERNOULLI (25.0) SEED (42)",
+            id="snowflake",
+        ),
+        pytest.param(
+            GXSqlDialect.BIGQUERY,
+            {"p": 0.1, "seed": 42},
+            "test_schema_name.test_table TABLESAMPLE SYSTEM (10.0 PERCENT)",
+            id="bigquery",
+        ),
+        pytest.param(
+            GXSqlDialect.DATABRICKS,
+            {"p": 0.1, "method": "bernoulli", "seed": 7},
+            "test_schema_name.test_table TABLESAMPLE (10.0 PERCENT) REPEATABLE (7)",
+            id="databricks",
+        ),
+        pytest.param(
+            GXSqlDialect.TRINO,
+            {"p": 0.5},
+            "test_schema_name.test_table TABLESAMPLE SYSTEM (50.0)",
+            id="trino",
+        ),
+    ],
+)
+def test_sample_using_tablesample_builds_dialect_native_query(
+    dialect_name: GXSqlDialect, sampling_kwargs: dict, expected_from_clause: str
+):
+    dialect = sqlalchemy.engine.default.DefaultDialect()
+
+    class MockSqlAlchemyExecutionEngine:
+        def __init__(self):
+            self.dialect_name = dialect_name
+            self.dialect = dialect
+
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        schema_name="test_schema_name",
+        sampling_method="sample_using_tablesample",
+        sampling_kwargs=sampling_kwargs,
+    )
+    query = SqlAlchemyDataSampler().sample_using_tablesample(
+        execution_engine=MockSqlAlchemyExecutionEngine(),
+        batch_spec=batch_spec,
+        where_clause=sqlalchemy.column("a") > 1,
+    )
+
+    query_str: str = clean_query_for_comparison(
+        str(query.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    )
+    assert query_str == clean_query_for_comparison(
+        f"SELECT * FROM {expected_from_clause} WHERE a > 1"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "sampling_kwargs",
+    [
+        pytest.param({}, id="p missing"),
+        pytest.param({"p": 0.0}, id="p out of range"),
+        pytest.param({"p": 0.1, "method": "reservoir"}, id="unknown method"),
+    ],
+)
+def test_sample_using_tablesample_invalid_sampling_kwargs(sampling_kwargs: dict):
+    batch_spec = BatchSpec(table_name="test_table", sampling_kwargs=sampling_kwargs)
+    with pytest.raises(gx_exceptions.SamplerError):
+        SqlAlchemyDataSampler().sample_using_tablesample(
+            execution_engine=None, batch_spec=batch_spec
+        )
+
+
+@pytest.mark.sqlite
+def test_sample_using_tablesample_falls_back_to_random_sampling(sqlite_view_engine, test_df):
+    my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine
+    )
+    add_dataframe_to_db(df=test_df, name="test_table_1", con=my_execution_engine.engine)
+
+    p = 2.0e-1
+    batch_spec = SqlAlchemyDatasourceBatchSpec(
+        table_name="test_table_1",
+        schema_name="main",
+        sampling_method="sample_using_tablesample",
+        sampling_kwargs={"p": p, "seed": 42},
+    )
+    batch_data: SqlAlchemyBatchData = my_execution_engine.get_batch_data(batch_spec=batch_spec)
+    num_rows: int = batch_data.execution_engine.execute_query(
+        sqlalchemy.select(sqlalchemy.func.count()).select_from(batch_data.selectable)
+    ).scalar()
+
+    assert num_rows == round(p * test_df.shape[0])
+
+
 @pytest.mark.unit
 def test_sample_using_random_batch_spec_test_table_name_required():
     fake_execution_engine = None
@@ -9,6 +9,7 @@ from typing_extensions import override
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.batch import BatchData, BatchMarkers
 from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypes,
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
@@ -183,12 +184,34 @@ def test_resolve_metrics_with_aggregates_and_column_map():
 
     metrics.update(results)
 
+    mean_partial = MetricConfiguration(
+        metric_name=f"column.mean.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    mean_partial.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    stdev_partial = MetricConfiguration(
+        metric_name=f"column.standard_deviation.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    stdev_partial.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(mean_partial, stdev_partial), metrics=metrics
+    )
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": mean_partial,
         "table.columns": table_columns_metric,
     }
     stdev = MetricConfiguration(
@@ -197,6 +220,7 @@ def test_resolve_metrics_with_aggregates_and_column_map():
         metric_value_kwargs=None,
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": stdev_partial,
         "table.columns": table_columns_metric,
     }
     desired_metrics = (mean, stdev)
@@ -262,12 +286,34 @@ def test_resolve_metrics_with_extraneous_value_key():
 
     metrics.update(results)
 
+    mean_partial = MetricConfiguration(
+        metric_name=f"column.mean.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    mean_partial.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    stdev_partial = MetricConfiguration(
+        metric_name=f"column.standard_deviation.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2, 3, 4, 5]},
+    )
+    stdev_partial.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(mean_partial, stdev_partial), metrics=metrics
+    )
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": mean_partial,
         "table.columns": table_columns_metric,
     }
     # Ensuring that an unused value key will not mess up computation
@@ -277,6 +323,7 @@ def test_resolve_metrics_with_extraneous_value_key():
         metric_value_kwargs={"value_set": [1, 2, 3, 4, 5]},
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": stdev_partial,
         "table.columns": table_columns_metric,
     }
 
@@ -0,0 +1,213 @@
+import pathlib
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_chunked_batch_data import (
+    CHUNK_DEFERRED_METRIC_VALUE,
+    PandasChunkedBatchData,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+RESULT_FORMAT = {"result_format": "SUMMARY", "partial_unexpected_count": 2}
+
+COMBINABLE_METRIC_CONFIGURATIONS = [
+    MetricConfiguration(metric_name="table.row_count", metric_domain_kwargs={}),
+    MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={}),
+    MetricConfiguration(
+        metric_name="table.head", metric_domain_kwargs={}, metric_value_kwargs={"n_rows": 4}
+    ),
+    MetricConfiguration(metric_name="column.min", metric_domain_kwargs={"column": "a"}),
+    MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": "a"}),
+    MetricConfiguration(metric_name="column.sum", metric_domain_kwargs={"column": "a"}),
+    MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"sort": "value", "collate": None},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.nonnull.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.nonnull.unexpected_index_list",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"result_format": RESULT_FORMAT},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_values",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y"], "result_format": RESULT_FORMAT},
+    ),
+]
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "a": [1, 2, None, 4, 5, 6, None, 8, 9, None],
+            "b": ["x", "y", "z", "x", "y", "q", "x", "z", "y", "x"],
+        }
+    )
+
+
+def _compute_metrics(
+    path: pathlib.Path,
+    metric_configurations: List[MetricConfiguration],
+    chunksize: Optional[int] = None,
+) -> Dict[tuple, object]:
+    engine = PandasExecutionEngine(chunksize=chunksize)
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec=PathBatchSpec(path=str(path)))
+    assert isinstance(batch_data, PandasBatchData if chunksize is None else PandasChunkedBatchData)
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    resolved_metrics, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=metric_configurations,
+        runtime_configuration={"catch_exceptions": True},
+    )
+    assert aborted_metrics == {}
+    return resolved_metrics
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("file_name", ["data.csv", "data.parquet"])
+def test_chunked_metrics_equal_in_memory_metrics(
+    tmp_path: pathlib.Path, df: pd.DataFrame, file_name: str
+):
+    path = tmp_path / file_name
+    if file_name.endswith(".csv"):
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path)
+
+    expected = _compute_metrics(path=path, metric_configurations=COMBINABLE_METRIC_CONFIGURATIONS)
+    actual = _compute_metrics(
+        path=path, metric_configurations=COMBINABLE_METRIC_CONFIGURATIONS, chunksize=3
+    )
+
+    for metric_configuration in COMBINABLE_METRIC_CONFIGURATIONS:
+        if isinstance(expected[metric_configuration.id], pd.DataFrame):
+            pd.testing.assert_frame_equal(
+                actual[metric_configuration.id], expected[metric_configuration.id]
+            )
+        elif isinstance(expected[metric_configuration.id], pd.Series):
+            pd.testing.assert_series_equal(
+                actual[metric_configuration.id], expected[metric_configuration.id]
+            )
+        else:
+            assert actual[metric_configuration.id] == expected[metric_configuration.id]
+
+    assert actual[COMBINABLE_METRIC_CONFIGURATIONS[-2].id] == [2, 6]
+    assert actual[COMBINABLE_METRIC_CONFIGURATIONS[-1].id] == ["z", "q"]
+
+
+@pytest.mark.unit
+def test_approximate_quantiles_merge_across_chunks(tmp_path: pathlib.Path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": range(1, 101)}).to_csv(path, index=False)
+
+    quantile_values_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": [0.0, 0.25, 0.5, 1.0], "allow_relative_error": 0.01},
+    )
+    median_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    resolved_metrics = _compute_metrics(
+        path=path, metric_configurations=[quantile_values_metric, median_metric], chunksize=7
+    )
+
+    assert resolved_metrics[quantile_values_metric.id] == [1.0, 25.0, 50.0, 100.0]
+    assert resolved_metrics[median_metric.id] == 50.0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_configuration",
+    [
+        pytest.param(
+            MetricConfiguration(metric_name="column.mean", metric_domain_kwargs={"column": "a"}),
+            id="depends_on_deferred_partial_metric",
+        ),
+        pytest.param(
+            MetricConfiguration(metric_name="column.median", metric_domain_kwargs={"column": "a"}),
+            id="requires_whole_batch_in_memory",
+        ),
+    ],
+)
+def test_unsupported_metrics_are_aborted(
+    tmp_path: pathlib.Path, df: pd.DataFrame, metric_configuration: MetricConfiguration
+):
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    engine = PandasExecutionEngine(chunksize=3)
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec=PathBatchSpec(path=str(path)))
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    _, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=[metric_configuration],
+        runtime_configuration={"catch_exceptions": True},
+    )
+
+    assert "chunk" in aborted_metrics[metric_configuration.id]["exception_info"].exception_message
+
+
+@pytest.mark.unit
+def test_chunk_deferred_metrics_are_neither_cached_nor_persisted(
+    tmp_path: pathlib.Path, df: pd.DataFrame, mocker
+):
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    engine = PandasExecutionEngine(chunksize=3)
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec=PathBatchSpec(path=str(path)))
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    persist_spy = mocker.spy(engine, "_persist_resolved_metrics")
+    resolved_metrics, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=COMBINABLE_METRIC_CONFIGURATIONS,
+        runtime_configuration={"catch_exceptions": True},
+    )
+
+    assert aborted_metrics == {}
+    assert engine._metric_cache
+    for metric_configuration in COMBINABLE_METRIC_CONFIGURATIONS:
+        assert engine._metric_cache[metric_configuration.id] is resolved_metrics[
+            metric_configuration.id
+        ]
+    assert all(
+        metric_value is not CHUNK_DEFERRED_METRIC_VALUE
+        for metric_value in engine._metric_cache.values()
+    )
+    for call in persist_spy.call_args_list:
+        assert all(
+            metric_value is not CHUNK_DEFERRED_METRIC_VALUE
+            for metric_value in call.kwargs["resolved_metrics"].values()
+        )
+
+
+@pytest.mark.unit
+def test_unsupported_reader_method_reads_file_whole(tmp_path: pathlib.Path, df: pd.DataFrame):
+    path = tmp_path / "data.json"
+    df.to_json(path)
+
+    engine = PandasExecutionEngine(chunksize=3)
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec=PathBatchSpec(path=str(path)))
+
+    assert isinstance(batch_data, PandasBatchData)
+    assert len(batch_data.dataframe) == len(df)
+
+
+@pytest.mark.unit
+def test_invalid_chunksize():
+    with pytest.raises(ValueError):
+        PandasExecutionEngine(chunksize=0)
@@ -1,7 +1,10 @@
+import logging
 import os
+from decimal import Decimal
 from typing import Dict, Tuple
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -11,12 +14,22 @@ from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
+from great_expectations.execution_engine import pandas_column_aggregates
+from great_expectations.execution_engine.pandas_column_aggregates import (
+    PandasColumnAggregate,
+    compute_column_aggregates,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_fused_map_condition_metrics import (
+    UnexpectedRowsMaskMatrix,
+)
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -236,6 +249,76 @@ def test_get_domain_records_with_multicolumn_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+@pytest.mark.unit
+def test_get_domain_records_memoizes_row_selections():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [2, 3, 4, 5, None, 6]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {
+        "column_list": ["a", "b"],
+        "row_condition": "a>1",
+        "condition_parser": "pandas",
+        "ignore_row_if": "any_value_is_missing",
+    }
+    expected_df = df.query("a>1", parser="pandas").dropna(how="any", subset=["a", "b"])
+
+    with mock.patch.object(
+        pd.DataFrame, "eval", autospec=True, side_effect=pd.DataFrame.eval
+    ) as eval_spy:
+        first = engine.get_domain_records(domain_kwargs=domain_kwargs)
+        second = engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    assert eval_spy.call_count == 1
+    assert first.equals(expected_df)
+    assert second.equals(expected_df)
+    assert len(engine.batch_manager.domain_records_cache) == 1
+
+    engine.batch_manager.reset_batch_cache()
+    assert len(engine.batch_manager.domain_records_cache) == 0
+    assert engine.batch_manager.domain_records_cache.num_bytes == 0
+
+
+@pytest.mark.unit
+def test_get_domain_records_cache_is_invalidated_when_batch_data_is_reloaded():
+    engine = PandasExecutionEngine()
+    domain_kwargs = {"column": "a", "row_condition": "a>1", "condition_parser": "pandas"}
+
+    engine.load_batch_data(batch_data=pd.DataFrame({"a": [1, 2, 3]}), batch_id="1234")
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs)["a"].tolist() == [2, 3]
+
+    engine.load_batch_data(batch_data=pd.DataFrame({"a": [3, 0, 2, 5]}), batch_id="1234")
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs)["a"].tolist() == [3, 2, 5]
+
+
+@pytest.mark.unit
+def test_get_domain_records_cache_evicts_least_recently_used_row_selections():
+    num_rows = 100
+    # Each boolean mask takes up "num_rows" bytes, so at most two of them fit in the budget.
+    engine = PandasExecutionEngine(domain_records_cache_max_bytes=2 * num_rows + 1)
+    assert engine.config["domain_records_cache_max_bytes"] == 2 * num_rows + 1
+    engine.load_batch_data(batch_data=pd.DataFrame({"a": range(num_rows)}), batch_id="1234")
+    cache = engine.batch_manager.domain_records_cache
+
+    def _domain_kwargs(threshold: int) -> dict:
+        return {"column": "a", "row_condition": f"a>{threshold}", "condition_parser": "pandas"}
+
+    engine.get_domain_records(domain_kwargs=_domain_kwargs(10))
+    engine.get_domain_records(domain_kwargs=_domain_kwargs(20))
+    engine.get_domain_records(domain_kwargs=_domain_kwargs(10))
+    engine.get_domain_records(domain_kwargs=_domain_kwargs(30))
+
+    assert len(cache) == 2
+    assert cache.num_bytes <= cache.max_bytes
+    assert cache.get(("1234", "a>10", "pandas", None, ())) is not None
+    assert cache.get(("1234", "a>20", "pandas", None, ())) is None
+    assert cache.get(("1234", "a>30", "pandas", None, ())) is not None
+
+    engine = PandasExecutionEngine(domain_records_cache_max_bytes=0)
+    engine.load_batch_data(batch_data=pd.DataFrame({"a": range(num_rows)}), batch_id="1234")
+    assert len(engine.get_domain_records(domain_kwargs=_domain_kwargs(10))) == num_rows - 11
+    assert len(engine.batch_manager.domain_records_cache) == 0
+
+
 @pytest.mark.unit
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = PandasExecutionEngine()
@@ -376,12 +459,34 @@ def test_resolve_metric_bundle():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    mean_aggregate_fn = MetricConfiguration(
+        metric_name=f"column.mean.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    mean_aggregate_fn.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    stdev_aggregate_fn = MetricConfiguration(
+        metric_name=f"column.standard_deviation.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    stdev_aggregate_fn.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(mean_aggregate_fn, stdev_aggregate_fn), metrics=metrics
+    )
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": mean_aggregate_fn,
         "table.columns": table_columns_metric,
     }
     stdev = MetricConfiguration(
@@ -390,12 +495,24 @@ def test_resolve_metric_bundle():
         metric_value_kwargs=None,
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": stdev_aggregate_fn,
         "table.columns": table_columns_metric,
     }
     desired_metrics = (mean, stdev)
-    results = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+    with mock.patch(
+        "great_expectations.execution_engine.pandas_execution_engine.compute_column_aggregates",
+        wraps=compute_column_aggregates,
+    ) as compute_column_aggregates_spy:
+        results = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
     metrics.update(results)
 
+    # Both aggregates of column "a" are computed together, in a single pass over its values.
+    compute_column_aggregates_spy.assert_called_once()
+    assert compute_column_aggregates_spy.call_args.kwargs["aggregates"] == {
+        PandasColumnAggregate.MEAN,
+        PandasColumnAggregate.STANDARD_DEVIATION,
+    }
+
     # Ensuring metrics have been properly resolved
     assert metrics[("column.mean", "column=a", ())] == 2.0, "mean metric not properly computed"
     assert metrics[("column.standard_deviation", "column=a", ())] == 1.0, (
@@ -403,6 +520,192 @@ def test_resolve_metric_bundle():
     )
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column,aggregates",
+    [
+        pytest.param(pd.Series([3, 1, 4, 1, 5, 9, 2, 6]), set(PandasColumnAggregate), id="int64"),
+        pytest.param(
+            pd.Series([3.5, None, -1.25, 4.0, None, 9.75]),
+            set(PandasColumnAggregate),
+            id="float64_with_nulls",
+        ),
+        pytest.param(
+            pd.Series([None, None], dtype="float64"), set(PandasColumnAggregate), id="all_null"
+        ),
+        pytest.param(pd.Series([7.0]), set(PandasColumnAggregate), id="single_value"),
+        pytest.param(pd.Series([], dtype="int64"), set(PandasColumnAggregate), id="empty"),
+        pytest.param(
+            pd.Series([1, None, 3], dtype="Int64"), set(PandasColumnAggregate), id="nullable_int"
+        ),
+        pytest.param(
+            pd.Series(["b", "a", "c"]),
+            {PandasColumnAggregate.MIN, PandasColumnAggregate.MAX},
+            id="strings",
+        ),
+    ],
+)
+def test_compute_column_aggregates_matches_pandas(column: pd.Series, aggregates: set):
+    series_methods = {
+        PandasColumnAggregate.MIN: "min",
+        PandasColumnAggregate.MAX: "max",
+        PandasColumnAggregate.SUM: "sum",
+        PandasColumnAggregate.MEAN: "mean",
+        PandasColumnAggregate.STANDARD_DEVIATION: "std",
+    }
+
+    results = compute_column_aggregates(column=column, aggregates=aggregates)
+
+    assert results.keys() == aggregates
+    for aggregate in aggregates:
+        expected = getattr(column, series_methods[aggregate])()
+        if pd.isna(expected):
+            assert pd.isna(results[aggregate])
+        else:
+            assert results[aggregate] == expected
+            assert type(results[aggregate]) is type(expected)
+
+
+@pytest.mark.unit
+def test_compute_column_aggregates_converts_decimals():
+    column = pd.Series([Decimal(2.0), Decimal(0.18781)])
+
+    results = compute_column_aggregates(
+        column=column,
+        aggregates={PandasColumnAggregate.SUM, PandasColumnAggregate.MEAN},
+    )
+
+    assert results == {PandasColumnAggregate.SUM: 2.18781, PandasColumnAggregate.MEAN: 1.093905}
+
+
+@pytest.mark.unit
+def test_compute_column_aggregates_combines_blocks(monkeypatch):
+    monkeypatch.setattr(pandas_column_aggregates, "FUSED_AGGREGATE_BLOCK_SIZE", 7)
+    column = pd.Series(np.random.default_rng(seed=42).normal(loc=100, scale=15, size=100))
+    column[::9] = np.nan
+
+    results = compute_column_aggregates(column=column, aggregates=set(PandasColumnAggregate))
+
+    assert results[PandasColumnAggregate.MIN] == column.min()
+    assert results[PandasColumnAggregate.MAX] == column.max()
+    assert results[PandasColumnAggregate.SUM] == pytest.approx(column.sum(), rel=1e-12)
+    assert results[PandasColumnAggregate.MEAN] == pytest.approx(column.mean(), rel=1e-12)
+    assert results[PandasColumnAggregate.STANDARD_DEVIATION] == pytest.approx(
+        column.std(), rel=1e-12
+    )
+
+
+FUSED_RESULT_FORMAT = {
+    "result_format": "SUMMARY",
+    "partial_unexpected_count": 2,
+    "unexpected_index_column_names": ["pk"],
+}
+
+FUSED_MAP_CONDITION_METRICS = (
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_count",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y"]},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_values",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y"], "result_format": FUSED_RESULT_FORMAT},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_index_list",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y"], "result_format": FUSED_RESULT_FORMAT},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_index_list",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={
+            "value_set": ["x", "y"],
+            "result_format": {**FUSED_RESULT_FORMAT, "exclude_unexpected_values": True},
+        },
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_rows",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y"], "result_format": FUSED_RESULT_FORMAT},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.nonnull.unexpected_count",
+        metric_domain_kwargs={"column": "b"},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.nonnull.unexpected_index_list",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"result_format": {"result_format": "COMPLETE"}},
+    ),
+)
+
+
+def _compute_fused_map_condition_metrics(
+    fuse_map_condition_metrics: bool,
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    df = pd.DataFrame(
+        {
+            "pk": [1, 2, 3, 4, 5, 6, 7],
+            "b": ["x", "q", None, "y", "z", "r", None],
+        }
+    )
+    execution_engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df}, fuse_map_condition_metrics=fuse_map_condition_metrics
+    )
+    resolved_metrics, aborted_metrics = MetricsCalculator(
+        execution_engine=execution_engine
+    ).compute_metrics(
+        metric_configurations=list(FUSED_MAP_CONDITION_METRICS),
+        runtime_configuration={"catch_exceptions": False},
+    )
+    assert aborted_metrics == {}
+    return resolved_metrics
+
+
+@pytest.mark.unit
+def test_fused_map_condition_metrics_match_separate_metric_functions(caplog):
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    fused = _compute_fused_map_condition_metrics(fuse_map_condition_metrics=True)
+    assert "PandasExecutionEngine resolved 7 metrics of 2 map conditions from one mask matrix." in [
+        record.message for record in caplog.records
+    ]
+
+    separate = _compute_fused_map_condition_metrics(fuse_map_condition_metrics=False)
+
+    unexpected_rows_id = FUSED_MAP_CONDITION_METRICS[4].id
+    pd.testing.assert_frame_equal(fused[unexpected_rows_id], separate[unexpected_rows_id])
+    for metric_configuration in FUSED_MAP_CONDITION_METRICS:
+        if metric_configuration.id != unexpected_rows_id:
+            assert fused[metric_configuration.id] == separate[metric_configuration.id]
+
+    assert fused[FUSED_MAP_CONDITION_METRICS[0].id] == 3
+    assert fused[FUSED_MAP_CONDITION_METRICS[1].id] == ["q", "z"]
+    assert fused[FUSED_MAP_CONDITION_METRICS[2].id] == [{"pk": 2, "b": "q"}, {"pk": 5, "b": "z"}]
+    assert fused[FUSED_MAP_CONDITION_METRICS[3].id] == [{"pk": [2, 5, 6]}]
+    assert list(fused[unexpected_rows_id]["pk"]) == [2, 5]
+    assert fused[FUSED_MAP_CONDITION_METRICS[5].id] == 2
+    assert fused[FUSED_MAP_CONDITION_METRICS[6].id] == [2, 6]
+
+
+@pytest.mark.unit
+def test_unexpected_rows_mask_matrix():
+    masks = np.random.default_rng(seed=42).random((3, 21)) < 0.3
+    matrix = UnexpectedRowsMaskMatrix(num_rows=21, num_conditions=3)
+    for condition_index, mask in enumerate(masks):
+        matrix.set_mask(condition_index=condition_index, mask=mask)
+
+    assert list(matrix.unexpected_counts()) == list(masks.sum(axis=1))
+    for condition_index, mask in enumerate(masks):
+        assert list(matrix.unexpected_positions(condition_index=condition_index)) == list(
+            np.flatnonzero(mask)
+        )
+        assert list(matrix.unexpected_positions(condition_index=condition_index, limit=2)) == list(
+            np.flatnonzero(mask)[:2]
+        )
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error  # noqa: E501
 @pytest.mark.unit
 def test_resolve_metric_bundle_with_nonexistent_metric():
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from great_expectations.execution_engine import pandas_quantile_sketch
+from great_expectations.execution_engine.pandas_quantile_sketch import (
+    DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR,
+    QuantileSketch,
+    get_quantile_sketch_relative_error,
+)
+
+QUANTILES = np.linspace(0.01, 0.99, 99)
+
+
+def _get_max_rank_error(sketch: QuantileSketch, sorted_values: np.ndarray) -> float:
+    estimates = sketch.get_quantiles(QUANTILES)
+    ranks = np.searchsorted(sorted_values, estimates, side="right") / len(sorted_values)
+    return float(np.abs(ranks - QUANTILES).max())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("relative_error", [0.05, 0.01])
+def test_estimated_quantiles_are_within_relative_error(relative_error: float):
+    values = np.random.default_rng(seed=42).normal(size=200_000)
+    values[::10] = np.nan
+
+    sketch = QuantileSketch(relative_error=relative_error)
+    block: np.ndarray
+    for block in np.array_split(values, 20):
+        sketch.update(block)
+
+    sorted_values = np.sort(values[~np.isnan(values)])
+    assert sketch.count == len(sorted_values)
+    assert sketch.num_retained < len(sorted_values) / 50
+    assert _get_max_rank_error(sketch=sketch, sorted_values=sorted_values) <= relative_error
+    assert sketch.get_quantiles([0.0, 1.0]) == [sorted_values[0], sorted_values[-1]]
+
+
+@pytest.mark.unit
+def test_large_update_is_compacted_in_bounded_blocks(mocker):
+    values = np.random.default_rng(seed=3).uniform(size=100_000)
+    sketch = QuantileSketch(relative_error=0.01)
+    level_sizes = []
+    compress = sketch._compress
+
+    def _compress():
+        level_sizes.extend(len(level) for level in sketch._levels)
+        compress()
+
+    mocker.patch.object(sketch, "_compress", _compress)
+    sketch.update(values)
+
+    assert max(level_sizes) <= sketch._k + pandas_quantile_sketch._UPDATE_BLOCK_SIZE
+    max_rank_error = _get_max_rank_error(sketch=sketch, sorted_values=np.sort(values))
+    assert max_rank_error <= sketch.relative_error
+
+
+@pytest.mark.unit
+def test_merged_sketches_summarize_union_of_values():
+    relative_error = 0.01
+    values = np.random.default_rng(seed=7).exponential(size=100_000)
+
+    merged = QuantileSketch(relative_error=relative_error)
+    part: np.ndarray
+    for part in np.array_split(values, 4):
+        sketch = QuantileSketch(relative_error=relative_error)
+        sketch.update(part)
+        merged.merge(sketch)
+
+    assert merged.count == len(values)
+    assert _get_max_rank_error(sketch=merged, sorted_values=np.sort(values)) <= relative_error
+
+
+@pytest.mark.unit
+def test_empty_sketch():
+    sketch = QuantileSketch()
+    sketch.update([np.nan, np.nan])
+
+    assert sketch.count == 0
+    assert sketch.get_quantiles([0.0, 0.5]) == [None, None]
+    assert QuantileSketch().merge(sketch).count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "allow_relative_error,expected",
+    [
+        pytest.param(False, None, id="false"),
+        pytest.param(None, None, id="none"),
+        pytest.param("linear", None, id="interpolation"),
+        pytest.param(True, DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR, id="true"),
+        pytest.param(0.05, 0.05, id="number"),
+    ],
+)
+def test_get_quantile_sketch_relative_error(allow_relative_error, expected):
+    assert get_quantile_sketch_relative_error(allow_relative_error) == expected
+
+
+@pytest.mark.unit
+def test_get_quantile_sketch_relative_error_out_of_range():
+    with pytest.raises(ValueError):
+        get_quantile_sketch_relative_error(1.5)
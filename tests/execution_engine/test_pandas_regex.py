@@ -0,0 +1,107 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility import pyarrow
+from great_expectations.execution_engine.pandas_regex import (
+    combine_regex_list,
+    series_matches_regex,
+    series_matches_regex_list,
+)
+
+VALUES = ["abc", "ABC", "a1b2", "", "x\ny", "foo bar", "bar"]
+
+REGEX_LISTS = [
+    ["a", "b"],
+    ["^a", "c$"],
+    ["[0-9]", "b"],
+    ["(a)\\1", "b"],
+    ["x$", "^y"],
+    ["(?i)abc", "bar"],
+    ["(f)(o)", "(b)"],
+]
+
+
+def _expected_matches(column: pd.Series, regex_list: List[str], match_on: str) -> pd.Series:
+    regex_match_df = pd.concat(
+        [column.astype(str).str.contains(regex) for regex in regex_list],
+        axis=1,
+        ignore_index=True,
+    )
+    if match_on == "any":
+        return regex_match_df.any(axis="columns")
+
+    return regex_match_df.all(axis="columns")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("regex", ["a", "^a", "[0-9]", "x$", "(?i)abc", "^$"])
+def test_series_matches_regex_matches_str_contains(regex: str):
+    column = pd.Series(VALUES + [1, 2.5, None], index=range(10, 20))
+
+    pd.testing.assert_series_equal(
+        series_matches_regex(column=column, regex=regex),
+        column.astype(str).str.contains(regex),
+    )
+
+
+@pytest.mark.unit
+# "str.contains" (the reference) warns about patterns with groups.
+@pytest.mark.filterwarnings("ignore:This pattern is interpreted as a regular expression:UserWarning")
+@pytest.mark.parametrize("match_on", ["any", "all"])
+@pytest.mark.parametrize("regex_list", REGEX_LISTS)
+def test_series_matches_regex_list_matches_str_contains(regex_list: List[str], match_on: str):
+    column = pd.Series(VALUES, index=range(100, 100 + len(VALUES)))
+
+    pd.testing.assert_series_equal(
+        series_matches_regex_list(column=column, regex_list=regex_list, match_on=match_on),
+        _expected_matches(column=column, regex_list=regex_list, match_on=match_on),
+    )
+
+
+@pytest.mark.unit
+def test_combine_regex_list():
+    assert combine_regex_list(("a", "b"), "any") == "(?:a)|(?:b)"
+    assert combine_regex_list(("a", "b"), "all") == r"\A(?=[\s\S]*?(?:a))(?=[\s\S]*?(?:b))"
+    # Inline flags would apply to all patterns, and groups of later patterns would shift backreferences.
+    assert combine_regex_list(("(?i)a", "b"), "any") is None
+    assert combine_regex_list(("a", "(b)\\1"), "all") is None
+
+
+@pytest.mark.unit
+def test_series_matches_regex_list_rejects_invalid_arguments():
+    column = pd.Series(VALUES)
+
+    with pytest.raises(ValueError):
+        series_matches_regex_list(column=column, regex_list=["a"], match_on="some")
+
+    with pytest.raises(ValueError):
+        series_matches_regex_list(column=column, regex_list=[], match_on="any")
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not pyarrow.pyarrow, reason="pyarrow is not installed")
+@pytest.mark.filterwarnings("ignore:This pattern is interpreted as a regular expression:UserWarning")
+@pytest.mark.parametrize(
+    "regex",
+    [
+        "1$",  # matches before a trailing newline
+        r"\d",  # matches non-ASCII digits
+        r"\bb",  # word boundaries of non-ASCII word characters
+        "a(?=1)",  # lookahead
+        r"(a)\1",  # backreference
+    ],
+)
+def test_arrow_backed_string_columns_are_matched_by_python_regex(regex: str):
+    values = ["a1\n", "\u0661", "\u00e9b", "aa", "b"]
+    expected = pd.Series(values, dtype=object).str.contains(regex).to_numpy()
+
+    for dtype in ["string[pyarrow]", pd.ArrowDtype(pyarrow.pyarrow.string())]:
+        column = pd.Series(values, dtype=dtype)
+        np.testing.assert_array_equal(series_matches_regex(column=column, regex=regex), expected)
+        np.testing.assert_array_equal(
+            series_matches_regex_list(column=column, regex_list=[regex, "zzz"], match_on="any"),
+            expected,
+        )
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import pandas_value_set as pandas_value_set_module
+from great_expectations.execution_engine.pandas_value_set import (
+    PREPARED_VALUE_SET_MIN_SIZE,
+    PreparedValueSet,
+    series_isin_value_set,
+)
+
+LARGE_VALUE_SET = list(range(0, 2 * PREPARED_VALUE_SET_MIN_SIZE, 2))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column",
+    [
+        pd.Series([0, 1, 2, 3, 1998, 1999, 5000], index=range(10, 17)),
+        pd.Series([0.0, 1.0, 2.0, np.nan, 1998.0]),
+        pd.Series(["0", 2, None, 4.0]),
+        pd.Series([True, False]),
+    ],
+)
+def test_series_isin_value_set_matches_isin(column: pd.Series):
+    pd.testing.assert_series_equal(
+        series_isin_value_set(column=column, value_set=LARGE_VALUE_SET),
+        column.isin(LARGE_VALUE_SET),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("values", [[0, 2, 3], ["0", "2", "3"]])
+def test_series_isin_value_set_keeps_name_of_column(values: list):
+    column = pd.Series(values, name="my_column")
+
+    pd.testing.assert_series_equal(
+        series_isin_value_set(column=column, value_set=LARGE_VALUE_SET),
+        column.isin(LARGE_VALUE_SET),
+    )
+
+
+@pytest.mark.unit
+def test_string_and_mixed_value_sets_match_isin():
+    value_set = [str(value) for value in LARGE_VALUE_SET] + [None, 7]
+    column = pd.Series(["0", "1", "2", None, 7, "7"])
+
+    pd.testing.assert_series_equal(
+        series_isin_value_set(column=column, value_set=value_set),
+        column.isin(value_set),
+    )
+
+
+@pytest.mark.unit
+def test_prepared_value_sets_are_shared_and_deduplicated(mocker):
+    pandas_value_set_module._get_prepared_value_set.cache_clear()
+    init_spy = mocker.spy(PreparedValueSet, "__init__")
+    column = pd.Series([0, 1, 2])
+
+    series_isin_value_set(column=column, value_set=LARGE_VALUE_SET + LARGE_VALUE_SET)
+    series_isin_value_set(column=column, value_set=LARGE_VALUE_SET + LARGE_VALUE_SET)
+    assert init_spy.call_count == 1
+
+    # Equal values of another type are prepared separately.
+    series_isin_value_set(
+        column=column, value_set=[float(value) for value in LARGE_VALUE_SET + LARGE_VALUE_SET]
+    )
+    assert init_spy.call_count == 2  # noqa: PLR2004
+
+    assert len(PreparedValueSet(value_set=LARGE_VALUE_SET + LARGE_VALUE_SET)) == len(
+        LARGE_VALUE_SET
+    )
+
+
+@pytest.mark.unit
+def test_small_value_sets_are_not_prepared(mocker):
+    init_spy = mocker.spy(PreparedValueSet, "__init__")
+    column = pd.Series([0, 1, 2])
+
+    assert series_isin_value_set(column=column, value_set=[1]).tolist() == [False, True, False]
+    assert init_spy.call_count == 0
@@ -0,0 +1,154 @@
+import pathlib
+import threading
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import persistent_metric_cache
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.execution_engine.persistent_metric_cache import (
+    PersistentMetricCache,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+MAX_METRIC_ID = ("column.max", "column=a", ())
+MIN_METRIC_ID = ("column.min", "column=a", ())
+
+
+@pytest.fixture
+def cache_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "metric_cache" / "metrics.db"
+
+
+@pytest.mark.unit
+def test_put_and_get(cache_path: pathlib.Path):
+    cache = PersistentMetricCache(path=cache_path)
+    cache.put(
+        batch_fingerprint="fingerprint",
+        metrics={
+            MAX_METRIC_ID: 3,
+            ("column.max.aggregate_fn", "column=a", ()): ("partial", {}, {}),
+            ("column.min", "column=b", ()): threading.Lock(),
+        },
+    )
+
+    # A new instance sharing the database file sees previously stored values.
+    cache = PersistentMetricCache(path=cache_path)
+    assert cache.get(
+        batch_fingerprint="fingerprint",
+        metric_ids=[
+            MAX_METRIC_ID,
+            MIN_METRIC_ID,
+            ("column.max.aggregate_fn", "column=a", ()),
+            ("column.min", "column=b", ()),
+        ],
+    ) == {MAX_METRIC_ID: 3}
+    assert cache.get(batch_fingerprint="other_fingerprint", metric_ids=[MAX_METRIC_ID]) == {}
+
+    cache.clear()
+    assert cache.get(batch_fingerprint="fingerprint", metric_ids=[MAX_METRIC_ID]) == {}
+
+
+@pytest.mark.unit
+def test_expired_values_are_ignored(cache_path: pathlib.Path):
+    cache = PersistentMetricCache(path=cache_path, ttl_seconds=60)
+    with mock.patch.object(persistent_metric_cache.time, "time", return_value=1000.0):
+        cache.put(batch_fingerprint="fingerprint", metrics={MAX_METRIC_ID: 3})
+
+    with mock.patch.object(persistent_metric_cache.time, "time", return_value=1059.0):
+        assert cache.get(batch_fingerprint="fingerprint", metric_ids=[MAX_METRIC_ID]) == {
+            MAX_METRIC_ID: 3
+        }
+
+    with mock.patch.object(persistent_metric_cache.time, "time", return_value=1061.0):
+        assert cache.get(batch_fingerprint="fingerprint", metric_ids=[MAX_METRIC_ID]) == {}
+
+
+@pytest.mark.unit
+def test_least_recently_used_values_are_evicted(cache_path: pathlib.Path):
+    value = "x" * 1000
+    cache = PersistentMetricCache(path=cache_path, max_bytes=2500)
+    with mock.patch.object(persistent_metric_cache.time, "time", return_value=1.0):
+        cache.put(batch_fingerprint="fingerprint", metrics={MAX_METRIC_ID: value})
+    with mock.patch.object(persistent_metric_cache.time, "time", return_value=2.0):
+        cache.put(batch_fingerprint="fingerprint", metrics={MIN_METRIC_ID: value})
+    with mock.patch.object(persistent_metric_cache.time, "time", return_value=3.0):
+        cache.get(batch_fingerprint="fingerprint", metric_ids=[MAX_METRIC_ID])
+
+    mean_metric_id = ("column.mean", "column=a", ())
+    with mock.patch.object(persistent_metric_cache.time, "time", return_value=4.0):
+        cache.put(batch_fingerprint="fingerprint", metrics={mean_metric_id: value})
+
+    assert cache.get(
+        batch_fingerprint="fingerprint",
+        metric_ids=[MAX_METRIC_ID, MIN_METRIC_ID, mean_metric_id],
+    ).keys() == {MAX_METRIC_ID, mean_metric_id}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"ttl_seconds": 0}, id="ttl_seconds"),
+        pytest.param({"max_bytes": 0}, id="max_bytes"),
+    ],
+)
+def test_invalid_configuration(cache_path: pathlib.Path, kwargs: dict):
+    with pytest.raises(ValueError):
+        PersistentMetricCache(path=cache_path, **kwargs)
+
+
+@pytest.mark.unit
+def test_metrics_are_reused_across_execution_engines(cache_path: pathlib.Path):
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": "my_id", "column": "a"},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs={"batch_id": "my_id", "column": "a"},
+        ),
+    ]
+
+    def compute_metrics(engine: PandasExecutionEngine) -> dict:
+        resolved_metrics, aborted_metrics = MetricsCalculator(
+            execution_engine=engine
+        ).compute_metrics(metric_configurations=metric_configurations)
+        assert aborted_metrics == {}
+        return {
+            metric_configuration.metric_name: resolved_metrics[metric_configuration.id]
+            for metric_configuration in metric_configurations
+        }
+
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df},
+        persistent_metric_cache={"path": str(cache_path)},
+    )
+    assert engine.config["persistent_metric_cache"]["path"] == str(cache_path)
+    expected = {"column.max": 3.0, "column_values.nonnull.unexpected_count": 1}
+    assert compute_metrics(engine=engine) == expected
+
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df.copy()},
+        persistent_metric_cache=PersistentMetricCache(path=cache_path),
+    )
+    with mock.patch.object(
+        PandasExecutionEngine, "resolve_metric_bundle", return_value={}
+    ) as mock_resolve_metric_bundle:
+        assert compute_metrics(engine=engine) == expected
+
+    # Every metric was found in the cache; hence, no aggregate was computed.
+    mock_resolve_metric_bundle.assert_not_called()
+
+    # Changed data has a different fingerprint; hence, its metrics are computed anew.
+    engine.load_batch_data(batch_id="my_id", batch_data=pd.DataFrame({"a": [5, None, None]}))
+    assert compute_metrics(engine=engine) == {
+        "column.max": 5.0,
+        "column_values.nonnull.unexpected_count": 2,
+    }
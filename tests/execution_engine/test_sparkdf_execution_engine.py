@@ -20,6 +20,7 @@ from great_expectations.expectations.row_conditions import (
 from great_expectations.self_check.util import build_spark_engine
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
 from tests.expectations.test_util import get_table_columns_metric
 from tests.test_utils import create_files_in_directory
 
@@ -1120,3 +1121,107 @@ def test_schema_properly_added(spark_session):
     )
     df = engine.dataframe
     assert df.schema == schema
+
+
+def test_domain_records_read_by_several_pending_metrics_are_persisted(spark_session):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, 3, 4], "b": [2, 3, 4, None]},
+        ),
+        batch_id="1234",
+    )
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "spark"}
+    pending_metrics = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": column_name, **domain_kwargs},
+        )
+        for column_name in ("a", "b")
+    ]
+
+    engine.prepare_batch_data_for_metrics(metric_configurations=pending_metrics)
+    data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert data.is_cached
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is data
+    assert data.count() == 2  # noqa: PLR2004
+
+    # Domains read by a single pending metric are not persisted; no longer pending ones are unpersisted.  # noqa: E501
+    engine.prepare_batch_data_for_metrics(metric_configurations=pending_metrics[:1])
+    assert not data.is_cached
+    assert not engine.get_domain_records(domain_kwargs=domain_kwargs).is_cached
+
+
+def _compute_unexpected_counts(engine: SparkDFExecutionEngine, metrics, mocker) -> Tuple[dict, set]:
+    """Returns resolved metrics, and names of metrics that were bundled into aggregate queries."""
+    resolve_metric_bundle_spy = mocker.spy(engine, "resolve_metric_bundle")
+    resolved_metrics, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=metrics,
+        runtime_configuration={"catch_exceptions": False},
+    )
+    assert aborted_metrics == {}
+
+    bundled_metric_names = {
+        metric_fn_configuration.metric_configuration.metric_name
+        for call in resolve_metric_bundle_spy.call_args_list
+        for metric_fn_configuration in call.kwargs["metric_fn_bundle"]
+    }
+    return resolved_metrics, bundled_metric_names
+
+
+def test_column_pair_unexpected_count_is_bundled_with_ignore_row_if(spark_session, mocker):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, None, 4, 5], "b": [1, 3, 3, None, 6]},
+        ),
+        batch_id="1234",
+    )
+    metric = MetricConfiguration(
+        metric_name="column_pair_values.equal.unexpected_count",
+        metric_domain_kwargs={
+            "column_A": "a",
+            "column_B": "b",
+            "ignore_row_if": "either_value_is_missing",
+        },
+    )
+
+    resolved_metrics, bundled_metric_names = _compute_unexpected_counts(
+        engine=engine, metrics=[metric], mocker=mocker
+    )
+
+    # Rows with a missing value are ignored: (2, 3) and (5, 6) are unexpected.
+    assert resolved_metrics[metric.id] == 2  # noqa: PLR2004
+    assert metric.metric_name in bundled_metric_names
+
+
+def test_compound_columns_unique_unexpected_count_is_not_bundled(spark_session, mocker):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 1, 1, 2, 3], "b": [1, 1, 2, 2, 3], "c": [10, 20, 30, 40, 50]},
+        ),
+        batch_id="1234",
+    )
+    compound_columns_metric = MetricConfiguration(
+        metric_name="compound_columns.unique.unexpected_count",
+        metric_domain_kwargs={"column_list": ["a", "b"]},
+    )
+    # Bundled into the same aggregate query as the compound columns condition would be.
+    select_column_values_metric = MetricConfiguration(
+        metric_name="select_column_values.unique.within_record.unexpected_count",
+        metric_domain_kwargs={"column_list": ["a", "b"]},
+    )
+
+    resolved_metrics, bundled_metric_names = _compute_unexpected_counts(
+        engine=engine,
+        metrics=[compound_columns_metric, select_column_values_metric],
+        mocker=mocker,
+    )
+
+    # (1, 1) occurs twice; values within a record repeat in (1, 1) twice and in (2, 2) and (3, 3).
+    assert resolved_metrics[compound_columns_metric.id] == 2  # noqa: PLR2004
+    assert resolved_metrics[select_column_values_metric.id] == 4  # noqa: PLR2004
+    # Spark rejects window functions inside aggregates.
+    assert compound_columns_metric.metric_name not in bundled_metric_names
+    assert select_column_values_metric.metric_name in bundled_metric_names
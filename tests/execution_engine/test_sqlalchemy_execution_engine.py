@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Dict, Tuple, cast
+from typing import Dict, Optional, Tuple, cast
 
 import pandas as pd
 import pytest
@@ -21,6 +21,12 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine import (
+    sqlalchemy_batched_quantiles as sqlalchemy_batched_quantiles_module,
+)
+from great_expectations.execution_engine import (
+    sqlalchemy_batched_value_counts as sqlalchemy_batched_value_counts_module,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -29,6 +35,9 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
     _dialect_requires_persisted_connection,
 )
+from great_expectations.execution_engine.sqlalchemy_value_set_tables import (
+    SqlAlchemyValueSetTables,
+)
 
 # Function to test for spark dataframe equality
 from great_expectations.expectations.row_conditions import (
@@ -39,12 +48,15 @@ from great_expectations.self_check.util import build_sa_execution_engine
 from great_expectations.util import get_sqlalchemy_domain_data
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
 from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 from tests.test_utils import (
+    get_default_postgres_url,
     get_sqlite_table_names,
     get_sqlite_temp_table_names,
     get_sqlite_temp_table_names_from_engine,
+    record_sql_statements,
 )
 
 try:
@@ -1090,6 +1102,584 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     validate_tmp_tables(execution_engine=execution_engine)
 
 
+def _build_file_based_sa_execution_engine(
+    sa, db_path, df: pd.DataFrame, max_query_concurrency=None
+) -> SqlAlchemyExecutionEngine:
+    engine = sa.create_engine(f"sqlite:///{db_path}")
+    add_dataframe_to_db(df=df, name="test", con=engine, index=False)
+    return SqlAlchemyExecutionEngine(
+        engine=engine,
+        batch_data_dict={
+            "1234": SqlAlchemyBatchData(
+                execution_engine=SqlAlchemyExecutionEngine(engine=engine), table_name="test"
+            )
+        },
+        max_query_concurrency=max_query_concurrency,
+    )
+
+
+def _resolve_column_max_on_row_condition_domains(
+    execution_engine: SqlAlchemyExecutionEngine, row_conditions: Tuple[str, ...]
+) -> Tuple[Dict[str, MetricConfiguration], Dict[Tuple[str, str, str], MetricValue]]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    metrics.update(results)
+
+    aggregate_fn_metrics: Dict[str, MetricConfiguration] = {}
+    for row_condition in row_conditions:
+        aggregate_fn_metrics[row_condition] = MetricConfiguration(
+            metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs={
+                "column": "a",
+                "row_condition": row_condition,
+                "condition_parser": "great_expectations__experimental__",
+            },
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metrics[row_condition].metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+
+    metrics.update(
+        execution_engine.resolve_metrics(
+            metrics_to_resolve=aggregate_fn_metrics.values(), metrics=metrics
+        )
+    )
+
+    desired_metrics: Dict[str, MetricConfiguration] = {}
+    for row_condition, aggregate_fn_metric in aggregate_fn_metrics.items():
+        desired_metrics[row_condition] = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=aggregate_fn_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metrics[row_condition].metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+
+    return desired_metrics, metrics
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_concurrently_matches_serial_results(sa, tmp_path, monkeypatch):
+    # File-based sqlite uses a regular connection pool, so it can stand in for a client/server dialect.  # noqa: E501
+    monkeypatch.setattr(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 2, 3, 3]})
+    row_conditions = ('col("b")==1', 'col("b")==2', 'col("b")==3')
+
+    results = {}
+    for max_query_concurrency in (None, 3):
+        execution_engine = _build_file_based_sa_execution_engine(
+            sa, tmp_path / f"{max_query_concurrency}.db", df, max_query_concurrency
+        )
+        desired_metrics, metrics = _resolve_column_max_on_row_condition_domains(
+            execution_engine=execution_engine, row_conditions=row_conditions
+        )
+        resolved = execution_engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics.values(), metrics=metrics
+        )
+        results[max_query_concurrency] = {
+            row_condition: resolved[metric.id] for row_condition, metric in desired_metrics.items()
+        }
+
+    assert results[None] == results[3] == {
+        'col("b")==1': 2,
+        'col("b")==2': 4,
+        'col("b")==3': 6,
+    }
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_concurrently_attributes_errors_to_failed_domain(
+    sa, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    execution_engine = _build_file_based_sa_execution_engine(
+        sa,
+        tmp_path / "test.db",
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": [1, 1, 2, 2]}),
+        max_query_concurrency=2,
+    )
+    desired_metrics, metrics = _resolve_column_max_on_row_condition_domains(
+        execution_engine=execution_engine,
+        row_conditions=('col("b")==1', 'col("does_not_exist")==2'),
+    )
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        execution_engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics.values(), metrics=metrics
+        )
+
+    assert [metric.id for metric in e.value.failed_metrics] == [
+        desired_metrics['col("does_not_exist")==2'].id
+    ]
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_is_serial_for_persisted_connection_dialects(sa, mocker):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": [1, 1, 2, 2]}), sa
+    )
+    execution_engine._max_query_concurrency = 4
+    spy = mocker.spy(execution_engine, "_execute_metric_bundle_queries_concurrently")
+
+    desired_metrics, metrics = _resolve_column_max_on_row_condition_domains(
+        execution_engine=execution_engine, row_conditions=('col("b")==1', 'col("b")==2')
+    )
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics.values(), metrics=metrics
+    )
+
+    assert results[desired_metrics['col("b")==2'].id] == 4
+    spy.assert_not_called()
+
+
+def _compute_column_value_counts(
+    execution_engine: SqlAlchemyExecutionEngine, columns: Tuple[str, ...], sort: str
+) -> Dict[str, pd.Series]:
+    value_counts_metrics = {
+        column: MetricConfiguration(
+            metric_name="column.value_counts",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"sort": sort, "collate": None},
+        )
+        for column in columns
+    }
+    resolved_metrics, aborted_metrics = MetricsCalculator(
+        execution_engine=execution_engine
+    ).compute_metrics(
+        metric_configurations=list(value_counts_metrics.values()),
+        runtime_configuration={"catch_exceptions": False},
+    )
+    assert aborted_metrics == {}
+    return {column: resolved_metrics[metric.id] for column, metric in value_counts_metrics.items()}
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("sort", ["value", "count"])
+def test_batched_column_value_counts_match_per_column_value_counts(sa, sort):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 2, 3, 3, 3, None],
+            "b": ["x", "y", "y", "y", None, "z", "z"],
+            "c": [0.5, 0.5, 0.5, 1.5, 1.5, 2.5, 0.5],
+        }
+    )
+    columns = ("a", "b", "c")
+    execution_engine = build_sa_execution_engine(df, sa)
+
+    with record_sql_statements(execution_engine.engine) as batched_statements:
+        batched = _compute_column_value_counts(execution_engine, columns, sort)
+
+    execution_engine = build_sa_execution_engine(df, sa)
+    execution_engine._batched_value_counts_max_cardinality = None
+    with record_sql_statements(execution_engine.engine) as per_column_statements:
+        per_column = _compute_column_value_counts(execution_engine, columns, sort)
+
+    # Values of all 3 columns are counted by one (instead of 3) "GROUP BY" statements, after one
+    # statement that samples the cardinality of the columns.
+    assert [
+        sum("GROUP BY" in statement for statement in statements)
+        for statements in (batched_statements, per_column_statements)
+    ] == [1, 3]
+    assert len(batched_statements) == len(per_column_statements) - 1
+
+    for column in columns:
+        pd.testing.assert_series_equal(batched[column], per_column[column])
+
+
+@pytest.mark.sqlite
+def test_batched_column_value_counts_skip_high_cardinality_columns(sa, mocker):
+    df = pd.DataFrame({"a": [1, 1, 2, 2], "b": ["x", "x", "y", "y"], "c": [1, 2, 3, 4]})
+    execution_engine = build_sa_execution_engine(df, sa)
+    execution_engine._batched_value_counts_max_cardinality = 2
+    spy = mocker.spy(sqlalchemy_batched_value_counts_module, "_get_batched_column_value_counts")
+
+    value_counts = _compute_column_value_counts(execution_engine, ("a", "b", "c"), "value")
+
+    assert spy.call_args.kwargs["columns"] == ["a", "b"]
+    assert value_counts["a"].to_dict() == {1: 2, 2: 2}
+    assert value_counts["b"].to_dict() == {"x": 2, "y": 2}
+    assert value_counts["c"].to_dict() == {1: 1, 2: 1, 3: 1, 4: 1}
+
+
+QUERY_BATCH_METRICS = (
+    MetricConfiguration(metric_name="table.row_count", metric_domain_kwargs={}),
+    MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": "a"}),
+    MetricConfiguration(metric_name="column.min", metric_domain_kwargs={"column": "a"}),
+    MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"sort": "value", "collate": None},
+    ),
+    MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={
+            "column": "a",
+            "row_condition": 'col("b")=="y"',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ),
+)
+
+
+def _compute_query_batch_metrics(
+    execution_engine: SqlAlchemyExecutionEngine, create_temp_table: Optional[bool] = None
+) -> Tuple[SqlAlchemyBatchData, Dict[Tuple[str, str, str], MetricValue]]:
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["x", "y", "y", "z", "y"]}),
+        name="test_table",
+        con=execution_engine.engine,
+        index=False,
+    )
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeQueryBatchSpec(
+            query="SELECT * FROM test_table WHERE a > 1", create_temp_table=create_temp_table
+        )
+    )
+    execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    resolved_metrics, aborted_metrics = MetricsCalculator(
+        execution_engine=execution_engine
+    ).compute_metrics(
+        metric_configurations=list(QUERY_BATCH_METRICS),
+        runtime_configuration={"catch_exceptions": False},
+    )
+    assert aborted_metrics == {}
+    return batch_data, resolved_metrics
+
+
+@pytest.mark.sqlite
+def test_query_batch_is_materialized_once_for_many_metric_queries(sa, mocker):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+    create_spy = mocker.spy(SqlAlchemyBatchData, "_create_temporary_table")
+
+    with record_sql_statements(execution_engine.engine) as statements:
+        batch_data, resolved_metrics = _compute_query_batch_metrics(execution_engine)
+
+    assert create_spy.call_count == 1
+    # The asset query is run once, into the temporary table, which all metric queries read.
+    assert sum("WHERE a > 1" in statement for statement in statements) == 1
+    assert batch_data.deferred_query is None
+    temp_table_name = batch_data.selectable.name
+    assert temp_table_name in get_sqlite_temp_table_names_from_engine(execution_engine.engine)
+
+    expected_engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", materialize_query_min_domain_queries=None
+    )
+    with record_sql_statements(expected_engine.engine) as expected_statements:
+        expected_batch_data, expected_metrics = _compute_query_batch_metrics(expected_engine)
+    assert expected_batch_data.deferred_query is not None
+    assert sum("WHERE a > 1" in statement for statement in expected_statements) > 1
+    assert create_spy.call_count == 1
+    for metric_configuration in QUERY_BATCH_METRICS:
+        if isinstance(expected_metrics[metric_configuration.id], pd.Series):
+            pd.testing.assert_series_equal(
+                resolved_metrics[metric_configuration.id], expected_metrics[metric_configuration.id]
+            )
+        else:
+            assert (
+                resolved_metrics[metric_configuration.id]
+                == expected_metrics[metric_configuration.id]
+            )
+
+    drop_spy = mocker.spy(execution_engine, "execute_query_in_transaction")
+    execution_engine.close()
+    assert str(drop_spy.call_args.args[0]) == f'DROP TABLE "{temp_table_name}"'
+
+
+@pytest.mark.sqlite
+def test_query_batch_is_not_materialized_for_few_metric_queries(sa):
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", materialize_query_min_domain_queries=10
+    )
+
+    batch_data, _ = _compute_query_batch_metrics(execution_engine)
+
+    assert batch_data.deferred_query is not None
+
+
+@pytest.mark.sqlite
+def test_query_batch_is_not_materialized_if_temp_table_is_explicitly_declined(sa, mocker):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+    create_spy = mocker.spy(SqlAlchemyBatchData, "_create_temporary_table")
+
+    with record_sql_statements(execution_engine.engine) as statements:
+        batch_data, _ = _compute_query_batch_metrics(execution_engine, create_temp_table=False)
+
+    create_spy.assert_not_called()
+    assert batch_data.deferred_query is None
+    assert sum("WHERE a > 1" in statement for statement in statements) > 1
+
+
+FUSED_RESULT_FORMAT = {
+    "result_format": "SUMMARY",
+    "partial_unexpected_count": 2,
+    "unexpected_index_column_names": ["pk"],
+}
+
+FUSED_MAP_CONDITION_METRICS = (
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_values",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y"], "result_format": FUSED_RESULT_FORMAT},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_index_list",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y"], "result_format": FUSED_RESULT_FORMAT},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.unique.unexpected_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"result_format": {"result_format": "COMPLETE"}},
+    ),
+)
+
+
+def _compute_fused_map_condition_metrics(
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    resolved_metrics, aborted_metrics = MetricsCalculator(
+        execution_engine=execution_engine
+    ).compute_metrics(
+        metric_configurations=list(FUSED_MAP_CONDITION_METRICS),
+        runtime_configuration={"catch_exceptions": False},
+    )
+    assert aborted_metrics == {}
+    return resolved_metrics
+
+
+@pytest.mark.sqlite
+def test_fused_map_condition_metrics_match_separate_metric_queries(sa):
+    df = pd.DataFrame(
+        {
+            "pk": [1, 2, 3, 4, 5, 6],
+            "a": [1, 2, 2, 3, 4, 4],
+            "b": ["x", "q", "y", "z", "r", "x"],
+        }
+    )
+    execution_engine = build_sa_execution_engine(df, sa)
+
+    with record_sql_statements(execution_engine.engine) as fused_statements:
+        fused = _compute_fused_map_condition_metrics(execution_engine)
+
+    execution_engine = build_sa_execution_engine(df, sa)
+    execution_engine._fuse_map_condition_queries = False
+    with record_sql_statements(execution_engine.engine) as separate_statements:
+        separate = _compute_fused_map_condition_metrics(execution_engine)
+
+    # Each of the "column_values.in_set" and "column_values.unique" conditions is queried once.
+    assert [
+        (
+            sum("NOT IN" in statement for statement in statements),
+            sum("HAVING" in statement for statement in statements),
+        )
+        for statements in (fused_statements, separate_statements)
+    ] == [(1, 1), (2, 2)]
+    assert len(fused_statements) == len(separate_statements) - 2
+
+    for metric_configuration in FUSED_MAP_CONDITION_METRICS:
+        assert fused[metric_configuration.id] == separate[metric_configuration.id]
+
+    assert fused[FUSED_MAP_CONDITION_METRICS[0].id] == ["q", "z"]
+    assert fused[FUSED_MAP_CONDITION_METRICS[1].id] == [{"pk": 2, "b": "q"}, {"pk": 4, "b": "z"}]
+    assert fused[FUSED_MAP_CONDITION_METRICS[2].id] == 4
+    assert sorted(fused[FUSED_MAP_CONDITION_METRICS[3].id]) == [2, 2, 4, 4]
+
+
+@pytest.mark.sqlite
+def test_fused_map_condition_metrics_leave_invalid_index_columns_to_index_list_metric(sa):
+    df = pd.DataFrame({"a": [1, 2, 2], "b": ["x", "q", "y"]})
+    execution_engine = build_sa_execution_engine(df, sa)
+
+    with pytest.raises(gx_exceptions.MetricResolutionError, match="unexpected_index_column"):
+        _compute_fused_map_condition_metrics(execution_engine)
+
+
+VALUE_SET_METRICS = (
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2, 3, 5]},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_count",
+        metric_domain_kwargs={
+            "column": "a",
+            "row_condition": 'col("a")<6',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        metric_value_kwargs={"value_set": [1, 2, 3, 5]},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_count",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": ["x", "y", "z", "w"]},
+    ),
+    MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_count",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"value_set": [1, "x", "y", "z"]},
+    ),
+)
+
+
+@pytest.mark.sqlite
+def test_large_value_sets_are_loaded_into_shared_temp_tables(sa, mocker):
+    df = pd.DataFrame({"a": [1, 2, 4, 5, 6], "b": ["x", "q", "y", "z", "r"]})
+    execution_engine = build_sa_execution_engine(df, sa)
+    execution_engine._value_set_tables = SqlAlchemyValueSetTables(
+        execution_engine=execution_engine, min_size=4
+    )
+    create_spy = mocker.spy(SqlAlchemyValueSetTables, "_create_value_set_table")
+
+    resolved_metrics, aborted_metrics = MetricsCalculator(
+        execution_engine=execution_engine
+    ).compute_metrics(
+        metric_configurations=list(VALUE_SET_METRICS),
+        runtime_configuration={"catch_exceptions": False},
+    )
+    assert aborted_metrics == {}
+
+    # Integer and string value sets get one table each (the mixed value set is rendered as "IN" list).  # noqa: E501
+    assert create_spy.call_count == 2
+    temp_table_names = get_sqlite_temp_table_names_from_engine(execution_engine.engine)
+    assert len(temp_table_names) == 2  # noqa: PLR2004
+    assert [resolved_metrics[metric.id] for metric in VALUE_SET_METRICS] == [2, 1, 2, 2]
+
+    execution_engine.close()
+    assert not get_sqlite_temp_table_names_from_engine(execution_engine.engine) & temp_table_names
+
+
+@pytest.mark.unit
+def test_batched_quantiles_of_several_columns_are_selected_by_one_statement(sa):
+    from sqlalchemy.dialects import postgresql
+
+    query = sa.select(
+        *sqlalchemy_batched_quantiles_module._build_quantile_selects(
+            dialect_name="postgresql",
+            columns=["a", "b"],
+            quantiles_lists=[[0.25, 0.5], [0.5]],
+        )
+    ).select_from(sa.table("test"))
+    sql = str(
+        query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+    assert sql.count("percentile_disc") == 3  # noqa: PLR2004
+    assert sql.count("WITHIN GROUP (ORDER BY b ASC)") == 1
+    assert sql.count("FROM") == 1
+
+
+@pytest.mark.sqlite
+def test_batched_column_quantiles_fall_back_to_per_column_queries(sa, caplog, mocker):
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [10, 20, 30, 40, 50]})
+    execution_engine = build_sa_execution_engine(df, sa)
+    # SQLite has no "percentile_disc()", so that the batched query fails.
+    mocker.patch.object(
+        sqlalchemy_batched_quantiles_module,
+        "BATCHED_QUANTILES_DIALECTS",
+        {GXSqlDialect.SQLITE},
+    )
+    quantile_metrics = [
+        MetricConfiguration(
+            metric_name="column.quantile_values",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"quantiles": [0.2, 0.4], "allow_relative_error": False},
+        )
+        for column in ("a", "b")
+    ]
+
+    resolved_metrics, aborted_metrics = MetricsCalculator(
+        execution_engine=execution_engine
+    ).compute_metrics(
+        metric_configurations=quantile_metrics,
+        runtime_configuration={"catch_exceptions": False},
+    )
+
+    assert aborted_metrics == {}
+    assert "Batched quantiles of columns ['a', 'b'] could not be computed" in caplog.text
+    assert [resolved_metrics[metric.id] for metric in quantile_metrics] == [[1, 2], [10, 20]]
+
+
+@pytest.mark.postgresql
+def test_batched_column_quantiles_match_per_column_quantiles(sa, test_backends, mocker):
+    if "postgresql" not in test_backends:
+        pytest.skip("test_batched_column_quantiles_match_per_column_quantiles requires postgresql")
+
+    engine = sa.create_engine(get_default_postgres_url())
+    table_name = "batched_column_quantiles"
+    add_dataframe_to_db(
+        df=pd.DataFrame(
+            {
+                "a": [5, 1, 4, 2, 3, 9, 7],
+                "b": [0.5, -1.25, 3.0, 2.5, 10.0, 7.75, 1.0],
+                "c": [70, 10, 60, 20, 50, 30, 40],
+            }
+        ),
+        name=table_name,
+        con=engine,
+        if_exists="replace",
+        index=False,
+    )
+    quantile_metrics = [
+        MetricConfiguration(
+            metric_name="column.quantile_values",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"quantiles": quantiles, "allow_relative_error": False},
+        )
+        for column, quantiles in (
+            ("a", [0.25, 0.5, 0.75]),
+            ("b", [0.1, 0.9]),
+            ("c", [0.5]),
+        )
+    ]
+    get_batched_column_quantile_values = mocker.spy(
+        sqlalchemy_batched_quantiles_module, "_get_batched_column_quantile_values"
+    )
+
+    quantile_values = {}
+    try:
+        for batch_column_quantile_queries in (True, False):
+            execution_engine = SqlAlchemyExecutionEngine(
+                engine=engine, batch_column_quantile_queries=batch_column_quantile_queries
+            )
+            execution_engine.load_batch_data(
+                "batched_column_quantiles_batch",
+                SqlAlchemyBatchData(execution_engine=execution_engine, table_name=table_name),
+            )
+            resolved_metrics, aborted_metrics = MetricsCalculator(
+                execution_engine=execution_engine
+            ).compute_metrics(
+                metric_configurations=quantile_metrics,
+                runtime_configuration={"catch_exceptions": False},
+            )
+            assert aborted_metrics == {}
+            quantile_values[batch_column_quantile_queries] = [
+                resolved_metrics[metric.id] for metric in quantile_metrics
+            ]
+    finally:
+        with engine.begin() as connection:
+            connection.execute(sa.text(f"DROP TABLE IF EXISTS {table_name}"))
+        engine.dispose()
+
+    assert get_batched_column_quantile_values.call_count == 1
+    assert quantile_values[True] == quantile_values[False]
+    assert quantile_values[False] == [[2, 4, 7], [-1.25, 10.0], [40]]
+
+
 @pytest.fixture
 def pd_dataframe() -> pd.DataFrame:
     return pd.DataFrame({"a": [1, 2], "b": [4, 4]})
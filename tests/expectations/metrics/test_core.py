@@ -1,6 +1,7 @@
 import copy
 import datetime
 import logging
+import sqlite3
 from decimal import Decimal
 from typing import Dict, Tuple, Union
 
@@ -27,6 +28,10 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (  # noqa: E501
+    _get_column_quantiles_sqlite,
+    _get_column_quantiles_sqlite_by_offset,
+)
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_column_names,
 )
@@ -39,6 +44,7 @@ from great_expectations.self_check.util import (
 from great_expectations.util import isclose
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -61,12 +67,24 @@ def test_basic_metric_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
 
@@ -102,12 +120,24 @@ def test_column_sum_metric_pd(build_engine, dataframe, expected_result):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.sum.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.sum",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
@@ -187,12 +217,24 @@ def test_column_mean_metric_pd(dataframe, expected_result):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.mean.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
@@ -274,12 +316,24 @@ def test_column_standard_deviation_metric_pd(build_engine, dataframe, expected_r
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.standard_deviation.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.standard_deviation",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
@@ -740,6 +794,70 @@ def test_quantiles_metric_pd():
     assert results == {desired_metric.id: [1.75, 2.5, 3.25]}
 
 
+@pytest.mark.unit
+def test_quantiles_metric_pd_with_relative_error():
+    engine = build_pandas_engine(pd.DataFrame({"a": list(range(1, 101))}))
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.quantile_sketch.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
+    quantile_sketch_metric = MetricConfiguration(
+        metric_name="column.quantile_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    quantile_sketch_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(quantile_sketch_metric,), metrics=metrics)
+    metrics.update(results)
+
+    desired_metrics = (
+        MetricConfiguration(
+            metric_name="column.quantile_values",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                "quantiles": [0.0, 2.5e-1, 5.0e-1, 7.5e-1, 1.0],
+                "allow_relative_error": 0.01,
+            },
+        ),
+        MetricConfiguration(
+            metric_name="column.median",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"allow_relative_error": 0.01},
+        ),
+    )
+    for desired_metric in desired_metrics:
+        desired_metric.metric_dependencies = {
+            "column.quantile_sketch": quantile_sketch_metric,
+            "table.columns": table_columns_metric,
+        }
+
+    results = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+    # Sketch retains all of these few values; hence, its quantiles are exact ("PERCENTILE_DISC").
+    assert results == {
+        desired_metrics[0].id: [1.0, 25.0, 50.0, 75.0, 100.0],
+        desired_metrics[1].id: 50.0,
+    }
+
+
 @pytest.mark.sqlite
 def test_quantiles_metric_sa(sa):
     engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 3, 4]}), sa)
@@ -788,6 +906,65 @@ def test_quantiles_metric_sa(sa):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+@pytest.mark.sqlite
+def test_quantiles_sqlite_are_selected_by_one_query(sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [5, 3, 1, 4, 2, 2]}), sa)
+    column = sa.column("a")
+    selectable = engine.get_domain_records(domain_kwargs={})
+    quantiles = [0.0, 0.1, 0.25, 0.5, 0.5, 0.75, 1.0]
+
+    statements = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine.engine, "before_cursor_execute", _record_statement)
+    quantile_values = _get_column_quantiles_sqlite(
+        column=column,
+        quantiles=quantiles,
+        selectable=selectable,
+        execution_engine=engine,
+        table_row_count=6,
+    )
+    sa.event.remove(engine.engine, "before_cursor_execute", _record_statement)
+
+    assert len(statements) == 1
+    assert quantile_values == [1, 1, 1, 2, 2, 3, 5]
+    # Same values as those selected by one "ORDER BY ... OFFSET" query per quantile.
+    assert quantile_values == _get_column_quantiles_sqlite_by_offset(
+        column=column,
+        offsets=[0, 0, 0, 2, 2, 3, 5],
+        selectable=selectable,
+        execution_engine=engine,
+    )
+
+
+@pytest.mark.sqlite
+def test_quantiles_sqlite_without_window_functions_are_selected_by_offset(sa, monkeypatch):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [5, 3, 1, 4, 2, 2]}), sa)
+    selectable = engine.get_domain_records(domain_kwargs={})
+    monkeypatch.setattr(sqlite3, "sqlite_version_info", (3, 24, 0))
+
+    statements = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine.engine, "before_cursor_execute", _record_statement)
+    quantile_values = _get_column_quantiles_sqlite(
+        column=sa.column("a"),
+        quantiles=[0.0, 0.5, 1.0],
+        selectable=selectable,
+        execution_engine=engine,
+        table_row_count=6,
+    )
+    sa.event.remove(engine.engine, "before_cursor_execute", _record_statement)
+
+    assert quantile_values == [1, 2, 5]
+    assert len(statements) == 3  # noqa: PLR2004
+    assert not any("ROW_NUMBER" in statement.upper() for statement in statements)
+
+
 @pytest.mark.spark
 def test_quantiles_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -905,6 +1082,19 @@ def test_column_histogram_metric_sa(sa):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.histogram.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "bins": [0.0, 0.9, 1.8, 2.7, 3.6, 4.5, 5.4, 6.3, 7.2, 8.1, 9.0],
+        },
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.histogram",
         metric_domain_kwargs={"column": "a"},
@@ -913,12 +1103,26 @@ def test_column_histogram_metric_sa(sa):
         },
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
     metrics.update(results)
     assert results == {desired_metric.id: [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]}
 
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.histogram.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={
+            "bins": [0.0],
+        },
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.histogram",
         metric_domain_kwargs={"column": "b"},
@@ -927,6 +1131,7 @@ def test_column_histogram_metric_sa(sa):
         },
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
@@ -934,6 +1139,50 @@ def test_column_histogram_metric_sa(sa):
     assert results == {desired_metric.id: [10]}
 
 
+@pytest.mark.sqlite
+def test_column_histograms_metric_sa_are_bundled_with_other_aggregates(sa):
+    engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [0, 1, 2, 3, None], "b": [None, None, None, None, None]}), sa
+    )
+    desired_metrics = (
+        MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"bins": (-np.inf, 1.0, 2.0, np.inf)},
+        ),
+        MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={"bins": (0.0, 1.0)},
+        ),
+        MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": "a"}),
+    )
+
+    statements = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    calculator = MetricsCalculator(execution_engine=engine)
+    # Metrics, on which the histograms depend (e.g., "table.columns"), are resolved first.
+    calculator.columns()
+    sa.event.listen(engine.engine, "before_cursor_execute", _record_statement)
+    resolved_metrics, aborted_metrics = calculator.compute_metrics(
+        metric_configurations=list(desired_metrics),
+        runtime_configuration={"catch_exceptions": False},
+    )
+    sa.event.remove(engine.engine, "before_cursor_execute", _record_statement)
+
+    assert aborted_metrics == {}
+    assert [resolved_metrics[metric.id] for metric in desired_metrics] == [
+        [1, 1, 2],
+        # Histograms of all-null columns are null (as no value is counted).
+        [None],
+        3,
+    ]
+    assert len([statement for statement in statements if "sum(CASE" in statement]) == 1
+
+
 @pytest.mark.spark
 def test_column_histogram_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -981,7 +1230,7 @@ def test_column_histogram_metric_spark(spark_session):
 
 
 @pytest.mark.big
-def test_column_partition_metric_pd():
+def test_column_partition_metric_pd():  # noqa: PLR0915
     """
     Test of "column.partition" metric for both, standard numeric column and "datetime.datetime" valued column.
 
@@ -1038,11 +1287,37 @@ def test_column_partition_metric_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    column_min_partial_metric = MetricConfiguration(
+        metric_name=f"column.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_min_partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_max_partial_metric = MetricConfiguration(
+        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_max_partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_min_partial_metric,
+            column_max_partial_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     column_min_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.min",
         metric_domain_kwargs={"column": "a"},
     )
     column_min_metric.metric_dependencies = {
+        "metric_partial_fn": column_min_partial_metric,
         "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
@@ -1050,6 +1325,7 @@ def test_column_partition_metric_pd():
         metric_domain_kwargs={"column": "a"},
     )
     column_max_metric.metric_dependencies = {
+        "metric_partial_fn": column_max_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -1090,11 +1366,37 @@ def test_column_partition_metric_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    column_min_partial_metric = MetricConfiguration(
+        metric_name=f"column.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs=None,
+    )
+    column_min_partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_max_partial_metric = MetricConfiguration(
+        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs=None,
+    )
+    column_max_partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_min_partial_metric,
+            column_max_partial_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     column_min_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.min",
         metric_domain_kwargs={"column": "b"},
     )
     column_min_metric.metric_dependencies = {
+        "metric_partial_fn": column_min_partial_metric,
         "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
@@ -1102,6 +1404,7 @@ def test_column_partition_metric_pd():
         metric_domain_kwargs={"column": "b"},
     )
     column_max_metric.metric_dependencies = {
+        "metric_partial_fn": column_max_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -1593,12 +1896,24 @@ def test_max_metric_column_exists_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
@@ -1620,18 +1935,18 @@ def test_max_metric_column_does_not_exist_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
-    desired_metric = MetricConfiguration(
-        metric_name="column.max",
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
         metric_domain_kwargs={"column": "non_existent_column"},
         metric_value_kwargs=None,
     )
-    desired_metric.metric_dependencies = {
+    partial_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
 
     with pytest.raises(gx_exceptions.MetricResolutionError) as eee:
         # noinspection PyUnusedLocal
-        results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+        results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
         metrics.update(results)
     assert str(eee.value) == 'Error: The column "non_existent_column" in BatchData does not exist.'
 
@@ -2699,20 +3014,44 @@ def test_z_score_under_threshold_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    mean_aggregate_fn = MetricConfiguration(
+        metric_name=f"column.mean.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    mean_aggregate_fn.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(mean_aggregate_fn,), metrics=metrics)
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": mean_aggregate_fn,
+        "table.columns": table_columns_metric,
+    }
+    stdev_aggregate_fn = MetricConfiguration(
+        metric_name=f"column.standard_deviation.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    stdev_aggregate_fn.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
+    results = engine.resolve_metrics(metrics_to_resolve=(stdev_aggregate_fn,), metrics=metrics)
+    metrics.update(results)
+
     stdev = MetricConfiguration(
         metric_name="column.standard_deviation",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": stdev_aggregate_fn,
         "table.columns": table_columns_metric,
     }
     desired_metrics = (mean, stdev)
@@ -3401,6 +3740,21 @@ def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_A": "b",
+            "column_B": "c",
+        },
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics)
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -3410,7 +3764,7 @@ def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -3482,6 +3836,21 @@ def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_A": "a",
+            "column_B": "d",
+        },
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics)
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -3491,7 +3860,7 @@ def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -4609,32 +4978,88 @@ def test_batch_aggregate_metrics_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    desired_aggregate_fn_metric_1 = MetricConfiguration(
+        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    desired_aggregate_fn_metric_1.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_aggregate_fn_metric_1,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric_1 = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "a"},
     )
     desired_metric_1.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_1,
         "table.columns": table_columns_metric,
     }
+    desired_aggregate_fn_metric_2 = MetricConfiguration(
+        metric_name=f"column.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    desired_aggregate_fn_metric_2.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_aggregate_fn_metric_2,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric_2 = MetricConfiguration(
         metric_name="column.min",
         metric_domain_kwargs={"column": "a"},
     )
     desired_metric_2.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_2,
+        "table.columns": table_columns_metric,
+    }
+    desired_aggregate_fn_metric_3 = MetricConfiguration(
+        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs=None,
+    )
+    desired_aggregate_fn_metric_3.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_aggregate_fn_metric_3,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric_3 = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "b"},
     )
     desired_metric_3.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_3,
+        "table.columns": table_columns_metric,
+    }
+    desired_aggregate_fn_metric_4 = MetricConfiguration(
+        metric_name=f"column.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs=None,
+    )
+    desired_aggregate_fn_metric_4.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_aggregate_fn_metric_4,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric_4 = MetricConfiguration(
         metric_name="column.min",
         metric_domain_kwargs={"column": "b"},
     )
     desired_metric_4.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_4,
         "table.columns": table_columns_metric,
     }
 
@@ -5354,6 +5779,20 @@ def test_map_multicolumn_sum_equal_spark(spark_session):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b"],
+        },
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics)
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -5362,7 +5801,7 @@ def test_map_multicolumn_sum_equal_spark(spark_session):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -5433,6 +5872,20 @@ def test_map_multicolumn_sum_equal_spark(spark_session):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b", "c"],
+        },
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics)
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -5441,7 +5894,7 @@ def test_map_multicolumn_sum_equal_spark(spark_session):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -6606,6 +7059,21 @@ def test_map_select_column_values_unique_within_record_spark(  # noqa: PLR0915 #
     )
     metrics.update(results)
 
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b", "c"],
+            "ignore_row_if": "all_values_are_missing",
+        },
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics)
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -6615,7 +7083,7 @@ def test_map_select_column_values_unique_within_record_spark(  # noqa: PLR0915 #
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -6702,6 +7170,21 @@ def test_map_select_column_values_unique_within_record_spark(  # noqa: PLR0915 #
     )
     metrics.update(results)
 
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b", "c"],
+            "ignore_row_if": "any_value_is_missing",
+        },
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics)
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -6711,7 +7194,7 @@ def test_map_select_column_values_unique_within_record_spark(  # noqa: PLR0915 #
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
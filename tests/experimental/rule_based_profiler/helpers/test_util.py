@@ -0,0 +1,67 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from great_expectations.experimental.rule_based_profiler.helpers import util
+from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    compute_bootstrap_quantiles_point_estimate,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _bootstrap_value_range(
+    num_metric_values: int, quantile_bias_correction: bool
+) -> List[float]:
+    return compute_bootstrap_quantiles_point_estimate(
+        metric_values=np.arange(num_metric_values, dtype=float) ** 1.5 % 97,
+        false_positive_rate=np.float64(0.05),
+        n_resamples=9999,
+        quantile_statistic_interpolation_method="linear",
+        quantile_bias_correction=quantile_bias_correction,
+        quantile_bias_std_error_ratio_threshold=0.25,
+        random_seed=43792,
+    ).value_range.tolist()
+
+
+# Expected ranges were computed by drawing all resamples as one "(n_resamples, num_metric_values)" matrix.
+@pytest.mark.parametrize(
+    "num_metric_values,quantile_bias_correction,expected_value_range",
+    [
+        pytest.param(20, False, [0.4750000000000001, 76.83982467076913], id="one_block"),
+        pytest.param(
+            20, True, [0.4750000000000001, 79.7545948366881], id="one_block_bias_corrected"
+        ),
+        # 9999 resamples of 200 values exceed "BOOTSTRAP_RESAMPLES_BLOCK_MAX_NUM_VALUES" (two blocks).
+        pytest.param(200, False, [2.4967740350836842, 92.83961854391984], id="two_blocks"),
+        pytest.param(
+            200, True, [2.7827164466275365, 92.59810959809093], id="two_blocks_bias_corrected"
+        ),
+    ],
+)
+def test_compute_bootstrap_quantiles_point_estimate_with_random_seed(
+    num_metric_values: int,
+    quantile_bias_correction: bool,
+    expected_value_range: List[float],
+):
+    assert (
+        _bootstrap_value_range(
+            num_metric_values=num_metric_values,
+            quantile_bias_correction=quantile_bias_correction,
+        )
+        == pytest.approx(expected_value_range, rel=1e-12)
+    )
+
+
+def test_compute_bootstrap_quantiles_point_estimate_does_not_depend_on_block_size(monkeypatch):
+    value_range: List[float] = _bootstrap_value_range(
+        num_metric_values=20, quantile_bias_correction=True
+    )
+
+    # Blocks of 7 resamples of 20 values (the last of them partial, since 9999 resamples are drawn).
+    monkeypatch.setattr(util, "BOOTSTRAP_RESAMPLES_BLOCK_MAX_NUM_VALUES", 140)
+
+    assert (
+        _bootstrap_value_range(num_metric_values=20, quantile_bias_correction=True) == value_range
+    )
@@ -0,0 +1,275 @@
+from typing import List
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from great_expectations.core.domain import Domain
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.datasource.fluent.interfaces import Batch
+from great_expectations.experimental.rule_based_profiler.config import ParameterBuilderConfig
+from great_expectations.experimental.rule_based_profiler.domain_builder import (
+    ColumnDomainBuilder,
+)
+from great_expectations.experimental.rule_based_profiler.parameter_builder import (
+    HistogramSingleBatchParameterBuilder,
+    MetricMultiBatchParameterBuilder,
+    NumericMetricRangeMultiBatchParameterBuilder,
+    ParameterBuilder,
+)
+from great_expectations.experimental.rule_based_profiler.rule import Rule
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def batch(ephemeral_context_with_defaults: AbstractDataContext) -> Batch:
+    datasource = ephemeral_context_with_defaults.data_sources.add_pandas("my_datasource")
+    asset = datasource.add_dataframe_asset(
+        "my_asset", dataframe=pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    )
+    return asset.add_batch_definition_whole_dataframe("my_batch_definition").get_batch()
+
+
+@pytest.fixture
+def column_max_parameter_builder(
+    ephemeral_context_with_defaults: AbstractDataContext, batch: Batch
+) -> MetricMultiBatchParameterBuilder:
+    parameter_builder = MetricMultiBatchParameterBuilder(
+        name="column_max",
+        metric_name="column.max",
+        metric_domain_kwargs="$domain.domain_kwargs",
+        single_batch_mode=True,
+        data_context=ephemeral_context_with_defaults,
+    )
+    parameter_builder.set_batch_list_if_null_batch_request(batch_list=[batch])
+    return parameter_builder
+
+
+@pytest.fixture
+def rule(
+    ephemeral_context_with_defaults: AbstractDataContext,
+    column_max_parameter_builder: MetricMultiBatchParameterBuilder,
+) -> Rule:
+    return Rule(
+        name="my_rule",
+        domain_builder=ColumnDomainBuilder(
+            include_column_names=["a", "b"],
+            data_context=ephemeral_context_with_defaults,
+        ),
+        parameter_builders=[column_max_parameter_builder],
+    )
+
+
+def _column_domain(column: str) -> Domain:
+    return Domain(domain_type=MetricDomainTypes.COLUMN, domain_kwargs={"column": column})
+
+
+def _spy_column_max_graphs(mocker: MockerFixture) -> List[List[MetricConfiguration]]:
+    """Returns (updated in place) "column.max" configurations of every "ValidationGraph" built."""
+    graphs: List[List[MetricConfiguration]] = []
+    build_metric_dependency_graph = MetricsCalculator.build_metric_dependency_graph
+
+    def _build_metric_dependency_graph(self, metric_configurations, **kwargs):
+        column_max_configurations = [
+            metric_configuration
+            for metric_configuration in metric_configurations
+            if metric_configuration.metric_name == "column.max"
+        ]
+        if column_max_configurations:
+            graphs.append(column_max_configurations)
+
+        return build_metric_dependency_graph(
+            self, metric_configurations=metric_configurations, **kwargs
+        )
+
+    mocker.patch.object(
+        MetricsCalculator, "build_metric_dependency_graph", _build_metric_dependency_graph
+    )
+    return graphs
+
+
+def _column_max_values(rule_state) -> dict:
+    return {
+        domain.domain_kwargs["column"]: rule_state.parameters[domain.id].parameter_nodes[
+            "parameter"
+        ]["parameter"]["column_max"]["value"]
+        for domain in rule_state.domains
+    }
+
+
+def test_build_metric_configurations_combines_batches_and_value_kwargs(
+    column_max_parameter_builder: MetricMultiBatchParameterBuilder, batch: Batch
+):
+    (
+        batch_ids,
+        domain_kwargs,
+        metric_value_kwargs,
+        metric_configurations,
+    ) = column_max_parameter_builder._build_metric_configurations(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs="$domain.domain_kwargs",
+        metric_value_kwargs=[{"quantiles": [0.5]}, {"quantiles": [0.25, 0.75]}],
+        domain=_column_domain("a"),
+    )
+
+    assert batch_ids == [batch.id]
+    assert domain_kwargs == {"column": "a"}
+    assert metric_value_kwargs == [{"quantiles": [0.5]}, {"quantiles": [0.25, 0.75]}]
+    assert [
+        (
+            metric_configuration.metric_name,
+            metric_configuration.metric_domain_kwargs,
+            metric_configuration.metric_value_kwargs,
+        )
+        for metric_configuration in metric_configurations
+    ] == [
+        ("column.quantile_values", {"column": "a", "batch_id": batch.id}, {"quantiles": [0.5]}),
+        (
+            "column.quantile_values",
+            {"column": "a", "batch_id": batch.id},
+            {"quantiles": [0.25, 0.75]},
+        ),
+    ]
+
+
+def test_get_metric_configurations_plans_own_metric(
+    column_max_parameter_builder: MetricMultiBatchParameterBuilder, batch: Batch
+):
+    metric_configurations = column_max_parameter_builder.get_metric_configurations(
+        domain=_column_domain("a")
+    )
+
+    assert [
+        (metric_configuration.metric_name, metric_configuration.metric_domain_kwargs)
+        for metric_configuration in metric_configurations
+    ] == [("column.max", {"column": "a", "batch_id": batch.id})]
+
+
+def test_get_metric_configurations_plans_only_suite_parameter_builders(
+    ephemeral_context_with_defaults: AbstractDataContext, batch: Batch
+):
+    suite_parameter_builder_configs = [
+        ParameterBuilderConfig(
+            module_name="great_expectations.experimental.rule_based_profiler.parameter_builder",
+            class_name="MetricMultiBatchParameterBuilder",
+            name="column_min",
+            metric_name="column.min",
+            metric_domain_kwargs="$domain.domain_kwargs",
+            single_batch_mode=True,
+        )
+    ]
+    parameter_builders: List[ParameterBuilder] = [
+        # "column.histogram" arguments depend on bins computed from "column.partition".
+        HistogramSingleBatchParameterBuilder(
+            name="histogram",
+            suite_parameter_builder_configs=suite_parameter_builder_configs,
+            data_context=ephemeral_context_with_defaults,
+        ),
+        # Metric values come from the referenced "MetricMultiBatchParameterBuilder".
+        NumericMetricRangeMultiBatchParameterBuilder(
+            name="column_min_range",
+            metric_multi_batch_parameter_builder_name="column_min",
+            suite_parameter_builder_configs=suite_parameter_builder_configs,
+            data_context=ephemeral_context_with_defaults,
+        ),
+    ]
+
+    for parameter_builder in parameter_builders:
+        parameter_builder.set_batch_list_if_null_batch_request(batch_list=[batch])
+        metric_configurations = parameter_builder.get_metric_configurations(
+            domain=_column_domain("a")
+        )
+        assert [
+            (metric_configuration.metric_name, metric_configuration.metric_domain_kwargs)
+            for metric_configuration in metric_configurations
+        ] == [("column.min", {"column": "a", "batch_id": batch.id})]
+
+
+def test_get_metrics_uses_resolved_metrics(
+    column_max_parameter_builder: MetricMultiBatchParameterBuilder,
+    mocker: MockerFixture,
+):
+    domain = _column_domain("a")
+    (metric_configuration,) = column_max_parameter_builder.get_metric_configurations(
+        domain=domain
+    )
+    column_max_parameter_builder.resolved_metrics = {metric_configuration.id: 42}
+    get_validator = mocker.spy(column_max_parameter_builder, "get_validator")
+
+    metric_computation_result = column_max_parameter_builder.get_metrics(
+        metric_name="column.max",
+        metric_domain_kwargs="$domain.domain_kwargs",
+        limit=1,
+        domain=domain,
+    )
+
+    assert metric_computation_result.attributed_resolved_metrics[0].conditioned_metric_values == [
+        42
+    ]
+    get_validator.assert_not_called()
+
+
+def test_rule_resolves_planned_metrics_of_all_domains_in_one_pass(
+    rule: Rule,
+    column_max_parameter_builder: MetricMultiBatchParameterBuilder,
+    batch: Batch,
+    mocker: MockerFixture,
+):
+    graphs = _spy_column_max_graphs(mocker)
+
+    rule_state = rule.run(batch_list=[batch])
+
+    assert _column_max_values(rule_state) == {"a": [3], "b": [6]}
+    assert len(graphs) == 1
+    assert sorted(
+        metric_configuration.metric_domain_kwargs["column"] for metric_configuration in graphs[0]
+    ) == ["a", "b"]
+    assert column_max_parameter_builder.resolved_metrics == {}
+
+
+def test_rule_computes_metrics_per_domain_when_planning_is_declined(
+    rule: Rule,
+    column_max_parameter_builder: MetricMultiBatchParameterBuilder,
+    batch: Batch,
+    mocker: MockerFixture,
+):
+    mocker.patch.object(
+        column_max_parameter_builder,
+        "get_metric_configurations",
+        side_effect=ValueError("depends on parameters not yet computed"),
+    )
+    graphs = _spy_column_max_graphs(mocker)
+
+    rule_state = rule.run(batch_list=[batch])
+
+    assert _column_max_values(rule_state) == {"a": [3], "b": [6]}
+    assert len(graphs) == 2
+
+
+def test_rule_computes_metrics_per_domain_when_planned_resolution_fails(
+    rule: Rule,
+    batch: Batch,
+    mocker: MockerFixture,
+):
+    compute_metrics = MetricsCalculator.compute_metrics
+
+    def _compute_metrics(self, metric_configurations, **kwargs):
+        if any(
+            metric_configuration.metric_name == "column.max"
+            for metric_configuration in metric_configurations
+        ):
+            raise RuntimeError("planned resolution failed")
+
+        return compute_metrics(self, metric_configurations=metric_configurations, **kwargs)
+
+    mocker.patch.object(MetricsCalculator, "compute_metrics", _compute_metrics)
+    graphs = _spy_column_max_graphs(mocker)
+
+    rule_state = rule.run(batch_list=[batch])
+
+    assert _column_max_values(rule_state) == {"a": [3], "b": [6]}
+    assert len(graphs) == 2
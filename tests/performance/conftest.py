@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def skip_unless_performance_tests_requested(request: pytest.FixtureRequest) -> None:
+    if not request.config.getoption("--performance-tests"):
+        pytest.skip("Performance tests are only run with the --performance-tests option.")
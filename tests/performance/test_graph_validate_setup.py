@@ -0,0 +1,59 @@
+"""Benchmark "Validator.graph_validate" for suites of 10 to 10,000 Expectations over a small Batch.
+
+With little data, run time is dominated by per-Expectation setup (configuration copies and
+"Expectation" construction) rather than by metric computation.  Run with:
+
+    pytest --performance-tests tests/performance/test_graph_validate_setup.py
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.validator import Validator
+
+pytestmark = pytest.mark.performance
+
+COLUMNS = ("a", "b", "c", "d")
+
+
+@pytest.fixture
+def validator() -> Validator:
+    context = gx.get_context(mode="ephemeral")
+    asset = context.data_sources.add_pandas("my_datasource").add_dataframe_asset("my_asset")
+    df = pd.DataFrame({column: [1, 2, None, 4, 5] * 20 for column in COLUMNS})
+    return context.get_validator(batch_request=asset.build_batch_request(dataframe=df))
+
+
+def _build_expectation_configurations(num_expectations: int) -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            type="expect_column_values_to_not_be_null",
+            kwargs={
+                "column": COLUMNS[idx % len(COLUMNS)],
+                "mostly": round(0.5 + (idx % 30) / 100, 2),
+            },
+        )
+        for idx in range(num_expectations)
+    ]
+
+
+@pytest.mark.parametrize("num_expectations", [10, 100, 1_000, 10_000])
+def test_graph_validate(benchmark, validator: Validator, num_expectations: int):
+    configurations = _build_expectation_configurations(num_expectations)
+
+    results = benchmark.pedantic(
+        validator.graph_validate,
+        kwargs={"configurations": configurations, "runtime_configuration": {}},
+        rounds=3,
+    )
+
+    assert len(results) == num_expectations
+    assert all(result.success for result in results)
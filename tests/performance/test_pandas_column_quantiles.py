@@ -0,0 +1,65 @@
+"""Benchmark "column.quantile_values" of a 10M-row pandas column, estimated by quantile sketch or computed exactly.
+
+Compares "allow_relative_error=True" (quantile sketch, updated in bounded blocks) against exact quantiles, and
+reports the largest rank error of the estimated quantiles.  Run with:
+
+    pytest --performance-tests tests/performance/test_pandas_column_quantiles.py
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.self_check.util import build_pandas_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+pytestmark = pytest.mark.performance
+
+NUM_ROWS = 10_000_000
+
+QUANTILES = np.linspace(0.01, 0.99, 99).tolist()
+
+
+@pytest.fixture(scope="module")
+def values() -> np.ndarray:
+    return np.random.default_rng(seed=42).normal(size=NUM_ROWS)
+
+
+@pytest.fixture(scope="module")
+def execution_engine(values: np.ndarray) -> PandasExecutionEngine:
+    return build_pandas_engine(pd.DataFrame({"a": values}))
+
+
+@pytest.mark.parametrize("allow_relative_error", [True, False])
+def test_pandas_column_quantiles(
+    benchmark,
+    execution_engine: PandasExecutionEngine,
+    values: np.ndarray,
+    allow_relative_error: bool,
+):
+    metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": QUANTILES,
+            "allow_relative_error": allow_relative_error,
+        },
+    )
+
+    def _compute_quantiles() -> list:
+        resolved_metrics, _ = MetricsCalculator(execution_engine=execution_engine).compute_metrics(
+            metric_configurations=[metric],
+            runtime_configuration={"catch_exceptions": False},
+        )
+        return resolved_metrics[metric.id]
+
+    quantile_values = benchmark.pedantic(_compute_quantiles, rounds=3)
+
+    ranks = np.searchsorted(np.sort(values), quantile_values, side="right") / NUM_ROWS
+    max_rank_error = float(np.abs(ranks - QUANTILES).max())
+    benchmark.extra_info["max_rank_error"] = max_rank_error
+    assert max_rank_error <= 0.01  # noqa: PLR2004
@@ -0,0 +1,76 @@
+"""Benchmark pandas column map Expectations validated with "SUMMARY" result format.
+
+Unexpected counts, values, index lists, and rows of all map conditions of a Domain are derived from one bit-packed
+mask matrix, unless "fuse_map_condition_metrics" is disabled.  Run with:
+
+    pytest --performance-tests tests/performance/test_pandas_map_metrics.py
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.validator import Validator
+
+pytestmark = pytest.mark.performance
+
+NUM_ROWS = 1_000_000
+NUM_COLUMNS = 10
+
+RESULT_FORMAT = {
+    "result_format": "SUMMARY",
+    "partial_unexpected_count": 20,
+    "unexpected_index_column_names": ["pk"],
+}
+
+
+@pytest.fixture
+def validator() -> Validator:
+    rng = np.random.default_rng(seed=42)
+    df = pd.DataFrame(
+        {f"c{idx}": rng.integers(0, 100, size=NUM_ROWS) for idx in range(NUM_COLUMNS)}
+    ).assign(pk=range(NUM_ROWS))
+
+    context = gx.get_context(mode="ephemeral")
+    asset = context.data_sources.add_pandas("my_datasource").add_dataframe_asset("my_asset")
+    return context.get_validator(batch_request=asset.build_batch_request(dataframe=df))
+
+
+def _build_expectation_configurations() -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            type="expect_column_values_to_be_between",
+            kwargs={"column": f"c{idx}", "min_value": 0, "max_value": 89},
+        )
+        for idx in range(NUM_COLUMNS)
+    ] + [
+        ExpectationConfiguration(
+            type="expect_column_values_to_be_in_set",
+            kwargs={"column": f"c{idx}", "value_set": list(range(95))},
+        )
+        for idx in range(NUM_COLUMNS)
+    ]
+
+
+@pytest.mark.parametrize("fuse_map_condition_metrics", [True, False])
+def test_map_metrics(benchmark, validator: Validator, fuse_map_condition_metrics: bool):
+    validator.execution_engine._fuse_map_condition_metrics = fuse_map_condition_metrics
+    configurations = _build_expectation_configurations()
+    runtime_configuration = {"result_format": RESULT_FORMAT}
+
+    results = benchmark.pedantic(
+        validator.graph_validate,
+        kwargs={"configurations": configurations, "runtime_configuration": runtime_configuration},
+        rounds=3,
+    )
+
+    assert len(results) == len(configurations)
+    assert all(len(result.result["partial_unexpected_index_list"]) == 20 for result in results)
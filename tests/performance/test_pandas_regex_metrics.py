@@ -0,0 +1,82 @@
+"""Benchmark regex conditions of "column_values.match_regex" family metrics over a 50M-row pandas string column.
+
+Compares the shared regex evaluation layer (cached compiled patterns, and combined "_list" patterns) against
+per-pattern "Series.astype(str).str.contains".  Requires about 8 GB of memory.
+Run with:
+
+    pytest --performance-tests tests/performance/test_pandas_regex_metrics.py
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility import pyarrow
+from great_expectations.execution_engine.pandas_regex import (
+    series_matches_regex,
+    series_matches_regex_list,
+)
+
+pytestmark = pytest.mark.performance
+
+NUM_ROWS = 50_000_000
+
+REGEX = r"^[a-z]+-\d{3}$"
+REGEX_LIST = [r"^abc", r"\d{3}$", r"-9", r"x", r"^[a-f]+-"]
+
+
+@pytest.fixture(scope="module")
+def string_values() -> np.ndarray:
+    rng = np.random.default_rng(seed=42)
+    words = np.array(["abc", "def", "xyz", "fedcba", "ghij", "q"], dtype=object)
+    numbers = rng.integers(0, 1000, size=NUM_ROWS).astype(str).astype(object)
+    return words[rng.integers(0, len(words), size=NUM_ROWS)] + "-" + numbers
+
+
+@pytest.fixture(params=["object", "string[pyarrow]"])
+def column(request, string_values: np.ndarray) -> pd.Series:
+    if request.param == "string[pyarrow]" and not pyarrow.pyarrow:
+        pytest.skip("pyarrow is not installed")
+
+    return pd.Series(string_values, dtype=request.param)
+
+
+def _str_contains_regex_list(column: pd.Series, regex_list: List[str], match_on: str) -> pd.Series:
+    regex_match_df = pd.concat(
+        [column.astype(str).str.contains(regex) for regex in regex_list],
+        axis=1,
+        ignore_index=True,
+    )
+    if match_on == "any":
+        return regex_match_df.any(axis="columns")
+
+    return regex_match_df.all(axis="columns")
+
+
+@pytest.mark.parametrize("use_regex_layer", [True, False])
+def test_match_regex(benchmark, column: pd.Series, use_regex_layer: bool):
+    if use_regex_layer:
+        result = benchmark.pedantic(
+            series_matches_regex, kwargs={"column": column, "regex": REGEX}, rounds=3
+        )
+    else:
+        result = benchmark.pedantic(lambda: column.astype(str).str.contains(REGEX), rounds=3)
+
+    assert len(result) == NUM_ROWS
+
+
+@pytest.mark.parametrize("match_on", ["any", "all"])
+@pytest.mark.parametrize("use_regex_layer", [True, False])
+def test_match_regex_list(benchmark, column: pd.Series, match_on: str, use_regex_layer: bool):
+    regex_list_fn = series_matches_regex_list if use_regex_layer else _str_contains_regex_list
+    result = benchmark.pedantic(
+        regex_list_fn,
+        kwargs={"column": column, "regex_list": REGEX_LIST, "match_on": match_on},
+        rounds=3,
+    )
+
+    assert len(result) == NUM_ROWS
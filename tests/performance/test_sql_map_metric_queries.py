@@ -0,0 +1,92 @@
+"""Benchmark SQL queries issued per column map Expectation validated with "SUMMARY" result format.
+
+Unexpected values and unexpected index list (and, for window conditions, such as uniqueness, unexpected count) are
+computed in one query per Expectation, unless "fuse_map_condition_queries" is disabled.  Number of queries per
+Expectation is reported in "extra_info" of every benchmark.  Run with:
+
+    pytest --performance-tests tests/performance/test_sql_map_metric_queries.py
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import pathlib
+from typing import List
+
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.validator import Validator
+
+pytestmark = pytest.mark.performance
+
+NUM_ROWS = 100_000
+
+RESULT_FORMAT = {
+    "result_format": "SUMMARY",
+    "partial_unexpected_count": 20,
+    "unexpected_index_column_names": ["pk"],
+}
+
+
+@pytest.fixture
+def validator(tmp_path: pathlib.Path) -> Validator:
+    connection_string = f"sqlite:///{tmp_path / 'benchmark.db'}"
+    pd.DataFrame(
+        {
+            "pk": range(NUM_ROWS),
+            "a": [idx % (NUM_ROWS // 2) for idx in range(NUM_ROWS)],
+            "b": [f"value_{idx % 10}" for idx in range(NUM_ROWS)],
+        }
+    ).to_sql("benchmark", sa.create_engine(connection_string), index=False)
+
+    context = gx.get_context(mode="ephemeral")
+    asset = context.data_sources.add_sqlite(
+        "my_datasource", connection_string=connection_string
+    ).add_table_asset("my_asset", table_name="benchmark")
+    return context.get_validator(batch_request=asset.build_batch_request())
+
+
+def _build_expectation_configurations() -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            type="expect_column_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": [f"value_{idx}" for idx in range(8)]},
+        ),
+        ExpectationConfiguration(
+            type="expect_column_values_to_be_unique",
+            kwargs={"column": "a"},
+        ),
+    ]
+
+
+@pytest.mark.parametrize("fuse_map_condition_queries", [True, False])
+def test_map_metric_queries(benchmark, validator: Validator, fuse_map_condition_queries: bool):
+    validator.execution_engine._fuse_map_condition_queries = fuse_map_condition_queries
+    configurations = _build_expectation_configurations()
+    runtime_configuration = {"result_format": RESULT_FORMAT}
+
+    statements: List[str] = []
+
+    def _count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(validator.execution_engine.engine, "before_cursor_execute", _count_statement)
+    validator.graph_validate(
+        configurations=configurations, runtime_configuration=runtime_configuration
+    )
+    sa.event.remove(validator.execution_engine.engine, "before_cursor_execute", _count_statement)
+    benchmark.extra_info["queries_per_expectation"] = len(statements) / len(configurations)
+
+    results = benchmark.pedantic(
+        validator.graph_validate,
+        kwargs={"configurations": configurations, "runtime_configuration": runtime_configuration},
+        rounds=3,
+    )
+
+    assert len(results) == len(configurations)
+    assert all(len(result.result["partial_unexpected_index_list"]) == 20 for result in results)
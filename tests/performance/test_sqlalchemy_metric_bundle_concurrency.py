@@ -0,0 +1,130 @@
+"""Benchmark concurrent execution of per-Domain metric bundle queries.
+
+Every statement is delayed by a fixed amount of time, which stands in for the network round trip to a remote
+warehouse.  Run with:
+
+    pytest --performance-tests tests/performance/test_sqlalchemy_metric_bundle_concurrency.py [--postgresql]
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
+    add_dataframe_to_db,
+)
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
+from great_expectations.execution_engine.sqlalchemy_batch_data import (
+    SqlAlchemyBatchData,
+)
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+from tests.test_utils import get_default_postgres_url
+
+pytestmark = pytest.mark.performance
+
+SIMULATED_ROUND_TRIP_SECONDS = 0.05
+NUM_DOMAINS = 24
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def sqlalchemy_engine(request, sa, tmp_path, monkeypatch):
+    if request.param == "sqlite":
+        # A file-based sqlite database uses a regular connection pool and does not need a persisted connection.  # noqa: E501
+        monkeypatch.setattr(
+            "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+            (),
+        )
+        engine = sa.create_engine(f"sqlite:///{tmp_path / 'benchmark.db'}")
+    else:
+        if not request.config.getoption("--postgresql"):
+            pytest.skip("Postgres benchmark requires the --postgresql option.")
+        engine = sa.create_engine(get_default_postgres_url())
+
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": range(10_000), "b": [i % NUM_DOMAINS for i in range(10_000)]}),
+        name="metric_bundle_benchmark",
+        con=engine,
+        if_exists="replace",
+        index=False,
+    )
+
+    def _simulate_round_trip(*args, **kwargs):
+        time.sleep(SIMULATED_ROUND_TRIP_SECONDS)
+
+    sa.event.listen(engine, "before_cursor_execute", _simulate_round_trip)
+    yield engine
+    sa.event.remove(engine, "before_cursor_execute", _simulate_round_trip)
+    engine.dispose()
+
+
+def _build_metrics(
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> Tuple[Tuple[MetricConfiguration, ...], Dict[Tuple[str, str, str], MetricValue]]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    metrics.update(results)
+
+    aggregate_fn_metrics = []
+    for domain_idx in range(NUM_DOMAINS):
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs={
+                "column": "a",
+                "row_condition": f'col("b")=={domain_idx}',
+                "condition_parser": "great_expectations__experimental__",
+            },
+        )
+        aggregate_fn_metric.metric_dependencies = {"table.columns": table_columns_metric}
+        aggregate_fn_metrics.append(aggregate_fn_metric)
+
+    metrics.update(
+        execution_engine.resolve_metrics(metrics_to_resolve=aggregate_fn_metrics, metrics=metrics)
+    )
+
+    desired_metrics = []
+    for aggregate_fn_metric in aggregate_fn_metrics:
+        desired_metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=aggregate_fn_metric.metric_domain_kwargs,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics.append(desired_metric)
+
+    return tuple(desired_metrics), metrics
+
+
+@pytest.mark.parametrize("max_query_concurrency", [None, 4, 8])
+def test_resolve_metric_bundle_across_domains(
+    benchmark, sqlalchemy_engine, max_query_concurrency: Optional[int]
+):
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        batch_data_dict={
+            "benchmark": SqlAlchemyBatchData(
+                execution_engine=SqlAlchemyExecutionEngine(engine=sqlalchemy_engine),
+                table_name="metric_bundle_benchmark",
+            )
+        },
+        max_query_concurrency=max_query_concurrency,
+    )
+    desired_metrics, metrics = _build_metrics(execution_engine=execution_engine)
+
+    results = benchmark.pedantic(
+        execution_engine.resolve_metrics,
+        kwargs={"metrics_to_resolve": desired_metrics, "metrics": metrics},
+        rounds=3,
+    )
+
+    assert len(results) == NUM_DOMAINS
@@ -0,0 +1,77 @@
+"""Benchmark "column.quantile_values" of a 1M-row SQLite column as the number of requested quantiles grows.
+
+Compares the single query, which sorts the column once and selects rows at offsets of all quantiles, against one
+"ORDER BY ... OFFSET" query (and sort) per quantile.  Run with:
+
+    pytest --performance-tests tests/performance/test_sqlite_column_quantiles.py
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (  # noqa: E501
+    _get_column_quantiles_sqlite,
+    _get_column_quantiles_sqlite_by_offset,
+)
+
+pytestmark = pytest.mark.performance
+
+NUM_ROWS = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def execution_engine(tmp_path_factory: pytest.TempPathFactory) -> SqlAlchemyExecutionEngine:
+    db_path: pathlib.Path = tmp_path_factory.mktemp("sqlite_quantiles") / "benchmark.db"
+    connection_string = f"sqlite:///{db_path}"
+    rng = np.random.default_rng(seed=42)
+    pd.DataFrame({"a": rng.normal(size=NUM_ROWS)}).to_sql(
+        "benchmark", sa.create_engine(connection_string), index=False
+    )
+    return SqlAlchemyExecutionEngine(connection_string=connection_string)
+
+
+@pytest.mark.parametrize("num_quantiles", [1, 10, 100])
+@pytest.mark.parametrize("single_sort", [True, False])
+def test_sqlite_column_quantiles(
+    benchmark,
+    execution_engine: SqlAlchemyExecutionEngine,
+    num_quantiles: int,
+    single_sort: bool,
+):
+    quantiles = np.linspace(0.0, 1.0, num_quantiles).tolist()
+    column = sa.column("a")
+    selectable = sa.table("benchmark")
+    if single_sort:
+        result = benchmark.pedantic(
+            _get_column_quantiles_sqlite,
+            kwargs={
+                "column": column,
+                "quantiles": quantiles,
+                "selectable": selectable,
+                "execution_engine": execution_engine,
+                "table_row_count": NUM_ROWS,
+            },
+            rounds=3,
+        )
+    else:
+        result = benchmark.pedantic(
+            _get_column_quantiles_sqlite_by_offset,
+            kwargs={
+                "column": column,
+                "offsets": [max(int(quantile * NUM_ROWS - 1), 0) for quantile in quantiles],
+                "selectable": selectable,
+                "execution_engine": execution_engine,
+            },
+            rounds=3,
+        )
+
+    assert len(result) == num_quantiles
@@ -0,0 +1,49 @@
+"""Benchmark building and scheduling a "ValidationGraph" for a 10,000-metric suite.
+
+The graph build is dominated by "MetricConfiguration.id" and "IDDict" hashing.  Run with:
+
+    pytest --performance-tests tests/performance/test_validation_graph_build.py
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import ValidationGraph
+
+pytestmark = pytest.mark.performance
+
+NUM_COLUMNS = 2_500
+METRIC_NAMES = ("column.max", "column.min", "column.mean", "column.median")
+
+
+def _build_metric_configurations() -> List[MetricConfiguration]:
+    return [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": f"column_{column_idx}", "batch_id": "my_batch"},
+        )
+        for column_idx in range(NUM_COLUMNS)
+        for metric_name in METRIC_NAMES
+    ]
+
+
+def _build_and_schedule_graph(execution_engine: PandasExecutionEngine) -> ValidationGraph:
+    graph = ValidationGraph(execution_engine=execution_engine)
+    for metric_configuration in _build_metric_configurations():
+        graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+    graph._parse(metrics={})
+    graph.waves  # noqa: B018 # schedule is computed on access
+
+    return graph
+
+
+def test_build_validation_graph_for_10k_metrics(benchmark):
+    graph = benchmark.pedantic(_build_and_schedule_graph, args=(PandasExecutionEngine(),), rounds=3)
+
+    assert len(graph.edges) > len(METRIC_NAMES) * NUM_COLUMNS
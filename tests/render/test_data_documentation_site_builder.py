@@ -4,15 +4,25 @@ from typing import Dict
 
 import pytest
 
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationResultsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.render.renderer import (
+    ExpectationSuitePageRenderer,
+    ValidationResultsPageRenderer,
+)
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -125,3 +135,133 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+@pytest.fixture
+def context_with_suite_and_validation_result(tmp_path):
+    context = get_context(project_root_dir=str(tmp_path))
+    context.suites.add(ExpectationSuite(name="my_suite"))
+    validation_result_key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+        run_id=RunIdentifier(run_name="my_run"),
+        batch_identifier="my_batch",
+    )
+    context.validation_results_store.set(
+        validation_result_key, _build_validation_result(validation_result_key, success=True)
+    )
+    return context, validation_result_key
+
+
+def _build_validation_result(validation_result_key, success):
+    return ExpectationSuiteValidationResult(
+        success=success,
+        results=[],
+        suite_name="my_suite",
+        meta={"run_id": validation_result_key.run_id.to_json_dict()},
+    )
+
+
+def _build_site_builder(context, **site_builder_config):
+    return instantiate_class_from_config(
+        config={
+            "class_name": "SiteBuilder",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "uncommitted/data_docs/incremental_site/",
+            },
+            **site_builder_config,
+        },
+        runtime_environment={
+            "data_context": context,
+            "root_directory": context.root_directory,
+            "site_name": "incremental_site",
+        },
+        config_defaults={"module_name": "great_expectations.render.renderer.site_builder"},
+    )
+
+
+def test_incremental_site_builder_renders_only_new_or_changed_resources(
+    context_with_suite_and_validation_result, mocker
+):
+    context, validation_result_key = context_with_suite_and_validation_result
+    suite_render_spy = mocker.spy(ExpectationSuitePageRenderer, "render")
+    validation_result_render_spy = mocker.spy(ValidationResultsPageRenderer, "render")
+
+    site_builder = _build_site_builder(context, incremental_build=True)
+    _, index_links_dict = site_builder.build()
+    assert suite_render_spy.call_count == 1
+    assert validation_result_render_spy.call_count == 1
+    assert index_links_dict["validations_links"][0]["validation_success"] is True
+    assert set(site_builder.target_store.get_render_manifest()["sections"]) == {
+        "expectations",
+        "validations",
+        "profiling",
+    }
+
+    # Nothing changed: no page is rendered again, and the index is built from the manifest.
+    get_validation_result_spy = mocker.spy(context, "get_validation_result")
+    _, index_links_dict = _build_site_builder(context, incremental_build=True).build()
+    assert suite_render_spy.call_count == 1
+    assert validation_result_render_spy.call_count == 1
+    assert get_validation_result_spy.call_count == 0
+    assert index_links_dict["validations_links"][0]["validation_success"] is True
+
+    context.validation_results_store.set(
+        validation_result_key, _build_validation_result(validation_result_key, success=False)
+    )
+    site_builder = _build_site_builder(context, incremental_build=True)
+    _, index_links_dict = site_builder.build()
+    assert suite_render_spy.call_count == 1
+    assert validation_result_render_spy.call_count == 2  # noqa: PLR2004
+    assert index_links_dict["validations_links"][0]["validation_success"] is False
+
+    # Pages removed from the site are rendered again.
+    site_builder.clean_site()
+    assert site_builder.target_store.get_render_manifest() == {}
+    site_builder.build()
+    assert suite_render_spy.call_count == 2  # noqa: PLR2004
+    assert validation_result_render_spy.call_count == 3  # noqa: PLR2004
+
+
+def test_incremental_site_builder_renders_again_when_renderer_config_changes(
+    context_with_suite_and_validation_result, mocker
+):
+    context, _ = context_with_suite_and_validation_result
+    suite_render_spy = mocker.spy(ExpectationSuitePageRenderer, "render")
+    _build_site_builder(context, incremental_build=True).build()
+    assert suite_render_spy.call_count == 1
+
+    # Same renderer class, but configured with other kwargs.
+    _build_site_builder(
+        context,
+        incremental_build=True,
+        site_section_builders={
+            "expectations": {
+                "renderer": {
+                    "class_name": "ExpectationSuitePageRenderer",
+                    "column_section_renderer": {
+                        "class_name": "ExpectationSuiteColumnSectionRenderer"
+                    },
+                }
+            }
+        },
+    ).build()
+    assert suite_render_spy.call_count == 2  # noqa: PLR2004
+
+
+def test_site_builder_renders_pages_concurrently(context_with_suite_and_validation_result):
+    context, validation_result_key = context_with_suite_and_validation_result
+    context.suites.add(ExpectationSuite(name="my_other_suite"))
+    site_builder = _build_site_builder(context, render_concurrency=4)
+    assert all(
+        section_builder.render_concurrency == 4  # noqa: PLR2004
+        for section_builder in site_builder.site_section_builders.values()
+    )
+
+    _, index_links_dict = site_builder.build()
+
+    assert sorted(
+        link["expectation_suite_name"] for link in index_links_dict["expectations_links"]
+    ) == ["my_other_suite", "my_suite"]
+    assert site_builder.get_resource_url(ExpectationSuiteIdentifier(name="my_other_suite"))
+    assert site_builder.get_resource_url(validation_result_key)
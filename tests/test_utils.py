@@ -177,6 +177,28 @@ def get_sqlite_temp_table_names_from_engine(engine: Engine):
     return {row[0] for row in rows}
 
 
+@contextmanager
+def record_sql_statements(engine: Engine) -> Generator[List[str], None, None]:
+    """Records SQL statements, which "engine" executes within the context
+
+    Args:
+        engine: The SQLAlchemy Engine whose "before_cursor_execute" events are listened to
+
+    Yields:
+        List of executed SQL statements (updated in place)
+    """
+    statements: List[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", _record_statement)
+    try:
+        yield statements
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", _record_statement)
+
+
 def build_tuple_filesystem_store_backend(
     base_directory: str,
     *,
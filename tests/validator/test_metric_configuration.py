@@ -63,3 +63,16 @@ def test_metric_configuration_get_domain(
             "column": "my_column",
         },
     )
+
+
+@pytest.mark.unit
+def test_metric_configuration_id_is_cached_until_kwargs_change(
+    table_head_metric_config: MetricConfiguration,
+) -> None:
+    metric_id = table_head_metric_config.id
+    assert table_head_metric_config.id is metric_id
+
+    table_head_metric_config.metric_value_kwargs["n_rows"] = 10
+
+    assert table_head_metric_config.id == ("table.head", "batch_id=abc123", "n_rows=10")
+    assert table_head_metric_config.id is not metric_id
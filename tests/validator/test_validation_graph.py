@@ -19,6 +19,7 @@ from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
     ValidationGraph,
+    _MetricResolutionScheduler,
 )
 from great_expectations.validator.validator import ValidationDependencies
 
@@ -28,6 +29,13 @@ def pandas_execution_engine_fake(
     failed_metric_config: MetricConfiguration,
 ) -> ExecutionEngine:
     class PandasExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def prepare_batch_data_for_metrics(
+            metric_configurations: Iterable[MetricConfiguration],
+        ) -> None:
+            pass
+
         # noinspection PyUnusedLocal
         @staticmethod
         def resolve_metrics(
@@ -304,7 +312,7 @@ def test_parse_validation_graph(
     ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(needed_metrics) == 11
 
     # Show that including "nonexistent" metric in dictionary of resolved metrics does not increase ready_metrics count.  # noqa: E501
     available_metrics = {("nonexistent", "nonexistent", "nonexistent"): "NONE"}
@@ -314,7 +322,7 @@ def test_parse_validation_graph(
     ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(needed_metrics) == 11
 
 
 @pytest.mark.unit
@@ -322,7 +330,7 @@ def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
 ):
     assert (
-        len(expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges) == 33
+        len(expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges) == 41
     )
 
 
@@ -430,21 +438,23 @@ def test_progress_bar_config(
     """  # noqa: E501
 
     class DummyMetricConfiguration:
-        pass
+        id = ("dummy_metric", "", "")
 
     class DummyExecutionEngine:
-        pass
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def prepare_batch_data_for_metrics(
+            metric_configurations: Iterable[MetricConfiguration],
+        ) -> None:
+            pass
 
     metric_configuration = cast(MetricConfiguration, DummyMetricConfiguration)
     execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
 
     # ValidationGraph is a complex object that requires len > 3 to not trigger tqdm
     with mock.patch(
-        "great_expectations.validator.validation_graph.ValidationGraph._parse",
-        return_value=(
-            {},
-            {},
-        ),
+        "great_expectations.validator.validation_graph.ValidationGraph._build_metric_resolution_scheduler",
+        return_value=_MetricResolutionScheduler(edges=[]),
     ), mock.patch(
         "great_expectations.validator.validation_graph.ValidationGraph.edges",
         new_callable=mock.PropertyMock,
@@ -478,6 +488,123 @@ def test_progress_bar_config(
         assert mock_tqdm.call_args[1]["disable"] is are_progress_bars_disabled
 
 
+@pytest.mark.unit
+def test_validation_graph_waves(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+    waves = graph.waves
+
+    ready_metrics, needed_metrics = graph._parse(metrics={})
+    assert {metric.id for metric in waves[0]} == {metric.id for metric in ready_metrics}
+    assert sum(len(wave) for wave in waves) == len(ready_metrics) + len(needed_metrics)
+
+    # Every dependency of a metric is scheduled in an earlier wave.
+    wave_index_by_metric_id = {
+        metric.id: wave_index for wave_index, wave in enumerate(waves) for metric in wave
+    }
+    for edge in graph.edges:
+        if edge.right is not None:
+            assert wave_index_by_metric_id[edge.right.id] < wave_index_by_metric_id[edge.left.id]
+
+
+@pytest.mark.unit
+def test_metric_resolution_scheduler_matches_full_parse(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    scheduler = _MetricResolutionScheduler(edges=graph.edges)
+
+    while True:
+        ready_metrics, needed_metrics = graph._parse(metrics=metrics)
+        assert {metric.id for metric in scheduler.ready_metrics} == {
+            metric.id for metric in ready_metrics
+        }
+        assert scheduler.num_needed_metrics == len(needed_metrics)
+        if not ready_metrics:
+            break
+
+        # Resolve a single metric at a time to exercise partial promotion of dependents.
+        metric_id = next(iter(ready_metrics)).id
+        metrics[metric_id] = "my_value"
+        scheduler.mark_resolved(metric_ids=[metric_id])
+
+    assert scheduler.num_needed_metrics == 0
+
+
+@pytest.mark.unit
+def test_metric_resolution_scheduler_skips_already_resolved_metrics(
+    table_head_metric_config: MetricConfiguration,
+    column_histogram_metric_config: MetricConfiguration,
+):
+    edges = [
+        MetricEdge(left=column_histogram_metric_config),
+        MetricEdge(left=table_head_metric_config, right=column_histogram_metric_config),
+    ]
+
+    scheduler = _MetricResolutionScheduler(
+        edges=edges, resolved_metric_ids=[column_histogram_metric_config.id]
+    )
+
+    assert [metric.id for metric in scheduler.ready_metrics] == [table_head_metric_config.id]
+    assert scheduler.num_needed_metrics == 0
+
+
+@pytest.mark.unit
+def test_metric_resolution_scheduler_skips_partial_metrics_of_resolved_metrics():
+    table_columns = MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={})
+    column_max_partial = MetricConfiguration(
+        metric_name="column.max.aggregate_fn", metric_domain_kwargs={"column": "a"}
+    )
+    column_max = MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": "a"})
+    column_min_partial = MetricConfiguration(
+        metric_name="column.min.aggregate_fn", metric_domain_kwargs={"column": "a"}
+    )
+    column_min = MetricConfiguration(metric_name="column.min", metric_domain_kwargs={"column": "a"})
+    edges = [
+        MetricEdge(left=table_columns),
+        MetricEdge(left=column_max_partial, right=table_columns),
+        MetricEdge(left=column_max, right=column_max_partial),
+        MetricEdge(left=column_min_partial, right=table_columns),
+        MetricEdge(left=column_min, right=column_min_partial),
+    ]
+
+    scheduler = _MetricResolutionScheduler(edges=edges, resolved_metric_ids=[column_max.id])
+
+    # "column.max.aggregate_fn" is needed only by resolved "column.max"; hence, it is not scheduled.
+    assert [wave_metric.id for wave in scheduler.waves() for wave_metric in wave] == [
+        table_columns.id,
+        column_min_partial.id,
+        column_min.id,
+    ]
+
+
+
+@pytest.mark.unit
+def test_metric_resolution_scheduler_marks_metrics_updated_during_resolution_resolved():
+    table_columns = MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={})
+    column_nonnull_condition = MetricConfiguration(
+        metric_name="column_values.nonnull.condition",
+        metric_domain_kwargs={"column": "UNQUOTED_COL"},
+    )
+    edges = [
+        MetricEdge(left=table_columns),
+        MetricEdge(left=column_nonnull_condition, right=table_columns),
+    ]
+
+    scheduler = _MetricResolutionScheduler(edges=edges)
+    scheduler.mark_resolved(metric_ids=[table_columns.id])
+    assert scheduler.ready_metrics == [column_nonnull_condition]
+
+    # Resolution normalizes column name of Domain, and thereby changes ID of "MetricConfiguration".
+    column_nonnull_condition.metric_domain_kwargs["column"] = "unquoted_col"
+    scheduler.mark_resolved(metric_ids=[column_nonnull_condition.id])
+
+    assert scheduler.ready_metrics == []
+    assert scheduler.num_needed_metrics == 0
+
+
 if __name__ == "__main__":
     argv: list = sys.argv[1:]
 
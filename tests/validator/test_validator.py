@@ -290,6 +290,49 @@ def test_graph_validate_with_runtime_config(
     ]
 
 
+@pytest.mark.big
+def test_graph_validate_does_not_share_nested_kwargs_and_meta_with_configurations(
+    in_memory_runtime_context, basic_datasource: PandasDatasource
+):
+    asset = basic_datasource.add_dataframe_asset(
+        "my_asset",
+        dataframe=pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]}),
+    )
+    batch_definition = asset.add_batch_definition_whole_dataframe("my batch definition")
+    batch = batch_definition.get_batch()
+
+    expectation_configuration = ExpectationConfiguration(
+        type="expect_column_values_to_be_in_set",
+        kwargs={"column": "a", "value_set": [1, 3, 5, 10, 22]},
+        meta={"notes": {"format": "markdown", "content": ["Allowed values."]}},
+    )
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        data_context=in_memory_runtime_context,
+        batches=[batch],
+    )
+
+    (
+        _,
+        _,
+        (evaluated_config,),
+    ) = validator._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+        expectation_configurations=[expectation_configuration],
+        processed_configurations=[],
+        catch_exceptions=False,
+        runtime_configuration={},
+    )
+    evaluated_config.kwargs["value_set"].append(42)
+    evaluated_config.meta["notes"]["content"].append("Updated.")
+
+    assert evaluated_config.kwargs["batch_id"] == batch.id
+    assert expectation_configuration.kwargs == {"column": "a", "value_set": [1, 3, 5, 10, 22]}
+    assert expectation_configuration.meta == {
+        "notes": {"format": "markdown", "content": ["Allowed values."]}
+    }
+    assert validator.graph_validate(configurations=[expectation_configuration])[0].success
+
+
 @pytest.mark.big
 def test_graph_validate_with_exception(basic_datasource: PandasDatasource, mocker: MockerFixture):
     # noinspection PyUnusedLocal